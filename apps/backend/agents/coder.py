@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 
 from core.client import create_client
+from debug import debug
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -18,7 +19,11 @@ from linear_updater import (
     linear_task_started,
     linear_task_stuck,
 )
-from phase_config import get_phase_model, get_phase_thinking_budget
+from phase_config import (
+    get_context_token_budget,
+    get_phase_model,
+    get_phase_thinking_budget,
+)
 from phase_event import ExecutionPhase, emit_phase
 from progress import (
     count_subtasks,
@@ -35,11 +40,14 @@ from prompt_generator import (
     generate_planner_prompt,
     generate_subtask_prompt,
     load_subtask_context,
+    pack_subtask_context,
 )
 from prompts import is_first_run
+from prompts_pkg.prompt_cache import PromptBuildTimer, get_prompt_cache
 from recovery import RecoveryManager
 from security.constants import PROJECT_DIR_ENV_VAR
 from task_logger import (
+    LogEntryType,
     LogPhase,
     get_task_logger,
 )
@@ -70,6 +78,21 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+def _report_prompt_build(timer: PromptBuildTimer, session_num: int) -> None:
+    """Report prompt build time and size for a session (DEBUG output)."""
+    stats = get_prompt_cache().stats
+    debug(
+        "coder",
+        f"Built {timer.kind} prompt for session {session_num}",
+        build_ms=round(timer.duration_ms, 2),
+        prompt_bytes=timer.prompt_bytes,
+        fragment_cache_hits=stats.cache_hits,
+        fragment_cache_misses=stats.cache_misses,
+        bytes_read=stats.bytes_read,
+        total_build_ms=round(stats.total_build_ms, 2),
+    )
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -293,9 +316,12 @@ async def run_autonomous_agent(
 
         # Generate appropriate prompt
         if first_run:
-            prompt = generate_planner_prompt(spec_dir, project_dir)
-            if planning_retry_context:
-                prompt += "\n\n" + planning_retry_context
+            with PromptBuildTimer("planner") as prompt_timer:
+                prompt = generate_planner_prompt(spec_dir, project_dir)
+                if planning_retry_context:
+                    prompt += "\n\n" + planning_retry_context
+                prompt_timer.prompt = prompt
+            _report_prompt_build(prompt_timer, iteration)
 
             # Retrieve Graphiti memory context for planning phase
             # This gives the planner knowledge of previous patterns, gotchas, and insights
@@ -353,20 +379,35 @@ async def run_autonomous_agent(
             plan = load_implementation_plan(spec_dir)
             phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
 
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
+            with PromptBuildTimer("subtask") as prompt_timer:
+                # Generate focused, minimal prompt for this subtask
+                prompt = generate_subtask_prompt(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask=next_subtask,
+                    phase=phase or {},
+                    attempt_count=attempt_count,
+                    recovery_hints=recovery_hints,
+                )
 
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
+                # Load relevant file context and pack it into the phase budget
+                context = load_subtask_context(spec_dir, project_dir, next_subtask)
+                packing_report = None
+                if context.get("patterns") or context.get("files_to_modify"):
+                    context, packing_report = pack_subtask_context(
+                        context, get_context_token_budget(spec_dir, "coding")
+                    )
+                    prompt += "\n\n" + format_context_for_prompt(context)
+                prompt_timer.prompt = prompt
+            _report_prompt_build(prompt_timer, iteration)
+            if packing_report and task_logger:
+                task_logger.log_with_detail(
+                    packing_report.summary(),
+                    packing_report.format_detail(),
+                    entry_type=LogEntryType.INFO,
+                    phase=LogPhase.CODING,
+                    print_to_console=False,
+                )
 
             # Retrieve and append Graphiti memory context (if enabled)
             graphiti_context = await get_graphiti_context(
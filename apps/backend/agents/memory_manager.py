@@ -7,7 +7,10 @@ Handles session memory storage using dual-layer approach:
 - FALLBACK: File-based memory - zero dependencies, always available
 """
 
+import asyncio
 import logging
+import threading
+import time
 from pathlib import Path
 
 from debug import (
@@ -20,14 +23,120 @@ from debug import (
     is_debug_enabled,
 )
 from graphiti_config import get_graphiti_status, is_graphiti_enabled
+from integrations.graphiti.queries_pkg.queries import get_write_generation
 
 # Import from parent memory package
 # Now safe since this module is named memory_manager (not memory)
+from memory import flush_memory_writes_async
 from memory import save_session_insights as save_file_based_memory
 from memory.graphiti_helpers import get_graphiti_memory
 
 logger = logging.getLogger(__name__)
 
+# One timeout for the whole (concurrent) context retrieval
+CONTEXT_RETRIEVAL_TIMEOUT_SECONDS = 30.0
+
+# Retrieved context is reused (e.g. for retried subtasks) until an episode is
+# added in this process or the TTL expires (covers writes by other processes)
+CONTEXT_CACHE_TTL_SECONDS = 120.0
+MAX_CONTEXT_CACHE_ENTRIES = 64
+
+_context_cache: dict[tuple, tuple[float, tuple]] = {}
+_context_cache_lock = threading.Lock()
+
+
+def _get_cached_context(key: tuple) -> tuple | None:
+    with _context_cache_lock:
+        entry = _context_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > CONTEXT_CACHE_TTL_SECONDS:
+            del _context_cache[key]
+            return None
+        return results
+
+
+def _cache_context(key: tuple, results: tuple) -> None:
+    with _context_cache_lock:
+        generation = key[-1]
+        # Entries from older write generations can never be hit again
+        for old_key in [k for k in _context_cache if k[-1] != generation]:
+            del _context_cache[old_key]
+        _context_cache[key] = (time.monotonic(), results)
+        while len(_context_cache) > MAX_CONTEXT_CACHE_ENTRIES:
+            del _context_cache[next(iter(_context_cache))]
+
+
+def clear_graphiti_context_cache() -> None:
+    """Drop all cached Graphiti context retrievals."""
+    with _context_cache_lock:
+        _context_cache.clear()
+
+
+async def _retrieve_graphiti_context(memory, query: str) -> tuple | None:
+    """
+    Run the context, pattern/gotcha and session history queries concurrently.
+
+    Returns (context_items, patterns, gotchas, session_history), or None if
+    the retrieval timed out. Results are cached per (group, spec, query,
+    write generation), unless a query failed.
+    """
+    cache_key = (
+        memory.group_id,
+        memory.spec_context_id,
+        query,
+        get_write_generation(),
+    )
+    cached = _get_cached_context(cache_key)
+    if cached is not None:
+        if is_debug_enabled():
+            debug("memory", "Using cached Graphiti context", query=query[:200])
+        return cached
+
+    # Initialize once up front, not concurrently from each query
+    await memory.initialize()
+
+    # The search layer logs and swallows errors, returning empty results
+    failures_before = memory.search_failures
+    try:
+        context_items, patterns_and_gotchas, session_history = await asyncio.wait_for(
+            asyncio.gather(
+                memory.get_relevant_context(query, num_results=5),
+                # Get patterns and gotchas specifically (THE FIX for learning loop!)
+                # This retrieves PATTERN and GOTCHA episode types for cross-session learning
+                memory.get_patterns_and_gotchas(query, num_results=3, min_score=0.5),
+                # Also get recent session history
+                memory.get_session_history(limit=3),
+                return_exceptions=True,
+            ),
+            timeout=CONTEXT_RETRIEVAL_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Graphiti context retrieval timed out after "
+            f"{CONTEXT_RETRIEVAL_TIMEOUT_SECONDS:.0f}s"
+        )
+        return None
+
+    # A failed query leaves its section empty; the others are still used
+    failed = memory.search_failures != failures_before
+    if isinstance(context_items, Exception):
+        logger.warning(f"Failed to get relevant context: {context_items}")
+        context_items, failed = [], True
+    if isinstance(patterns_and_gotchas, Exception):
+        logger.warning(f"Failed to get patterns and gotchas: {patterns_and_gotchas}")
+        patterns_and_gotchas, failed = ([], []), True
+    if isinstance(session_history, Exception):
+        logger.warning(f"Failed to get session history: {session_history}")
+        session_history, failed = [], True
+
+    patterns, gotchas = patterns_and_gotchas
+    results = (context_items, patterns, gotchas, session_history)
+    if not failed and memory.is_initialized:
+        _cache_context(cache_key, results)
+    return results
+
 
 def debug_memory_system_status() -> None:
     """
@@ -140,17 +249,10 @@ async def get_graphiti_context(
                 num_results=5,
             )
 
-        # Get relevant context
-        context_items = await memory.get_relevant_context(query, num_results=5)
-
-        # Get patterns and gotchas specifically (THE FIX for learning loop!)
-        # This retrieves PATTERN and GOTCHA episode types for cross-session learning
-        patterns, gotchas = await memory.get_patterns_and_gotchas(
-            query, num_results=3, min_score=0.5
-        )
-
-        # Also get recent session history
-        session_history = await memory.get_session_history(limit=3)
+        results = await _retrieve_graphiti_context(memory, query)
+        if results is None:
+            return None
+        context_items, patterns, gotchas, session_history = results
 
         if is_debug_enabled():
             debug(
@@ -283,6 +385,9 @@ async def save_session_memory(
             spec_dir=str(spec_dir),
         )
 
+    # Write out patterns, gotchas and codebase map updates queued during the session
+    await flush_memory_writes_async()
+
     # Build insights structure (same format for both storage systems)
     insights = {
         "subtasks_completed": subtasks_completed,
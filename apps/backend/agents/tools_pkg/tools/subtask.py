@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from core.file_utils import write_json_atomic
+from core.spec_catalog import record_plan
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -130,6 +131,7 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
 
             # Use atomic write to prevent file corruption
             write_json_atomic(plan_file, plan, indent=2)
+            record_plan(plan_file, plan)
 
             return {
                 "content": [
@@ -154,6 +156,7 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
 
                     if subtask_found:
                         write_json_atomic(plan_file, plan, indent=2)
+                        record_plan(plan_file, plan)
                         return {
                             "content": [
                                 {
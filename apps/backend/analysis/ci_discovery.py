@@ -6,6 +6,10 @@ CI Discovery Module
 Parses CI/CD configuration files to extract test commands and workflows.
 Supports GitHub Actions, GitLab CI, CircleCI, and Jenkins.
 
+Parsed configurations are cached under .auto-claude/ keyed by the signatures
+of the CI files (see discovery_cache), so they are only re-parsed when a CI
+file changes.
+
 The CI discovery results are used by:
 - QA Agent: To understand existing CI test patterns
 - Validation Strategy: To match CI commands
@@ -30,6 +34,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .discovery_cache import DiscoveryCache
+
 # Try to import yaml, fall back gracefully
 try:
     import yaml
@@ -84,6 +90,15 @@ class CIConfig:
     environment_variables: list[str] = field(default_factory=list)
 
 
+# CI config locations, in detection priority order
+CI_CONFIG_PATHS = [
+    ("github_actions", ".github/workflows"),
+    ("gitlab", ".gitlab-ci.yml"),
+    ("circleci", ".circleci/config.yml"),
+    ("jenkins", "Jenkinsfile"),
+]
+
+
 # =============================================================================
 # CI PARSERS
 # =============================================================================
@@ -100,8 +115,14 @@ class CIDiscovery:
     - Jenkins (Jenkinsfile)
     """
 
-    def __init__(self) -> None:
-        """Initialize CI discovery."""
+    def __init__(self, use_cache: bool = True) -> None:
+        """
+        Initialize CI discovery.
+
+        Args:
+            use_cache: Reuse parsed configurations stored under .auto-claude/
+        """
+        self.use_cache = use_cache
         self._cache: dict[str, CIConfig | None] = {}
 
     def discover(self, project_dir: Path) -> CIConfig | None:
@@ -120,42 +141,62 @@ class CIDiscovery:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        # Try each CI system
+        disk_cache = (
+            DiscoveryCache.open(project_dir, "ci_discovery") if self.use_cache else None
+        )
+
+        # Try each CI system, in priority order
         result = None
+        for ci_system, config_path in CI_CONFIG_PATHS:
+            path = project_dir / config_path
+            if not path.exists():
+                continue
+            result = self._discover_system(ci_system, path, disk_cache)
+            if result:
+                break
 
-        # GitHub Actions
-        github_workflows = project_dir / ".github" / "workflows"
-        if github_workflows.exists():
-            result = self._parse_github_actions(github_workflows)
-
-        # GitLab CI
-        if not result:
-            gitlab_ci = project_dir / ".gitlab-ci.yml"
-            if gitlab_ci.exists():
-                result = self._parse_gitlab_ci(gitlab_ci)
-
-        # CircleCI
-        if not result:
-            circleci = project_dir / ".circleci" / "config.yml"
-            if circleci.exists():
-                result = self._parse_circleci(circleci)
-
-        # Jenkins
-        if not result:
-            jenkinsfile = project_dir / "Jenkinsfile"
-            if jenkinsfile.exists():
-                result = self._parse_jenkinsfile(jenkinsfile)
+        if disk_cache is not None:
+            disk_cache.save()
 
         self._cache[cache_key] = result
         return result
 
+    def _discover_system(
+        self, ci_system: str, path: Path, disk_cache: DiscoveryCache | None
+    ) -> CIConfig:
+        """Parse the config of one CI system, or reuse its cached result."""
+        parsers = {
+            "github_actions": self._parse_github_actions,
+            "gitlab": self._parse_gitlab_ci,
+            "circleci": self._parse_circleci,
+            "jenkins": self._parse_jenkinsfile,
+        }
+        if disk_cache is None:
+            return parsers[ci_system](path)
+
+        # The parse result of YAML configs depends on PyYAML being installed
+        inputs = {"yaml": HAS_YAML}
+        hit, value = disk_cache.get(ci_system, inputs)
+        if hit:
+            return self.from_dict(value)
+
+        # Taken before parsing, so edits made meanwhile invalidate the entry
+        deps = disk_cache.signatures([path, *self._workflow_files(path)])
+        result = parsers[ci_system](path)
+        disk_cache.put(ci_system, self.to_dict(result), deps, inputs)
+        return result
+
+    def _workflow_files(self, path: Path) -> list[Path]:
+        """Workflow files of a CI config directory (empty for single files)."""
+        if not path.is_dir():
+            return []
+        return list(path.glob("*.yml")) + list(path.glob("*.yaml"))
+
     def _parse_github_actions(self, workflows_dir: Path) -> CIConfig:
         """Parse GitHub Actions workflow files."""
         result = CIConfig(ci_system="github_actions")
 
-        workflow_files = list(workflows_dir.glob("*.yml")) + list(
-            workflows_dir.glob("*.yaml")
-        )
+        workflow_files = self._workflow_files(workflows_dir)
 
         for wf_file in workflow_files:
             result.config_files.append(
@@ -485,6 +526,17 @@ class CIDiscovery:
             "environment_variables": result.environment_variables,
         }
 
+    def from_dict(self, data: dict[str, Any]) -> CIConfig:
+        """Create a result from its to_dict() form."""
+        return CIConfig(
+            ci_system=data["ci_system"],
+            config_files=list(data.get("config_files", [])),
+            test_commands=dict(data.get("test_commands", {})),
+            coverage_command=data.get("coverage_command"),
+            workflows=[CIWorkflow(**w) for w in data.get("workflows", [])],
+            environment_variables=list(data.get("environment_variables", [])),
+        )
+
     def clear_cache(self) -> None:
         """Clear the internal cache."""
         self._cache.clear()
@@ -0,0 +1,193 @@
+"""
+Discovery Cache
+===============
+
+Persistent cache for the CI and test discovery detectors.
+
+Each detector result is stored under .auto-claude/ together with the
+signatures of the paths it read:
+
+- Files: mtime, size and a content hash. A changed mtime with unchanged
+  content (checkout, touch) is revalidated by hash instead of re-running.
+- Directories: mtime, which changes when entries are added or removed.
+- Missing paths: the detector result depends on their absence.
+
+Reusing a result costs one stat per path it depends on, so a new backend
+process only re-runs the detectors whose inputs changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+DISCOVERY_CACHE_DIR = ".auto-claude"
+
+# Paths modified this recently can still change within the same mtime tick,
+# so their signature is never trusted on its own (see path_signature)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def path_signature(path: Path) -> dict[str, Any] | None:
+    """
+    Signature of a file or directory, or None if it doesn't exist.
+
+    Take it before reading the path, so a change made while the detector runs
+    invalidates the cached result instead of being hidden by it.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+
+    signature: dict[str, Any] = {"mtime_ns": st.st_mtime_ns}
+    if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+        signature["racy"] = True
+    if stat.S_ISDIR(st.st_mode):
+        signature["dir"] = True
+    else:
+        signature["size"] = st.st_size
+        signature["sha256"] = _file_hash(path)
+    return signature
+
+
+class DiscoveryCache:
+    """
+    On-disk cache of detector results for one project.
+
+    Entries are keyed by detector name. An entry is reused while the paths it
+    depends on keep their signatures and the detector inputs (results of
+    other detectors, optional dependencies) are unchanged. A missing or
+    corrupt cache file is an empty cache; writing it is best effort.
+    """
+
+    VERSION = 1
+
+    def __init__(self, project_dir: Path, name: str):
+        self.project_dir = Path(project_dir)
+        self.path = self.project_dir / DISCOVERY_CACHE_DIR / f"{name}_cache.json"
+        self._entries: dict[str, Any] | None = None
+        self._dirty = False
+
+    @classmethod
+    def open(cls, project_dir: Path, name: str) -> DiscoveryCache | None:
+        """
+        Open the cache of a project, or None if it can't be stored.
+
+        Creates the cache directory first: creating it later would change the
+        mtime of the project root that the test tree entry depends on.
+        """
+        project_dir = Path(project_dir)
+        if not project_dir.is_dir():
+            return None
+        try:
+            (project_dir / DISCOVERY_CACHE_DIR).mkdir(exist_ok=True)
+        except OSError:
+            return None
+        return cls(project_dir, name)
+
+    def _load(self) -> dict[str, Any]:
+        if self._entries is None:
+            data: Any = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+            if not isinstance(data, dict) or data.get("version") != self.VERSION:
+                data = {}
+            entries = data.get("entries")
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def signatures(self, paths: Iterable[Path | str]) -> dict[str, Any]:
+        """Signatures of paths (relative to the project), keyed by relative path."""
+        deps = {}
+        for path in paths:
+            rel = Path(path)
+            if rel.is_absolute():
+                rel = rel.relative_to(self.project_dir)
+            deps[rel.as_posix()] = path_signature(self.project_dir / rel)
+        return deps
+
+    def _is_valid(self, deps: dict[str, Any]) -> bool:
+        for rel, signature in deps.items():
+            path = self.project_dir / rel
+            try:
+                st = path.stat()
+            except OSError:
+                st = None
+            if signature is None or st is None:
+                if signature is not None or st is not None:
+                    return False
+                continue
+
+            if signature.get("dir"):
+                if (
+                    not stat.S_ISDIR(st.st_mode)
+                    or signature.get("racy")
+                    or st.st_mtime_ns != signature["mtime_ns"]
+                ):
+                    return False
+                continue
+
+            if stat.S_ISDIR(st.st_mode) or st.st_size != signature["size"]:
+                return False
+            if st.st_mtime_ns == signature["mtime_ns"] and not signature.get("racy"):
+                continue
+            # Touched or racy: the content decides
+            current = path_signature(path)
+            if current is None or current["sha256"] != signature["sha256"]:
+                return False
+            deps[rel] = current
+            self._dirty = True
+        return True
+
+    def get(self, detector: str, inputs: Any = None) -> tuple[bool, Any]:
+        """Return (True, value) if the cached result of a detector is valid."""
+        entry = self._load().get(detector)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("inputs") != inputs
+            or not self._is_valid(entry.get("deps", {}))
+        ):
+            return False, None
+        return True, entry.get("value")
+
+    def put(
+        self, detector: str, value: Any, deps: dict[str, Any], inputs: Any = None
+    ) -> None:
+        """Store the result of a detector with the signatures it depends on."""
+        self._load()[detector] = {"inputs": inputs, "deps": deps, "value": value}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if any entry was added or refreshed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                # default=str: YAML values such as dates aren't JSON types
+                json.dumps(
+                    {"version": self.VERSION, "entries": self._entries}, default=str
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best effort
@@ -11,10 +11,14 @@ Falls back to generic insights if extraction fails (never blocks the build).
 
 from __future__ import annotations
 
+import fnmatch
 import json
 import logging
 import os
+import re
 import subprocess
+import tempfile
+import time
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +44,52 @@ DEFAULT_EXTRACTION_MODEL = "claude-haiku-4-5-20251001"
 # Maximum diff size to send to the LLM (avoid context limits)
 MAX_DIFF_CHARS = 15000
 
+# Git diff is stopped after this long and the partial diff is used
+DIFF_TIMEOUT_SECONDS = 30
+
+# Files left out of the diff that are listed by name
+MAX_SKIPPED_FILES_LISTED = 50
+
+# Generated, vendored and lock files: their patches come last in the diff
+GENERATED_DIRS = {
+    "node_modules",
+    "vendor",
+    "dist",
+    "build",
+    "out",
+    ".next",
+    "__generated__",
+    "generated",
+    "__snapshots__",
+}
+GENERATED_FILE_PATTERNS = (
+    "*.lock",
+    "*-lock.json",
+    "*-lock.yaml",
+    "*.lockb",
+    "go.sum",
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*.snap",
+    "*.pb.go",
+    "*_pb2.py",
+    "*.generated.*",
+    "*.g.dart",
+)
+# Docs and data files: after source, before generated files
+DOC_FILE_PATTERNS = (
+    "*.md",
+    "*.rst",
+    "*.txt",
+    "*.json",
+    "*.yaml",
+    "*.yml",
+    "*.toml",
+    "*.csv",
+    "*.svg",
+)
+
 # Maximum attempt history entries to include
 MAX_ATTEMPTS_TO_INCLUDE = 3
 
@@ -65,13 +115,166 @@ def get_extraction_model() -> str:
 # =============================================================================
 
 
-def get_session_diff(
+def _numstat(
+    project_dir: Path, commit_before: str, commit_after: str
+) -> list[tuple[str, int | None, int | None]]:
+    """
+    Changed files with their added/deleted line counts (None for binary files).
+
+    Reads `git diff --numstat`, which is one short line per file however large
+    the changes are. Raises subprocess.CalledProcessError if git fails.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--numstat", "--no-renames", "-z", commit_before, commit_after],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        timeout=10,
+        check=True,
+    )
+    files = []
+    for record in result.stdout.split("\0"):
+        added, _, rest = record.partition("\t")
+        deleted, _, path = rest.partition("\t")
+        if not path:
+            continue
+        files.append(
+            (
+                path,
+                int(added) if added.isdigit() else None,
+                int(deleted) if deleted.isdigit() else None,
+            )
+        )
+    return files
+
+
+def _diff_priority(path: str, added: int | None) -> int:
+    """Sort key for a changed file: 0 = source, 1 = docs/data, 2 = generated."""
+    if added is None:
+        return 2  # Binary
+    parts = path.split("/")
+    name = parts[-1].lower()
+    if any(part in GENERATED_DIRS for part in parts[:-1]) or any(
+        fnmatch.fnmatch(name, pattern) for pattern in GENERATED_FILE_PATTERNS
+    ):
+        return 2
+    if any(fnmatch.fnmatch(name, pattern) for pattern in DOC_FILE_PATTERNS):
+        return 1
+    return 0
+
+
+def _stream_diff(
+    project_dir: Path,
+    commit_before: str,
+    commit_after: str,
+    ordered_paths: list[str],
+    budget: int,
+) -> tuple[str, int]:
+    """
+    Read `git diff` in the given file order until the budget is used up.
+
+    The diff is read line by line (never more than the remaining budget at
+    once) and git is stopped as soon as the budget runs out, so generated
+    files with hundreds of MB of changes are never held in memory.
+
+    Returns:
+        (diff text, number of files from ordered_paths whose patch is included)
+    """
+    # git diff -O takes glob patterns; one escaped pattern per path fixes the order
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".order", delete=False, encoding="utf-8"
+    ) as order_file:
+        order_file.write(
+            "\n".join(re.sub(r"([\\*?[])", r"\\\1", p) for p in ordered_paths)
+        )
+
+    included: list[bytes] = []
+    included_size = 0
+    current: list[bytes] = []
+    current_size = 0
+    files_done = 0
+    deadline = time.monotonic() + DIFF_TIMEOUT_SECONDS
+    process = None
+    try:
+        process = subprocess.Popen(
+            [
+                "git",
+                "diff",
+                "--no-renames",
+                "--no-color",
+                f"-O{order_file.name}",
+                commit_before,
+                commit_after,
+            ],
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        while True:
+            remaining = budget - included_size - current_size
+            line = process.stdout.readline(max(remaining, 0) + 1)
+            if not line:
+                # End of diff: the last file fits
+                if current:
+                    included.extend(current)
+                    files_done += 1
+                break
+            if line.startswith(b"diff --git ") and current:
+                included.extend(current)
+                included_size += current_size
+                files_done += 1
+                current, current_size = [], 0
+                remaining = budget - included_size
+            if len(line) > remaining or time.monotonic() > deadline:
+                if time.monotonic() > deadline:
+                    logger.warning("Git diff timed out, using partial diff")
+                # Out of budget: keep a truncated patch only if nothing fits
+                if not included:
+                    current.append(line[: max(remaining, 0)])
+                    current.append(b"\n... (truncated)\n")
+                    included.extend(current)
+                    files_done += 1
+                break
+            current.append(line)
+            current_size += len(line)
+    finally:
+        if process is not None:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+        os.unlink(order_file.name)
+
+    return b"".join(included).decode("utf-8", errors="replace"), files_done
+
+
+def _format_skipped_files(files: list[tuple[str, int | None, int | None]]) -> str:
+    """Summarize files left out of the diff, like `git diff --stat`."""
+    lines = [
+        f"... ({len(files)} more files not shown, diff limited to {MAX_DIFF_CHARS} chars)"
+    ]
+    for path, added, deleted in files[:MAX_SKIPPED_FILES_LISTED]:
+        if added is None:
+            lines.append(f" {path} | Bin")
+        else:
+            lines.append(f" {path} | {added + deleted} (+{added} -{deleted})")
+    if len(files) > MAX_SKIPPED_FILES_LISTED:
+        lines.append(f" ... and {len(files) - MAX_SKIPPED_FILES_LISTED} more")
+    return "\n".join(lines)
+
+
+def collect_session_changes(
     project_dir: Path,
     commit_before: str | None,
     commit_after: str | None,
-) -> str:
+) -> dict:
     """
-    Get the git diff between two commits.
+    Get the diff, changed files and commit messages of a session.
+
+    The changed files come from `git diff --numstat`. Patches are then
+    streamed in relevance order (source first; docs and data next;
+    generated, vendored, lock and binary files last) until MAX_DIFF_CHARS,
+    and the files that did not fit are listed with their line counts.
 
     Args:
         project_dir: Project root directory
@@ -79,38 +282,65 @@ def get_session_diff(
         commit_after: Commit hash after session (or None)
 
     Returns:
-        Diff text (truncated if too large)
+        Dict with diff, changed_files and commit_messages
     """
+    changes = {
+        "diff": "(No commits to diff)",
+        "changed_files": [],
+        "commit_messages": get_commit_messages(
+            project_dir, commit_before, commit_after
+        ),
+    }
     if not commit_before or not commit_after:
-        return "(No commits to diff)"
-
+        return changes
     if commit_before == commit_after:
-        return "(No changes - same commit)"
+        changes["diff"] = "(No changes - same commit)"
+        return changes
 
     try:
-        result = subprocess.run(
-            ["git", "diff", commit_before, commit_after],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=30,
+        files = _numstat(project_dir, commit_before, commit_after)
+        changes["changed_files"] = [path for path, _, _ in files]
+
+        ordered = sorted(files, key=lambda f: _diff_priority(f[0], f[1]))
+        diff, files_done = _stream_diff(
+            project_dir,
+            commit_before,
+            commit_after,
+            [path for path, _, _ in ordered],
+            MAX_DIFF_CHARS,
         )
-        diff = result.stdout
-
-        if len(diff) > MAX_DIFF_CHARS:
-            # Truncate and add note
-            diff = (
-                diff[:MAX_DIFF_CHARS] + f"\n\n... (truncated, {len(diff)} chars total)"
-            )
-
-        return diff if diff else "(Empty diff)"
+        skipped = ordered[files_done:]
+        if skipped:
+            diff = f"{diff}\n\n{_format_skipped_files(skipped)}".lstrip()
+        changes["diff"] = diff if diff else "(Empty diff)"
 
     except subprocess.TimeoutExpired:
         logger.warning("Git diff timed out")
-        return "(Git diff timed out)"
+        changes["diff"] = "(Git diff timed out)"
     except Exception as e:
         logger.warning(f"Failed to get git diff: {e}")
-        return f"(Failed to get diff: {e})"
+        changes["diff"] = f"(Failed to get diff: {e})"
+
+    return changes
+
+
+def get_session_diff(
+    project_dir: Path,
+    commit_before: str | None,
+    commit_after: str | None,
+) -> str:
+    """
+    Get the git diff between two commits.
+
+    Args:
+        project_dir: Project root directory
+        commit_before: Commit hash before session (or None)
+        commit_after: Commit hash after session (or None)
+
+    Returns:
+        Diff text (limited to MAX_DIFF_CHARS, see collect_session_changes())
+    """
+    return collect_session_changes(project_dir, commit_before, commit_after)["diff"]
 
 
 def get_changed_files(
@@ -133,15 +363,9 @@ def get_changed_files(
         return []
 
     try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", commit_before, commit_after],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-        return files
+        return [
+            path for path, _, _ in _numstat(project_dir, commit_before, commit_after)
+        ]
 
     except Exception as e:
         logger.warning(f"Failed to get changed files: {e}")
@@ -206,14 +430,8 @@ def gather_extraction_inputs(
     # Get subtask description from implementation plan
     subtask_description = _get_subtask_description(spec_dir, subtask_id)
 
-    # Get git diff
-    diff = get_session_diff(project_dir, commit_before, commit_after)
-
-    # Get changed files
-    changed_files = get_changed_files(project_dir, commit_before, commit_after)
-
-    # Get commit messages
-    commit_messages = get_commit_messages(project_dir, commit_before, commit_after)
+    # Get git diff, changed files and commit messages
+    changes = collect_session_changes(project_dir, commit_before, commit_after)
 
     # Get attempt history
     attempt_history = _get_attempt_history(recovery_manager, subtask_id)
@@ -223,9 +441,9 @@ def gather_extraction_inputs(
         "subtask_description": subtask_description,
         "session_num": session_num,
         "success": success,
-        "diff": diff,
-        "changed_files": changed_files,
-        "commit_messages": commit_messages,
+        "diff": changes["diff"],
+        "changed_files": changes["changed_files"],
+        "commit_messages": changes["commit_messages"],
         "attempt_history": attempt_history,
     }
 
@@ -7,6 +7,11 @@ Consolidates security scanning including secrets detection and SAST tools.
 This module integrates the existing scan_secrets.py and provides a unified
 interface for all security scanning.
 
+Scans run concurrently. Dependency audit results are cached in
+.auto-claude/security_scan_cache.json by a hash of the lockfiles, and Bandit
+findings by file content hash, so repeated QA iterations only re-run the
+scans whose inputs changed.
+
 The security scanner is used by:
 - QA Agent: To verify no secrets are committed
 - Validation Strategy: To run security scans for high-risk changes
@@ -23,21 +28,77 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import shutil
 import subprocess
-from dataclasses import dataclass, field
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 # Import the existing secrets scanner
 try:
-    from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
+    from security.scan_secrets import (
+        SecretMatch,
+        get_all_tracked_files,
+        scan_diff,
+        scan_files,
+    )
 
     HAS_SECRETS_SCANNER = True
 except ImportError:
     HAS_SECRETS_SCANNER = False
     SecretMatch = None
 
+# Scan cache, relative to the project directory
+SCAN_CACHE_FILE = Path(".auto-claude") / "security_scan_cache.json"
+
+# Audit results are reused while the lockfiles are unchanged, but advisory
+# databases keep growing, so they expire after a day
+AUDIT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Files whose contents key the cached dependency audit results
+NPM_AUDIT_LOCKFILES = [
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+]
+PIP_AUDIT_LOCKFILES = [
+    "requirements*.txt",
+    "poetry.lock",
+    "Pipfile.lock",
+    "uv.lock",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+]
+# Requirements files pip-audit audits directly (-r); without them it audits
+# the installed environment it runs in
+PIP_AUDIT_REQUIREMENTS = "requirements*.txt"
+
+# Directories bandit skips by default when scanning recursively
+BANDIT_EXCLUDED_DIRS = {
+    ".svn",
+    "CVS",
+    ".bzr",
+    ".hg",
+    ".git",
+    "__pycache__",
+    ".tox",
+    ".eggs",
+}
+
+# Files per bandit invocation (keeps command lines short)
+BANDIT_BATCH_SIZE = 200
+
 
 # =============================================================================
 # DATA CLASSES
@@ -88,6 +149,135 @@ class SecurityScanResult:
     should_block_qa: bool = False
 
 
+# =============================================================================
+# SCAN CACHE
+# =============================================================================
+
+
+def hash_files(project_dir: Path, patterns: list[str]) -> str:
+    """Hash the names and contents of the project files matching patterns."""
+    hasher = hashlib.sha256()
+    paths = sorted({p for pattern in patterns for p in project_dir.glob(pattern)})
+    for path in paths:
+        if path.is_file():
+            hasher.update(path.relative_to(project_dir).as_posix().encode())
+            hasher.update(b"\0")
+            hasher.update(hashlib.sha256(path.read_bytes()).digest())
+    return hasher.hexdigest()
+
+
+def python_environment_key(executable: str | None) -> str | None:
+    """
+    Key of the packages installed in the environment of a Python tool.
+
+    Installing or removing a package changes the mtime of site-packages.
+    Returns None if the environment can't be located.
+    """
+    if not executable:
+        return None
+    env_dir = Path(executable).resolve().parent.parent
+    site_dirs = sorted(
+        [*env_dir.glob("lib/python*/site-packages"), env_dir / "Lib" / "site-packages"]
+    )
+    stamps = []
+    for site_dir in site_dirs:
+        try:
+            stamps.append(f"{site_dir}:{site_dir.stat().st_mtime_ns}")
+        except OSError:
+            continue
+    return "\n".join(stamps) or None
+
+
+class SecurityScanCache:
+    """
+    On-disk cache of dependency audit and Bandit results for one project.
+
+    Audit results are keyed by a hash of the lockfiles (plus the installed
+    packages when pip-audit audits its environment), Bandit findings by the
+    content hash of each Python file (and the Bandit version), so repeated QA
+    iterations only re-run what changed. The cache is a JSON file written
+    atomically on every update; a missing or corrupt file is an empty cache.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] | None = None
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            data: dict[str, Any] = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+            if not isinstance(data, dict) or data.get("version") != self.VERSION:
+                data = {"version": self.VERSION}
+            data.setdefault("audits", {})
+            data.setdefault("bandit", {"version": None, "files": {}})
+            self._data = data
+        return self._data
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def get_audit(self, tool: str, key: str) -> list[SecurityVulnerability] | None:
+        """Cached findings of an audit tool, or None if stale or missing."""
+        with self._lock:
+            entry = self._load()["audits"].get(tool)
+        if (
+            not entry
+            or entry.get("key") != key
+            or time.time() - entry.get("created_at", 0) > AUDIT_CACHE_TTL_SECONDS
+        ):
+            return None
+        return [SecurityVulnerability(**v) for v in entry.get("vulnerabilities", [])]
+
+    def put_audit(
+        self, tool: str, key: str, vulnerabilities: list[SecurityVulnerability]
+    ) -> None:
+        """Store the findings of an audit tool for a lockfile hash."""
+        with self._lock:
+            self._load()["audits"][tool] = {
+                "key": key,
+                "created_at": time.time(),
+                "vulnerabilities": [asdict(v) for v in vulnerabilities],
+            }
+            self._save()
+
+    def get_bandit_findings(
+        self, version: str, file_hashes: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Cached Bandit findings by file content hash (missing hashes left out)."""
+        with self._lock:
+            bandit = self._load()["bandit"]
+            if bandit.get("version") != version:
+                return {}
+            files = bandit["files"]
+            return {h: files[h] for h in file_hashes if h in files}
+
+    def put_bandit_findings(
+        self, version: str, findings: dict[str, list[dict[str, Any]]]
+    ) -> None:
+        """
+        Replace the cached Bandit findings.
+
+        findings holds every file of the latest scan, so the findings of
+        deleted and since-changed files are dropped.
+        """
+        with self._lock:
+            self._load()["bandit"] = {"version": version, "files": findings}
+            self._save()
+
+
 # =============================================================================
 # SECURITY SCANNER
 # =============================================================================
@@ -101,12 +291,27 @@ class SecurityScanner:
     - scan_secrets.py for secrets detection
     - Bandit for Python SAST (if available)
     - npm audit for JavaScript vulnerabilities (if applicable)
+    - pip-audit for Python dependencies (if available)
+
+    The scans run concurrently. Dependency audit results are cached by a hash
+    of the lockfiles and Bandit findings by file content hash (see
+    SecurityScanCache), so unchanged dependencies aren't audited again and
+    only changed Python files are re-analyzed.
     """
 
-    def __init__(self) -> None:
-        """Initialize the security scanner."""
+    def __init__(self, use_cache: bool = True) -> None:
+        """
+        Initialize the security scanner.
+
+        Args:
+            use_cache: Whether to reuse cached audit and Bandit results
+        """
         self._bandit_available: bool | None = None
+        self._bandit_version: str | None = None
         self._npm_available: bool | None = None
+        self.use_cache = use_cache
+        self._caches: dict[Path, SecurityScanCache] = {}
+        self._caches_lock = threading.Lock()
 
     def scan(
         self,
@@ -116,6 +321,7 @@ class SecurityScanner:
         run_secrets: bool = True,
         run_sast: bool = True,
         run_dependency_audit: bool = True,
+        base_branch: str | None = None,
     ) -> SecurityScanResult:
         """
         Run all applicable security scans.
@@ -127,6 +333,8 @@ class SecurityScanner:
             run_secrets: Whether to run secrets scanning
             run_sast: Whether to run SAST tools
             run_dependency_audit: Whether to run dependency audits
+            base_branch: If set, the secrets scan only checks lines added in
+                the working tree since this branch (plus context)
 
         Returns:
             SecurityScanResult with all findings
@@ -134,17 +342,21 @@ class SecurityScanner:
         project_dir = Path(project_dir)
         result = SecurityScanResult()
 
-        # Run secrets scan
+        scans: list[Callable[[SecurityScanResult], None]] = []
         if run_secrets:
-            self._run_secrets_scan(project_dir, changed_files, result)
-
-        # Run SAST based on project type
+            scans.append(
+                partial(
+                    self._run_secrets_scan,
+                    project_dir,
+                    changed_files,
+                    base_branch=base_branch,
+                )
+            )
         if run_sast:
-            self._run_sast_scans(project_dir, result)
-
-        # Run dependency audits
+            scans.append(partial(self._run_sast_scans, project_dir))
         if run_dependency_audit:
-            self._run_dependency_audits(project_dir, result)
+            scans.extend(self._dependency_audit_scans(project_dir))
+        self._run_concurrently(scans, result)
 
         # Determine if should block QA
         result.has_critical_issues = (
@@ -163,11 +375,49 @@ class SecurityScanner:
 
         return result
 
+    def _run_concurrently(
+        self,
+        scans: list[Callable[[SecurityScanResult], None]],
+        result: SecurityScanResult,
+    ) -> None:
+        """Run scans in parallel threads and merge their findings in order."""
+        if not scans:
+            return
+
+        scan_results = [SecurityScanResult() for _ in scans]
+        # The scans mostly wait on subprocesses, so threads are enough
+        with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            futures = [
+                executor.submit(scan, scan_result)
+                for scan, scan_result in zip(scans, scan_results)
+            ]
+        for future, scan_result in zip(futures, scan_results):
+            try:
+                future.result()
+            except Exception as e:
+                scan_result.scan_errors.append(f"Scan error: {str(e)}")
+            result.secrets.extend(scan_result.secrets)
+            result.vulnerabilities.extend(scan_result.vulnerabilities)
+            result.scan_errors.extend(scan_result.scan_errors)
+
+    def _get_cache(self, project_dir: Path) -> SecurityScanCache | None:
+        """Get the scan cache of a project (None if caching is disabled)."""
+        if not self.use_cache:
+            return None
+        key = project_dir.resolve()
+        with self._caches_lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                cache = SecurityScanCache(key / SCAN_CACHE_FILE)
+                self._caches[key] = cache
+            return cache
+
     def _run_secrets_scan(
         self,
         project_dir: Path,
         changed_files: list[str] | None,
         result: SecurityScanResult,
+        base_branch: str | None = None,
     ) -> None:
         """Run secrets scanning using scan_secrets.py."""
         if not HAS_SECRETS_SCANNER:
@@ -175,14 +425,22 @@ class SecurityScanner:
             return
 
         try:
-            # Get files to scan
-            if changed_files:
-                files_to_scan = changed_files
-            else:
-                files_to_scan = get_all_tracked_files()
+            matches = None
+            if base_branch:
+                # Only the lines added since the base branch
+                matches = scan_diff(
+                    project_dir, base_ref=base_branch, files=changed_files or None
+                )
 
-            # Run scan
-            matches = scan_files(files_to_scan, project_dir)
+            if matches is None:
+                # Get files to scan
+                if changed_files:
+                    files_to_scan = changed_files
+                else:
+                    files_to_scan = get_all_tracked_files()
+
+                # Run scan
+                matches = scan_files(files_to_scan, project_dir)
 
             # Convert matches to result format
             for match in matches:
@@ -233,23 +491,115 @@ class SecurityScanner:
                     candidate_path.exists()
                     and (candidate_path / "__init__.py").exists()
                 ):
-                    src_dirs.append(str(candidate_path))
+                    src_dirs.append(candidate)
 
             if not src_dirs:
                 # Try to find any Python files
-                py_files = list(project_dir.glob("**/*.py"))
-                if not py_files:
-                    return
                 src_dirs = ["."]
 
-            # Run bandit
+            py_files = self._find_python_files(project_dir, src_dirs)
+            if not py_files:
+                return
+
+            file_hashes = {
+                path: hashlib.sha256((project_dir / path).read_bytes()).hexdigest()
+                for path in py_files
+            }
+            version = self._bandit_version or ""
+            cache = self._get_cache(project_dir)
+            cached = (
+                cache.get_bandit_findings(version, list(file_hashes.values()))
+                if cache
+                else {}
+            )
+
+            # Only files whose content changed are analyzed again
+            findings = {
+                path: cached[file_hash]
+                for path, file_hash in file_hashes.items()
+                if file_hash in cached
+            }
+            to_scan = [path for path in py_files if path not in findings]
+            if to_scan:
+                findings.update(self._run_bandit_on_files(project_dir, to_scan, result))
+                if cache:
+                    cache.put_bandit_findings(
+                        version,
+                        {
+                            file_hashes[path]: file_findings
+                            for path, file_findings in findings.items()
+                            if path in file_hashes
+                        },
+                    )
+
+            for path in sorted(findings):
+                for finding in findings[path]:
+                    severity = finding.get("issue_severity", "MEDIUM").lower()
+                    if severity == "high":
+                        severity = "high"
+                    elif severity == "medium":
+                        severity = "medium"
+                    else:
+                        severity = "low"
+
+                    result.vulnerabilities.append(
+                        SecurityVulnerability(
+                            severity=severity,
+                            source="bandit",
+                            title=finding.get("issue_text", "Unknown issue"),
+                            description=finding.get("issue_text", ""),
+                            file=path,
+                            line=finding.get("line_number"),
+                            cwe=(finding.get("issue_cwe") or {}).get("id"),
+                        )
+                    )
+
+        except subprocess.TimeoutExpired:
+            result.scan_errors.append("Bandit scan timed out")
+        except FileNotFoundError:
+            result.scan_errors.append("Bandit not found")
+        except Exception as e:
+            result.scan_errors.append(f"Bandit error: {str(e)}")
+
+    def _find_python_files(self, project_dir: Path, src_dirs: list[str]) -> list[str]:
+        """List the Python files bandit -r would scan, relative to project_dir."""
+        py_files = set()
+        for src_dir in src_dirs:
+            for root, dirnames, filenames in os.walk(project_dir / src_dir):
+                dirnames[:] = [
+                    d
+                    for d in dirnames
+                    if d not in BANDIT_EXCLUDED_DIRS and not d.endswith(".egg")
+                ]
+                for filename in filenames:
+                    if filename.endswith(".py"):
+                        py_files.add(
+                            os.path.normpath(
+                                os.path.relpath(
+                                    os.path.join(root, filename), project_dir
+                                )
+                            )
+                        )
+        return sorted(py_files)
+
+    def _run_bandit_on_files(
+        self, project_dir: Path, files: list[str], result: SecurityScanResult
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Run Bandit on specific files.
+
+        Returns:
+            Findings by file for the files Bandit analyzed without errors
+        """
+        findings: dict[str, list[dict[str, Any]]] = {}
+        for i in range(0, len(files), BANDIT_BATCH_SIZE):
+            batch = files[i : i + BANDIT_BATCH_SIZE]
             cmd = [
                 "bandit",
-                "-r",
-                *src_dirs,
                 "-f",
                 "json",
                 "--exit-zero",  # Don't fail on findings
+                *batch,
             ]
 
             proc = subprocess.run(
@@ -260,53 +610,87 @@ class SecurityScanner:
                 timeout=120,
             )
 
-            if proc.stdout:
-                try:
-                    bandit_output = json.loads(proc.stdout)
-                    for finding in bandit_output.get("results", []):
-                        severity = finding.get("issue_severity", "MEDIUM").lower()
-                        if severity == "high":
-                            severity = "high"
-                        elif severity == "medium":
-                            severity = "medium"
-                        else:
-                            severity = "low"
-
-                        result.vulnerabilities.append(
-                            SecurityVulnerability(
-                                severity=severity,
-                                source="bandit",
-                                title=finding.get("issue_text", "Unknown issue"),
-                                description=finding.get("issue_text", ""),
-                                file=finding.get("filename"),
-                                line=finding.get("line_number"),
-                                cwe=finding.get("issue_cwe", {}).get("id"),
-                            )
-                        )
-                except json.JSONDecodeError:
-                    result.scan_errors.append("Failed to parse Bandit output")
+            if not proc.stdout:
+                continue
+            try:
+                bandit_output = json.loads(proc.stdout)
+            except json.JSONDecodeError:
+                result.scan_errors.append("Failed to parse Bandit output")
+                continue
+
+            batch_findings: dict[str, list[dict[str, Any]]] = {
+                path: [] for path in batch
+            }
+            for finding in bandit_output.get("results", []):
+                path = os.path.normpath(finding.get("filename", ""))
+                batch_findings.setdefault(path, []).append(
+                    {
+                        "issue_severity": finding.get("issue_severity", "MEDIUM"),
+                        "issue_text": finding.get("issue_text", "Unknown issue"),
+                        "line_number": finding.get("line_number"),
+                        "issue_cwe": finding.get("issue_cwe") or {},
+                    }
+                )
+            # Files Bandit couldn't analyze are retried on the next scan
+            for error in bandit_output.get("errors", []):
+                batch_findings.pop(os.path.normpath(error.get("filename", "")), None)
+            findings.update(batch_findings)
+        return findings
+
+    def _dependency_audit_scans(
+        self, project_dir: Path
+    ) -> list[Callable[[SecurityScanResult], None]]:
+        """Get the dependency audits that apply to a project."""
+        scans: list[Callable[[SecurityScanResult], None]] = []
 
-        except subprocess.TimeoutExpired:
-            result.scan_errors.append("Bandit scan timed out")
-        except FileNotFoundError:
-            result.scan_errors.append("Bandit not found")
-        except Exception as e:
-            result.scan_errors.append(f"Bandit error: {str(e)}")
+        # npm audit for JavaScript projects
+        if (project_dir / "package.json").exists():
+            scans.append(partial(self._run_npm_audit, project_dir))
+
+        # pip-audit for Python projects (if available)
+        if self._is_python_project(project_dir):
+            scans.append(partial(self._run_pip_audit, project_dir))
+
+        return scans
 
     def _run_dependency_audits(
         self, project_dir: Path, result: SecurityScanResult
     ) -> None:
         """Run dependency vulnerability audits."""
-        # npm audit for JavaScript projects
-        if (project_dir / "package.json").exists():
-            self._run_npm_audit(project_dir, result)
+        self._run_concurrently(self._dependency_audit_scans(project_dir), result)
 
-        # pip-audit for Python projects (if available)
-        if self._is_python_project(project_dir):
-            self._run_pip_audit(project_dir, result)
+    def _get_cached_audit(
+        self,
+        project_dir: Path,
+        tool: str,
+        lockfiles: list[str],
+        environment_key: str = "",
+    ) -> tuple[SecurityScanCache | None, str, list[SecurityVulnerability] | None]:
+        """
+        Look up the cached results of an audit tool for the current lockfiles.
+
+        environment_key is added to the key of audits of installed packages.
+        """
+        cache = self._get_cache(project_dir)
+        if cache is None:
+            return None, "", None
+        try:
+            key = hash_files(project_dir, lockfiles)
+        except OSError:
+            return None, "", None
+        if environment_key:
+            key = hashlib.sha256(f"{key}\n{environment_key}".encode()).hexdigest()
+        return cache, key, cache.get_audit(tool, key)
 
     def _run_npm_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
         """Run npm audit for JavaScript projects."""
+        cache, key, cached = self._get_cached_audit(
+            project_dir, "npm_audit", NPM_AUDIT_LOCKFILES
+        )
+        if cached is not None:
+            result.vulnerabilities.extend(cached)
+            return
+
         try:
             cmd = ["npm", "audit", "--json"]
 
@@ -321,36 +705,40 @@ class SecurityScanner:
             if proc.stdout:
                 try:
                     audit_output = json.loads(proc.stdout)
-
-                    # npm audit v2+ format
-                    vulnerabilities = audit_output.get("vulnerabilities", {})
-                    for pkg_name, vuln_info in vulnerabilities.items():
-                        severity = vuln_info.get("severity", "moderate")
-                        if severity == "critical":
-                            severity = "critical"
-                        elif severity == "high":
-                            severity = "high"
-                        elif severity == "moderate":
-                            severity = "medium"
-                        else:
-                            severity = "low"
-
-                        result.vulnerabilities.append(
-                            SecurityVulnerability(
-                                severity=severity,
-                                source="npm_audit",
-                                title=f"Vulnerable dependency: {pkg_name}",
-                                description=vuln_info.get("via", [{}])[0].get(
-                                    "title", ""
-                                )
-                                if isinstance(vuln_info.get("via"), list)
-                                and vuln_info.get("via")
-                                else str(vuln_info.get("via", "")),
-                                file="package.json",
-                            )
-                        )
                 except json.JSONDecodeError:
-                    pass  # npm audit may return invalid JSON on no findings
+                    return  # npm audit may return invalid JSON on no findings
+
+                found = []
+                # npm audit v2+ format
+                vulnerabilities = audit_output.get("vulnerabilities", {})
+                for pkg_name, vuln_info in vulnerabilities.items():
+                    severity = vuln_info.get("severity", "moderate")
+                    if severity == "critical":
+                        severity = "critical"
+                    elif severity == "high":
+                        severity = "high"
+                    elif severity == "moderate":
+                        severity = "medium"
+                    else:
+                        severity = "low"
+
+                    found.append(
+                        SecurityVulnerability(
+                            severity=severity,
+                            source="npm_audit",
+                            title=f"Vulnerable dependency: {pkg_name}",
+                            description=vuln_info.get("via", [{}])[0].get("title", "")
+                            if isinstance(vuln_info.get("via"), list)
+                            and vuln_info.get("via")
+                            else str(vuln_info.get("via", "")),
+                            file="package.json",
+                        )
+                    )
+                result.vulnerabilities.extend(found)
+
+                # Failed audits (e.g. registry unreachable) report an error
+                if cache and "error" not in audit_output:
+                    cache.put_audit("npm_audit", key, found)
 
         except subprocess.TimeoutExpired:
             result.scan_errors.append("npm audit timed out")
@@ -361,8 +749,31 @@ class SecurityScanner:
 
     def _run_pip_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
         """Run pip-audit for Python projects (if available)."""
+        requirements = sorted(
+            p.relative_to(project_dir).as_posix()
+            for p in project_dir.glob(PIP_AUDIT_REQUIREMENTS)
+            if p.is_file()
+        )
+        environment_key = ""
+        if not requirements:
+            # Audits the installed environment: its packages are part of the key
+            # (not cached if the environment can't be located)
+            environment_key = python_environment_key(shutil.which("pip-audit"))
+        cache, key, cached = (
+            self._get_cached_audit(
+                project_dir, "pip_audit", PIP_AUDIT_LOCKFILES, environment_key
+            )
+            if environment_key is not None
+            else (None, "", None)
+        )
+        if cached is not None:
+            result.vulnerabilities.extend(cached)
+            return
+
         try:
             cmd = ["pip-audit", "--format", "json"]
+            for requirements_file in requirements:
+                cmd += ["-r", requirements_file]
 
             proc = subprocess.run(
                 cmd,
@@ -375,22 +786,27 @@ class SecurityScanner:
             if proc.stdout:
                 try:
                     audit_output = json.loads(proc.stdout)
-                    for vuln in audit_output:
-                        severity = "high" if vuln.get("fix_versions") else "medium"
-
-                        result.vulnerabilities.append(
-                            SecurityVulnerability(
-                                severity=severity,
-                                source="pip_audit",
-                                title=f"Vulnerable package: {vuln.get('name')}",
-                                description=vuln.get("description", ""),
-                                cwe=vuln.get("aliases", [""])[0]
-                                if vuln.get("aliases")
-                                else None,
-                            )
-                        )
                 except json.JSONDecodeError:
-                    pass
+                    return
+
+                found = []
+                for vuln in audit_output:
+                    severity = "high" if vuln.get("fix_versions") else "medium"
+
+                    found.append(
+                        SecurityVulnerability(
+                            severity=severity,
+                            source="pip_audit",
+                            title=f"Vulnerable package: {vuln.get('name')}",
+                            description=vuln.get("description", ""),
+                            cwe=vuln.get("aliases", [""])[0]
+                            if vuln.get("aliases")
+                            else None,
+                        )
+                    )
+                result.vulnerabilities.extend(found)
+                if cache:
+                    cache.put_audit("pip_audit", key, found)
 
         except FileNotFoundError:
             pass  # pip-audit not available
@@ -413,12 +829,16 @@ class SecurityScanner:
         """Check if Bandit is available."""
         if self._bandit_available is None:
             try:
-                subprocess.run(
+                proc = subprocess.run(
                     ["bandit", "--version"],
                     capture_output=True,
+                    text=True,
                     timeout=5,
                 )
                 self._bandit_available = True
+                # Cached Bandit findings are only valid for the same version
+                lines = (proc.stdout or "").splitlines()
+                self._bandit_version = lines[0].strip() if lines else ""
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 self._bandit_available = False
         return self._bandit_available
@@ -487,6 +907,7 @@ def scan_for_security_issues(
     project_dir: Path,
     spec_dir: Path | None = None,
     changed_files: list[str] | None = None,
+    base_branch: str | None = None,
 ) -> SecurityScanResult:
     """
     Convenience function to run security scan.
@@ -495,12 +916,13 @@ def scan_for_security_issues(
         project_dir: Path to project root
         spec_dir: Optional spec directory to save results
         changed_files: Optional list of files to scan
+        base_branch: Optional branch to scan added lines against (secrets)
 
     Returns:
         SecurityScanResult with all findings
     """
     scanner = SecurityScanner()
-    return scanner.scan(project_dir, spec_dir, changed_files)
+    return scanner.scan(project_dir, spec_dir, changed_files, base_branch=base_branch)
 
 
 def has_security_issues(project_dir: Path) -> bool:
@@ -558,15 +980,25 @@ def main() -> None:
         "--secrets-only", action="store_true", help="Only scan for secrets"
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run audits and Bandit instead of using cached results",
+    )
+    parser.add_argument(
+        "--base-branch",
+        help="Only scan lines added since this branch for secrets",
+    )
 
     args = parser.parse_args()
 
-    scanner = SecurityScanner()
+    scanner = SecurityScanner(use_cache=not args.no_cache)
     result = scanner.scan(
         args.project_dir,
         spec_dir=args.spec_dir,
         run_sast=not args.secrets_only,
         run_dependency_audit=not args.secrets_only,
+        base_branch=args.base_branch,
     )
 
     if args.json:
@@ -12,6 +12,10 @@ The test discovery results are used by:
 - Test Creator: To know what framework to use when creating tests
 - Planner: To include correct test commands in verification strategy
 
+Detector results are cached under .auto-claude/ keyed by the signatures of
+the manifests and directories each detector read (see discovery_cache), so
+only detectors whose inputs changed run again in a new process.
+
 Usage:
     from test_discovery import TestDiscovery
 
@@ -25,10 +29,16 @@ Usage:
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
+from .analyzers.base import SKIP_DIRS
+from .discovery_cache import DiscoveryCache, path_signature
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -182,6 +192,38 @@ FRAMEWORK_PATTERNS = {
 }
 
 
+# Top-level directories that hold tests
+TEST_DIR_NAMES = ["tests", "test", "spec", "__tests__", "specs"]
+TEST_DIR_GLOB = "test_*"
+
+# Test file names, searched for across the project
+TEST_FILE_PATTERNS = [
+    "test_*.py",
+    "*_test.py",
+    "*.test.js",
+    "*.test.ts",
+    "*.test.tsx",
+    "*.spec.js",
+    "*.spec.ts",
+    "*.spec.tsx",
+    "test_*.go",
+    "*_test.go",
+    "*_test.rs",
+]
+# RSpec files only count inside a spec/ directory
+RSPEC_FILE_PATTERN = "*_spec.rb"
+
+# Files whose presence marks a Python project
+PYTHON_INDICATORS = [
+    "pyproject.toml",
+    "requirements.txt",
+    "setup.py",
+    "pytest.ini",
+    "conftest.py",
+    "tests/conftest.py",
+]
+
+
 # =============================================================================
 # TEST DISCOVERY
 # =============================================================================
@@ -199,8 +241,14 @@ class TestDiscovery:
 
     __test__ = False  # Prevent pytest from collecting this as a test class
 
-    def __init__(self) -> None:
-        """Initialize the test discovery."""
+    def __init__(self, use_cache: bool = True) -> None:
+        """
+        Initialize the test discovery.
+
+        Args:
+            use_cache: Reuse detector results stored under .auto-claude/
+        """
+        self.use_cache = use_cache
         self._cache: dict[str, TestDiscoveryResult] = {}
 
     def discover(self, project_dir: Path) -> TestDiscoveryResult:
@@ -219,39 +267,71 @@ class TestDiscovery:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        disk_cache = (
+            DiscoveryCache.open(project_dir, "test_discovery")
+            if self.use_cache
+            else None
+        )
         result = TestDiscoveryResult()
 
         # Detect package manager
         result.package_manager = self._detect_package_manager(project_dir)
 
+        # Find test directories and test files (one pass over the project)
+        result.test_directories, result.has_tests = self._scan_test_tree(
+            project_dir, disk_cache
+        )
+
         # Discover frameworks based on project type
         if (project_dir / "package.json").exists():
-            self._discover_js_frameworks(project_dir, result)
+            js_config_files = [
+                cf
+                for pattern in FRAMEWORK_PATTERNS.values()
+                if "package_key" in pattern
+                for cf in pattern["config_files"]
+            ]
+            self._run_detector(
+                "javascript",
+                self._discover_js_frameworks,
+                ["package.json", *js_config_files],
+                {"package_manager": result.package_manager},
+                project_dir,
+                result,
+                disk_cache,
+            )
 
         # Check for Python project indicators
-        python_indicators = [
-            project_dir / "pyproject.toml",
-            project_dir / "requirements.txt",
-            project_dir / "setup.py",
-            project_dir / "pytest.ini",
-            project_dir / "conftest.py",
-            project_dir / "tests" / "conftest.py",
-        ]
-        if any(p.exists() for p in python_indicators):
-            self._discover_python_frameworks(project_dir, result)
+        if any((project_dir / p).exists() for p in PYTHON_INDICATORS):
+            self._run_detector(
+                "python",
+                self._discover_python_frameworks,
+                PYTHON_INDICATORS,
+                {
+                    "frameworks": [f.name for f in result.frameworks],
+                    "has_test_directories": bool(result.test_directories),
+                },
+                project_dir,
+                result,
+                disk_cache,
+            )
 
         if (project_dir / "Cargo.toml").exists():
             self._discover_rust_frameworks(project_dir, result)
         if (project_dir / "go.mod").exists():
             self._discover_go_frameworks(project_dir, result)
         if (project_dir / "Gemfile").exists():
-            self._discover_ruby_frameworks(project_dir, result)
-
-        # Find test directories
-        result.test_directories = self._find_test_directories(project_dir)
+            self._run_detector(
+                "ruby",
+                self._discover_ruby_frameworks,
+                ["Gemfile", ".rspec"],
+                None,
+                project_dir,
+                result,
+                disk_cache,
+            )
 
-        # Check if tests exist
-        result.has_tests = self._has_test_files(project_dir, result.test_directories)
+        if disk_cache is not None:
+            disk_cache.save()
 
         # Set primary test command
         if result.frameworks:
@@ -267,6 +347,45 @@ class TestDiscovery:
         self._cache[cache_key] = result
         return result
 
+    def _run_detector(
+        self,
+        name: str,
+        detect: Callable[[Path, TestDiscoveryResult], None],
+        files: list[str],
+        inputs: Any,
+        project_dir: Path,
+        result: TestDiscoveryResult,
+        disk_cache: DiscoveryCache | None,
+    ) -> None:
+        """
+        Run a framework detector, or reuse the frameworks it found last time.
+
+        Args:
+            name: Cache entry of the detector
+            detect: Detector adding its frameworks to the result
+            files: Files the detector reads or checks for
+            inputs: Earlier results the detector depends on
+            project_dir: Path to the project root
+            result: Result to add the frameworks to
+            disk_cache: Persistent cache, or None to always run the detector
+        """
+        if disk_cache is None:
+            detect(project_dir, result)
+            return
+
+        hit, frameworks = disk_cache.get(name, inputs)
+        if hit:
+            result.frameworks.extend(TestFramework(**f) for f in frameworks)
+            return
+
+        # Taken before detecting, so edits made meanwhile invalidate the entry
+        deps = disk_cache.signatures(files)
+        start = len(result.frameworks)
+        detect(project_dir, result)
+        disk_cache.put(
+            name, [asdict(f) for f in result.frameworks[start:]], deps, inputs
+        )
+
     def _detect_package_manager(self, project_dir: Path) -> str:
         """Detect the package manager used by the project."""
         if (project_dir / "pnpm-lock.yaml").exists():
@@ -447,8 +566,7 @@ class TestDiscovery:
 
         # Fall back to unittest if test files exist but no framework detected
         if not result.frameworks:
-            test_dirs = self._find_test_directories(project_dir)
-            if test_dirs:
+            if result.test_directories:
                 result.frameworks.append(
                     TestFramework(
                         name="unittest",
@@ -517,63 +635,94 @@ class TestDiscovery:
                 )
             )
 
-    def _find_test_directories(self, project_dir: Path) -> list[str]:
-        """Find test directories in the project."""
-        test_dir_patterns = [
-            "tests",
-            "test",
-            "spec",
-            "__tests__",
-            "specs",
-            "test_*",
-        ]
-
-        found_dirs = []
-        for pattern in test_dir_patterns:
-            if pattern.endswith("*"):
-                # Glob pattern
-                for d in project_dir.glob(pattern):
-                    if d.is_dir():
-                        found_dirs.append(str(d.relative_to(project_dir)))
+    def _scan_test_tree(
+        self, project_dir: Path, disk_cache: DiscoveryCache | None
+    ) -> tuple[list[str], bool]:
+        """
+        Find the test directories and whether any test files exist.
+
+        A cached result with a test file stays valid while that file exists
+        and the top-level entries are unchanged; one without test files while
+        no searched directory gains or loses entries.
+        """
+        if disk_cache is not None:
+            hit, value = disk_cache.get("test_tree")
+            if hit:
+                return value["test_directories"], value["has_tests"]
+
+        dir_signatures: dict[str, Any] = {}
+        test_directories, test_file = self._walk_test_tree(project_dir, dir_signatures)
+
+        if disk_cache is not None and "." in dir_signatures:
+            if test_file:
+                deps = {".": dir_signatures["."], **disk_cache.signatures([test_file])}
             else:
-                # Exact name
-                test_dir = project_dir / pattern
-                if test_dir.is_dir():
-                    found_dirs.append(pattern)
-
-        return found_dirs
-
-    def _has_test_files(self, project_dir: Path, test_directories: list[str]) -> bool:
-        """Check if any test files exist."""
-        test_file_patterns = [
-            "**/test_*.py",
-            "**/*_test.py",
-            "**/*.test.js",
-            "**/*.test.ts",
-            "**/*.test.tsx",
-            "**/*.spec.js",
-            "**/*.spec.ts",
-            "**/*.spec.tsx",
-            "**/test_*.go",
-            "**/*_test.go",
-            "**/*_test.rs",
-            "**/spec/**/*_spec.rb",
-        ]
-
-        # Check in test directories
-        for test_dir in test_directories:
-            test_path = project_dir / test_dir
-            if test_path.exists():
-                for pattern in test_file_patterns:
-                    if list(test_path.glob(pattern.replace("**/", ""))):
-                        return True
-
-        # Check project-wide
-        for pattern in test_file_patterns:
-            if list(project_dir.glob(pattern)):
-                return True
-
-        return False
+                deps = dir_signatures
+            disk_cache.put(
+                "test_tree",
+                {"test_directories": test_directories, "has_tests": bool(test_file)},
+                deps,
+            )
+        return test_directories, test_file is not None
+
+    def _walk_test_tree(
+        self, project_dir: Path, dir_signatures: dict[str, Any]
+    ) -> tuple[list[str], str | None]:
+        """
+        Walk the project once for test directories and a test file.
+
+        The top-level directories are matched against the test directory
+        names, then the tree (minus SKIP_DIRS) is searched until the first
+        test file. The signature of every listed directory is recorded in
+        dir_signatures, taken before listing it.
+
+        Returns:
+            (test directories, relative path of a test file or None)
+        """
+        named_dirs: list[str] = []
+        globbed_dirs: list[str] = []
+        test_file = None
+
+        # (directory, whether it is inside a spec/ directory)
+        stack = [(project_dir, False)]
+        while stack and test_file is None:
+            directory, in_spec = stack.pop()
+            rel_dir = directory.relative_to(project_dir).as_posix()
+            signature = path_signature(directory)
+            if signature is None:
+                continue
+            dir_signatures[rel_dir] = signature
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    if directory == project_dir:
+                        if entry.name in TEST_DIR_NAMES:
+                            named_dirs.append(entry.name)
+                        elif fnmatch(entry.name, TEST_DIR_GLOB):
+                            globbed_dirs.append(entry.name)
+                    if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                        stack.append(
+                            (Path(entry.path), in_spec or entry.name == "spec")
+                        )
+                elif test_file is None and self._is_test_file(entry.name, in_spec):
+                    test_file = Path(entry.path).relative_to(project_dir).as_posix()
+
+        named_dirs.sort(key=TEST_DIR_NAMES.index)
+        return named_dirs + sorted(globbed_dirs), test_file
+
+    def _is_test_file(self, name: str, in_spec: bool) -> bool:
+        """Check if a file name is a test file name."""
+        if in_spec and fnmatch(name, RSPEC_FILE_PATTERN):
+            return True
+        return any(fnmatch(name, pattern) for pattern in TEST_FILE_PATTERNS)
 
     def to_dict(self, result: TestDiscoveryResult) -> dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
@@ -42,6 +42,7 @@ from .workspace_commands import (
     handle_discard_command,
     handle_list_worktrees_command,
     handle_merge_command,
+    handle_merge_readiness_command,
     handle_review_command,
 )
 
@@ -190,6 +191,11 @@ Environment Variables:
         action="store_true",
         help="Preview merge conflicts without actually merging (returns JSON)",
     )
+    parser.add_argument(
+        "--merge-readiness",
+        action="store_true",
+        help="Check all spec branches for merge conflicts with the base branch (returns JSON)",
+    )
 
     # QA options
     parser.add_argument(
@@ -338,6 +344,17 @@ def _run_cli() -> None:
         handle_list_worktrees_command(project_dir)
         return
 
+    # Handle --merge-readiness command
+    if args.merge_readiness:
+        import json
+
+        result = handle_merge_readiness_command(
+            project_dir, base_branch=args.base_branch
+        )
+        # Output as JSON for the UI to parse
+        print(json.dumps(result))
+        return
+
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
         handle_cleanup_worktrees_command(project_dir)
@@ -15,8 +15,8 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
+from core.workspace.conflict_precheck import check_git_conflicts_bulk
 from core.workspace.git_utils import (
-    _is_auto_claude_file,
     apply_path_mapping,
     detect_file_renames,
     get_file_content_from_ref,
@@ -536,19 +536,48 @@ def handle_cleanup_worktrees_command(project_dir: Path) -> None:
     cleanup_all_worktrees(project_dir, confirm=True)
 
 
+def handle_merge_readiness_command(
+    project_dir: Path, base_branch: str | None = None
+) -> dict:
+    """
+    Handle the --merge-readiness command.
+
+    Reports git conflicts and divergence for every spec branch against the
+    base branch in one batched, cached pass (see core.workspace.conflict_precheck).
+
+    Args:
+        project_dir: Project root directory
+        base_branch: Branch to merge into (default: current branch)
+
+    Returns:
+        JSON-serializable dict with a "specs" mapping of spec name to result
+    """
+    results = check_git_conflicts_bulk(project_dir, base_branch=base_branch)
+    return {
+        "success": True,
+        "specs": results,
+        "summary": {
+            "total": len(results),
+            "withConflicts": sum(1 for r in results.values() if r["has_conflicts"]),
+            "needsRebase": sum(1 for r in results.values() if r["needs_rebase"]),
+        },
+    }
+
+
 def _check_git_merge_conflicts(
     project_dir: Path, spec_name: str, base_branch: str | None = None
 ) -> dict:
     """
     Check for git-level merge conflicts WITHOUT modifying the working directory.
 
-    Uses git merge-tree and git diff to detect conflicts in-memory,
-    which avoids triggering Vite HMR or other file watchers.
+    Uses the batched precheck (git merge-tree in memory), which avoids
+    triggering Vite HMR or other file watchers and reuses the cached result
+    while neither branch has moved.
 
     Args:
         project_dir: Project root directory
         spec_name: Name of the spec
-        base_branch: Branch the task was created from (default: auto-detect)
+        base_branch: Branch the task was created from (default: current branch)
 
     Returns:
         Dictionary with git conflict information:
@@ -558,157 +587,42 @@ def _check_git_merge_conflicts(
         - base_branch: str
         - spec_branch: str
     """
-    import subprocess
-
     debug(MODULE, "Checking for git-level merge conflicts (non-destructive)...")
 
-    spec_branch = f"auto-claude/{spec_name}"
     result = {
         "has_conflicts": False,
         "conflicting_files": [],
         "needs_rebase": False,
         "base_branch": base_branch or "main",
-        "spec_branch": spec_branch,
+        "spec_branch": f"auto-claude/{spec_name}",
         "commits_behind": 0,
     }
 
     try:
-        # Use provided base_branch, or detect from current HEAD
-        if not base_branch:
-            base_result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-            )
-            if base_result.returncode == 0:
-                result["base_branch"] = base_result.stdout.strip()
-        else:
-            result["base_branch"] = base_branch
-            debug(MODULE, f"Using provided base branch: {base_branch}")
-
-        # Get the merge base commit
-        merge_base_result = subprocess.run(
-            ["git", "merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
-            return result
-
-        merge_base = merge_base_result.stdout.strip()
-
-        # Count commits main is ahead
-        ahead_result = subprocess.run(
-            ["git", "rev-list", "--count", f"{merge_base}..{result['base_branch']}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if ahead_result.returncode == 0:
-            commits_behind = int(ahead_result.stdout.strip())
-            result["commits_behind"] = commits_behind
-            if commits_behind > 0:
-                result["needs_rebase"] = True
-                debug(
-                    MODULE, f"Main is {commits_behind} commits ahead of worktree base"
-                )
-
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # This is a plumbing command that does a 3-way merge in memory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = subprocess.run(
-            [
-                "git",
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        # merge-tree returns exit code 1 if there are conflicts
-        if merge_tree_result.returncode != 0:
-            result["has_conflicts"] = True
-            debug(MODULE, "Git merge-tree detected conflicts")
-
-            # Parse the output for conflicting files
-            # merge-tree --write-tree outputs conflict info to stderr
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                # Look for lines indicating conflicts
-                if "CONFLICT" in line:
-                    # Extract file path from conflict message
-                    import re
-
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
-            if not result["conflicting_files"]:
-                # Files changed in main since merge-base
-                main_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, result["base_branch"]],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                main_files = (
-                    set(main_files_result.stdout.strip().split("\n"))
-                    if main_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files changed in spec branch since merge-base
-                spec_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, spec_branch],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                spec_files = (
-                    set(spec_files_result.stdout.strip().split("\n"))
-                    if spec_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files modified in both = potential conflicts
-                # Filter out .auto-claude files - they should never be merged
-                conflicting = main_files & spec_files
-                result["conflicting_files"] = [
-                    f for f in conflicting if not _is_auto_claude_file(f)
-                ]
-                debug(
-                    MODULE, f"Found {len(conflicting)} files modified in both branches"
-                )
-
-            debug(MODULE, f"Conflicting files: {result['conflicting_files']}")
-        else:
-            debug_success(MODULE, "Git merge-tree: no conflicts detected")
-
+        checked = check_git_conflicts_bulk(
+            project_dir, [spec_name], base_branch=base_branch
+        )[spec_name]
     except Exception as e:
         debug_error(MODULE, f"Error checking git conflicts: {e}")
         import traceback
 
         debug_verbose(MODULE, "Exception traceback", traceback=traceback.format_exc())
+        return result
+
+    if "error" in checked:
+        debug_warning(MODULE, "Could not check git conflicts", error=checked["error"])
+        result["base_branch"] = checked["base_branch"]
+        return result
 
+    result.update(checked)
+    if result["needs_rebase"]:
+        debug(
+            MODULE, f"Main is {result['commits_behind']} commits ahead of worktree base"
+        )
+    if result["has_conflicts"]:
+        debug(MODULE, f"Conflicting files: {result['conflicting_files']}")
+    else:
+        debug_success(MODULE, "Git merge-tree: no conflicts detected")
     return result
 
 
@@ -10,10 +10,18 @@ from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
+from .packer import (
+    ContextFragment,
+    ContextPacker,
+    PackingReport,
+    estimate_tokens,
+    pack_task_context,
+)
 from .pattern_discovery import PatternDiscoverer
 from .search import CodeSearcher
 from .serialization import load_context, save_context, serialize_context
 from .service_matcher import ServiceMatcher
+from .symbol_index import SymbolIndex
 
 __all__ = [
     # Main builder
@@ -27,6 +35,13 @@ __all__ = [
     "KeywordExtractor",
     "FileCategorizer",
     "PatternDiscoverer",
+    "SymbolIndex",
+    # Token budgeting
+    "ContextFragment",
+    "ContextPacker",
+    "PackingReport",
+    "estimate_tokens",
+    "pack_task_context",
     # Graphiti integration
     "fetch_graph_hints",
     "is_graphiti_enabled",
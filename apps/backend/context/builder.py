@@ -14,9 +14,11 @@ from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
+from .packer import pack_task_context
 from .pattern_discovery import PatternDiscoverer
 from .search import CodeSearcher
 from .service_matcher import ServiceMatcher
+from .symbol_index import SymbolIndex
 
 
 class ContextBuilder:
@@ -32,6 +34,7 @@ class ContextBuilder:
         self.keyword_extractor = KeywordExtractor()
         self.categorizer = FileCategorizer()
         self.pattern_discoverer = PatternDiscoverer(self.project_dir)
+        self._symbol_index: SymbolIndex | None = None
 
     def _load_project_index(self) -> dict:
         """Load project index from file or create new one (.auto-claude is the installed instance)."""
@@ -51,6 +54,8 @@ class ContextBuilder:
         services: list[str] | None = None,
         keywords: list[str] | None = None,
         include_graph_hints: bool = True,
+        token_budget: int | None = None,
+        use_symbol_index: bool = False,
     ) -> TaskContext:
         """
         Build context for a specific task.
@@ -60,6 +65,10 @@ class ContextBuilder:
             services: List of service names to search (None = auto-detect)
             keywords: Additional keywords to search for
             include_graph_hints: Whether to include historical hints from Graphiti
+            token_budget: Optional token budget; when set, files, patterns and
+                hints are packed by relevance to fit it (see context.packer)
+            use_symbol_index: Rank files by symbol definitions and import-graph
+                proximity in addition to keyword hits (see context.symbol_index)
 
         Returns:
             TaskContext with relevant files and patterns
@@ -87,6 +96,10 @@ class ContextBuilder:
 
             # Search this service
             matches = self.searcher.search_service(service_path, service_name, keywords)
+            if use_symbol_index:
+                matches = self._rank_with_symbol_index(
+                    matches, service_path, service_name, keywords
+                )
             all_matches.extend(matches)
 
             # Load or generate service context
@@ -123,7 +136,7 @@ class ContextBuilder:
                 # Graphiti is optional - fail gracefully
                 graph_hints = []
 
-        return TaskContext(
+        context = TaskContext(
             task_description=task,
             scoped_services=services,
             files_to_modify=[
@@ -137,12 +150,18 @@ class ContextBuilder:
             graph_hints=graph_hints,
         )
 
+        if token_budget is not None:
+            context, _ = pack_task_context(context, token_budget)
+        return context
+
     async def build_context_async(
         self,
         task: str,
         services: list[str] | None = None,
         keywords: list[str] | None = None,
         include_graph_hints: bool = True,
+        token_budget: int | None = None,
+        use_symbol_index: bool = False,
     ) -> TaskContext:
         """
         Build context for a specific task (async version).
@@ -155,6 +174,10 @@ class ContextBuilder:
             services: List of service names to search (None = auto-detect)
             keywords: Additional keywords to search for
             include_graph_hints: Whether to include historical hints from Graphiti
+            token_budget: Optional token budget; when set, files, patterns and
+                hints are packed by relevance to fit it (see context.packer)
+            use_symbol_index: Rank files by symbol definitions and import-graph
+                proximity in addition to keyword hits (see context.symbol_index)
 
         Returns:
             TaskContext with relevant files and patterns
@@ -182,6 +205,10 @@ class ContextBuilder:
 
             # Search this service
             matches = self.searcher.search_service(service_path, service_name, keywords)
+            if use_symbol_index:
+                matches = self._rank_with_symbol_index(
+                    matches, service_path, service_name, keywords
+                )
             all_matches.extend(matches)
 
             # Load or generate service context
@@ -204,7 +231,7 @@ class ContextBuilder:
         if include_graph_hints:
             graph_hints = await fetch_graph_hints(task, str(self.project_dir))
 
-        return TaskContext(
+        context = TaskContext(
             task_description=task,
             scoped_services=services,
             files_to_modify=[
@@ -218,6 +245,59 @@ class ContextBuilder:
             graph_hints=graph_hints,
         )
 
+        if token_budget is not None:
+            context, _ = pack_task_context(context, token_budget)
+        return context
+
+    def _get_symbol_index(self) -> SymbolIndex:
+        """Load the persisted symbol index and bring it up to date (once)."""
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex(self.project_dir)
+            self._symbol_index.update()
+        return self._symbol_index
+
+    def _rank_with_symbol_index(
+        self,
+        matches: list[FileMatch],
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+        limit: int = 20,
+    ) -> list[FileMatch]:
+        """
+        Re-rank keyword matches using definition hits and import proximity.
+
+        Files that define a matching symbol (or import/are imported by one)
+        are boosted, and added if keyword search missed them.
+        """
+        try:
+            prefix = str(service_path.resolve().relative_to(self.project_dir))
+        except ValueError:
+            return matches
+        prefix = None if prefix == "." else prefix.replace("\\", "/")
+
+        ranked = self._get_symbol_index().rank_files(
+            keywords, limit=limit, path_prefix=prefix
+        )
+        by_path = {m.path.replace("\\", "/"): m for m in matches}
+
+        for path, score, reasons in ranked:
+            match = by_path.get(path)
+            if match is None:
+                match = FileMatch(
+                    path=path,
+                    service=service_name,
+                    reason="Symbols: " + ", ".join(reasons[:3]),
+                    relevance_score=0,
+                )
+                by_path[path] = match
+            elif reasons:
+                match.reason += f"; symbols: {', '.join(reasons[:3])}"
+            match.relevance_score += score
+
+        merged = sorted(by_path.values(), key=lambda m: m.relevance_score, reverse=True)
+        return merged[:limit]
+
     def _get_service_context(
         self,
         service_path: Path,
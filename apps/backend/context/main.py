@@ -51,6 +51,8 @@ def build_task_context(
     services: list[str] | None = None,
     keywords: list[str] | None = None,
     output_file: Path | None = None,
+    token_budget: int | None = None,
+    use_symbol_index: bool = False,
 ) -> dict:
     """
     Build context for a task and optionally save to file.
@@ -61,12 +63,20 @@ def build_task_context(
         services: Services to search (None = auto-detect)
         keywords: Keywords to search for (None = extract from task)
         output_file: Optional path to save JSON output
+        token_budget: Optional token budget for packing files, patterns and hints
+        use_symbol_index: Rank files with the persistent symbol index
 
     Returns:
         Context as a dictionary
     """
     builder = ContextBuilder(project_dir)
-    context = builder.build_context(task, services, keywords)
+    context = builder.build_context(
+        task,
+        services,
+        keywords,
+        token_budget=token_budget,
+        use_symbol_index=use_symbol_index,
+    )
 
     result = serialize_context(context)
 
@@ -116,6 +126,17 @@ def main():
         default=None,
         help="Output file for JSON results",
     )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Pack files, patterns and hints into this many estimated tokens",
+    )
+    parser.add_argument(
+        "--symbols",
+        action="store_true",
+        help="Rank files by symbol definitions and import-graph proximity",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -134,6 +155,8 @@ def main():
         services,
         keywords,
         args.output,
+        args.token_budget,
+        args.symbols,
     )
 
     if not args.quiet or not args.output:
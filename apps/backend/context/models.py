@@ -32,3 +32,4 @@ class TaskContext:
     graph_hints: list[dict] = field(
         default_factory=list
     )  # Historical hints from Graphiti
+    packing_report: dict | None = None  # Set when packed into a token budget
@@ -0,0 +1,313 @@
+"""
+Context Packing
+===============
+
+Fits prompt context into a token budget.
+
+Context sources (files to modify, reference files, discovered patterns, graph
+hints, file contents) are split into fragments, each with an estimated token
+cost and a relevance score. The packer greedily keeps the most relevant
+fragments until the budget is spent and produces a report of what was kept
+and what was dropped, so oversized prompts are trimmed by relevance instead of
+by fixed per-source caps.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from .models import TaskContext
+
+# Rough characters-per-token ratio for English prose and source code
+CHARS_PER_TOKEN = 4
+
+# Don't bother keeping a truncated fragment smaller than this
+MIN_TRUNCATED_TOKENS = 64
+
+# Relevance weights per fragment kind (multiplied with the fragment's own score)
+KIND_WEIGHTS: dict[str, float] = {
+    "file_to_modify": 3.0,
+    "pattern": 2.0,
+    "file_to_reference": 1.5,
+    "graph_hint": 1.0,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a piece of text.
+
+    Uses a character-based heuristic (~4 chars per token), which is accurate
+    enough for budgeting without pulling in a tokenizer dependency.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated number of tokens
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class ContextFragment:
+    """A piece of context competing for prompt budget."""
+
+    kind: str
+    key: str
+    content: str
+    relevance: float = 0.0
+    truncatable: bool = False
+    payload: Any = None
+    tokens: int = -1
+
+    def __post_init__(self):
+        if self.tokens < 0:
+            self.tokens = estimate_tokens(self.content)
+
+
+@dataclass
+class PackingReport:
+    """Outcome of packing fragments into a budget."""
+
+    budget_tokens: int
+    used_tokens: int = 0
+    kept: list[dict] = field(default_factory=list)
+    dropped: list[dict] = field(default_factory=list)
+    truncated: list[dict] = field(default_factory=list)
+
+    @property
+    def dropped_tokens(self) -> int:
+        return sum(item["tokens"] for item in self.dropped)
+
+    def summary(self) -> str:
+        """One-line summary suitable for the task log."""
+        text = (
+            f"Context packed: kept {len(self.kept)} fragment(s) "
+            f"(~{self.used_tokens}/{self.budget_tokens} tokens), "
+            f"dropped {len(self.dropped)} (~{self.dropped_tokens} tokens)"
+        )
+        if self.truncated:
+            text += f", truncated {len(self.truncated)}"
+        return text
+
+    def format_detail(self) -> str:
+        """Multi-line breakdown of kept and dropped fragments."""
+        lines = [f"Budget: {self.budget_tokens} tokens, used: {self.used_tokens}"]
+        truncated_keys = {(t["kind"], t["key"]) for t in self.truncated}
+        if self.kept:
+            lines.append("")
+            lines.append("Kept:")
+            for item in self.kept:
+                marker = (
+                    " (truncated)"
+                    if (item["kind"], item["key"]) in truncated_keys
+                    else ""
+                )
+                lines.append(
+                    f"  + [{item['kind']}] {item['key']} "
+                    f"~{item['tokens']} tokens, relevance {item['relevance']:.2f}{marker}"
+                )
+        if self.dropped:
+            lines.append("")
+            lines.append("Dropped:")
+            for item in self.dropped:
+                lines.append(
+                    f"  - [{item['kind']}] {item['key']} "
+                    f"~{item['tokens']} tokens, relevance {item['relevance']:.2f}"
+                )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "budget_tokens": self.budget_tokens,
+            "used_tokens": self.used_tokens,
+            "dropped_tokens": self.dropped_tokens,
+            "kept": self.kept,
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+        }
+
+
+def _describe(fragment: ContextFragment) -> dict:
+    return {
+        "kind": fragment.kind,
+        "key": fragment.key,
+        "tokens": fragment.tokens,
+        "relevance": round(fragment.relevance, 3),
+    }
+
+
+def _truncate_to_tokens(content: str, max_tokens: int) -> str:
+    """Cut content at a line boundary so it fits within max_tokens."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    marker = "\n... (truncated to fit context budget)"
+    cut = content[: max(0, max_chars - len(marker))]
+    newline = cut.rfind("\n")
+    if newline > 0:
+        cut = cut[:newline]
+    return cut + marker
+
+
+class ContextPacker:
+    """Greedily fills a token budget with the most relevant fragments."""
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        min_truncated_tokens: int = MIN_TRUNCATED_TOKENS,
+    ):
+        self.budget_tokens = max(0, budget_tokens)
+        self.min_truncated_tokens = min_truncated_tokens
+
+    def pack(
+        self, fragments: list[ContextFragment]
+    ) -> tuple[list[ContextFragment], PackingReport]:
+        """
+        Select fragments that fit the budget, most relevant first.
+
+        Fragments that don't fit are skipped (smaller, less relevant ones may
+        still fit afterwards). A truncatable fragment is cut down to the
+        remaining budget when at least ``min_truncated_tokens`` remain.
+
+        Args:
+            fragments: Candidate fragments
+
+        Returns:
+            Tuple of (kept fragments in their original order, report)
+        """
+        report = PackingReport(budget_tokens=self.budget_tokens)
+        ranked = sorted(
+            enumerate(fragments),
+            key=lambda item: (-item[1].relevance, item[1].tokens, item[0]),
+        )
+
+        kept: list[tuple[int, ContextFragment]] = []
+        remaining = self.budget_tokens
+        for index, fragment in ranked:
+            if fragment.tokens <= remaining:
+                kept.append((index, fragment))
+                remaining -= fragment.tokens
+                report.kept.append(_describe(fragment))
+            elif fragment.truncatable and remaining >= self.min_truncated_tokens:
+                content = _truncate_to_tokens(fragment.content, remaining)
+                cut = replace(
+                    fragment, content=content, tokens=estimate_tokens(content)
+                )
+                kept.append((index, cut))
+                remaining -= cut.tokens
+                report.kept.append(_describe(cut))
+                report.truncated.append(
+                    {**_describe(cut), "original_tokens": fragment.tokens}
+                )
+            else:
+                report.dropped.append(_describe(fragment))
+
+        report.used_tokens = self.budget_tokens - remaining
+        kept.sort(key=lambda item: item[0])
+        return [fragment for _, fragment in kept], report
+
+
+def _file_match_text(match: dict) -> str:
+    lines = [f"{match.get('path', '')}: {match.get('reason', '')}"]
+    for line_no, line in match.get("matching_lines", []):
+        lines.append(f"  {line_no}: {line}")
+    return "\n".join(lines)
+
+
+def fragments_from_task_context(context: TaskContext) -> list[ContextFragment]:
+    """
+    Split a TaskContext into budgeted fragments.
+
+    Args:
+        context: Context produced by ContextBuilder
+
+    Returns:
+        Fragments for files, patterns and graph hints
+    """
+    fragments: list[ContextFragment] = []
+
+    for kind, matches in (
+        ("file_to_modify", context.files_to_modify),
+        ("file_to_reference", context.files_to_reference),
+    ):
+        for match in matches:
+            fragments.append(
+                ContextFragment(
+                    kind=kind,
+                    key=match.get("path", ""),
+                    content=_file_match_text(match),
+                    relevance=KIND_WEIGHTS[kind]
+                    * float(match.get("relevance_score", 0.0)),
+                    payload=match,
+                )
+            )
+
+    # Patterns inherit the relevance of the reference file they came from
+    # (PatternDiscoverer prefixes each snippet with "From <path>:")
+    file_scores = {
+        match.get("path", ""): float(match.get("relevance_score", 0.0))
+        for match in context.files_to_reference + context.files_to_modify
+    }
+    for key, snippet in context.patterns_discovered.items():
+        source = snippet.split("\n", 1)[0].removeprefix("From ").rstrip(":")
+        fragments.append(
+            ContextFragment(
+                kind="pattern",
+                key=key,
+                content=snippet,
+                relevance=KIND_WEIGHTS["pattern"] * file_scores.get(source, 1.0),
+                truncatable=True,
+                payload=key,
+            )
+        )
+
+    for rank, hint in enumerate(context.graph_hints):
+        fragments.append(
+            ContextFragment(
+                kind="graph_hint",
+                key=str(hint.get("type", f"hint_{rank}")),
+                content=json.dumps(hint, default=str),
+                relevance=KIND_WEIGHTS["graph_hint"]
+                * float(hint.get("score", 1.0) or 1.0),
+                payload=hint,
+            )
+        )
+
+    return fragments
+
+
+def pack_task_context(
+    context: TaskContext, budget_tokens: int
+) -> tuple[TaskContext, PackingReport]:
+    """
+    Trim a TaskContext to fit a token budget.
+
+    Args:
+        context: Context produced by ContextBuilder
+        budget_tokens: Token budget for files, patterns and hints
+
+    Returns:
+        Tuple of (packed TaskContext, packing report)
+    """
+    kept, report = ContextPacker(budget_tokens).pack(
+        fragments_from_task_context(context)
+    )
+
+    patterns = {f.payload: f.content for f in kept if f.kind == "pattern"}
+    packed = replace(
+        context,
+        files_to_modify=[f.payload for f in kept if f.kind == "file_to_modify"],
+        files_to_reference=[f.payload for f in kept if f.kind == "file_to_reference"],
+        patterns_discovered={
+            key: patterns[key] for key in context.patterns_discovered if key in patterns
+        },
+        graph_hints=[f.payload for f in kept if f.kind == "graph_hint"],
+        packing_report=report.to_dict(),
+    )
+    return packed, report
@@ -21,7 +21,7 @@ def serialize_context(context: TaskContext) -> dict:
     Returns:
         Dictionary representation
     """
-    return {
+    result = {
         "task_description": context.task_description,
         "scoped_services": context.scoped_services,
         "files_to_modify": context.files_to_modify,
@@ -30,6 +30,9 @@ def serialize_context(context: TaskContext) -> dict:
         "service_contexts": context.service_contexts,
         "graph_hints": context.graph_hints,
     }
+    if context.packing_report is not None:
+        result["packing"] = context.packing_report
+    return result
 
 
 def save_context(context: TaskContext, output_file: Path) -> None:
@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+"""
+Symbol Index
+============
+
+Persistent per-file index of definitions, imports and referenced identifiers.
+
+Keyword search (context/search.py) only counts substring hits, so common
+words flood the results. The symbol index knows where things are *defined*
+and which files import which, so context discovery can rank a file that
+defines ``RetryPolicy`` above a file that merely mentions "retry" in a
+comment, and pull in the files adjacent to it in the import graph.
+
+Python files are parsed with the stdlib ``ast`` module. TypeScript/JavaScript,
+Go and Rust use lightweight regex tokenizers that recognise top-level
+definitions and import statements.
+
+The index is stored in ``.auto-claude/symbol_index.json`` and updated
+incrementally: only files whose (mtime, size) changed are re-parsed.
+
+Usage:
+    index = SymbolIndex(project_dir)
+    index.update()
+    ranked = index.rank_files(["retry", "proxy"])
+
+    # Benchmark a cold build and a warm incremental update
+    python -m context.symbol_index --project-dir /path/to/repo --benchmark
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "symbol_index.json"
+
+# Files larger than this are indexed by name only (usually generated/minified)
+MAX_INDEXED_FILE_BYTES = 1_000_000
+
+# Scoring weights for rank_files
+DEFINITION_WEIGHT = 10.0
+PARTIAL_DEFINITION_WEIGHT = 6.0
+REFERENCE_WEIGHT = 1.0
+IMPORT_NEIGHBOR_WEIGHT = 0.3
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+_JS_DEFINITION_RES = [
+    (
+        "function",
+        re.compile(
+            r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)",
+            re.M,
+        ),
+    ),
+    (
+        "class",
+        re.compile(
+            r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+([A-Za-z_$][\w$]*)",
+            re.M,
+        ),
+    ),
+    (
+        "interface",
+        re.compile(r"^\s*(?:export\s+)?interface\s+([A-Za-z_$][\w$]*)", re.M),
+    ),
+    ("type", re.compile(r"^\s*(?:export\s+)?type\s+([A-Za-z_$][\w$]*)\s*[=<]", re.M)),
+    (
+        "enum",
+        re.compile(r"^\s*(?:export\s+)?(?:const\s+)?enum\s+([A-Za-z_$][\w$]*)", re.M),
+    ),
+    (
+        "variable",
+        re.compile(
+            r"^\s*(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*[=:]", re.M
+        ),
+    ),
+]
+_JS_IMPORT_RES = [
+    re.compile(r"""^\s*import\s+(?:[^'"]*?\s+from\s+)?['"]([^'"]+)['"]""", re.M),
+    re.compile(r"""^\s*export\s+[^'"]*?\s+from\s+['"]([^'"]+)['"]""", re.M),
+    re.compile(r"""\brequire\(\s*['"]([^'"]+)['"]\s*\)"""),
+    re.compile(r"""\bimport\(\s*['"]([^'"]+)['"]\s*\)"""),
+]
+
+_GO_DEFINITION_RES = [
+    ("function", re.compile(r"^func\s+(?:\([^)]*\)\s*)?([A-Za-z_]\w*)", re.M)),
+    ("type", re.compile(r"^type\s+([A-Za-z_]\w*)", re.M)),
+    ("variable", re.compile(r"^(?:var|const)\s+([A-Za-z_]\w*)", re.M)),
+]
+_GO_IMPORT_BLOCK_RE = re.compile(r"^import\s*\((.*?)\)", re.M | re.S)
+_GO_IMPORT_LINE_RE = re.compile(r'^import\s+(?:[\w.]+\s+)?"([^"]+)"', re.M)
+_GO_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+_RUST_DEFINITION_RES = [
+    (
+        "function",
+        re.compile(
+            r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?(?:unsafe\s+)?(?:const\s+)?fn\s+([A-Za-z_]\w*)",
+            re.M,
+        ),
+    ),
+    (
+        "struct",
+        re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?struct\s+([A-Za-z_]\w*)", re.M),
+    ),
+    ("enum", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?enum\s+([A-Za-z_]\w*)", re.M)),
+    ("trait", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?trait\s+([A-Za-z_]\w*)", re.M)),
+    ("type", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?type\s+([A-Za-z_]\w*)", re.M)),
+    ("module", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?mod\s+([A-Za-z_]\w*)", re.M)),
+]
+_RUST_IMPORT_RE = re.compile(r"^\s*(?:pub\s+)?use\s+([\w:]+)", re.M)
+
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".vue": "javascript",
+    ".svelte": "javascript",
+    ".go": "go",
+    ".rs": "rust",
+}
+
+_JS_RESOLVE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".vue", ".svelte")
+
+
+@dataclass
+class FileSymbols:
+    """Symbols extracted from one file."""
+
+    path: str
+    language: str
+    mtime_ns: int
+    size: int
+    definitions: list[tuple[str, str, int]] = field(default_factory=list)
+    imports: list[str] = field(default_factory=list)
+    references: list[str] = field(default_factory=list)
+
+
+@dataclass
+class IndexUpdateStats:
+    """What an incremental update did."""
+
+    scanned: int = 0
+    parsed: int = 0
+    removed: int = 0
+    duration_ms: float = 0.0
+
+
+@lru_cache(maxsize=65536)
+def _split_identifier(name: str) -> tuple[str, ...]:
+    """Split camelCase / snake_case identifiers into lowercase words."""
+    words = re.findall(r"[A-Z]+(?=[A-Z][a-z]|\b|\d|_)|[A-Z]?[a-z]+|\d+", name)
+    return tuple(w.lower() for w in words if w)
+
+
+def _line_of(content: str, offset: int) -> int:
+    return content.count("\n", 0, offset) + 1
+
+
+def _extract_python(content: str) -> tuple[list, list, set]:
+    tree = ast.parse(content)
+    definitions = []
+    imports = []
+    references = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            definitions.append((node.name, "function", node.lineno))
+        elif isinstance(node, ast.ClassDef):
+            definitions.append((node.name, "class", node.lineno))
+        elif isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            imports.append(module)
+            if node.module is None:
+                # "from . import x" - each name may be a submodule
+                imports.extend("." * node.level + alias.name for alias in node.names)
+        elif isinstance(node, ast.Name):
+            references.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            references.add(node.attr)
+
+    # Module-level assignments count as definitions (constants, aliases)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    definitions.append((target.id, "variable", node.lineno))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            definitions.append((node.target.id, "variable", node.lineno))
+
+    return definitions, imports, references
+
+
+def _extract_with_patterns(
+    content: str, definition_res: list, import_values: list[str]
+) -> tuple[list, list, set]:
+    definitions = []
+    for kind, pattern in definition_res:
+        for match in pattern.finditer(content):
+            definitions.append((match.group(1), kind, _line_of(content, match.start())))
+    references = set(_IDENTIFIER_RE.findall(content))
+    return definitions, import_values, references
+
+
+def _extract_javascript(content: str) -> tuple[list, list, set]:
+    imports = []
+    for pattern in _JS_IMPORT_RES:
+        imports.extend(pattern.findall(content))
+    return _extract_with_patterns(content, _JS_DEFINITION_RES, imports)
+
+
+def _extract_go(content: str) -> tuple[list, list, set]:
+    imports = _GO_IMPORT_LINE_RE.findall(content)
+    for block in _GO_IMPORT_BLOCK_RE.findall(content):
+        imports.extend(_GO_QUOTED_RE.findall(block))
+    return _extract_with_patterns(content, _GO_DEFINITION_RES, imports)
+
+
+def _extract_rust(content: str) -> tuple[list, list, set]:
+    imports = _RUST_IMPORT_RE.findall(content)
+    return _extract_with_patterns(content, _RUST_DEFINITION_RES, imports)
+
+
+_EXTRACTORS = {
+    "python": _extract_python,
+    "javascript": _extract_javascript,
+    "typescript": _extract_javascript,
+    "go": _extract_go,
+    "rust": _extract_rust,
+}
+
+
+def extract_symbols(path: str, content: str) -> tuple[str, list, list, list]:
+    """
+    Extract definitions, imports and references from source text.
+
+    Args:
+        path: Relative file path (used to pick the language)
+        content: File contents
+
+    Returns:
+        Tuple of (language, definitions, imports, sorted references)
+    """
+    language = _LANGUAGE_BY_EXTENSION.get(PurePosixPath(path).suffix, "other")
+    extractor = _EXTRACTORS.get(language)
+    if extractor is None:
+        return language, [], [], sorted(set(_IDENTIFIER_RE.findall(content)))
+
+    try:
+        definitions, imports, references = extractor(content)
+    except (SyntaxError, ValueError, RecursionError):
+        # Unparseable Python (e.g. templates): fall back to identifiers only
+        definitions, imports = [], []
+        references = set(_IDENTIFIER_RE.findall(content))
+
+    return language, definitions, imports, sorted(references)
+
+
+class SymbolIndex:
+    """Incrementally maintained symbol index for a project."""
+
+    def __init__(self, project_dir: Path, index_file: Path | None = None):
+        self.project_dir = project_dir.resolve()
+        self.index_file = index_file or (
+            self.project_dir / ".auto-claude" / INDEX_FILENAME
+        )
+        self.files: dict[str, FileSymbols] = {}
+        self._definitions: dict[str, set[str]] | None = None
+        self._definition_words: dict[str, set[str]] | None = None
+        self._references: dict[str, set[str]] | None = None
+        self._import_graph: dict[str, set[str]] | None = None
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """Load the persisted index (missing or stale formats are ignored)."""
+        self._loaded = True
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+
+        files = {}
+        for path, entry in data.get("files", {}).items():
+            try:
+                files[path] = FileSymbols(
+                    path=path,
+                    language=entry["language"],
+                    mtime_ns=entry["mtime_ns"],
+                    size=entry["size"],
+                    definitions=[tuple(d) for d in entry["definitions"]],
+                    imports=entry["imports"],
+                    references=entry["references"],
+                )
+            except (KeyError, TypeError):
+                continue
+        self.files = files
+        self._invalidate_derived()
+
+    def save(self) -> None:
+        """Persist the index atomically."""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "files": {
+                path: {k: v for k, v in asdict(entry).items() if k != "path"}
+                for path, entry in self.files.items()
+            },
+        }
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_file, self.index_file)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _iter_code_files(self):
+        """Yield (relative_path, stat) for indexable code files."""
+        for root, dirs, filenames in os.walk(self.project_dir):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS and d != ".auto-claude"]
+            for filename in filenames:
+                if os.path.splitext(filename)[1] not in CODE_EXTENSIONS:
+                    continue
+                full_path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+                rel_path = os.path.relpath(full_path, self.project_dir)
+                yield rel_path.replace(os.sep, "/"), stat
+
+    def update(self, save: bool = True) -> IndexUpdateStats:
+        """
+        Bring the index up to date with the working tree.
+
+        Only files whose (mtime, size) changed since the last update are
+        re-parsed; deleted files are dropped.
+
+        Args:
+            save: Whether to persist the index afterwards
+
+        Returns:
+            Statistics about the update
+        """
+        start = time.perf_counter()
+        if not self._loaded:
+            self.load()
+
+        stats = IndexUpdateStats()
+        seen = set()
+        for rel_path, stat in self._iter_code_files():
+            stats.scanned += 1
+            seen.add(rel_path)
+            existing = self.files.get(rel_path)
+            if (
+                existing is not None
+                and existing.mtime_ns == stat.st_mtime_ns
+                and existing.size == stat.st_size
+            ):
+                continue
+            self.files[rel_path] = self._parse_file(rel_path, stat)
+            stats.parsed += 1
+
+        for rel_path in [p for p in self.files if p not in seen]:
+            del self.files[rel_path]
+            stats.removed += 1
+
+        if stats.parsed or stats.removed:
+            self._invalidate_derived()
+            if save:
+                try:
+                    self.save()
+                except OSError:
+                    pass  # Index is an optimization - keep the in-memory copy
+
+        stats.duration_ms = (time.perf_counter() - start) * 1000
+        return stats
+
+    def _parse_file(self, rel_path: str, stat: os.stat_result) -> FileSymbols:
+        content = ""
+        if stat.st_size <= MAX_INDEXED_FILE_BYTES:
+            try:
+                content = (self.project_dir / rel_path).read_text(
+                    encoding="utf-8", errors="ignore"
+                )
+            except OSError:
+                content = ""
+        language, definitions, imports, references = extract_symbols(rel_path, content)
+        return FileSymbols(
+            path=rel_path,
+            language=language,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            definitions=definitions,
+            imports=imports,
+            references=references,
+        )
+
+    # ------------------------------------------------------------------
+    # Derived lookups
+    # ------------------------------------------------------------------
+
+    def _invalidate_derived(self) -> None:
+        self._definitions = None
+        self._definition_words = None
+        self._references = None
+        self._import_graph = None
+
+    @property
+    def definitions(self) -> dict[str, set[str]]:
+        """Lowercased symbol name -> files that define it."""
+        if self._definitions is None:
+            table: dict[str, set[str]] = defaultdict(set)
+            for path, entry in self.files.items():
+                for name, _kind, _line in entry.definitions:
+                    table[name.lower()].add(path)
+            self._definitions = table
+        return self._definitions
+
+    @property
+    def definition_words(self) -> dict[str, set[str]]:
+        """Word -> lowercased definition names containing it (RetryPolicy -> retry)."""
+        if self._definition_words is None:
+            table: dict[str, set[str]] = defaultdict(set)
+            for path, entry in self.files.items():
+                for name, _kind, _line in entry.definitions:
+                    for word in _split_identifier(name):
+                        table[word].add(name.lower())
+            self._definition_words = table
+        return self._definition_words
+
+    @property
+    def references(self) -> dict[str, set[str]]:
+        """Lowercased identifier word -> files that reference it."""
+        if self._references is None:
+            table: dict[str, set[str]] = defaultdict(set)
+            for path, entry in self.files.items():
+                for name in entry.references:
+                    table[name.lower()].add(path)
+                    for word in _split_identifier(name):
+                        table[word].add(path)
+            self._references = table
+        return self._references
+
+    @property
+    def import_graph(self) -> dict[str, set[str]]:
+        """Undirected file adjacency built from resolvable imports."""
+        if self._import_graph is None:
+            graph: dict[str, set[str]] = defaultdict(set)
+            module_map = self._python_module_map()
+            for path, entry in self.files.items():
+                for spec in entry.imports:
+                    target = self._resolve_import(
+                        path, entry.language, spec, module_map
+                    )
+                    if target and target != path:
+                        graph[path].add(target)
+                        graph[target].add(path)
+            self._import_graph = graph
+        return self._import_graph
+
+    def _python_module_map(self) -> dict[str, str | None]:
+        """
+        Map dotted module names (and their suffixes) to file paths.
+
+        A module path from the repository root wins over a suffix of a deeper
+        path. Names claimed by several files at the same level (two nested
+        source roots with a "utils" module) map to None, so they produce no
+        import edge instead of an arbitrary one.
+        """
+        claims: dict[str, tuple[bool, str | None]] = {}
+        for path, entry in self.files.items():
+            if entry.language != "python":
+                continue
+            parts = list(PurePosixPath(path).with_suffix("").parts)
+            if parts and parts[-1] == "__init__":
+                parts = parts[:-1]
+            # Register every suffix so "pkg.mod" resolves from nested source roots
+            for i in range(len(parts)):
+                name = ".".join(parts[i:])
+                is_suffix = i > 0
+                claim = claims.get(name)
+                if claim is None or (claim[0] and not is_suffix):
+                    claims[name] = (is_suffix, path)
+                elif claim[0] == is_suffix and claim[1] != path:
+                    claims[name] = (is_suffix, None)
+        return {name: path for name, (_is_suffix, path) in claims.items()}
+
+    def _resolve_import(
+        self,
+        importer: str,
+        language: str,
+        spec: str,
+        module_map: dict[str, str | None],
+    ) -> str | None:
+        if language == "python":
+            if spec.startswith("."):
+                level = len(spec) - len(spec.lstrip("."))
+                base = PurePosixPath(importer).parent
+                for _ in range(level - 1):
+                    base = base.parent
+                rest = spec.lstrip(".")
+                candidate = base.joinpath(*rest.split(".")) if rest else base
+                for option in (f"{candidate}.py", f"{candidate}/__init__.py"):
+                    if option in self.files:
+                        return option
+                return None
+            return module_map.get(spec)
+
+        if language in ("javascript", "typescript") and spec.startswith("."):
+            base = os.path.normpath(
+                os.path.join(str(PurePosixPath(importer).parent), spec)
+            ).replace(os.sep, "/")
+            if base in self.files:
+                return base
+            for ext in _JS_RESOLVE_EXTENSIONS:
+                if f"{base}{ext}" in self.files:
+                    return f"{base}{ext}"
+            for ext in _JS_RESOLVE_EXTENSIONS:
+                if f"{base}/index{ext}" in self.files:
+                    return f"{base}/index{ext}"
+        return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_definitions(self, name: str) -> list[tuple[str, str, int]]:
+        """
+        Find where a symbol is defined.
+
+        Args:
+            name: Symbol name (case-insensitive)
+
+        Returns:
+            List of (path, kind, line)
+        """
+        results = []
+        for path in sorted(self.definitions.get(name.lower(), ())):
+            for def_name, kind, line in self.files[path].definitions:
+                if def_name.lower() == name.lower():
+                    results.append((path, kind, line))
+        return results
+
+    def rank_files(
+        self,
+        keywords: list[str],
+        limit: int = 20,
+        path_prefix: str | None = None,
+    ) -> list[tuple[str, float, list[str]]]:
+        """
+        Rank files by definition hits, reference hits and import proximity.
+
+        A file defining a symbol that matches a keyword scores highest (exact
+        name, then names containing the keyword as a word). Files referencing
+        the keyword score lower. Files adjacent in the import graph to a
+        defining file get a share of its score.
+
+        Args:
+            keywords: Lowercase search keywords
+            limit: Maximum number of results
+            path_prefix: Only rank files under this relative directory
+
+        Returns:
+            List of (path, score, reasons) sorted by score
+        """
+        scores: dict[str, float] = defaultdict(float)
+        definition_scores: dict[str, float] = defaultdict(float)
+        reasons: dict[str, list[str]] = defaultdict(list)
+        definitions = self.definitions
+
+        for keyword in keywords:
+            keyword = keyword.lower()
+            for path in definitions.get(keyword, ()):
+                definition_scores[path] += DEFINITION_WEIGHT
+                reasons[path].append(f"defines {keyword}")
+            for name in self.definition_words.get(keyword, ()):
+                if name == keyword:
+                    continue
+                for path in definitions.get(name, ()):
+                    definition_scores[path] += PARTIAL_DEFINITION_WEIGHT
+                    reasons[path].append(f"defines {name}")
+            for path in self.references.get(keyword, ()):
+                scores[path] += REFERENCE_WEIGHT
+
+        # Spread definition scores to import-graph neighbours
+        graph = self.import_graph
+        for path, score in definition_scores.items():
+            scores[path] += score
+            for neighbor in graph.get(path, ()):
+                scores[neighbor] += score * IMPORT_NEIGHBOR_WEIGHT
+                if neighbor not in definition_scores:
+                    reasons[neighbor].append(f"imports/imported by {path}")
+
+        if path_prefix:
+            prefix = path_prefix.rstrip("/") + "/"
+            scores = {p: s for p, s in scores.items() if p.startswith(prefix)}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(path, score, reasons.get(path, [])) for path, score in ranked[:limit]]
+
+
+def benchmark(project_dir: Path, index_file: Path | None = None) -> dict:
+    """
+    Measure a cold build, a warm reload and a no-change incremental update.
+
+    Args:
+        project_dir: Repository to index
+        index_file: Where to store the index (deleted first). Defaults to a
+            temporary file, so the project's own index is left alone.
+
+    Returns:
+        Timing and size figures
+    """
+    if index_file is None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            return benchmark(project_dir, Path(tmp_dir) / INDEX_FILENAME)
+
+    index = SymbolIndex(project_dir, index_file)
+    if index.index_file.exists():
+        index.index_file.unlink()
+
+    cold = index.update()
+
+    warm_index = SymbolIndex(project_dir, index_file)
+    warm = warm_index.update()
+
+    start = time.perf_counter()
+    warm_index.rank_files(["index", "config", "error"])
+    query_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "files": cold.scanned,
+        "cold_build_ms": round(cold.duration_ms, 1),
+        "warm_update_ms": round(warm.duration_ms, 1),
+        "warm_reparsed": warm.parsed,
+        "first_query_ms": round(query_ms, 1),
+        "index_bytes": index.index_file.stat().st_size
+        if index.index_file.exists()
+        else 0,
+    }
+
+
+def main():
+    """CLI entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or query the symbol index")
+    parser.add_argument(
+        "--project-dir",
+        type=Path,
+        default=Path.cwd(),
+        help="Project directory (default: current directory)",
+    )
+    parser.add_argument(
+        "--query",
+        type=str,
+        default=None,
+        help="Comma-separated keywords to rank files by",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time a cold build and a warm incremental update",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(json.dumps(benchmark(args.project_dir), indent=2))
+        return
+
+    index = SymbolIndex(args.project_dir)
+    stats = index.update()
+    print(
+        f"Indexed {stats.scanned} files ({stats.parsed} parsed, "
+        f"{stats.removed} removed) in {stats.duration_ms:.0f}ms"
+    )
+    if args.query:
+        for path, score, reasons in index.rank_files(args.query.split(",")):
+            print(f"{score:7.1f}  {path}  {'; '.join(reasons[:3])}")
+
+
+if __name__ == "__main__":
+    main()
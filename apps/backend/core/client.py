@@ -665,6 +665,7 @@ def create_client(
     max_thinking_tokens: int | None = None,
     output_format: dict | None = None,
     agents: dict | None = None,
+    tool_hooks: dict[str, list] | None = None,
 ) -> ClaudeSDKClient:
     """
     Create a Claude Agent SDK client with multi-layered security.
@@ -691,6 +692,9 @@ def create_client(
                Format: {"agent-name": {"description": "...", "prompt": "...",
                         "tools": [...], "model": "inherit"}}
                See: https://platform.claude.com/docs/en/agent-sdk/subagents
+        tool_hooks: Optional extra PreToolUse hooks keyed by tool matcher,
+                   e.g. {"Read|Grep|Glob": [hook]}. They run alongside the
+                   Bash security hook.
 
     Returns:
         Configured ClaudeSDKClient
@@ -1020,6 +1024,10 @@ def create_client(
         "hooks": {
             "PreToolUse": [
                 HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
+                *(
+                    HookMatcher(matcher=matcher, hooks=hooks)
+                    for matcher, hooks in (tool_hooks or {}).items()
+                ),
             ],
         },
         "max_turns": 1000,
@@ -8,7 +8,11 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
+import copy
+import functools
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from core.plan_normalization import normalize_subtask_aliases
@@ -26,38 +30,230 @@ from ui import (
     warning,
 )
 
+PLAN_FILE = "implementation_plan.json"
 
-def count_subtasks(spec_dir: Path) -> tuple[int, int]:
+# Plans cached by load_plan_snapshot(), most recently used last
+_SNAPSHOT_CACHE_SIZE = 32
+_snapshot_cache: OrderedDict[Path, "PlanSnapshot"] = OrderedDict()
+_snapshot_lock = threading.Lock()
+
+
+def _phase_subtasks(phase: dict) -> list:
+    return phase.get("subtasks", phase.get("chunks", []))
+
+
+class PlanSnapshot:
     """
-    Count completed and total subtasks in implementation_plan.json.
+    A parsed implementation_plan.json with derived progress values.
+
+    The plan is parsed once and each derived value is computed on first
+    access, so the progress helpers below can share a single snapshot.
+    Treat the snapshot (and ``plan``) as read-only; the helpers return
+    copies of anything callers might modify.
+
+    Use load_plan_snapshot() to get a cached, mtime-validated snapshot.
+    """
+
+    def __init__(self, plan: dict, key: tuple[int, int, int] | None = None):
+        self.plan = plan if isinstance(plan, dict) else {}
+        self.key = key
+        self.phases: list[dict] = self.plan.get("phases", [])
+
+        self.completed = 0
+        self.total = 0
+        self.counts = {
+            "completed": 0,
+            "in_progress": 0,
+            "pending": 0,
+            "failed": 0,
+            "total": 0,
+        }
+        for phase in self.phases:
+            for subtask in phase.get("subtasks", []):
+                status = subtask.get("status", "pending")
+                self.total += 1
+                if status == "completed":
+                    self.completed += 1
+                if status not in ("completed", "in_progress", "failed"):
+                    status = "pending"
+                self.counts[status] += 1
+        self.counts["total"] = self.total
+
+    @classmethod
+    def empty(cls) -> "PlanSnapshot":
+        return cls({})
+
+    @property
+    def is_complete(self) -> bool:
+        return self.total > 0 and self.completed == self.total
+
+    @property
+    def percentage(self) -> float:
+        if self.total == 0:
+            return 0.0
+        return (self.completed / self.total) * 100
+
+    @functools.cached_property
+    def phase_complete(self) -> dict[str, bool]:
+        """Completion of each phase, keyed by str(id or phase number)."""
+        complete: dict[str, bool] = {}
+        for i, phase in enumerate(self.phases):
+            phase_id_value = phase.get("id")
+            phase_id_raw = (
+                phase_id_value if phase_id_value is not None else phase.get("phase")
+            )
+            phase_id_key = (
+                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
+            )
+            complete[phase_id_key] = all(
+                s.get("status") == "completed" for s in _phase_subtasks(phase)
+            )
+        return complete
+
+    @functools.cached_property
+    def current_phase(self) -> dict | None:
+        """The first phase with incomplete subtasks."""
+        for phase in self.phases:
+            subtasks = _phase_subtasks(phase)
+            if any(s.get("status") != "completed" for s in subtasks):
+                return {
+                    "id": phase.get("id"),
+                    "phase": phase.get("phase"),
+                    "name": phase.get("name"),
+                    "completed": sum(
+                        1 for s in subtasks if s.get("status") == "completed"
+                    ),
+                    "total": len(subtasks),
+                }
+        return None
+
+    @functools.cached_property
+    def next_subtask(self) -> dict | None:
+        """The first pending subtask whose phase dependencies are complete."""
+        for phase in self.phases:
+            phase_id_value = phase.get("id")
+            phase_id = (
+                phase_id_value if phase_id_value is not None else phase.get("phase")
+            )
+            depends_on_raw = phase.get("depends_on", [])
+            if isinstance(depends_on_raw, list):
+                depends_on = [str(d) for d in depends_on_raw if d is not None]
+            elif depends_on_raw is None:
+                depends_on = []
+            else:
+                depends_on = [str(depends_on_raw)]
+
+            # Check if dependencies are satisfied
+            if not all(self.phase_complete.get(dep, False) for dep in depends_on):
+                continue
+
+            # Find first pending subtask in this phase
+            for subtask in _phase_subtasks(phase):
+                status = subtask.get("status", "pending")
+                if status in {"pending", "not_started", "not started"}:
+                    subtask_out, _changed = normalize_subtask_aliases(subtask)
+                    subtask_out["status"] = "pending"
+                    return {
+                        **subtask_out,
+                        "phase_id": phase_id,
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                    }
+        return None
+
+    @functools.cached_property
+    def summary(self) -> dict:
+        """Per-phase and overall subtask statistics (see get_plan_summary)."""
+        summary = {
+            "workflow_type": self.plan.get("workflow_type"),
+            "total_phases": len(self.phases),
+            "total_subtasks": self.total,
+            "completed_subtasks": self.counts["completed"],
+            "pending_subtasks": self.counts["pending"],
+            "in_progress_subtasks": self.counts["in_progress"],
+            "failed_subtasks": self.counts["failed"],
+            "phases": [],
+        }
+        for phase in self.phases:
+            subtasks = phase.get("subtasks", [])
+            summary["phases"].append(
+                {
+                    "id": phase.get("id"),
+                    "phase": phase.get("phase"),
+                    "name": phase.get("name"),
+                    "depends_on": phase.get("depends_on", []),
+                    "subtasks": [
+                        {
+                            "id": subtask.get("id"),
+                            "description": subtask.get("description"),
+                            "status": subtask.get("status", "pending"),
+                            "service": subtask.get("service"),
+                        }
+                        for subtask in subtasks
+                    ],
+                    "completed": sum(
+                        1 for s in subtasks if s.get("status") == "completed"
+                    ),
+                    "total": len(subtasks),
+                }
+            )
+        return summary
+
+
+def load_plan_snapshot(spec_dir: Path) -> PlanSnapshot:
+    """
+    Get a snapshot of the spec's implementation_plan.json.
+
+    Snapshots are cached per plan file and reused until the file's mtime,
+    size or inode changes, so repeated progress queries parse the plan once.
+    A missing or unreadable plan gives an empty snapshot.
 
     Args:
         spec_dir: Directory containing implementation_plan.json
 
     Returns:
-        (completed_count, total_count)
+        PlanSnapshot for the current plan contents
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan_file = Path(spec_dir) / PLAN_FILE
+    try:
+        st = plan_file.stat()
+    except OSError:
+        return PlanSnapshot.empty()
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
 
-    if not plan_file.exists():
-        return 0, 0
+    with _snapshot_lock:
+        snapshot = _snapshot_cache.get(plan_file)
+        if snapshot is not None and snapshot.key == key:
+            _snapshot_cache.move_to_end(plan_file)
+            return snapshot
 
     try:
-        with open(plan_file) as f:
+        with open(plan_file, encoding="utf-8") as f:
             plan = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return PlanSnapshot.empty()
 
-        total = 0
-        completed = 0
+    snapshot = PlanSnapshot(plan, key)
+    with _snapshot_lock:
+        _snapshot_cache[plan_file] = snapshot
+        _snapshot_cache.move_to_end(plan_file)
+        while len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+            _snapshot_cache.popitem(last=False)
+    return snapshot
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
 
-        return completed, total
-    except (OSError, json.JSONDecodeError):
-        return 0, 0
+def count_subtasks(spec_dir: Path) -> tuple[int, int]:
+    """
+    Count completed and total subtasks in implementation_plan.json.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+
+    Returns:
+        (completed_count, total_count)
+    """
+    snapshot = load_plan_snapshot(spec_dir)
+    return snapshot.completed, snapshot.total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -67,35 +263,7 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    result = {
-        "completed": 0,
-        "in_progress": 0,
-        "pending": 0,
-        "failed": 0,
-        "total": 0,
-    }
-
-    if not plan_file.exists():
-        return result
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
-        return result
-    except (OSError, json.JSONDecodeError):
-        return result
+    return dict(load_plan_snapshot(spec_dir).counts)
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -108,8 +276,7 @@ def is_build_complete(spec_dir: Path) -> bool:
     Returns:
         True if all subtasks complete, False otherwise
     """
-    completed, total = count_subtasks(spec_dir)
-    return total > 0 and completed == total
+    return load_plan_snapshot(spec_dir).is_complete
 
 
 def get_progress_percentage(spec_dir: Path) -> float:
@@ -122,10 +289,7 @@ def get_progress_percentage(spec_dir: Path) -> float:
     Returns:
         Percentage of subtasks completed (0-100)
     """
-    completed, total = count_subtasks(spec_dir)
-    if total == 0:
-        return 0.0
-    return (completed / total) * 100
+    return load_plan_snapshot(spec_dir).percentage
 
 
 def print_session_header(
@@ -166,7 +330,8 @@ def print_session_header(
 
 def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
     """Print a summary of current progress with enhanced formatting."""
-    completed, total = count_subtasks(spec_dir)
+    snapshot = load_plan_snapshot(spec_dir)
+    completed, total = snapshot.completed, snapshot.total
 
     if total > 0:
         print()
@@ -181,57 +346,50 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json") as f:
-                plan = json.load(f)
-
-            print("\nPhases:")
-            for phase in plan.get("phases", []):
-                phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
+        print("\nPhases:")
+        for phase in snapshot.phases:
+            phase_subtasks = phase.get("subtasks", [])
+            phase_completed = sum(
+                1 for s in phase_subtasks if s.get("status") == "completed"
+            )
+            phase_total = len(phase_subtasks)
+            phase_name = phase.get("name", phase.get("id", "Unknown"))
+
+            if phase_completed == phase_total:
+                status = "complete"
+            elif phase_completed > 0 or any(
+                s.get("status") == "in_progress" for s in phase_subtasks
+            ):
+                status = "in_progress"
+            else:
+                # Check if blocked by dependencies
+                deps = phase.get("depends_on", [])
+                all_deps_complete = True
+                for dep_id in deps:
+                    for p in snapshot.phases:
+                        if p.get("id") == dep_id or p.get("phase") == dep_id:
+                            p_subtasks = p.get("subtasks", [])
+                            if not all(
+                                s.get("status") == "completed" for s in p_subtasks
+                            ):
+                                all_deps_complete = False
+                            break
+                status = "pending" if all_deps_complete else "blocked"
+
+            print_phase_status(phase_name, phase_completed, phase_total, status)
+
+        # Show next subtask if requested
+        if show_next and completed < total:
+            next_subtask = snapshot.next_subtask
+            if next_subtask:
+                print()
+                next_id = next_subtask.get("id", "unknown")
+                next_desc = next_subtask.get("description", "")
+                if len(next_desc) > 60:
+                    next_desc = next_desc[:57] + "..."
+                print(
+                    f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                 )
-                phase_total = len(phase_subtasks)
-                phase_name = phase.get("name", phase.get("id", "Unknown"))
-
-                if phase_completed == phase_total:
-                    status = "complete"
-                elif phase_completed > 0 or any(
-                    s.get("status") == "in_progress" for s in phase_subtasks
-                ):
-                    status = "in_progress"
-                else:
-                    # Check if blocked by dependencies
-                    deps = phase.get("depends_on", [])
-                    all_deps_complete = True
-                    for dep_id in deps:
-                        for p in plan.get("phases", []):
-                            if p.get("id") == dep_id or p.get("phase") == dep_id:
-                                p_subtasks = p.get("subtasks", [])
-                                if not all(
-                                    s.get("status") == "completed" for s in p_subtasks
-                                ):
-                                    all_deps_complete = False
-                                break
-                    status = "pending" if all_deps_complete else "blocked"
-
-                print_phase_status(phase_name, phase_completed, phase_total, status)
-
-            # Show next subtask if requested
-            if show_next and completed < total:
-                next_subtask = get_next_subtask(spec_dir)
-                if next_subtask:
-                    print()
-                    next_id = next_subtask.get("id", "unknown")
-                    next_desc = next_subtask.get("description", "")
-                    if len(next_desc) > 60:
-                        next_desc = next_desc[:57] + "..."
-                    print(
-                        f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
-                    )
-
-        except (OSError, json.JSONDecodeError):
-            pass
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -287,117 +445,13 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
-
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
-
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
-
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return copy.deepcopy(load_plan_snapshot(spec_dir).summary)
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
-
-    except (OSError, json.JSONDecodeError):
-        return None
+    current_phase = load_plan_snapshot(spec_dir).current_phase
+    return dict(current_phase) if current_phase else None
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -410,68 +464,8 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete: dict[str, bool] = {}
-        for i, phase in enumerate(phases):
-            phase_id_value = phase.get("id")
-            phase_id_raw = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            phase_id_key = (
-                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
-            )
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            phase_complete[phase_id_key] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
-
-        # Find next available subtask
-        for phase in phases:
-            phase_id_value = phase.get("id")
-            phase_id = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
-                depends_on = [str(d) for d in depends_on_raw if d is not None]
-            elif depends_on_raw is None:
-                depends_on = []
-            else:
-                depends_on = [str(depends_on_raw)]
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", phase.get("chunks", [])):
-                status = subtask.get("status", "pending")
-                if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
-                    subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
-
-        return None
-
-    except (OSError, json.JSONDecodeError):
-        return None
+    next_subtask = load_plan_snapshot(spec_dir).next_subtask
+    return copy.deepcopy(next_subtask) if next_subtask else None
 
 
 def format_duration(seconds: float) -> str:
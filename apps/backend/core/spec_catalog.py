@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Spec Catalog
+============
+
+A small index of every spec in a project (.auto-claude/specs/.catalog.json)
+so that listing specs does not have to parse each implementation_plan.json.
+
+Each entry records the spec's number, name, status and subtask progress,
+keyed by the mtime and size of its implementation_plan.json. Plan writers
+call record_plan() to keep the entry current; on listing, any spec whose
+plan changed without going through record_plan() (or whose entry is
+missing) is re-parsed, so the catalog never needs to be trusted blindly.
+
+Usage:
+    from core.spec_catalog import SpecCatalog
+
+    specs = SpecCatalog(project_dir / ".auto-claude" / "specs").list(project_dir)
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = ".catalog.json"
+CATALOG_VERSION = 1
+
+PLAN_FILE = "implementation_plan.json"
+
+
+def summarize_plan(plan: dict[str, Any]) -> tuple[str, str]:
+    """
+    Status and progress strings for a parsed implementation plan.
+
+    Uses the same counting as core.progress.count_subtasks().
+
+    Returns:
+        (status, progress), e.g. ("in_progress", "3/5")
+    """
+    total = 0
+    completed = 0
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            total += 1
+            if subtask.get("status") == "completed":
+                completed += 1
+
+    if total == 0:
+        return "initialized", "0/0"
+    status = "complete" if completed == total else "in_progress"
+    return status, f"{completed}/{total}"
+
+
+def _plan_key(plan_file: Path) -> list[int] | None:
+    """(mtime_ns, size) of the plan file, or None if it does not exist."""
+    try:
+        st = plan_file.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _parse_folder_name(folder_name: str) -> tuple[str, str] | None:
+    """Split "001-initial-app" into ("001", "initial-app")."""
+    parts = folder_name.split("-", 1)
+    if len(parts) != 2 or not parts[0].isdigit():
+        return None
+    return parts[0], parts[1]
+
+
+def _build_folders(project_dir: Path) -> set[str]:
+    """Spec folder names that have a build worktree (new or legacy location)."""
+    names: set[str] = set()
+    for worktrees_dir in (
+        project_dir / ".auto-claude" / "worktrees" / "tasks",
+        project_dir / ".worktrees",
+    ):
+        try:
+            with os.scandir(worktrees_dir) as entries:
+                names.update(entry.name for entry in entries)
+        except OSError:
+            continue
+    return names
+
+
+class SpecCatalog:
+    """Cached per-spec status for one specs directory."""
+
+    def __init__(self, specs_dir: Path):
+        self.specs_dir = Path(specs_dir)
+        self.catalog_file = self.specs_dir / CATALOG_FILE
+        self.stats = {"parsed": 0, "cached": 0}
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Catalog entries by spec folder name (empty if missing or unreadable)."""
+        try:
+            with open(self.catalog_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+            return {}
+        specs = data.get("specs")
+        return specs if isinstance(specs, dict) else {}
+
+    def save(self, entries: dict[str, dict[str, Any]]) -> None:
+        try:
+            write_json_atomic(
+                self.catalog_file, {"version": CATALOG_VERSION, "specs": entries}
+            )
+        except OSError as e:
+            logger.debug(f"Could not write spec catalog {self.catalog_file}: {e}")
+
+    def _entry(
+        self, folder_name: str, plan: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Build a fresh entry for a spec folder, parsing its plan if needed."""
+        parsed = _parse_folder_name(folder_name)
+        if parsed is None:
+            return None
+        number, name = parsed
+
+        plan_file = self.specs_dir / folder_name / PLAN_FILE
+        key = _plan_key(plan_file)
+        if key is None:
+            status, progress = "pending", "-"
+        else:
+            if plan is None:
+                try:
+                    with open(plan_file, encoding="utf-8") as f:
+                        plan = json.load(f)
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                    plan = {}
+                self.stats["parsed"] += 1
+            status, progress = summarize_plan(plan if isinstance(plan, dict) else {})
+
+        return {
+            "number": number,
+            "name": name,
+            "plan": key,
+            "status": status,
+            "progress": progress,
+        }
+
+    def record_plan(self, spec_dir: Path, plan: dict[str, Any]) -> None:
+        """
+        Update one spec's entry right after its plan was written.
+
+        Only updates an existing catalog (created on first listing) so that
+        plan writes in worktrees and temp dirs do not scatter catalog files.
+        """
+        if not self.catalog_file.exists():
+            return
+        entries = self.load()
+        entry = self._entry(Path(spec_dir).name, plan)
+        if entry is None:
+            return
+        entries[Path(spec_dir).name] = entry
+        self.save(entries)
+
+    def list(self, project_dir: Path) -> list[dict[str, Any]]:
+        """
+        List all specs, re-parsing only plans that changed since last listing.
+
+        Returns:
+            Spec info dicts as returned by cli.spec_commands.list_specs()
+        """
+        if not self.specs_dir.exists():
+            return []
+
+        cached = self.load()
+        entries: dict[str, dict[str, Any]] = {}
+        builds = _build_folders(project_dir)
+        specs = []
+
+        for spec_folder in sorted(self.specs_dir.iterdir()):
+            folder_name = spec_folder.name
+            if not spec_folder.is_dir() or _parse_folder_name(folder_name) is None:
+                continue
+            if not (spec_folder / "spec.md").exists():
+                continue
+
+            entry = cached.get(folder_name)
+            if entry is not None and entry.get("plan") == _plan_key(
+                spec_folder / PLAN_FILE
+            ):
+                self.stats["cached"] += 1
+            else:
+                entry = self._entry(folder_name)
+            entries[folder_name] = entry
+
+            has_build = folder_name in builds
+            status = entry["status"]
+            if has_build:
+                status = f"{status} (has build)"
+
+            specs.append(
+                {
+                    "number": entry["number"],
+                    "name": entry["name"],
+                    "folder": folder_name,
+                    "path": spec_folder,
+                    "status": status,
+                    "progress": entry["progress"],
+                    "has_build": has_build,
+                }
+            )
+
+        if entries != cached:
+            self.save(entries)
+        return specs
+
+
+def record_plan(plan_file: Path, plan: dict[str, Any]) -> None:
+    """Refresh the catalog entry for a plan that was just written."""
+    spec_dir = Path(plan_file).parent
+    SpecCatalog(spec_dir.parent).record_plan(spec_dir, plan)
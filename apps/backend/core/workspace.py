@@ -71,6 +71,7 @@ except ImportError:
 
 
 # Import merge system
+from core.workspace.conflict_precheck import check_git_conflicts_bulk
 from core.workspace.display import (
     print_conflict_info as _print_conflict_info,
 )
@@ -922,14 +923,14 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     """
     Check for git-level conflicts WITHOUT modifying the working directory.
 
-    Uses git merge-tree to check conflicts in-memory, avoiding HMR triggers
-    from file system changes.
+    Uses the batched precheck (git merge-tree in memory, avoiding HMR triggers
+    from file system changes), so an unchanged (base, spec) commit pair is
+    answered from its cache. A rebase moves the spec branch, so the check
+    after a rebase is never a stale cache hit.
 
     Returns:
         Dict with has_conflicts, conflicting_files, etc.
     """
-    import re
-
     spec_branch = f"auto-claude/{spec_name}"
     result = {
         "has_conflicts": False,
@@ -941,138 +942,35 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     }
 
     try:
-        # Get current branch
-        base_result = run_git(
-            ["rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-        )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
-
-        # Get merge base
-        merge_base_result = run_git(
-            ["merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
-            return result
-
-        _merge_base = (
-            merge_base_result.stdout.strip()
-        )  # Reserved for future conflict detection
-
-        # Get commit hashes
-        main_commit_result = run_git(
-            ["rev-parse", result["base_branch"]],
-            cwd=project_dir,
-        )
-        spec_commit_result = run_git(
-            ["rev-parse", spec_branch],
-            cwd=project_dir,
-        )
-
-        if main_commit_result.returncode != 0 or spec_commit_result.returncode != 0:
-            debug_warning(MODULE, "Could not resolve branch commits")
-            return result
+        checked = check_git_conflicts_bulk(project_dir, [spec_name])[spec_name]
+    except Exception as e:
+        print(muted(f"  Error checking git conflicts: {e}"))
+        return result
 
-        main_commit = main_commit_result.stdout.strip()
-        spec_commit = spec_commit_result.stdout.strip()
+    if "error" in checked:
+        debug_warning(MODULE, "Could not check git conflicts", error=checked["error"])
+        result["base_branch"] = checked["base_branch"]
+        return result
 
-        # Check if spec branch is behind base branch (needs rebase)
-        # Count commits that are in base branch but not in spec branch
-        rev_list_result = run_git(
-            ["rev-list", "--count", f"{spec_commit}..{main_commit}"],
-            cwd=project_dir,
+    result.update(checked)
+    if result["has_conflicts"]:
+        debug(
+            MODULE,
+            f"Found {len(result['conflicting_files'])} actual git conflicts",
+            files=result["conflicting_files"],
         )
-        if rev_list_result.returncode == 0:
-            # LOGIC-002: Handle potential non-integer output gracefully
-            try:
-                commits_behind = int(rev_list_result.stdout.strip())
-            except (ValueError, AttributeError):
-                commits_behind = 0
-                debug_warning(
-                    MODULE,
-                    "Could not parse commit count from rev-list output",
-                    stdout=rev_list_result.stdout[:100]
-                    if rev_list_result.stdout
-                    else "",
-                )
-            result["commits_behind"] = commits_behind
-            if commits_behind > 0:
-                result["needs_rebase"] = True
-                debug(
-                    MODULE,
-                    f"Spec branch is {commits_behind} commit(s) behind base branch",
-                    base_branch=result["base_branch"],
-                    spec_branch=spec_branch,
-                )
-        else:
-            debug_warning(
-                MODULE,
-                "Could not count commits behind",
-                stderr=rev_list_result.stderr,
-            )
-
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = run_git(
-            [
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
+    elif result["auto_claude_conflicts_only"]:
+        # Only .auto-claude files conflict: the branches diverged but git can
+        # merge everything else - we handle this with direct file copy
+        debug(MODULE, "Only .auto-claude files conflict - branches can be merged")
+        result["diverged_but_no_conflicts"] = True  # Flag for direct copy
+    if result["needs_rebase"]:
+        debug(
+            MODULE,
+            f"Spec branch is {result['commits_behind']} commit(s) behind base branch",
+            base_branch=result["base_branch"],
+            spec_branch=spec_branch,
         )
-
-        # merge-tree returns exit code 1 if there are actual text conflicts
-        # Exit code 0 means clean merge possible
-        if merge_tree_result.returncode != 0:
-            # Parse the output for ACTUAL conflicting files (look for CONFLICT markers)
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                if "CONFLICT" in line:
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Only set has_conflicts if we found ACTUAL CONFLICT markers
-            # A non-zero exit code without CONFLICT markers just means branches diverged
-            # but git can auto-merge them - we handle this with direct file copy
-            if result["conflicting_files"]:
-                result["has_conflicts"] = True
-                debug(
-                    MODULE,
-                    f"Found {len(result['conflicting_files'])} actual git conflicts",
-                    files=result["conflicting_files"],
-                )
-            else:
-                # No CONFLICT markers = no actual conflicts
-                # Branches diverged but changes don't overlap - git can auto-merge
-                # We'll handle this by copying files directly from spec branch
-                debug(
-                    MODULE,
-                    "No CONFLICT markers - branches diverged but can be auto-merged",
-                    merge_tree_returncode=merge_tree_result.returncode,
-                )
-                result["has_conflicts"] = False
-                result["diverged_but_no_conflicts"] = True  # Flag for direct copy
-
-    except Exception as e:
-        print(muted(f"  Error checking git conflicts: {e}"))
-
     return result
 
 
@@ -35,6 +35,8 @@ _rebase_spec_branch = _workspace_module._rebase_spec_branch
 
 # Models and Enums
 # Display Functions
+# Batched conflict precheck
+from .conflict_precheck import check_git_conflicts_bulk
 from .display import (
     _print_conflict_info,
     # Export private names for backward compatibility
@@ -115,6 +117,7 @@ __all__ = [
     "_build_merge_prompt",  # Internal prompt builder (ACS-194)
     "_check_git_conflicts",  # Internal git conflict detection (ACS-224)
     "_rebase_spec_branch",  # Internal rebase function (ACS-224)
+    "check_git_conflicts_bulk",
     # Models
     "WorkspaceMode",
     "WorkspaceChoice",
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Batched Git Conflict Precheck
+=============================
+
+Checks every spec branch (auto-claude/*) against the base branch at once,
+for merge-readiness reporting across many tasks.
+
+- One `git for-each-ref` resolves the current branch and all spec branch
+  commits.
+- Each (base commit, spec commit) pair is checked with
+  `git merge-tree --write-tree` (in memory, the working directory is never
+  touched) and `git rev-list --left-right --count`. Pairs are checked
+  concurrently.
+- Results are cached in .auto-claude/git_conflicts_cache.json by the pair of
+  commit SHAs, so a refresh only runs git for branches that moved (or when
+  the base branch moved).
+
+Result dicts use the same keys as core.workspace._check_git_conflicts().
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+from core.git_executable import run_git
+
+from .git_utils import _is_auto_claude_file
+
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.conflict_precheck"
+
+SPEC_BRANCH_PREFIX = "auto-claude/"
+CACHE_FILE = "git_conflicts_cache.json"
+CACHE_VERSION = 2
+# Oldest entries are dropped beyond this (branches move, pairs go stale)
+MAX_CACHE_ENTRIES = 1000
+MAX_WORKERS = 8
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40,64}$")
+
+
+def _load_cache(cache_file: Path) -> dict[str, dict]:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("pairs")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache_file: Path, entries: dict[str, dict]) -> None:
+    if len(entries) > MAX_CACHE_ENTRIES:
+        # dicts keep insertion order: keep the most recently added pairs
+        entries = dict(list(entries.items())[-MAX_CACHE_ENTRIES:])
+    try:
+        write_json_atomic(cache_file, {"version": CACHE_VERSION, "pairs": entries})
+    except OSError as e:
+        debug_warning(MODULE, f"Could not write conflict cache: {e}")
+
+
+def resolve_branch_commits(project_dir: Path) -> tuple[str | None, dict[str, str]]:
+    """
+    Resolve all local branches with a single `git for-each-ref`.
+
+    Returns:
+        (current branch name or None if detached, {branch name: commit SHA})
+    """
+    result = run_git(
+        ["for-each-ref", "--format=%(HEAD) %(objectname) %(refname)", "refs/heads/"],
+        cwd=project_dir,
+    )
+    if result.returncode != 0:
+        debug_warning(MODULE, "for-each-ref failed", stderr=result.stderr)
+        return None, {}
+
+    current = None
+    commits: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        if len(line) < 3:
+            continue
+        # "%(HEAD)" is "*" for the checked-out branch and " " otherwise
+        marker, rest = line[0], line[2:]
+        sha, _, refname = rest.partition(" ")
+        branch = refname.removeprefix("refs/heads/")
+        commits[branch] = sha
+        if marker == "*":
+            current = branch
+    return current, commits
+
+
+def check_commit_pair(project_dir: Path, base_commit: str, spec_commit: str) -> dict:
+    """
+    Check one (base, spec) commit pair for conflicts and divergence.
+
+    Returns:
+        Dict with has_conflicts, conflicting_files, commits_behind,
+        commits_ahead and auto_claude_conflicts_only (git conflicts that are
+        all in .auto-claude files, which are never merged), or {"error": ...} if git could not check the pair
+        (e.g. unrelated histories). Errors are not cached.
+    """
+    merge_tree = run_git(
+        [
+            "merge-tree",
+            "--write-tree",
+            "--name-only",
+            "--no-messages",
+            base_commit,
+            spec_commit,
+        ],
+        cwd=project_dir,
+    )
+    lines = merge_tree.stdout.splitlines()
+    # Exit code 1 with a tree OID means conflicts; anything else is an error
+    if merge_tree.returncode not in (0, 1) or not lines or not _SHA_RE.match(lines[0]):
+        return {"error": (merge_tree.stderr or "merge-tree failed").strip()}
+
+    conflicting_files: list[str] = []
+    auto_claude_conflicts = False
+    if merge_tree.returncode == 1:
+        # With --name-only, the conflicted paths follow the tree OID
+        for path in lines[1:]:
+            if not path:
+                break
+            if _is_auto_claude_file(path):
+                auto_claude_conflicts = True
+            elif path not in conflicting_files:
+                conflicting_files.append(path)
+
+    counts = run_git(
+        ["rev-list", "--left-right", "--count", f"{base_commit}...{spec_commit}"],
+        cwd=project_dir,
+    )
+    try:
+        behind, ahead = (int(n) for n in counts.stdout.split())
+    except ValueError:
+        return {"error": (counts.stderr or "rev-list failed").strip()}
+
+    return {
+        "has_conflicts": bool(conflicting_files),
+        "conflicting_files": conflicting_files,
+        "commits_behind": behind,
+        "commits_ahead": ahead,
+        "auto_claude_conflicts_only": auto_claude_conflicts and not conflicting_files,
+    }
+
+
+def check_git_conflicts_bulk(
+    project_dir: Path,
+    spec_names: list[str] | None = None,
+    base_branch: str | None = None,
+    use_cache: bool = True,
+) -> dict[str, dict]:
+    """
+    Check spec branches for conflicts with the base branch in one pass.
+
+    Args:
+        project_dir: Project root directory
+        spec_names: Specs to check (default: every auto-claude/* branch)
+        base_branch: Branch to merge into (default: current branch)
+        use_cache: Reuse and update the (base SHA, spec SHA) result cache
+
+    Returns:
+        {spec name: result dict}. Result dicts have the keys of
+        _check_git_conflicts() (has_conflicts, conflicting_files,
+        base_branch, spec_branch, needs_rebase, commits_behind) plus
+        commits_ahead, auto_claude_conflicts_only, base_commit, spec_commit
+        and, if the spec branch could not be checked, error.
+    """
+    project_dir = Path(project_dir)
+    current, commits = resolve_branch_commits(project_dir)
+
+    base_branch = base_branch or current or "main"
+    base_commit = commits.get(base_branch)
+    if base_commit is None:
+        # Not a local branch (remote ref, tag, detached HEAD...)
+        rev_parse = run_git(
+            ["rev-parse", "--verify", "-q", base_branch], cwd=project_dir
+        )
+        if rev_parse.returncode == 0:
+            base_commit = rev_parse.stdout.strip()
+
+    if spec_names is None:
+        spec_names = sorted(
+            branch.removeprefix(SPEC_BRANCH_PREFIX)
+            for branch in commits
+            if branch.startswith(SPEC_BRANCH_PREFIX)
+        )
+
+    results: dict[str, dict] = {}
+    for spec_name in spec_names:
+        spec_branch = f"{SPEC_BRANCH_PREFIX}{spec_name}"
+        results[spec_name] = {
+            "has_conflicts": False,
+            "conflicting_files": [],
+            "base_branch": base_branch,
+            "spec_branch": spec_branch,
+            "needs_rebase": False,
+            "commits_behind": 0,
+            "commits_ahead": 0,
+            "auto_claude_conflicts_only": False,
+            "base_commit": base_commit,
+            "spec_commit": commits.get(spec_branch),
+        }
+
+    if base_commit is None:
+        debug_warning(MODULE, f"Could not resolve base branch {base_branch}")
+        for result in results.values():
+            result["error"] = f"Could not resolve base branch {base_branch}"
+        return results
+
+    cache_file = project_dir / ".auto-claude" / CACHE_FILE
+    cache = _load_cache(cache_file) if use_cache else {}
+    pending: dict[str, str] = {}
+
+    for spec_name, result in results.items():
+        spec_commit = result["spec_commit"]
+        if spec_commit is None:
+            result["error"] = f"Branch {result['spec_branch']} not found"
+            continue
+        key = f"{base_commit}:{spec_commit}"
+        if key in cache:
+            entry = cache[key]
+            result.update(entry)
+            result["conflicting_files"] = list(entry["conflicting_files"])
+        else:
+            pending[spec_name] = key
+
+    if pending:
+        debug(MODULE, f"Checking {len(pending)} of {len(results)} spec branches")
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as pool:
+            checked = dict(
+                zip(
+                    pending,
+                    pool.map(
+                        lambda name: check_commit_pair(
+                            project_dir, base_commit, results[name]["spec_commit"]
+                        ),
+                        pending,
+                    ),
+                )
+            )
+        for spec_name, outcome in checked.items():
+            results[spec_name].update(outcome)
+            if "error" not in outcome:
+                cache[pending[spec_name]] = outcome
+        if use_cache:
+            _save_cache(cache_file, cache)
+
+    for result in results.values():
+        result["needs_rebase"] = result["commits_behind"] > 0
+    return results
@@ -0,0 +1,723 @@
+#!/usr/bin/env python3
+"""
+Dependency Sharing
+==================
+
+Shares installed dependencies and build caches from the main project into
+task worktrees, so a worktree can run tests, type checks and pre-commit
+hooks without reinstalling anything.
+
+Discovery:
+- Workspace roots are the project root, the services listed in
+  .auto-claude/project_index.json, and manifest directories under
+  apps/, packages/ and services/.
+- Each root's ecosystems come from the package managers StackDetector finds
+  there (plus its manifest files, for workspace members whose lockfile is
+  hoisted to the repository root).
+
+Strategies:
+- symlink (a junction on Windows) for installed dependencies
+  (node_modules, .venv, vendor/...). Package directories that are only
+  replaced by their package manager, never edited in place, fall back to a
+  hardlink farm when the filesystem can't create links to directories.
+  Virtualenvs are only ever symlinked: their files are rewritten in place,
+  which would reach the main project through a hardlink.
+- reflink (copy-on-write clone) for build caches that tools write to
+  (cargo target/, .next/cache, .gradle). These are only shared when the
+  filesystem supports cloning (APFS, Btrfs, XFS); a plain copy would cost
+  more than it saves.
+
+Installed dependencies are only shared while the worktree's lockfile matches
+the main project's. When they differ (or the lockfile changes in the
+worktree later), the link is removed so installing in the worktree can't
+modify the main project's dependencies.
+
+What was shared, and the disk space it avoided duplicating, is recorded in
+the worktree's .auto-claude/shared_dependencies.json. A shared directory is
+only ever removed again when it is still the link (or marked hardlink farm)
+this module created.
+
+Set AUTO_CLAUDE_DEPENDENCY_SHARING to symlink, hardlink, reflink or off to
+override the per-directory strategy (default: auto).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from project.stack_detector import StackDetector
+
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.dependency_sharing"
+
+STRATEGY_ENV_VAR = "AUTO_CLAUDE_DEPENDENCY_SHARING"
+
+# Written inside the worktree (.auto-claude/ is gitignored there)
+SHARED_RECORD_FILE = Path(".auto-claude") / "shared_dependencies.json"
+
+# Directory sizes are cached per project so linking stays fast
+USAGE_CACHE_FILE = Path(".auto-claude") / "worktrees" / "dependency_usage.json"
+
+# Written into each hardlink farm, naming the directory it mirrors
+HARDLINK_MARKER = ".auto-claude-shared"
+
+# Cloning a large build cache should take seconds; give up well before a
+# stuck copy blocks workspace setup
+REFLINK_TIMEOUT_SECONDS = 300
+
+
+class ShareStrategy(Enum):
+    """How a dependency directory is made available in a worktree."""
+
+    SYMLINK = "symlink"  # Link to the project's directory (junction on Windows)
+    HARDLINK = "hardlink"  # Directory tree of hardlinks to the project's files
+    REFLINK = "reflink"  # Copy-on-write clone (private, writable copy)
+
+
+@dataclass(frozen=True)
+class DependencyDir:
+    """A dependency directory an ecosystem keeps inside a workspace root."""
+
+    path: str
+    strategy: ShareStrategy
+    # Files are only replaced by the package manager (never written in
+    # place), so a hardlink farm can't modify the main project's copy
+    hardlink_safe: bool = False
+
+
+# Dependency directories and lockfiles per ecosystem.
+# Go modules and Maven artifacts live in global caches ($GOMODCACHE, ~/.m2)
+# that every worktree already shares, so they need nothing here.
+ECOSYSTEMS: dict[str, tuple[tuple[DependencyDir, ...], tuple[str, ...]]] = {
+    "node": (
+        (DependencyDir("node_modules", ShareStrategy.SYMLINK, hardlink_safe=True),),
+        ("package-lock.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb", "bun.lock"),
+    ),
+    "python": (
+        (
+            DependencyDir(".venv", ShareStrategy.SYMLINK),
+            DependencyDir("venv", ShareStrategy.SYMLINK),
+        ),
+        ("uv.lock", "poetry.lock", "pdm.lock", "Pipfile.lock", "requirements.txt"),
+    ),
+    "rust": ((DependencyDir("target", ShareStrategy.REFLINK),), ("Cargo.lock",)),
+    "ruby": (
+        (DependencyDir("vendor/bundle", ShareStrategy.SYMLINK, hardlink_safe=True),),
+        ("Gemfile.lock",),
+    ),
+    "php": (
+        (DependencyDir("vendor", ShareStrategy.SYMLINK, hardlink_safe=True),),
+        ("composer.lock",),
+    ),
+    "gradle": ((DependencyDir(".gradle", ShareStrategy.REFLINK),), ()),
+    "nextjs": ((DependencyDir(".next/cache", ShareStrategy.REFLINK),), ()),
+}
+
+# StackDetector package manager -> ecosystem
+PACKAGE_MANAGER_ECOSYSTEMS = {
+    "npm": "node",
+    "yarn": "node",
+    "pnpm": "node",
+    "bun": "node",
+    "pip": "python",
+    "poetry": "python",
+    "uv": "python",
+    "pdm": "python",
+    "pipenv": "python",
+    "cargo": "rust",
+    "gem": "ruby",
+    "composer": "php",
+    "gradle": "gradle",
+}
+
+# Manifest files that make a directory part of an ecosystem even when its
+# lockfile lives in a parent (npm/yarn/pnpm workspaces, uv workspaces)
+MANIFEST_ECOSYSTEMS = {
+    "package.json": "node",
+    "pyproject.toml": "python",
+    "requirements.txt": "python",
+    "Cargo.toml": "rust",
+    "Gemfile": "ruby",
+    "composer.json": "php",
+    "build.gradle": "gradle",
+    "build.gradle.kts": "gradle",
+    "next.config.js": "nextjs",
+    "next.config.mjs": "nextjs",
+    "next.config.ts": "nextjs",
+}
+
+# Where monorepo workspace members usually live
+WORKSPACE_PARENTS = ("apps", "packages", "services")
+
+
+@dataclass
+class SharedDependency:
+    """A dependency directory shared into a worktree."""
+
+    path: str
+    strategy: str
+    bytes_saved: int = 0
+    files: int = 0
+    seconds: float = 0.0
+    lockfile: str | None = None
+    lockfile_hash: str | None = None
+
+
+@dataclass
+class LockfileConflict:
+    """A dependency directory not shared because its lockfile differs."""
+
+    path: str
+    lockfile: str
+    unshared: bool = False
+
+
+@dataclass
+class DependencySharingReport:
+    """Outcome of sharing dependencies into one worktree."""
+
+    shared: list[SharedDependency] = field(default_factory=list)
+    conflicts: list[LockfileConflict] = field(default_factory=list)
+    skipped: dict[str, str] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        return sum(dep.bytes_saved for dep in self.shared)
+
+    def summary(self) -> str:
+        """One-line summary for the CLI."""
+        parts = ", ".join(f"{dep.path} ({dep.strategy})" for dep in self.shared)
+        return (
+            f"{parts} - {_format_size(self.bytes_saved)} not duplicated, "
+            f"linked in {self.seconds:.2f}s"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "shared": [asdict(dep) for dep in self.shared],
+            "conflicts": [asdict(conflict) for conflict in self.conflicts],
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "bytes_saved": self.bytes_saved,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return None
+
+
+# =============================================================================
+# Discovery
+# =============================================================================
+
+
+def discover_workspace_roots(project_dir: Path) -> list[Path]:
+    """
+    Find the directories that can hold their own dependency directories.
+
+    Args:
+        project_dir: The main project directory
+
+    Returns:
+        Workspace roots relative to project_dir (Path(".") for the root)
+    """
+    project_dir = project_dir.resolve()
+    roots: dict[Path, None] = {Path("."): None}
+
+    index_file = project_dir / ".auto-claude" / "project_index.json"
+    try:
+        with open(index_file, encoding="utf-8") as f:
+            services = json.load(f).get("services", {})
+    except (OSError, json.JSONDecodeError, AttributeError):
+        services = {}
+    if isinstance(services, dict):
+        for service in services.values():
+            service_path = (
+                Path(service.get("path", "")) if isinstance(service, dict) else None
+            )
+            if not service_path:
+                continue
+            if not service_path.is_absolute():
+                service_path = project_dir / service_path
+            try:
+                rel = service_path.resolve().relative_to(project_dir)
+            except (OSError, ValueError):
+                # Index written for another checkout
+                continue
+            if (project_dir / rel).is_dir():
+                roots[rel] = None
+
+    for parent in WORKSPACE_PARENTS:
+        parent_dir = project_dir / parent
+        if not parent_dir.is_dir():
+            continue
+        for item in sorted(parent_dir.iterdir()):
+            if item.is_dir() and any((item / m).is_file() for m in MANIFEST_ECOSYSTEMS):
+                roots[item.relative_to(project_dir)] = None
+
+    return list(roots)
+
+
+def detect_ecosystems(root_dir: Path) -> list[str]:
+    """Ecosystems used in a workspace root (package managers + manifests)."""
+    detector = StackDetector(root_dir)
+    detector.detect_package_managers()
+    ecosystems: dict[str, None] = {}
+    for manager in detector.stack.package_managers:
+        if manager in PACKAGE_MANAGER_ECOSYSTEMS:
+            ecosystems[PACKAGE_MANAGER_ECOSYSTEMS[manager]] = None
+    for manifest, ecosystem in MANIFEST_ECOSYSTEMS.items():
+        if (root_dir / manifest).is_file():
+            ecosystems[ecosystem] = None
+    return list(ecosystems)
+
+
+def _find_lockfile(
+    project_dir: Path, root: Path, names: tuple[str, ...]
+) -> Path | None:
+    """Nearest lockfile for a root, walking up to the project root (hoisting)."""
+    current = root
+    while True:
+        for name in names:
+            if (project_dir / current / name).is_file():
+                return current / name
+        if current == Path("."):
+            return None
+        current = current.parent
+
+
+def _has_editable_install(venv: Path, project_dir: Path) -> bool:
+    """Whether a virtualenv has editable installs pointing at the project."""
+    marker = str(project_dir.resolve())
+    for entry in venv.glob("lib/python*/site-packages/*"):
+        if entry.suffix not in (".pth", ".egg-link"):
+            continue
+        try:
+            if marker in entry.read_text(errors="ignore"):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+# =============================================================================
+# Sharing strategies
+# =============================================================================
+
+_reflink_support: dict[tuple[int, int], bool] = {}
+
+
+def _reflink_command(source: Path, target: Path) -> list[str] | None:
+    if sys.platform == "darwin":
+        return ["cp", "-c", "-R", "-p", str(source), str(target)]
+    if sys.platform.startswith("linux"):
+        return ["cp", "-a", "--reflink=always", str(source), str(target)]
+    return None
+
+
+def supports_reflink(source_dir: Path, target_dir: Path) -> bool:
+    """Probe (once per pair of devices) whether files can be cloned."""
+    try:
+        key = (source_dir.stat().st_dev, target_dir.stat().st_dev)
+    except OSError:
+        return False
+    if key in _reflink_support:
+        return _reflink_support[key]
+
+    supported = False
+    probe = source_dir / f".reflink-probe-{os.getpid()}"
+    clone = target_dir / probe.name
+    command = _reflink_command(probe, clone)
+    if command is not None and key[0] == key[1]:
+        try:
+            probe.write_bytes(b"probe")
+            result = subprocess.run(command, capture_output=True, timeout=10)
+            supported = result.returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            supported = False
+        finally:
+            probe.unlink(missing_ok=True)
+            clone.unlink(missing_ok=True)
+    _reflink_support[key] = supported
+    return supported
+
+
+def _reflink_tree(source: Path, target: Path) -> None:
+    command = _reflink_command(source, target)
+    if command is None:
+        raise OSError("copy-on-write cloning is not supported on this platform")
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, timeout=REFLINK_TIMEOUT_SECONDS
+        )
+    except subprocess.TimeoutExpired:
+        shutil.rmtree(target, ignore_errors=True)
+        raise OSError(
+            f"cp --reflink timed out after {REFLINK_TIMEOUT_SECONDS}s"
+        ) from None
+    if result.returncode != 0:
+        shutil.rmtree(target, ignore_errors=True)
+        raise OSError(result.stderr.strip() or "cp --reflink failed")
+
+
+def _symlink_dir(source: Path, target: Path) -> None:
+    if sys.platform == "win32":
+        # Junctions need no admin rights, but require absolute paths
+        result = subprocess.run(
+            ["cmd", "/c", "mklink", "/J", str(target), str(source)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise OSError(result.stderr or "mklink /J failed")
+    else:
+        # Relative symlinks keep working if the project is moved
+        os.symlink(os.path.relpath(source, target.parent), target)
+
+
+def _hardlink_tree(source: Path, target: Path) -> None:
+    """Mirror a directory tree with hardlinked files (symlinks are copied)."""
+    try:
+        for dirpath, dirnames, filenames in os.walk(source):
+            rel = Path(dirpath).relative_to(source)
+            dest_dir = target / rel
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            for name in list(dirnames):
+                src = Path(dirpath) / name
+                if src.is_symlink():
+                    os.symlink(os.readlink(src), dest_dir / name)
+                    dirnames.remove(name)
+            for name in filenames:
+                src = Path(dirpath) / name
+                if src.is_symlink():
+                    os.symlink(os.readlink(src), dest_dir / name)
+                else:
+                    os.link(src, dest_dir / name)
+        (target / HARDLINK_MARKER).write_text(str(source.resolve()), encoding="utf-8")
+    except OSError:
+        shutil.rmtree(target, ignore_errors=True)
+        raise
+
+
+def _links_to(target: Path, source: Path) -> bool:
+    try:
+        return os.path.samefile(os.path.realpath(target), source)
+    except OSError:
+        return False
+
+
+def _remove_shared(target: Path, source: Path, strategy: str | None) -> bool:
+    """
+    Remove a directory shared into a worktree.
+
+    Only removes what this module created: a link that still points at the
+    source, or a hardlink farm carrying the marker for it. Anything else
+    (the user replaced it, a reinstall made it a real directory) is left
+    alone.
+
+    Returns:
+        True if the target was removed
+    """
+    try:
+        if strategy == ShareStrategy.SYMLINK.value:
+            if not _links_to(target, source):
+                raise OSError("no longer links to the main project")
+            if target.is_symlink():
+                target.unlink()
+            elif sys.platform == "win32":
+                # Junction: rmdir removes the link only. Never rmtree here,
+                # that could delete the main project's files through it.
+                os.rmdir(target)
+            else:
+                raise OSError("not a link")
+        elif strategy == ShareStrategy.HARDLINK.value:
+            marker = target / HARDLINK_MARKER
+            if target.is_symlink() or not marker.is_file():
+                raise OSError("not a hardlink farm created for the worktree")
+            if marker.read_text(encoding="utf-8") != str(source.resolve()):
+                raise OSError("hardlink farm mirrors another directory")
+            shutil.rmtree(target)
+        else:
+            # Reflinks are private copies, nothing reaches the main project
+            return False
+    except OSError as e:
+        debug_warning(MODULE, f"Not removing {target}: {e}")
+        return False
+    return True
+
+
+def _directory_usage(path: Path) -> tuple[int, int]:
+    """Total size in bytes and file count of a tree (symlinks not followed)."""
+    total = 0
+    files = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                            files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total, files
+
+
+def _cached_usage(
+    project_dir: Path, source: Path, rel: str, fingerprint: str
+) -> tuple[int, int]:
+    """Directory usage, cached per project until the fingerprint changes."""
+    cache_file = project_dir / USAGE_CACHE_FILE
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        cache = {}
+
+    entry = cache.get(rel)
+    if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+        return int(entry.get("bytes", 0)), int(entry.get("files", 0))
+
+    size, files = _directory_usage(source)
+    cache[rel] = {"fingerprint": fingerprint, "bytes": size, "files": files}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        debug_warning(MODULE, f"Could not save dependency usage cache: {e}")
+    return size, files
+
+
+def _strategy_override() -> ShareStrategy | None | bool:
+    """Strategy from the environment: a strategy, None (auto) or False (off)."""
+    value = os.getenv(STRATEGY_ENV_VAR, "auto").strip().lower()
+    if value in ("", "auto"):
+        return None
+    if value in ("off", "none", "0", "false"):
+        return False
+    try:
+        return ShareStrategy(value)
+    except ValueError:
+        debug_warning(MODULE, f"Ignoring invalid {STRATEGY_ENV_VAR}={value!r}")
+        return None
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def load_shared_record(worktree_path: Path) -> dict:
+    """Read what was shared into a worktree (empty if nothing recorded)."""
+    try:
+        with open(worktree_path / SHARED_RECORD_FILE, encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return record if isinstance(record, dict) else {}
+
+
+def share_dependencies_to_worktree(
+    project_dir: Path,
+    worktree_path: Path,
+    strategy: ShareStrategy | None = None,
+) -> DependencySharingReport:
+    """
+    Share the project's dependency directories into a worktree.
+
+    Existing directories in the worktree are never overwritten. Links whose
+    lockfile no longer matches the project's are removed.
+
+    Args:
+        project_dir: The main project directory
+        worktree_path: Path to the worktree
+        strategy: Force one strategy for every directory (default: per
+            directory, or AUTO_CLAUDE_DEPENDENCY_SHARING)
+
+    Returns:
+        Report of shared, conflicting, skipped and failed directories
+    """
+    started = time.monotonic()
+    report = DependencySharingReport()
+    override = strategy if strategy is not None else _strategy_override()
+    if override is False:
+        return report
+
+    previous = {
+        dep.get("path"): dep
+        for dep in load_shared_record(worktree_path).get("shared", [])
+    }
+
+    for root in discover_workspace_roots(project_dir):
+        for ecosystem in detect_ecosystems(project_dir / root):
+            dependency_dirs, lockfile_names = ECOSYSTEMS[ecosystem]
+            lockfile = _find_lockfile(project_dir, root, lockfile_names)
+            for dependency in dependency_dirs:
+                rel = (root / dependency.path).as_posix()
+                source = project_dir / rel
+                target = worktree_path / rel
+                if rel in report.skipped or any(d.path == rel for d in report.shared):
+                    continue
+                if not source.is_dir():
+                    continue
+                chosen = override or dependency.strategy
+
+                # Installed dependencies must match the worktree's lockfile
+                lockfile_hash = None
+                if lockfile is not None and chosen != ShareStrategy.REFLINK:
+                    lockfile_hash = _file_hash(project_dir / lockfile)
+                    worktree_lockfile = worktree_path / lockfile
+                    if worktree_lockfile.is_file() and (
+                        _file_hash(worktree_lockfile) != lockfile_hash
+                    ):
+                        conflict = LockfileConflict(
+                            path=rel, lockfile=lockfile.as_posix()
+                        )
+                        if rel in previous and (target.is_symlink() or target.exists()):
+                            conflict.unshared = _remove_shared(
+                                target, source, previous[rel].get("strategy")
+                            )
+                        report.conflicts.append(conflict)
+                        debug_warning(
+                            MODULE,
+                            f"Not sharing {rel}: {lockfile} differs from project",
+                        )
+                        continue
+
+                if target.exists() or target.is_symlink():
+                    # Never overwrite (also covers broken symlinks)
+                    if rel in previous:
+                        report.shared.append(SharedDependency(**previous[rel]))
+                    else:
+                        report.skipped[rel] = "already exists in worktree"
+                    continue
+
+                if dependency.path in (".venv", "venv") and _has_editable_install(
+                    source, project_dir
+                ):
+                    report.skipped[rel] = "editable install points at the main project"
+                    continue
+
+                if chosen == ShareStrategy.HARDLINK and not dependency.hardlink_safe:
+                    report.skipped[rel] = "written in place, can only be symlinked"
+                    continue
+
+                if chosen == ShareStrategy.REFLINK and not supports_reflink(
+                    source.parent, worktree_path
+                ):
+                    report.skipped[rel] = "filesystem does not support copy-on-write"
+                    continue
+
+                try:
+                    fingerprint = f"{source.stat().st_mtime_ns}:{lockfile_hash}"
+                except OSError:
+                    fingerprint = ""
+                shared = _share_one(
+                    project_dir,
+                    source,
+                    target,
+                    rel,
+                    chosen,
+                    dependency.hardlink_safe,
+                    fingerprint,
+                    report,
+                )
+                if shared is None:
+                    continue
+                if lockfile is not None and chosen != ShareStrategy.REFLINK:
+                    shared.lockfile = lockfile.as_posix()
+                    shared.lockfile_hash = lockfile_hash
+                report.shared.append(shared)
+
+    report.seconds = time.monotonic() - started
+    if report.shared or report.conflicts or previous:
+        try:
+            record_file = worktree_path / SHARED_RECORD_FILE
+            record_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(record_file, "w", encoding="utf-8") as f:
+                json.dump(report.to_dict(), f, indent=2)
+        except OSError as e:
+            debug_warning(MODULE, f"Could not record shared dependencies: {e}")
+    return report
+
+
+def _share_one(
+    project_dir: Path,
+    source: Path,
+    target: Path,
+    rel: str,
+    strategy: ShareStrategy,
+    hardlink_safe: bool,
+    fingerprint: str,
+    report: DependencySharingReport,
+) -> SharedDependency | None:
+    """Share a single directory, falling back from symlinks to a hardlink farm."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    attempts = [strategy]
+    if strategy == ShareStrategy.SYMLINK and hardlink_safe:
+        attempts.append(ShareStrategy.HARDLINK)
+
+    for attempt in attempts:
+        try:
+            if attempt == ShareStrategy.SYMLINK:
+                _symlink_dir(source, target)
+            elif attempt == ShareStrategy.HARDLINK:
+                _hardlink_tree(source, target)
+            else:
+                _reflink_tree(source, target)
+        except OSError as e:
+            debug_warning(MODULE, f"Could not {attempt.value} {rel}: {e}")
+            report.failed[rel] = str(e)
+            continue
+
+        report.failed.pop(rel, None)
+        size, files = _cached_usage(project_dir, source, rel, fingerprint)
+        debug(MODULE, f"Shared {rel} via {attempt.value} ({_format_size(size)})")
+        return SharedDependency(
+            path=rel,
+            strategy=attempt.value,
+            bytes_saved=size,
+            files=files,
+            seconds=round(time.monotonic() - started, 3),
+        )
+    return None
@@ -28,6 +28,16 @@ from typing import TypedDict, TypeVar
 
 from core.gh_executable import get_gh_executable, invalidate_gh_cache
 from core.git_executable import get_git_executable, get_isolated_git_env, run_git
+from core.worktree_pool import WorktreePool, get_pool_size_from_env
+from core.worktree_stats import (
+    common_git_dir,
+    compute_worktree_stats,
+    parse_commit_date,
+    read_worktree_head,
+    resolve_ref,
+    stats_cache_path,
+    worktree_git_dir,
+)
 from debug import debug_warning
 
 T = TypeVar("T")
@@ -178,11 +188,35 @@ class WorktreeManager:
     GH_CLI_TIMEOUT = 60  # 1 minute for gh CLI commands
     GH_QUERY_TIMEOUT = 30  # 30 seconds for gh CLI queries
 
-    def __init__(self, project_dir: Path, base_branch: str | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        base_branch: str | None = None,
+        pool_size: int | None = None,
+        prepare_worktree: Callable[[Path], None] | None = None,
+    ):
+        """
+        Args:
+            project_dir: The main project directory
+            base_branch: Base branch for new worktrees (auto-detected if None)
+            pool_size: Number of pre-warmed worktrees to keep parked
+                (default: AUTO_CLAUDE_WORKTREE_POOL_SIZE, 0 disables the pool)
+            prepare_worktree: Sets up a parked worktree before it is claimed
+                (e.g. copies env files and links dependencies)
+        """
         self.project_dir = project_dir
         self.base_branch = base_branch or self._detect_base_branch()
         self.worktrees_dir = project_dir / ".auto-claude" / "worktrees" / "tasks"
         self._merge_lock = asyncio.Lock()
+        if pool_size is None:
+            pool_size = get_pool_size_from_env()
+        self.pool = (
+            WorktreePool(
+                project_dir, self.base_branch, pool_size, prepare=prepare_worktree
+            )
+            if pool_size > 0
+            else None
+        )
 
     def _detect_base_branch(self) -> str:
         """
@@ -338,28 +372,44 @@ class WorktreeManager:
 
     def get_worktree_info(self, spec_name: str) -> WorktreeInfo | None:
         """Get info about a spec's worktree."""
-        worktree_path = self.get_worktree_path(spec_name)
-        if not worktree_path.exists():
-            return None
-
-        # Verify the branch exists in the worktree
-        result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree_path)
-        if result.returncode != 0:
-            return None
+        infos = self._get_worktree_infos([spec_name])
+        return infos[0] if infos else None
+
+    def _get_worktree_infos(self, spec_names: list[str]) -> list[WorktreeInfo]:
+        """Get info about several worktrees, computing their stats in one batch."""
+        branches: dict[str, str] = {}
+        heads: dict[str, str | None] = {}
+        for spec_name in spec_names:
+            worktree_path = self.get_worktree_path(spec_name)
+            if not worktree_path.exists():
+                continue
 
-        actual_branch = result.stdout.strip()
+            # Read the branch from the worktree's HEAD file, falling back to git
+            branch, head = read_worktree_head(worktree_path)
+            if branch is None:
+                result = self._run_git(
+                    ["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree_path
+                )
+                if result.returncode != 0:
+                    continue
+                branch = result.stdout.strip()
+            branches[spec_name] = branch
+            heads[spec_name] = head
 
         # Get statistics
-        stats = self._get_worktree_stats(spec_name)
-
-        return WorktreeInfo(
-            path=worktree_path,
-            branch=actual_branch,
-            spec_name=spec_name,
-            base_branch=self.base_branch,
-            is_active=True,
-            **stats,
-        )
+        stats = self._get_worktree_stats_batch(heads)
+
+        return [
+            WorktreeInfo(
+                path=self.get_worktree_path(spec_name),
+                branch=branch,
+                spec_name=spec_name,
+                base_branch=self.base_branch,
+                is_active=True,
+                **stats[spec_name],
+            )
+            for spec_name, branch in branches.items()
+        ]
 
     def _check_branch_namespace_conflict(self) -> str | None:
         """
@@ -380,88 +430,100 @@ class WorktreeManager:
 
     def _get_worktree_stats(self, spec_name: str) -> dict:
         """Get diff statistics for a worktree."""
-        worktree_path = self.get_worktree_path(spec_name)
+        return self._get_worktree_stats_batch({spec_name: None})[spec_name]
+
+    def _resolve_base_commit(self) -> str | None:
+        """Commit SHA of the base branch, read from the ref files when possible."""
+        git_dir = self.project_dir / ".git"
+        if not git_dir.is_dir():
+            git_dir = worktree_git_dir(self.project_dir)
+        if git_dir is not None:
+            common_dir = common_git_dir(git_dir)
+            base = self.base_branch
+            candidates = (
+                [base]
+                if base.startswith("refs/")
+                else [f"refs/heads/{base}", f"refs/remotes/{base}"]
+            )
+            for ref in candidates:
+                sha = resolve_ref(common_dir, ref)
+                if sha:
+                    return sha
+
+        result = self._run_git(["rev-parse", "--verify", "-q", self.base_branch])
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+        return None
+
+    def _get_worktree_stats_batch(self, heads: dict[str, str | None]) -> dict:
+        """
+        Get diff statistics for several worktrees.
 
+        Statistics are cached by (HEAD commit, base commit) and cache misses
+        are computed together (see core.worktree_stats).
+
+        Args:
+            heads: Spec name -> worktree HEAD commit, or None to read it here
+
+        Returns:
+            Spec name -> stats dict
+        """
         stats = {
-            "commit_count": 0,
-            "files_changed": 0,
-            "additions": 0,
-            "deletions": 0,
-            "last_commit_date": None,
-            "days_since_last_commit": None,
+            spec_name: {
+                "commit_count": 0,
+                "files_changed": 0,
+                "additions": 0,
+                "deletions": 0,
+                "last_commit_date": None,
+                "days_since_last_commit": None,
+            }
+            for spec_name in heads
         }
 
-        if not worktree_path.exists():
+        resolved: dict[str, str] = {}
+        for spec_name, head in heads.items():
+            worktree_path = self.get_worktree_path(spec_name)
+            if not worktree_path.exists():
+                continue
+            if head is None:
+                head = read_worktree_head(worktree_path)[1]
+            if head is None:
+                result = self._run_git(["rev-parse", "HEAD"], cwd=worktree_path)
+                if result.returncode != 0:
+                    continue
+                head = result.stdout.strip()
+            resolved[spec_name] = head
+
+        if not resolved:
             return stats
 
-        # Commit count
-        result = self._run_git(
-            ["rev-list", "--count", f"{self.base_branch}..HEAD"], cwd=worktree_path
-        )
-        if result.returncode == 0:
-            stats["commit_count"] = int(result.stdout.strip() or "0")
+        base_commit = self._resolve_base_commit()
+        if base_commit is None:
+            debug_warning(
+                "worktree", f"Could not resolve base branch {self.base_branch}"
+            )
+            return stats
 
-        # Last commit date (most recent commit in this worktree)
-        result = self._run_git(
-            ["log", "-1", "--format=%cd", "--date=iso"], cwd=worktree_path
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                # Parse ISO date format: "2026-01-04 00:25:25 +0100"
-                date_str = result.stdout.strip()
-                # Convert git format to ISO format for fromisoformat()
-                # "2026-01-04 00:25:25 +0100" -> "2026-01-04T00:25:25+01:00"
-                parts = date_str.rsplit(" ", 1)
-                if len(parts) == 2:
-                    date_part, tz_part = parts
-                    # Convert timezone format: "+0100" -> "+01:00"
-                    if len(tz_part) == 5 and (
-                        tz_part.startswith("+") or tz_part.startswith("-")
-                    ):
-                        tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
-                        iso_str = f"{date_part.replace(' ', 'T')}{tz_formatted}"
-                        last_commit_date = datetime.fromisoformat(iso_str)
-                        stats["last_commit_date"] = last_commit_date
-                        # Use timezone-aware now() for accurate comparison
-                        now_aware = datetime.now(last_commit_date.tzinfo)
-                        stats["days_since_last_commit"] = (
-                            now_aware - last_commit_date
-                        ).days
-                    else:
-                        # Fallback for unexpected timezone format
-                        last_commit_date = datetime.strptime(
-                            parts[0], "%Y-%m-%d %H:%M:%S"
-                        )
-                        stats["last_commit_date"] = last_commit_date
-                        stats["days_since_last_commit"] = (
-                            datetime.now() - last_commit_date
-                        ).days
-                else:
-                    # No timezone in output
-                    last_commit_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    stats["last_commit_date"] = last_commit_date
-                    stats["days_since_last_commit"] = (
-                        datetime.now() - last_commit_date
-                    ).days
-            except (ValueError, TypeError) as e:
-                # If parsing fails, silently continue without date info
-                pass
-
-        # Diff stats
-        result = self._run_git(
-            ["diff", "--shortstat", f"{self.base_branch}...HEAD"], cwd=worktree_path
+        computed = compute_worktree_stats(
+            self.project_dir,
+            base_commit,
+            list(resolved.values()),
+            cache_file=stats_cache_path(self.project_dir),
         )
-        if result.returncode == 0 and result.stdout.strip():
-            # Parse: "3 files changed, 50 insertions(+), 10 deletions(-)"
-            match = re.search(r"(\d+) files? changed", result.stdout)
-            if match:
-                stats["files_changed"] = int(match.group(1))
-            match = re.search(r"(\d+) insertions?", result.stdout)
-            if match:
-                stats["additions"] = int(match.group(1))
-            match = re.search(r"(\d+) deletions?", result.stdout)
-            if match:
-                stats["deletions"] = int(match.group(1))
+
+        for spec_name, head in resolved.items():
+            entry = computed.get(head)
+            if entry is None:
+                continue
+            spec_stats = stats[spec_name]
+            for key in ("commit_count", "files_changed", "additions", "deletions"):
+                spec_stats[key] = entry.get(key, 0)
+            last_commit_date = parse_commit_date(entry.get("last_commit_date") or "")
+            if last_commit_date is not None:
+                spec_stats["last_commit_date"] = last_commit_date
+                # Use timezone-aware now() for accurate comparison
+                now = datetime.now(last_commit_date.tzinfo)
+                spec_stats["days_since_last_commit"] = (now - last_commit_date).days
 
         return stats
 
@@ -469,6 +531,9 @@ class WorktreeManager:
         """
         Create a worktree for a spec.
 
+        Claims a pre-warmed worktree from the pool when one is enabled and
+        parked; otherwise fetches the base branch and checks out a new worktree.
+
         Args:
             spec_name: The spec folder name (e.g., "002-implement-memory")
 
@@ -501,6 +566,24 @@ class WorktreeManager:
         # Delete branch if it exists (from previous attempt)
         self._run_git(["branch", "-D", branch_name])
 
+        # Claim a pre-warmed worktree if one is parked (skips fetch + checkout)
+        if self.pool is not None:
+            claim_start = time.monotonic()
+            if self.pool.claim(worktree_path, branch_name):
+                # Refill the slot in the background for the next task
+                self.pool.replenish_async()
+                print(
+                    f"Claimed pre-warmed worktree: {worktree_path.name} on branch "
+                    f"{branch_name} ({time.monotonic() - claim_start:.2f}s)"
+                )
+                return WorktreeInfo(
+                    path=worktree_path,
+                    branch=branch_name,
+                    spec_name=spec_name,
+                    base_branch=self.base_branch,
+                    is_active=True,
+                )
+
         # Fetch latest from remote to ensure we have the most up-to-date code
         # GitHub/remote is the source of truth, not the local branch
         fetch_result = self._run_git(["fetch", "origin", self.base_branch])
@@ -537,6 +620,10 @@ class WorktreeManager:
 
         print(f"Created worktree: {worktree_path.name} on branch {branch_name}")
 
+        # Pool miss: warm it after our own fetch/checkout so they don't contend
+        if self.pool is not None:
+            self.pool.replenish_async()
+
         return WorktreeInfo(
             path=worktree_path,
             branch=branch_name,
@@ -712,28 +799,22 @@ class WorktreeManager:
 
     def list_all_worktrees(self) -> list[WorktreeInfo]:
         """List all spec worktrees (includes legacy .worktrees/ location)."""
-        worktrees = []
-        seen_specs = set()
+        spec_names = []
 
         # Check new location first
         if self.worktrees_dir.exists():
             for item in self.worktrees_dir.iterdir():
                 if item.is_dir():
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
-                        seen_specs.add(item.name)
+                    spec_names.append(item.name)
 
         # Check legacy location (.worktrees/)
         legacy_dir = self.project_dir / ".worktrees"
         if legacy_dir.exists():
             for item in legacy_dir.iterdir():
-                if item.is_dir() and item.name not in seen_specs:
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
+                if item.is_dir() and item.name not in spec_names:
+                    spec_names.append(item.name)
 
-        return worktrees
+        return self._get_worktree_infos(spec_names)
 
     def list_all_spec_branches(self) -> list[str]:
         """List all auto-claude branches (even if worktree removed)."""
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Pre-warmed Worktree Pool
+========================
+
+Creating a task worktree from scratch means a network fetch of the base
+branch, a full ``git worktree add`` checkout and then copying env files and
+linking node_modules into it. On large repositories that is the slowest part
+of starting a build.
+
+The pool keeps up to N detached worktrees parked at the latest base commit
+under .auto-claude/worktrees/pool/slot-{n}/, already prepared (env files,
+dependency links). A new task claims a slot: the slot is moved to the task's
+worktree path and only the task branch is created there, which touches just
+the files that differ from the parked commit. Slots are refreshed and
+replenished in a background thread after each claim.
+
+Slots live on disk, so they are shared by every process working on the
+project. Each slot has a metadata file next to it (slot-{n}.json) that is
+written only once the slot is fully prepared, and a lock file (slot-{n}.lock)
+held while a slot is claimed or refreshed.
+
+Enable with AUTO_CLAUDE_WORKTREE_POOL_SIZE=<n> (0 or unset disables the pool).
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from core.git_executable import run_git
+from debug import debug, debug_warning
+
+MODULE = "worktree.pool"
+
+# Environment variable holding the number of parked worktrees
+POOL_SIZE_ENV_VAR = "AUTO_CLAUDE_WORKTREE_POOL_SIZE"
+
+# Slots are fetched again before a claim if the last fetch is older than this
+DEFAULT_MAX_BASE_AGE = 600.0
+
+# Slot locks older than this are assumed to belong to a crashed process
+LOCK_STALE_SECONDS = 600.0
+
+STATS_FILE = "stats.json"
+STATE_FILE = "state.json"
+
+
+def get_pool_size_from_env() -> int:
+    """Read the configured pool size (0 when unset or invalid)."""
+    value = os.getenv(POOL_SIZE_ENV_VAR, "").strip()
+    if not value:
+        return 0
+    try:
+        return max(0, int(value))
+    except ValueError:
+        debug_warning(MODULE, f"Ignoring invalid {POOL_SIZE_ENV_VAR}={value!r}")
+        return 0
+
+
+class WorktreePool:
+    """
+    Pool of prepared, detached worktrees parked at the base branch.
+
+    Usage:
+        pool = WorktreePool(project_dir, "main", size=2, prepare=link_deps)
+        if pool.claim(target_path, "auto-claude/001-feature"):
+            ...  # target_path is a ready worktree on the new branch
+        pool.replenish_async()
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        base_branch: str,
+        size: int,
+        prepare: Callable[[Path], None] | None = None,
+        max_base_age: float = DEFAULT_MAX_BASE_AGE,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            project_dir: The main project directory
+            base_branch: Branch that slots are parked at (origin/<branch> preferred)
+            size: Number of slots to keep ready
+            prepare: Called with a new slot's path to set it up (env files,
+                dependency links) before the slot is offered for claiming
+            max_base_age: Seconds after which a claim re-fetches the base branch
+        """
+        self.project_dir = project_dir
+        self.base_branch = base_branch
+        self.size = size
+        self.prepare = prepare
+        self.max_base_age = max_base_age
+        self.pool_dir = project_dir / ".auto-claude" / "worktrees" / "pool"
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+
+    # ==================== Git helpers ====================
+
+    def _run_git(self, args: list[str], cwd: Path | None = None, timeout: int = 60):
+        return run_git(args, cwd=cwd or self.project_dir, timeout=timeout)
+
+    def fetch(self) -> bool:
+        """Fetch the base branch from origin and record when it happened."""
+        result = self._run_git(["fetch", "origin", self.base_branch], timeout=120)
+        if result.returncode != 0:
+            debug_warning(
+                MODULE,
+                f"Could not fetch {self.base_branch} from origin: {result.stderr}",
+            )
+            return False
+        self._write_json(self.pool_dir / STATE_FILE, {"fetched_at": time.time()})
+        return True
+
+    def resolve_start_point(self) -> tuple[str, str] | None:
+        """
+        Resolve the ref and commit new task branches start from.
+
+        Returns:
+            (ref, commit SHA), preferring origin/<base> over the local branch,
+            or None if neither exists
+        """
+        for ref in (f"origin/{self.base_branch}", self.base_branch):
+            result = self._run_git(["rev-parse", "--verify", f"{ref}^{{commit}}"])
+            if result.returncode == 0:
+                return ref, result.stdout.strip()
+        return None
+
+    def _base_is_stale(self) -> bool:
+        state = self._read_json(self.pool_dir / STATE_FILE) or {}
+        fetched_at = state.get("fetched_at", 0)
+        return time.time() - fetched_at > self.max_base_age
+
+    # ==================== Slot bookkeeping ====================
+
+    def _slot_path(self, index: int) -> Path:
+        return self.pool_dir / f"slot-{index}"
+
+    def _meta_path(self, slot: Path) -> Path:
+        return slot.with_name(f"{slot.name}.json")
+
+    def _lock_path(self, slot: Path) -> Path:
+        return slot.with_name(f"{slot.name}.lock")
+
+    @staticmethod
+    def _read_json(path: Path) -> dict | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _try_lock(self, slot: Path) -> bool:
+        """Take the slot's lock file (shared between processes)."""
+        lock_path = self._lock_path(slot)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    age = time.time() - lock_path.stat().st_mtime
+                except OSError:
+                    continue
+                if age < LOCK_STALE_SECONDS:
+                    return False
+                debug_warning(MODULE, f"Breaking stale lock on {slot.name}")
+                lock_path.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    def _unlock(self, slot: Path) -> None:
+        self._lock_path(slot).unlink(missing_ok=True)
+
+    def _discard_slot(self, slot: Path) -> None:
+        """Remove a slot that is half-created or can't be reset."""
+        self._meta_path(slot).unlink(missing_ok=True)
+        if slot.exists():
+            self._run_git(["worktree", "remove", "--force", str(slot)])
+            shutil.rmtree(slot, ignore_errors=True)
+        self._run_git(["worktree", "prune"])
+
+    def ready_slots(self) -> list[Path]:
+        """Slots that are fully prepared and can be claimed."""
+        return [
+            self._slot_path(i)
+            for i in range(self.size)
+            if self._slot_path(i).is_dir()
+            and self._meta_path(self._slot_path(i)).is_file()
+        ]
+
+    # ==================== Claiming ====================
+
+    def claim(self, target_path: Path, branch_name: str) -> bool:
+        """
+        Turn a parked slot into a task worktree.
+
+        The slot is moved to target_path and branch_name is created at the
+        current base commit. Any files that changed since the slot was parked
+        are updated by the checkout; everything else is reused as-is.
+
+        Args:
+            target_path: Worktree path for the task (must not exist)
+            branch_name: Branch to create (must not exist)
+
+        Returns:
+            True on a pool hit, False if the caller has to create the worktree
+        """
+        started = time.monotonic()
+        claimed = self._claim(target_path, branch_name)
+        self._record_claim(claimed, time.monotonic() - started)
+        return claimed
+
+    def _claim(self, target_path: Path, branch_name: str) -> bool:
+        if self.size <= 0 or not self.ready_slots():
+            return False
+
+        if self._base_is_stale():
+            self.fetch()
+        start_point = self.resolve_start_point()
+        if start_point is None:
+            return False
+        start_ref, _ = start_point
+
+        for slot in self.ready_slots():
+            with self._lock:
+                if not self._try_lock(slot):
+                    continue
+            try:
+                if not self._meta_path(slot).is_file():
+                    continue
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                result = self._run_git(
+                    ["worktree", "move", str(slot), str(target_path)]
+                )
+                if result.returncode != 0:
+                    debug_warning(
+                        MODULE, f"Could not move {slot.name}: {result.stderr}"
+                    )
+                    self._discard_slot(slot)
+                    continue
+                self._meta_path(slot).unlink(missing_ok=True)
+
+                # Same start point and upstream tracking as `worktree add -b`
+                result = self._run_git(
+                    ["checkout", "-B", branch_name, start_ref], cwd=target_path
+                )
+                if result.returncode != 0:
+                    debug_warning(
+                        MODULE,
+                        f"Could not create {branch_name} in claimed slot: "
+                        f"{result.stderr}",
+                    )
+                    self._discard_slot(target_path)
+                    return False
+                debug(MODULE, f"Claimed {slot.name} as {target_path.name}")
+                return True
+            finally:
+                self._unlock(slot)
+        return False
+
+    # ==================== Replenishing ====================
+
+    def replenish(self) -> int:
+        """
+        Fetch the base branch and bring every slot to the latest base commit.
+
+        Missing slots are created and prepared; parked slots at an older
+        commit are moved forward. Slots locked by another process are skipped.
+
+        Returns:
+            Number of slots created or refreshed
+        """
+        if self.size <= 0:
+            return 0
+        with self._refresh_lock:
+            self.fetch()
+            start_point = self.resolve_start_point()
+            if start_point is None:
+                return 0
+            _, commit = start_point
+
+            changed = 0
+            for index in range(self.size):
+                slot = self._slot_path(index)
+                with self._lock:
+                    if not self._try_lock(slot):
+                        continue
+                try:
+                    if self._refresh_slot(slot, commit):
+                        changed += 1
+                except OSError as e:
+                    debug_warning(MODULE, f"Could not refresh {slot.name}: {e}")
+                finally:
+                    self._unlock(slot)
+            return changed
+
+    def _refresh_slot(self, slot: Path, commit: str) -> bool:
+        meta = self._read_json(self._meta_path(slot))
+        if meta is not None and slot.is_dir():
+            if meta.get("commit") == commit:
+                return False
+            result = self._run_git(
+                ["checkout", "--detach", "--force", commit], cwd=slot
+            )
+            if result.returncode == 0:
+                meta.update(commit=commit, parked_at=datetime.now().isoformat())
+                self._write_json(self._meta_path(slot), meta)
+                self._update_stats(slots_refreshed=1)
+                return True
+            debug_warning(MODULE, f"Could not reset {slot.name}: {result.stderr}")
+
+        # Missing, half-created (no metadata) or broken: start over
+        self._discard_slot(slot)
+        result = self._run_git(["worktree", "add", "--detach", str(slot), commit])
+        if result.returncode != 0:
+            debug_warning(MODULE, f"Could not create {slot.name}: {result.stderr}")
+            return False
+        if self.prepare is not None:
+            self.prepare(slot)
+        self._write_json(
+            self._meta_path(slot),
+            {
+                "base_branch": self.base_branch,
+                "commit": commit,
+                "parked_at": datetime.now().isoformat(),
+            },
+        )
+        self._update_stats(slots_created=1)
+        return True
+
+    def replenish_async(self) -> threading.Thread | None:
+        """Replenish in a background thread (no-op if one is already running)."""
+        if self.size <= 0:
+            return None
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            self._refresh_thread = threading.Thread(
+                target=self._replenish_quietly,
+                name="worktree-pool-replenish",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def _replenish_quietly(self) -> None:
+        try:
+            self.replenish()
+        except Exception as e:
+            debug_warning(MODULE, f"Background replenish failed: {e}")
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for a running background replenish to finish."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def clear(self) -> None:
+        """Remove all parked slots."""
+        self.wait()
+        if not self.pool_dir.exists():
+            return
+        for slot in self.pool_dir.glob("slot-*"):
+            if slot.is_dir():
+                self._discard_slot(slot)
+
+    # ==================== Metrics ====================
+
+    def _update_stats(self, **increments: float) -> None:
+        with self._lock:
+            stats_path = self.pool_dir / STATS_FILE
+            stats = self._read_json(stats_path) or {}
+            for key, value in increments.items():
+                stats[key] = stats.get(key, 0) + value
+            try:
+                self._write_json(stats_path, stats)
+            except OSError as e:
+                debug_warning(MODULE, f"Could not save pool stats: {e}")
+
+    def _record_claim(self, hit: bool, seconds: float) -> None:
+        self._update_stats(
+            hits=1 if hit else 0,
+            misses=0 if hit else 1,
+            claim_seconds_total=seconds,
+        )
+        debug(
+            MODULE,
+            f"Pool {'hit' if hit else 'miss'} for claim in {seconds:.3f}s",
+        )
+
+    def get_stats(self) -> dict:
+        """
+        Cumulative pool metrics across all processes.
+
+        Returns:
+            Dict with hits, misses, hit_rate, avg_claim_seconds,
+            slots_created, slots_refreshed and ready_slots
+        """
+        stats = self._read_json(self.pool_dir / STATS_FILE) or {}
+        hits = int(stats.get("hits", 0))
+        misses = int(stats.get("misses", 0))
+        claims = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / claims if claims else 0.0,
+            "avg_claim_seconds": (
+                stats.get("claim_seconds_total", 0.0) / claims if claims else 0.0
+            ),
+            "slots_created": int(stats.get("slots_created", 0)),
+            "slots_refreshed": int(stats.get("slots_refreshed", 0)),
+            "ready_slots": len(self.ready_slots()),
+        }
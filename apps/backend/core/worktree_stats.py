@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Worktree Statistics Cache
+=========================
+
+Listing worktrees used to run three git commands per worktree
+(rev-list --count, log -1 and diff --shortstat) plus a rev-parse for its
+branch. Those statistics only depend on the worktree's HEAD commit and the
+base branch commit, so they are cached by that pair in the repository's
+shared git directory (.git/auto-claude/worktree_stats.json). Keeping the cache
+there means it never shows up as an untracked file in the project, which would
+block merges that require a clean working tree.
+
+HEADs are read straight from the worktree's git files: the worktree's .git
+file points at its admin directory (.git/worktrees/<name>/; pool-claimed
+worktrees keep their slot-{n} admin name, so the directory name can't be
+derived from the spec name), whose HEAD names a branch that is resolved from
+the loose ref or packed-refs. Nothing is spawned unless a file is missing or
+in an unexpected format.
+
+Cache misses are computed together: the commit dates of every missed HEAD
+come from one `git show`, and the per-worktree counts and diff stats run
+concurrently.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+from core.git_executable import run_git
+from debug import debug, debug_warning
+
+MODULE = "worktree.stats"
+
+STATS_CACHE_FILE = "worktree_stats.json"
+STATS_CACHE_VERSION = 1
+# Oldest entries are dropped beyond this (every new commit adds a key)
+MAX_CACHE_ENTRIES = 500
+MAX_WORKERS = 8
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40,64}$")
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def worktree_git_dir(worktree_path: Path) -> Path | None:
+    """Admin directory of a linked worktree, from its `.git` file."""
+    content = _read_text(worktree_path / ".git")
+    if not content or not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content.removeprefix("gitdir:").strip())
+    if not git_dir.is_absolute():
+        git_dir = (worktree_path / git_dir).resolve()
+    return git_dir
+
+
+def common_git_dir(git_dir: Path) -> Path:
+    """The repository's shared git directory for a worktree admin directory."""
+    common = _read_text(git_dir / "commondir")
+    if not common:
+        return git_dir
+    common_dir = Path(common)
+    if not common_dir.is_absolute():
+        common_dir = (git_dir / common_dir).resolve()
+    return common_dir
+
+
+def resolve_ref(common_dir: Path, ref: str) -> str | None:
+    """Resolve a full ref name (refs/heads/...) from loose refs or packed-refs."""
+    sha = _read_text(common_dir / ref)
+    if sha and _SHA_RE.match(sha):
+        return sha
+
+    packed = _read_text(common_dir / "packed-refs")
+    if packed:
+        for line in packed.splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            sha, _, name = line.partition(" ")
+            if name == ref and _SHA_RE.match(sha):
+                return sha
+    return None
+
+
+def read_worktree_head(worktree_path: Path) -> tuple[str | None, str | None]:
+    """
+    Read a worktree's branch and HEAD commit without running git.
+
+    Returns:
+        (branch, commit SHA). The branch is "HEAD" when detached, matching
+        `git rev-parse --abbrev-ref HEAD`. Either value is None if it could
+        not be read from the git files.
+    """
+    git_dir = worktree_git_dir(worktree_path)
+    if git_dir is None:
+        return None, None
+
+    head = _read_text(git_dir / "HEAD")
+    if not head:
+        return None, None
+    if _SHA_RE.match(head):
+        return "HEAD", head
+    if not head.startswith("ref:"):
+        return None, None
+
+    ref = head.removeprefix("ref:").strip()
+    branch = ref.removeprefix("refs/heads/")
+    return branch, resolve_ref(common_git_dir(git_dir), ref)
+
+
+def stats_cache_path(project_dir: Path) -> Path | None:
+    """Location of the stats cache inside the project's shared git directory."""
+    git_dir = project_dir / ".git"
+    if not git_dir.is_dir():
+        git_dir = worktree_git_dir(project_dir)
+        if git_dir is None:
+            return None
+    return common_git_dir(git_dir) / "auto-claude" / STATS_CACHE_FILE
+
+
+def parse_commit_date(date_str: str) -> datetime | None:
+    """Parse a strict ISO 8601 git date (%cI), keeping its timezone."""
+    try:
+        return datetime.fromisoformat(date_str.strip())
+    except ValueError:
+        return None
+
+
+def _load_cache(cache_file: Path) -> dict[str, dict]:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATS_CACHE_VERSION:
+        return {}
+    entries = data.get("stats")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache_file: Path, entries: dict[str, dict]) -> None:
+    if len(entries) > MAX_CACHE_ENTRIES:
+        # dicts keep insertion order: keep the most recently added entries
+        entries = dict(list(entries.items())[-MAX_CACHE_ENTRIES:])
+    try:
+        write_json_atomic(
+            cache_file, {"version": STATS_CACHE_VERSION, "stats": entries}
+        )
+    except OSError as e:
+        debug_warning(MODULE, f"Could not write worktree stats cache: {e}")
+
+
+def _diff_counts(project_dir: Path, base_commit: str, head: str) -> dict:
+    counts = {"commit_count": 0, "files_changed": 0, "additions": 0, "deletions": 0}
+
+    result = run_git(["rev-list", "--count", f"{base_commit}..{head}"], cwd=project_dir)
+    if result.returncode == 0:
+        counts["commit_count"] = int(result.stdout.strip() or "0")
+
+    result = run_git(
+        ["diff", "--shortstat", f"{base_commit}...{head}"], cwd=project_dir
+    )
+    if result.returncode == 0 and result.stdout.strip():
+        # Parse: "3 files changed, 50 insertions(+), 10 deletions(-)"
+        for key, pattern in (
+            ("files_changed", r"(\d+) files? changed"),
+            ("additions", r"(\d+) insertions?"),
+            ("deletions", r"(\d+) deletions?"),
+        ):
+            match = re.search(pattern, result.stdout)
+            if match:
+                counts[key] = int(match.group(1))
+    return counts
+
+
+def _commit_dates(project_dir: Path, heads: list[str]) -> dict[str, str]:
+    """Committer dates (%cI) of several commits from a single `git show`."""
+    if not heads:
+        return {}
+    result = run_git(
+        ["show", "-s", "--format=%H %cI", *heads],
+        cwd=project_dir,
+    )
+    dates = {}
+    for line in result.stdout.splitlines():
+        sha, _, date = line.partition(" ")
+        if sha and date:
+            dates[sha] = date
+    return dates
+
+
+def compute_worktree_stats(
+    project_dir: Path,
+    base_commit: str,
+    heads: list[str],
+    cache_file: Path | None = None,
+) -> dict[str, dict]:
+    """
+    Statistics for each HEAD commit relative to the base commit.
+
+    Args:
+        project_dir: Main project directory (worktrees share its objects)
+        base_commit: Commit SHA of the base branch
+        heads: Worktree HEAD commit SHAs
+        cache_file: Cache file to read and update (None disables caching)
+
+    Returns:
+        {head SHA: {commit_count, files_changed, additions, deletions,
+        last_commit_date (ISO string or None)}}
+    """
+    cache = _load_cache(cache_file) if cache_file else {}
+    results: dict[str, dict] = {}
+    misses = []
+    for head in dict.fromkeys(heads):
+        entry = cache.get(f"{head}:{base_commit}")
+        if entry is not None:
+            results[head] = entry
+        else:
+            misses.append(head)
+
+    if not misses:
+        return results
+
+    debug(MODULE, f"Computing stats for {len(misses)} of {len(results) + len(misses)}")
+    dates = _commit_dates(project_dir, misses)
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(misses))) as pool:
+        counts = pool.map(lambda h: _diff_counts(project_dir, base_commit, h), misses)
+        for head, head_counts in zip(misses, counts):
+            entry = {**head_counts, "last_commit_date": dates.get(head)}
+            results[head] = entry
+            cache[f"{head}:{base_commit}"] = entry
+
+    if cache_file:
+        _save_cache(cache_file, cache)
+    return results
@@ -15,6 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 from core.file_utils import write_json_atomic
+from core.spec_catalog import record_plan
 
 from .enums import PhaseType, SubtaskStatus, WorkflowType
 from .phase import Phase
@@ -116,8 +117,10 @@ class ImplementationPlan:
     def save(self, path: Path) -> None:
         """Save plan to JSON file using atomic write to prevent corruption."""
         self._update_timestamps_and_status()
+        data = self.to_dict()
         # Use atomic write to prevent corruption on crash/interrupt
-        write_json_atomic(path, self.to_dict(), indent=2, ensure_ascii=False)
+        write_json_atomic(path, data, indent=2, ensure_ascii=False)
+        record_plan(path, data)
 
     async def async_save(self, path: Path) -> None:
         """
@@ -154,6 +157,8 @@ class ImplementationPlan:
                 setattr(self, field.name, getattr(restored, field.name))
             raise
 
+        await loop.run_in_executor(None, record_plan, path, data)
+
     def update_status_from_subtasks(self):
         """Update overall status and planStatus based on subtask completion state.
 
@@ -18,6 +18,7 @@ sys.modules["_insight_extractor_impl"] = _module
 _spec.loader.exec_module(_module)
 
 # Re-export all public functions
+collect_session_changes = _module.collect_session_changes
 extract_session_insights = _module.extract_session_insights
 gather_extraction_inputs = _module.gather_extraction_inputs
 get_changed_files = _module.get_changed_files
@@ -29,6 +30,7 @@ parse_insights = _module.parse_insights
 run_insight_extraction = _module.run_insight_extraction
 
 __all__ = [
+    "collect_session_changes",
     "extract_session_insights",
     "gather_extraction_inputs",
     "get_changed_files",
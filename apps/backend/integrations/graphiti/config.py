@@ -20,6 +20,8 @@ Environment Variables:
     # Database
     GRAPHITI_DATABASE: Graph database name (default: auto_claude_memory)
     GRAPHITI_DB_PATH: Database storage path (default: ~/.auto-claude/memories)
+    GRAPHITI_READ_CONNECTIONS: Database connections for concurrent read queries (default: 4)
+    GRAPHITI_EMBEDDING_CACHE: Set to "false" to disable the on-disk embedding cache
 
     # OpenAI
     OPENAI_API_KEY: Required for OpenAI provider
@@ -66,6 +68,10 @@ from typing import Optional
 # Default configuration values
 DEFAULT_DATABASE = "auto_claude_memory"
 DEFAULT_DB_PATH = "~/.auto-claude/memories"
+DEFAULT_READ_CONNECTIONS = 4
+
+# Embedding vectors cached by content hash (dot-file: not listed as a database)
+EMBEDDING_CACHE_FILE = ".embedding_cache.sqlite"
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 
 # Graphiti state marker file (stores connection info and status)
@@ -118,6 +124,8 @@ class GraphitiConfig:
     # Database settings (LadybugDB - embedded, no Docker required)
     database: str = DEFAULT_DATABASE
     db_path: str = DEFAULT_DB_PATH
+    read_connections: int = DEFAULT_READ_CONNECTIONS
+    embedding_cache: bool = True
 
     # OpenAI settings
     openai_api_key: str = ""
@@ -171,6 +179,18 @@ class GraphitiConfig:
         # Database settings (LadybugDB - embedded)
         database = os.environ.get("GRAPHITI_DATABASE", DEFAULT_DATABASE)
         db_path = os.environ.get("GRAPHITI_DB_PATH", DEFAULT_DB_PATH)
+        try:
+            read_connections = int(
+                os.environ.get(
+                    "GRAPHITI_READ_CONNECTIONS", str(DEFAULT_READ_CONNECTIONS)
+                )
+            )
+        except ValueError:
+            read_connections = DEFAULT_READ_CONNECTIONS
+        read_connections = max(1, read_connections)
+        embedding_cache = os.environ.get(
+            "GRAPHITI_EMBEDDING_CACHE", "true"
+        ).lower() not in ("false", "0", "no", "off")
 
         # OpenAI settings
         openai_api_key = os.environ.get("OPENAI_API_KEY", "")
@@ -233,6 +253,8 @@ class GraphitiConfig:
             embedder_provider=embedder_provider,
             database=database,
             db_path=db_path,
+            read_connections=read_connections,
+            embedding_cache=embedding_cache,
             openai_api_key=openai_api_key,
             openai_model=openai_model,
             openai_embedding_model=openai_embedding_model,
@@ -358,6 +380,10 @@ class GraphitiConfig:
         full_path.parent.mkdir(parents=True, exist_ok=True)
         return full_path
 
+    def get_embedding_cache_path(self) -> Path:
+        """Get the path of the embedding cache (next to the databases)."""
+        return Path(self.db_path).expanduser() / EMBEDDING_CACHE_FILE
+
     def get_provider_summary(self) -> str:
         """Get a summary of configured providers."""
         return f"LLM: {self.llm_provider}, Embedder: {self.embedder_provider}"
@@ -412,6 +438,23 @@ class GraphitiConfig:
             return 1536  # Default for unknown OpenRouter models
         return 768  # Safe default
 
+    def get_embedding_model(self) -> str:
+        """
+        Get the embedding model for the current embedder provider.
+
+        Returns:
+            Model (or Azure deployment) name, "" if not configured
+        """
+        models = {
+            "openai": self.openai_embedding_model,
+            "voyage": self.voyage_embedding_model,
+            "azure_openai": self.azure_openai_embedding_deployment,
+            "ollama": self.ollama_embedding_model,
+            "google": self.google_embedding_model,
+            "openrouter": self.openrouter_embedding_model,
+        }
+        return models.get(self.embedder_provider, "")
+
     def get_provider_signature(self) -> str:
         """
         Get a unique signature for the current embedding provider configuration.
@@ -25,6 +25,9 @@ Usage:
 # Core exceptions
 # Cross-encoder / reranker
 from .cross_encoder import create_cross_encoder
+
+# Embedding cache
+from .embedding_cache import CachedEmbedder, EmbeddingStore
 from .exceptions import ProviderError, ProviderNotInstalled
 
 # Factory functions
@@ -52,6 +55,9 @@ __all__ = [
     "create_llm_client",
     "create_embedder",
     "create_cross_encoder",
+    # Embedding cache
+    "CachedEmbedder",
+    "EmbeddingStore",
     # Models
     "EMBEDDING_DIMENSIONS",
     "get_expected_embedding_dim",
@@ -0,0 +1,370 @@
+"""
+Embedding Cache
+===============
+
+Provider-agnostic cache and batcher for Graphiti embedders.
+
+The embedder providers embed every text they are given, so the same file
+summaries, task descriptions and episode contents get embedded again in
+every session. CachedEmbedder wraps any embedder with the Graphiti
+EmbedderClient interface (create / create_batch) and:
+
+- Looks vectors up in a local SQLite store keyed by
+  (provider, model, dimension, sha256(text)) before calling the provider
+- Shares one provider request between concurrent requests for the same text
+- Coalesces requests made within a short window into provider-sized batches
+"""
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+try:
+    from graphiti_core.embedder.client import EmbedderClient
+except ImportError:  # graphiti-core not installed (cache usable on its own)
+    EmbedderClient = object
+
+logger = logging.getLogger(__name__)
+
+# Texts per provider request (API limits, kept well below for request size)
+PROVIDER_BATCH_SIZES = {
+    "openai": 256,
+    "azure_openai": 256,
+    "openrouter": 256,
+    "voyage": 128,
+    "google": 100,
+    "ollama": 64,
+}
+DEFAULT_BATCH_SIZE = 64
+
+# How long to wait for more requests before sending a partial batch
+BATCH_WINDOW_SECONDS = 0.01
+
+# Keeps SQLite's IN (...) lists below its variable limit
+_LOOKUP_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    """Content hash used as the cache key of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    SQLite store of embedding vectors.
+
+    Vectors are keyed by (provider, model, dimension, sha256(text)) and stored
+    as float64 arrays, so cached vectors are identical to the provider's. Any
+    database error disables the store for the rest of the process (embedding
+    then simply isn't cached).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(self.path), timeout=5, check_same_thread=False
+                )
+                # Several agent processes share the cache
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS embeddings (
+                        provider TEXT NOT NULL,
+                        model TEXT NOT NULL,
+                        dimension INTEGER NOT NULL,
+                        text_hash TEXT NOT NULL,
+                        vector BLOB NOT NULL,
+                        created_at REAL NOT NULL,
+                        PRIMARY KEY (provider, model, dimension, text_hash)
+                    ) WITHOUT ROWID
+                    """
+                )
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+        return self._conn
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"Embedding cache disabled ({self.path}): {error}")
+        self._disabled = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get_many(
+        self, namespace: tuple[str, str, int], hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """Look up the vectors of text hashes; missing hashes are left out."""
+        found: dict[str, list[float]] = {}
+        if not hashes:
+            return found
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return found
+            try:
+                for i in range(0, len(hashes), _LOOKUP_CHUNK):
+                    chunk = hashes[i : i + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"""
+                        SELECT text_hash, vector FROM embeddings
+                        WHERE provider = ? AND model = ? AND dimension = ?
+                          AND text_hash IN ({placeholders})
+                        """,
+                        (*namespace, *chunk),
+                    )
+                    for hash_, blob in rows:
+                        vector = array("d")
+                        vector.frombytes(blob)
+                        found[hash_] = vector.tolist()
+            except sqlite3.Error as e:
+                self._disable(e)
+        return found
+
+    def put_many(
+        self, namespace: tuple[str, str, int], vectors: dict[str, list[float]]
+    ) -> None:
+        """Store vectors by text hash."""
+        if not vectors:
+            return
+        now = time.time()
+        rows = [
+            (*namespace, hash_, array("d", vector).tobytes(), now)
+            for hash_, vector in vectors.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Embedder wrapper that caches, deduplicates and batches embedding requests.
+
+    Subclasses graphiti-core's EmbedderClient (GraphitiClients validates the
+    embedder with isinstance) and forwards any other attribute to the wrapped
+    embedder. create() calls with a single text are cached; other inputs
+    (token IDs, several texts joined by the provider) go straight through.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        provider: str,
+        model: str,
+        dimension: int = 0,
+        store: EmbeddingStore | None = None,
+        batch_size: int | None = None,
+        batch_window: float = BATCH_WINDOW_SECONDS,
+    ):
+        self.embedder = embedder
+        self.namespace = (provider, model, dimension)
+        self.store = store
+        self.batch_size = max(
+            1, batch_size or PROVIDER_BATCH_SIZES.get(provider, DEFAULT_BATCH_SIZE)
+        )
+        self.batch_window = batch_window
+
+        # Requests waiting for (or in) a provider call, by text hash
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._queue: list[tuple[str, str]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.stats = {
+            "requested": 0,
+            "hits": 0,
+            "deduplicated": 0,
+            "embedded": 0,
+            "batches": 0,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set in __init__ (e.g. embedder.config)
+        embedder = self.__dict__.get("embedder")
+        if embedder is None:
+            raise AttributeError(name)
+        return getattr(embedder, name)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requested texts served from the cache."""
+        requested = self.stats["requested"]
+        return self.stats["hits"] / requested if requested else 0.0
+
+    async def create(self, input_data: Any) -> list[float]:
+        """Embed one text (graphiti-core passes it as [text])."""
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list)
+            and len(input_data) == 1
+            and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            return await self.embedder.create(input_data)
+        return (await self.embed([text]))[0]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """Embed a list of texts."""
+        return await self.embed(list(input_data_list))
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, using the cache and shared provider batches."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and timers belong to their loop: start over on a new one
+            self._loop = loop
+            self._pending = {}
+            self._queue = []
+            self._flush_handle = None
+
+        hashes = [text_hash(text) for text in texts]
+        unique = dict(zip(hashes, texts))
+        self.stats["requested"] += len(texts)
+        self.stats["deduplicated"] += len(texts) - len(unique)
+
+        results: dict[str, list[float]] = {}
+        if self.store is not None:
+            lookup = [h for h in unique if h not in self._pending]
+            results = self.store.get_many(self.namespace, lookup)
+            self.stats["hits"] += len(results)
+
+        waiting: dict[str, asyncio.Future] = {}
+        for hash_, text in unique.items():
+            if hash_ in results:
+                continue
+            future = self._pending.get(hash_)
+            if future is None:
+                future = loop.create_future()
+                self._pending[hash_] = future
+                self._queue.append((hash_, text))
+            else:
+                # Already requested by another caller: share its result
+                self.stats["deduplicated"] += 1
+            waiting[hash_] = future
+
+        if self._queue:
+            self._schedule_flush()
+        if waiting:
+            vectors = await asyncio.gather(*waiting.values())
+            results.update(zip(waiting, vectors))
+        return [results[hash_] for hash_ in hashes]
+
+    def _schedule_flush(self) -> None:
+        if len(self._queue) >= self.batch_size:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_window, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        items, self._queue = self._queue, []
+        if items:
+            task = self._loop.create_task(self._embed_batches(items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batches(self, items: list[tuple[str, str]]) -> None:
+        """Send queued texts to the provider in batch_size requests."""
+        for i in range(0, len(items), self.batch_size):
+            batch = items[i : i + self.batch_size]
+            texts = [text for _hash, text in batch]
+            try:
+                vectors = None
+                if hasattr(self.embedder, "create_batch"):
+                    try:
+                        vectors = await self.embedder.create_batch(texts)
+                    except NotImplementedError:
+                        pass  # EmbedderClient's default create_batch
+                if vectors is None:
+                    vectors = await asyncio.gather(
+                        *(self.embedder.create([text]) for text in texts)
+                    )
+                if len(vectors) != len(batch):
+                    raise ValueError(
+                        f"Embedder returned {len(vectors)} vectors for "
+                        f"{len(batch)} texts"
+                    )
+            except Exception as e:
+                for hash_, _text in batch:
+                    future = self._pending.pop(hash_, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.stats["batches"] += 1
+            self.stats["embedded"] += len(batch)
+            vectors = [list(vector) for vector in vectors]
+            if self.store is not None:
+                self.store.put_many(
+                    self.namespace,
+                    {hash_: vector for (hash_, _text), vector in zip(batch, vectors)},
+                )
+            for (hash_, _text), vector in zip(batch, vectors):
+                future = self._pending.pop(hash_, None)
+                if future is not None and not future.done():
+                    future.set_result(vector)
+
+
+_stores: dict[str, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(path: Path) -> EmbeddingStore:
+    """Get the process-wide EmbeddingStore for a cache file."""
+    key = str(Path(path).expanduser().resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if not _stores:
+                atexit.register(_close_stores)
+            store = EmbeddingStore(Path(key))
+            _stores[key] = store
+        return store
+
+
+def _close_stores() -> None:
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
@@ -19,6 +19,7 @@ from .embedder_providers import (
     create_openrouter_embedder,
     create_voyage_embedder,
 )
+from .embedding_cache import CachedEmbedder, get_embedding_store
 from .exceptions import ProviderError
 from .llm_providers import (
     create_anthropic_llm_client,
@@ -74,7 +75,8 @@ def create_embedder(config: "GraphitiConfig") -> Any:
         config: GraphitiConfig with provider settings
 
     Returns:
-        Embedder instance for Graphiti
+        Embedder instance for Graphiti (wrapped in a CachedEmbedder unless
+        the embedding cache is disabled)
 
     Raises:
         ProviderNotInstalled: If required packages are missing
@@ -85,16 +87,28 @@ def create_embedder(config: "GraphitiConfig") -> Any:
     logger.info(f"Creating embedder for provider: {provider}")
 
     if provider == "openai":
-        return create_openai_embedder(config)
+        embedder = create_openai_embedder(config)
     elif provider == "voyage":
-        return create_voyage_embedder(config)
+        embedder = create_voyage_embedder(config)
     elif provider == "azure_openai":
-        return create_azure_openai_embedder(config)
+        embedder = create_azure_openai_embedder(config)
     elif provider == "ollama":
-        return create_ollama_embedder(config)
+        embedder = create_ollama_embedder(config)
     elif provider == "google":
-        return create_google_embedder(config)
+        embedder = create_google_embedder(config)
     elif provider == "openrouter":
-        return create_openrouter_embedder(config)
+        embedder = create_openrouter_embedder(config)
     else:
         raise ProviderError(f"Unknown embedder provider: {provider}")
+
+    if not config.embedding_cache:
+        return embedder
+
+    # Reuse vectors of identical texts and batch concurrent requests
+    return CachedEmbedder(
+        embedder,
+        provider=provider,
+        model=config.get_embedding_model(),
+        dimension=config.get_embedding_dimension(),
+        store=get_embedding_store(config.get_embedding_cache_path()),
+    )
@@ -161,14 +161,19 @@ class GraphitiClient:
             try:
                 # Use our patched KuzuDriver that properly creates FTS indexes
                 # The original graphiti-core KuzuDriver has build_indices_and_constraints()
-                # as a no-op, which causes FTS search failures
+                # as a no-op, which causes FTS search failures.
+                # The driver is shared by every client on this path in the
+                # process (any event loop): Kuzu can't open a database twice.
                 from integrations.graphiti.queries_pkg.kuzu_driver_patched import (
-                    create_patched_kuzu_driver,
+                    acquire_kuzu_driver,
                 )
 
                 db_path = self.config.get_db_path()
                 try:
-                    self._driver = create_patched_kuzu_driver(db=str(db_path))
+                    self._driver = acquire_kuzu_driver(
+                        db=str(db_path),
+                        max_concurrent_queries=self.config.read_connections,
+                    )
                 except (OSError, PermissionError) as e:
                     logger.warning(
                         f"Failed to initialize LadybugDB driver at {db_path}: {e}"
@@ -220,8 +225,18 @@ class GraphitiClient:
 
         except Exception as e:
             logger.warning(f"Failed to initialize Graphiti client: {e}")
+            self._release_driver()
             return False
 
+    def _release_driver(self) -> None:
+        if self._driver is not None:
+            from integrations.graphiti.queries_pkg.kuzu_driver_patched import (
+                release_kuzu_driver,
+            )
+
+            release_kuzu_driver(self._driver)
+            self._driver = None
+
     async def close(self) -> None:
         """
         Close the Graphiti client and clean up connections.
@@ -234,7 +249,7 @@ class GraphitiClient:
                 logger.warning(f"Error closing Graphiti: {e}")
             finally:
                 self._graphiti = None
-                self._driver = None
                 self._llm_client = None
                 self._embedder = None
                 self._initialized = False
+        self._release_driver()
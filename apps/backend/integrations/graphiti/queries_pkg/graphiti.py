@@ -96,6 +96,11 @@ class GraphitiMemory:
             and self.state.initialized
         )
 
+    @property
+    def search_failures(self) -> int:
+        """Number of searches that failed and returned empty results."""
+        return self._search.failed_searches if self._search is not None else 0
+
     @property
     def group_id(self) -> str:
         """
@@ -6,22 +6,74 @@ The original graphiti-core KuzuDriver has two bugs:
 2. execute_query() filters out None parameters, but queries still reference them
 
 This patched driver fixes both issues for LadybugDB compatibility.
+
+It also separates read queries from write queries. Kuzu runs any number of
+read transactions next to a single write transaction, so read-only queries
+(Graphiti's FTS, vector and graph-traversal searches) fan out across a pool
+of connections on the same database, while everything else goes through one
+writer connection and stays serialized.
+
+Drivers are shared per database path within the process (acquire_kuzu_driver):
+Kuzu holds a lock on the database files, so a second Database on the same
+path - e.g. from the memory write queue's own event loop - would fail to
+open. The driver's connections run queries on their own executor threads,
+so one driver can serve every event loop.
 """
 
 import logging
 import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+from integrations.graphiti.config import DEFAULT_READ_CONNECTIONS
+
 # Import kuzu (might be real_ladybug via monkeypatch)
 try:
     import kuzu
 except ImportError:
-    import real_ladybug as kuzu  # type: ignore
+    try:
+        import real_ladybug as kuzu  # type: ignore
+    except ImportError:
+        kuzu = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Clauses and statements that modify the database, its schema or its settings
+_WRITE_CLAUSE_RE = re.compile(
+    r"\b(?:CREATE|MERGE|SET|DELETE|DETACH|REMOVE|DROP|ALTER|COPY|INSTALL|LOAD"
+    r"|ATTACH|USE|IMPORT|EXPORT|BEGIN|COMMIT|ROLLBACK|CHECKPOINT)\b"
+    # Procedures such as CREATE_FTS_INDEX / DROP_VECTOR_INDEX and CALL x=value
+    r"|\b(?:CREATE|DROP)_\w+|\bCALL\s+\w+\s*=",
+    re.IGNORECASE,
+)
+_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`")
+
+
+def is_read_only_query(cypher_query: str) -> bool:
+    """
+    Check whether a Cypher query only reads from the database.
+
+    Anything that might write (including queries we can't classify) is
+    treated as a write, so misclassification only costs concurrency.
+    """
+    # Ignore keywords inside string literals and quoted identifiers
+    stripped = _LITERAL_RE.sub("''", cypher_query)
+    return not _WRITE_CLAUSE_RE.search(stripped)
+
 
-def create_patched_kuzu_driver(db: str = ":memory:", max_concurrent_queries: int = 1):
+def create_patched_kuzu_driver(
+    db: str = ":memory:", max_concurrent_queries: int = DEFAULT_READ_CONNECTIONS
+):
+    """
+    Create a PatchedKuzuDriver.
+
+    Args:
+        db: Database path (":memory:" for an in-memory database)
+        max_concurrent_queries: Number of read connections; writes always use
+            a single writer connection
+    """
     from graphiti_core.driver.driver import GraphProvider
     from graphiti_core.driver.kuzu_driver import KuzuDriver as OriginalKuzuDriver
     from graphiti_core.graph_queries import get_fulltext_indices
@@ -33,16 +85,22 @@ def create_patched_kuzu_driver(db: str = ":memory:", max_concurrent_queries: int
         Fixes two bugs in graphiti-core:
         1. FTS indexes are never created (build_indices_and_constraints is a no-op)
         2. None parameters are filtered out, causing "Parameter not found" errors
+
+        Read-only queries run on a pool of max_concurrent_queries connections
+        (self.client); all other queries run on a single writer connection.
         """
 
         def __init__(
             self,
             db: str = ":memory:",
-            max_concurrent_queries: int = 1,
+            max_concurrent_queries: int = DEFAULT_READ_CONNECTIONS,
         ):
             # Store database path before calling parent (which creates the Database)
             self._database = db  # Required by Graphiti for group_id checks
-            super().__init__(db, max_concurrent_queries)
+            # The parent's client becomes the read pool
+            super().__init__(db, max(1, max_concurrent_queries))
+            # One connection (and one executor thread): writes run one at a time
+            self._write_client = kuzu.AsyncConnection(self.db, max_concurrent_queries=1)
 
         async def execute_query(
             self, cypher_query_: str, **kwargs: Any
@@ -53,6 +111,9 @@ def create_patched_kuzu_driver(db: str = ":memory:", max_concurrent_queries: int
             The original driver filters out None values, but LadybugDB requires
             all referenced parameters to exist. This override keeps None values
             in the parameters dict.
+
+            Read-only queries go to the read pool, everything else to the
+            writer connection.
             """
             # Don't filter out None values - LadybugDB needs them
             params = {k: v for k, v in kwargs.items()}
@@ -60,8 +121,13 @@ def create_patched_kuzu_driver(db: str = ":memory:", max_concurrent_queries: int
             params.pop("database_", None)
             params.pop("routing_", None)
 
+            if is_read_only_query(cypher_query_):
+                client = self.client
+            else:
+                client = self._write_client
+
             try:
-                results = await self.client.execute(cypher_query_, parameters=params)
+                results = await client.execute(cypher_query_, parameters=params)
             except Exception as e:
                 # Truncate long values for logging
                 log_params = {
@@ -174,3 +240,60 @@ def create_patched_kuzu_driver(db: str = ":memory:", max_concurrent_queries: int
             super().setup_schema()
 
     return PatchedKuzuDriver(db=db, max_concurrent_queries=max_concurrent_queries)
+
+
+@dataclass
+class _SharedDriver:
+    driver: Any
+    references: int = 0
+
+
+_shared_drivers: dict[str, _SharedDriver] = {}
+_shared_drivers_lock = threading.Lock()
+
+
+def acquire_kuzu_driver(
+    db: str, max_concurrent_queries: int = DEFAULT_READ_CONNECTIONS
+):
+    """
+    Get the process-wide PatchedKuzuDriver for a database path.
+
+    The first caller creates it (opening the database and setting up the
+    schema); later callers, from any thread or event loop, share it. Pair
+    each call with release_kuzu_driver().
+
+    Args:
+        db: Database path (":memory:" always gets a private driver)
+        max_concurrent_queries: Read connections, used when creating it
+    """
+    if db == ":memory:":
+        return create_patched_kuzu_driver(db, max_concurrent_queries)
+
+    key = str(Path(db).resolve())
+    with _shared_drivers_lock:
+        shared = _shared_drivers.get(key)
+        if shared is None:
+            shared = _SharedDriver(
+                create_patched_kuzu_driver(
+                    db=db, max_concurrent_queries=max_concurrent_queries
+                )
+            )
+            _shared_drivers[key] = shared
+        shared.references += 1
+        return shared.driver
+
+
+def release_kuzu_driver(driver: Any) -> None:
+    """
+    Drop a reference taken with acquire_kuzu_driver().
+
+    The last release forgets the driver, so its database is closed once
+    garbage collected (the Kuzu driver has no explicit close).
+    """
+    with _shared_drivers_lock:
+        for key, shared in _shared_drivers.items():
+            if shared.driver is driver:
+                shared.references -= 1
+                if shared.references <= 0:
+                    del _shared_drivers[key]
+                return
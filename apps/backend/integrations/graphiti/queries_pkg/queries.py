@@ -6,6 +6,7 @@ Handles episode storage, retrieval, and filtering operations.
 
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 
 from .schema import (
@@ -18,6 +19,21 @@ from .schema import (
 
 logger = logging.getLogger(__name__)
 
+# Bumped whenever this process adds an episode (invalidates cached searches)
+_write_generation = 0
+_write_generation_lock = threading.Lock()
+
+
+def get_write_generation() -> int:
+    """Get the graph write generation of this process."""
+    return _write_generation
+
+
+def _bump_write_generation() -> None:
+    global _write_generation
+    with _write_generation_lock:
+        _write_generation += 1
+
 
 class GraphitiQueries:
     """
@@ -40,6 +56,14 @@ class GraphitiQueries:
         self.group_id = group_id
         self.spec_context_id = spec_context_id
 
+    async def _add_episode(self, **kwargs) -> None:
+        """Add an episode to the graph and bump the write generation."""
+        try:
+            await self.client.graphiti.add_episode(**kwargs)
+        finally:
+            # Even a failed add may have written part of the episode
+            _bump_write_generation()
+
     async def add_session_insight(
         self,
         session_num: int,
@@ -66,7 +90,7 @@ class GraphitiQueries:
                 **insights,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"session_{session_num:03d}_{self.spec_context_id}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -110,7 +134,7 @@ class GraphitiQueries:
                 "files": discoveries,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"codebase_discovery_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -146,7 +170,7 @@ class GraphitiQueries:
                 "pattern": pattern,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -182,7 +206,7 @@ class GraphitiQueries:
                 "gotcha": gotcha,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -230,7 +254,7 @@ class GraphitiQueries:
                 **(metadata or {}),
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"task_outcome_{task_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -281,7 +305,7 @@ class GraphitiQueries:
                         "gotchas": file_insight.get("gotchas", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"file_insight_{file_insight.get('path', 'unknown').replace('/', '_')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -324,7 +348,7 @@ class GraphitiQueries:
                         "example": example,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -365,7 +389,7 @@ class GraphitiQueries:
                         "solution": solution,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -402,7 +426,7 @@ class GraphitiQueries:
                         "changed_files": insights.get("changed_files", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -435,7 +459,7 @@ class GraphitiQueries:
                         "success": insights.get("success", False),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"recommendations_{insights.get('subtask_id', 'unknown')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -51,6 +51,9 @@ class GraphitiSearch:
         self.spec_context_id = spec_context_id
         self.group_id_mode = group_id_mode
         self.project_dir = project_dir
+        # Searches that failed (and returned empty results instead of raising),
+        # so callers can tell empty results from errors
+        self.failed_searches = 0
 
     async def get_relevant_context(
         self,
@@ -119,6 +122,7 @@ class GraphitiSearch:
             return context_items
 
         except Exception as e:
+            self.failed_searches += 1
             logger.warning(f"Failed to search context: {e}")
             return []
 
@@ -173,6 +177,7 @@ class GraphitiSearch:
             return sessions[:limit]
 
         except Exception as e:
+            self.failed_searches += 1
             logger.warning(f"Failed to get session history: {e}")
             return []
 
@@ -226,6 +231,7 @@ class GraphitiSearch:
             return outcomes[:limit]
 
         except Exception as e:
+            self.failed_searches += 1
             logger.warning(f"Failed to get similar task outcomes: {e}")
             return []
 
@@ -336,5 +342,6 @@ class GraphitiSearch:
             return patterns[:num_results], gotchas[:num_results]
 
         except Exception as e:
+            self.failed_searches += 1
             logger.warning(f"Failed to get patterns/gotchas: {e}")
             return [], []
@@ -61,6 +61,10 @@ Public API:
 
     # Summary
     - get_memory_summary(spec_dir) -> dict
+
+    # Write queue (patterns, gotchas and codebase map writes are batched)
+    - flush_memory_writes(timeout=None) -> bool
+    - get_write_queue() -> MemoryWriteQueue
 """
 
 # Graphiti integration
@@ -85,6 +89,14 @@ from .sessions import load_all_insights, save_session_insights
 # Summary utilities
 from .summary import get_memory_summary
 
+# Write queue
+from .write_queue import (
+    MemoryWriteQueue,
+    flush_memory_writes,
+    flush_memory_writes_async,
+    get_write_queue,
+)
+
 __all__ = [
     # Graphiti helpers
     "is_graphiti_memory_enabled",
@@ -105,4 +117,9 @@ __all__ = [
     "load_gotchas",
     # Summary
     "get_memory_summary",
+    # Write queue
+    "MemoryWriteQueue",
+    "flush_memory_writes",
+    "flush_memory_writes_async",
+    "get_write_queue",
 ]
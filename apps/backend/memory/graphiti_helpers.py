@@ -12,10 +12,12 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .graphiti_pool import get_graphiti_pool
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from graphiti_memory import GraphitiMemory
+    from integrations.graphiti.memory import GraphitiMemory
 
 
 def is_graphiti_memory_enabled() -> bool:
@@ -43,6 +45,10 @@ def get_graphiti_memory(
     """
     Get a GraphitiMemory instance if available.
 
+    Inside an event loop this is a borrowed reference to a pooled instance
+    that stays initialized between uses (see graphiti_pool.py); close()
+    returns it to the pool. Without a running loop a new instance is returned.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root directory (defaults to spec_dir.parent.parent)
@@ -54,12 +60,19 @@ def get_graphiti_memory(
         return None
 
     try:
-        from graphiti_memory import GraphitiMemory, GroupIdMode
+        from integrations.graphiti.memory import GraphitiMemory, GroupIdMode
 
         if project_dir is None:
             project_dir = spec_dir.parent.parent
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to pool the instance for
+            return GraphitiMemory(
+                spec_dir, project_dir, group_id_mode=GroupIdMode.PROJECT
+            )
         # Use project-wide shared memory for cross-spec learning
-        return GraphitiMemory(spec_dir, project_dir, group_id_mode=GroupIdMode.PROJECT)
+        return get_graphiti_pool().borrow(spec_dir, project_dir, GroupIdMode.PROJECT)
     except ImportError:
         return None
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Graphiti Memory Pool
+====================
+
+Process-wide pool of initialized GraphitiMemory instances.
+
+Initializing a GraphitiMemory builds the LadybugDB (Kuzu) driver, the LLM
+client and embedder, and runs build_indices_and_constraints(). Context
+retrieval, the memory write queue and the session-end insight saver used to
+create and initialize a fresh instance each, several times per session.
+
+The pool holds one GraphitiMemory per (project_dir, spec_dir, group_id_mode)
+and event loop, and hands out borrowed references (PooledGraphitiMemory).
+A borrowed reference behaves like the GraphitiMemory it wraps, except that
+close() only returns it to the pool, so existing callers that close their
+memory in a `finally` block keep working. The pooled instances are closed at
+process exit (or with close_graphiti_pool()).
+
+Instances are per event loop because the LLM and embedder HTTP clients keep
+connections that belong to the loop they were opened in. The database driver
+is not per loop: instances on the same database path share one driver (see
+acquire_kuzu_driver), since Kuzu can't open a database twice. Instances whose
+loop has been closed are discarded. An instance that failed to initialize is
+dropped when it is returned, so the next borrower retries.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from integrations.graphiti.memory import GraphitiMemory
+
+
+@dataclass
+class _PoolEntry:
+    memory: "GraphitiMemory"
+    loop: weakref.ref
+    borrowed: int = 0
+    init_lock: asyncio.Lock | None = None
+    _lock_guard: threading.Lock = field(default_factory=threading.Lock)
+
+    def is_stale(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """True if the entry's loop was closed (its id may have been reused)."""
+        entry_loop = self.loop()
+        return entry_loop is not loop or entry_loop.is_closed()
+
+
+class PooledGraphitiMemory:
+    """
+    Borrowed reference to a pooled GraphitiMemory.
+
+    Attribute access is forwarded to the pooled instance. close() returns the
+    reference to the pool instead of closing the connection.
+    """
+
+    def __init__(self, pool: "GraphitiMemoryPool", key: tuple, entry: _PoolEntry):
+        self._pool = pool
+        self._key = key
+        self._entry = entry
+        self._released = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._entry.memory, name)
+
+    async def initialize(self) -> bool:
+        """Initialize the pooled instance once, even for concurrent borrowers."""
+        entry = self._entry
+        with entry._lock_guard:
+            if entry.init_lock is None:
+                entry.init_lock = asyncio.Lock()
+        async with entry.init_lock:
+            return await entry.memory.initialize()
+
+    async def close(self) -> None:
+        """Return the memory to the pool (the connection stays open)."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._key, self._entry)
+
+
+class GraphitiMemoryPool:
+    """One initialized GraphitiMemory per (project, spec, group mode, loop)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, _PoolEntry] = {}
+        self.stats = {"created": 0, "borrowed": 0, "discarded": 0}
+
+    def borrow(
+        self, spec_dir: Path, project_dir: Path, group_id_mode: str
+    ) -> PooledGraphitiMemory:
+        """
+        Borrow the pooled instance for this key, creating it if needed.
+
+        Must be called from a running event loop (raises RuntimeError).
+        """
+        from integrations.graphiti.memory import GraphitiMemory
+
+        loop = asyncio.get_running_loop()
+        key = (
+            str(Path(project_dir).resolve()),
+            str(Path(spec_dir).resolve()),
+            group_id_mode,
+            id(loop),
+        )
+
+        stale = []
+        with self._lock:
+            # Drop instances whose loop has been closed
+            for other_key, other in list(self._entries.items()):
+                other_loop = other.loop()
+                if other_loop is None or other_loop.is_closed():
+                    stale.append(self._entries.pop(other_key))
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_stale(loop):
+                stale.append(self._entries.pop(key))
+                entry = None
+            if entry is None:
+                entry = _PoolEntry(
+                    memory=GraphitiMemory(spec_dir, project_dir, group_id_mode),
+                    loop=weakref.ref(loop),
+                )
+                self._entries[key] = entry
+                self.stats["created"] += 1
+            entry.borrowed += 1
+            self.stats["borrowed"] += 1
+
+        for old in stale:
+            self.stats["discarded"] += 1
+            if old.memory.is_initialized:
+                _close_memory(old.memory, wait=False)
+        return PooledGraphitiMemory(self, key, entry)
+
+    def release(self, key: tuple, entry: _PoolEntry) -> None:
+        """Return a borrowed reference (called by PooledGraphitiMemory.close())."""
+        with self._lock:
+            entry.borrowed = max(entry.borrowed - 1, 0)
+            failed = not entry.memory.is_initialized and entry.borrowed == 0
+            if failed and self._entries.get(key) is entry:
+                # Never initialized (disabled or failed): let the next borrower retry
+                del self._entries[key]
+                self.stats["discarded"] += 1
+
+    async def close_all(self) -> None:
+        """Close every pooled instance."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if not entry.memory.is_initialized:
+                continue
+            if entry.loop() is not loop:
+                _close_memory(entry.memory, wait=False)
+                continue
+            try:
+                await entry.memory.close()
+            except Exception:
+                logger.debug("Failed to close pooled Graphiti memory", exc_info=True)
+
+    def close_all_sync(self) -> None:
+        """Close every pooled instance from synchronous code (process exit)."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if entry.memory.is_initialized:
+                _close_memory(entry.memory)
+
+
+def _close_memory(memory: "GraphitiMemory", wait: bool = True) -> None:
+    """Close a GraphitiMemory outside its own event loop, in a fresh loop."""
+
+    def run():
+        try:
+            asyncio.run(memory.close())
+        except Exception:
+            logger.debug("Failed to close pooled Graphiti memory", exc_info=True)
+
+    # asyncio.run() can't be used from a thread with a running loop
+    thread = threading.Thread(target=run, name="graphiti-pool-close", daemon=True)
+    thread.start()
+    if wait:
+        thread.join(timeout=10)
+
+
+_pool: GraphitiMemoryPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_graphiti_pool() -> GraphitiMemoryPool:
+    """Get the process-wide GraphitiMemory pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = GraphitiMemoryPool()
+            atexit.register(_pool.close_all_sync)
+        return _pool
+
+
+async def close_graphiti_pool() -> None:
+    """Close all pooled GraphitiMemory instances."""
+    await get_graphiti_pool().close_all()
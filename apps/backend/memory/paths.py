@@ -49,6 +49,9 @@ def clear_memory(spec_dir: Path) -> None:
     Args:
         spec_dir: Path to spec directory
     """
+    from .write_queue import get_write_queue
+
+    get_write_queue().discard(spec_dir)
     memory_dir = get_memory_dir(spec_dir)
 
     if memory_dir.exists():
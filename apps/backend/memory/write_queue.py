@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Memory Write Queue
+==================
+
+Write-behind queue for patterns, gotchas and codebase map updates.
+
+append_pattern(), append_gotcha() and update_codebase_map() used to re-read
+and re-parse their file for every call and then run the Graphiti save
+synchronously (a new event loop per write). Saving 50 discoveries after a
+session stalled the coder loop for the whole time.
+
+Writes are now queued and return immediately:
+- Patterns and gotchas are deduplicated against in-memory sets, loaded once
+  per file (and reloaded if the file changes on disk).
+- Pending file writes are applied in batches: one append per markdown file
+  and one rewrite of codebase_map.json per flush.
+- Graphiti episodes are ingested in batches by a background worker thread
+  with its own event loop: one GraphitiMemory connection per spec and batch,
+  with the codebase discoveries merged into a single episode.
+
+Pending writes are flushed FLUSH_DELAY_SECONDS after they are queued, when
+MAX_PENDING_WRITES are pending, on flush() (called at session end) and at
+interpreter exit. Readers (load_patterns() etc.) flush the spec's pending
+file writes first, so they always see earlier writes.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .graphiti_helpers import get_graphiti_memory, is_graphiti_memory_enabled
+from .paths import get_memory_dir
+
+logger = logging.getLogger(__name__)
+
+# Pending writes are flushed this long after the first one is queued...
+FLUSH_DELAY_SECONDS = 0.5
+# ...or as soon as this many are pending
+MAX_PENDING_WRITES = 100
+
+# How long interpreter exit waits for queued writes (a hung Graphiti
+# ingestion must not block the process from exiting)
+EXIT_FLUSH_TIMEOUT_SECONDS = 30.0
+
+CODEBASE_MAP_FILE = "codebase_map.json"
+
+# Bullet list files: kind -> (file name, header written before the first entry)
+BULLET_FILES = {
+    "patterns": (
+        "patterns.md",
+        "# Code Patterns\n\nEstablished patterns to follow in this codebase:\n\n",
+    ),
+    "gotchas": (
+        "gotchas.md",
+        "# Gotchas and Pitfalls\n\nThings to watch out for in this codebase:\n\n",
+    ),
+}
+
+
+def read_bullets(path: Path) -> list[str]:
+    """Entries of a markdown bullet list file ("- entry" lines)."""
+    if not path.exists():
+        return []
+
+    entries = []
+    for line in path.read_text().split("\n"):
+        line = line.strip()
+        if line.startswith("- "):
+            entries.append(line[2:].strip())
+    return entries
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class _BulletState:
+    """Known entries of one bullet file, valid while the file is unchanged."""
+
+    known: set[str]
+    signature: tuple[int, int] | None
+    pending: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _SpecWrites:
+    """Dedupe state and pending writes for one spec."""
+
+    bullets: dict[str, _BulletState] = field(default_factory=dict)
+    pending_map: dict[str, str] = field(default_factory=dict)
+    graphiti_patterns: list[str] = field(default_factory=list)
+    graphiti_gotchas: list[str] = field(default_factory=list)
+    graphiti_discoveries: dict[str, str] = field(default_factory=dict)
+
+    def has_file_writes(self) -> bool:
+        return bool(self.pending_map) or any(
+            state.pending for state in self.bullets.values()
+        )
+
+    def take_graphiti_batch(self) -> tuple[list[str], list[str], dict[str, str]]:
+        batch = (
+            self.graphiti_patterns,
+            self.graphiti_gotchas,
+            self.graphiti_discoveries,
+        )
+        self.graphiti_patterns, self.graphiti_gotchas = [], []
+        self.graphiti_discoveries = {}
+        return batch
+
+
+class MemoryWriteQueue:
+    """
+    Write-behind queue for file-based memory and Graphiti.
+
+    Usage:
+        queue = get_write_queue()
+        queue.add_bullet(spec_dir, "patterns", "Use dependency injection")
+        queue.flush()  # at session end
+        queue.get_stats()
+    """
+
+    def __init__(
+        self,
+        flush_delay: float = FLUSH_DELAY_SECONDS,
+        max_pending: int = MAX_PENDING_WRITES,
+    ):
+        self.flush_delay = flush_delay
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # Serializes file writes between the worker and readers
+        self._file_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._specs: dict[Path, _SpecWrites] = {}
+        self._pending = 0
+        self._first_pending_at: float | None = None
+        self._flush_requested = 0
+        self._flushed = 0
+        self._worker: threading.Thread | None = None
+        self._stats = {
+            "queued": 0,
+            "duplicates": 0,
+            "enqueue_ms_total": 0.0,
+            "enqueue_ms_max": 0.0,
+            "file_flushes": 0,
+            "file_flush_ms_total": 0.0,
+            "graphiti_batches": 0,
+            "graphiti_episodes": 0,
+            "graphiti_ms_total": 0.0,
+            "errors": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Enqueueing
+    # -------------------------------------------------------------------------
+
+    def add_bullet(self, spec_dir: Path, kind: str, entry: str) -> bool:
+        """
+        Queue a pattern or gotcha ("patterns" or "gotchas").
+
+        Returns:
+            True if queued, False if empty or already known
+        """
+        start = time.perf_counter()
+        entry = entry.strip()
+        if not entry:
+            return False
+
+        path = get_memory_dir(spec_dir) / BULLET_FILES[kind][0]
+        signature = _file_signature(path)
+        graphiti_enabled = is_graphiti_memory_enabled()
+        with self._lock:
+            spec = self._spec(spec_dir)
+            state = spec.bullets.get(kind)
+            if state is None or (not state.pending and state.signature != signature):
+                # First use, or the file changed on disk (cleared, edited)
+                state = _BulletState(set(read_bullets(path)), signature)
+                spec.bullets[kind] = state
+            if entry in state.known:
+                self._stats["duplicates"] += 1
+                return False
+
+            state.known.add(entry)
+            state.pending.append(entry)
+            if graphiti_enabled:
+                if kind == "patterns":
+                    spec.graphiti_patterns.append(entry)
+                else:
+                    spec.graphiti_gotchas.append(entry)
+            self._queued(start)
+        return True
+
+    def add_discoveries(self, spec_dir: Path, discoveries: dict[str, str]) -> None:
+        """Queue codebase map updates (file path -> purpose)."""
+        start = time.perf_counter()
+        graphiti_enabled = is_graphiti_memory_enabled()
+        with self._lock:
+            spec = self._spec(spec_dir)
+            spec.pending_map.update(discoveries)
+            if graphiti_enabled and discoveries:
+                spec.graphiti_discoveries.update(discoveries)
+            self._queued(start)
+
+    def _spec(self, spec_dir: Path) -> _SpecWrites:
+        key = Path(spec_dir).resolve()
+        if key not in self._specs:
+            self._specs[key] = _SpecWrites()
+        return self._specs[key]
+
+    def _queued(self, start: float) -> None:
+        # Called with self._lock held
+        self._pending += 1
+        if self._first_pending_at is None:
+            self._first_pending_at = time.monotonic()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["queued"] += 1
+        self._stats["enqueue_ms_total"] += elapsed_ms
+        self._stats["enqueue_ms_max"] = max(self._stats["enqueue_ms_max"], elapsed_ms)
+        self._ensure_worker()
+        self._wakeup.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Flushing
+    # -------------------------------------------------------------------------
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Write out everything queued so far, including Graphiti episodes.
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                if not self._pending:
+                    return True
+                self._ensure_worker()
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._wakeup.notify_all()
+            return self._wakeup.wait_for(lambda: self._flushed >= target, timeout)
+
+    def flush_at_exit(self, timeout: float = EXIT_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """
+        flush() with a bounded wait, registered to run at interpreter exit.
+
+        Logs the writes given up on if the timeout expires.
+        """
+        if self.flush(timeout):
+            return True
+        with self._lock:
+            file_writes = sum(
+                len(spec.pending_map)
+                + sum(len(state.pending) for state in spec.bullets.values())
+                for spec in self._specs.values()
+            )
+            episodes = sum(
+                len(spec.graphiti_patterns)
+                + len(spec.graphiti_gotchas)
+                + bool(spec.graphiti_discoveries)
+                for spec in self._specs.values()
+            )
+        logger.warning(
+            f"Memory writes still running after {timeout:.0f}s at exit; dropping "
+            f"{file_writes} queued file writes, {episodes} queued Graphiti "
+            f"episodes and the batch in progress"
+        )
+        return False
+
+    async def flush_async(self, timeout: float | None = None) -> bool:
+        """flush() for async callers, without blocking the event loop."""
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def flush_files(self, spec_dir: Path) -> None:
+        """Write out one spec's pending file writes (Graphiti stays queued)."""
+        key = Path(spec_dir).resolve()
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is None or not spec.has_file_writes():
+                return
+        self._write_files(key, spec)
+
+    def discard(self, spec_dir: Path) -> None:
+        """Drop one spec's pending writes and dedupe state (memory cleared)."""
+        with self._lock:
+            spec = self._specs.pop(Path(spec_dir).resolve(), None)
+            if spec is not None:
+                for state in spec.bullets.values():
+                    self._pending -= len(state.pending)
+                    state.pending = []
+                spec.pending_map = {}
+                spec.take_graphiti_batch()
+                self._pending = max(self._pending, 0)
+
+    def _write_files(self, spec_dir: Path, spec: _SpecWrites) -> None:
+        with self._file_lock:
+            with self._lock:
+                bullets = {
+                    kind: state.pending
+                    for kind, state in spec.bullets.items()
+                    if state.pending
+                }
+                for state in spec.bullets.values():
+                    state.pending = []
+                discoveries, spec.pending_map = spec.pending_map, {}
+            if not bullets and not discoveries:
+                return
+
+            start = time.perf_counter()
+            try:
+                memory_dir = get_memory_dir(spec_dir)
+                for kind, entries in bullets.items():
+                    file_name, header = BULLET_FILES[kind]
+                    path = memory_dir / file_name
+                    with open(path, "a") as f:
+                        if path.stat().st_size == 0:
+                            # First entry - add header
+                            f.write(header)
+                        f.writelines(f"- {entry}\n" for entry in entries)
+                    with self._lock:
+                        spec.bullets[kind].signature = _file_signature(path)
+                if discoveries:
+                    _merge_codebase_map(memory_dir / CODEBASE_MAP_FILE, discoveries)
+            except OSError as e:
+                logger.warning(f"Failed to write memory files: {e}")
+                self._count("errors")
+
+            self._count("file_flushes")
+            self._count("file_flush_ms_total", (time.perf_counter() - start) * 1000)
+
+    async def _ingest(
+        self,
+        spec_dir: Path,
+        patterns: list[str],
+        gotchas: list[str],
+        discoveries: dict[str, str],
+    ) -> None:
+        """Save one spec's batch of Graphiti episodes over one connection."""
+        start = time.perf_counter()
+        graphiti = None
+        try:
+            graphiti = get_graphiti_memory(spec_dir)
+            if graphiti is None:
+                return
+            if discoveries:
+                await graphiti.save_codebase_discoveries(discoveries)
+            for pattern in patterns:
+                await graphiti.save_pattern(pattern)
+            for gotcha in gotchas:
+                await graphiti.save_gotcha(gotcha)
+            self._count("graphiti_batches")
+            self._count(
+                "graphiti_episodes", len(patterns) + len(gotchas) + bool(discoveries)
+            )
+        except Exception as e:
+            logger.warning(f"Graphiti memory save failed: {e}")
+            self._count("errors")
+        finally:
+            if graphiti is not None:
+                try:
+                    await graphiti.close()
+                except Exception:
+                    logger.debug(
+                        "Failed to close Graphiti memory connection", exc_info=True
+                    )
+            self._count("graphiti_ms_total", (time.perf_counter() - start) * 1000)
+
+    def _flush_all(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            specs = list(self._specs.items())
+            self._pending = 0
+            self._first_pending_at = None
+
+        for spec_dir, spec in specs:
+            self._write_files(spec_dir, spec)
+            with self._lock:
+                batch = spec.take_graphiti_batch()
+            if any(batch):
+                loop.run_until_complete(self._ingest(spec_dir, *batch))
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        # Called with self._lock held
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="memory-write-queue", daemon=True
+            )
+            self._worker.start()
+
+    def _due(self) -> bool:
+        # Called with self._lock held
+        if self._flush_requested > self._flushed:
+            return True
+        if not self._pending:
+            return False
+        return (
+            self._pending >= self.max_pending
+            or time.monotonic() - self._first_pending_at >= self.flush_delay
+        )
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                with self._lock:
+                    while not self._due():
+                        timeout = None
+                        if self._first_pending_at is not None:
+                            timeout = max(
+                                self._first_pending_at
+                                + self.flush_delay
+                                - time.monotonic(),
+                                0,
+                            )
+                        self._wakeup.wait(timeout)
+                    target = self._flush_requested
+
+                try:
+                    self._flush_all(loop)
+                except Exception as e:
+                    logger.warning(f"Memory write flush failed: {e}")
+                    self._count("errors")
+
+                with self._lock:
+                    self._flushed = max(self._flushed, target)
+                    self._wakeup.notify_all()
+        finally:
+            loop.close()
+
+    def _count(self, key: str, value: float = 1) -> None:
+        with self._lock:
+            self._stats[key] += value
+
+    def get_stats(self) -> dict:
+        """Counters and latencies (ms) of queued writes and flushes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = self._pending
+        return stats
+
+
+def _merge_codebase_map(map_file: Path, discoveries: dict[str, str]) -> None:
+    """Merge discoveries into codebase_map.json and update its metadata."""
+    # Load existing map or create new
+    if map_file.exists():
+        try:
+            with open(map_file) as f:
+                codebase_map = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            codebase_map = {}
+    else:
+        codebase_map = {}
+
+    # Update with new discoveries
+    codebase_map.update(discoveries)
+
+    # Add metadata
+    if "_metadata" not in codebase_map:
+        codebase_map["_metadata"] = {}
+
+    codebase_map["_metadata"]["last_updated"] = datetime.now(timezone.utc).isoformat()
+    codebase_map["_metadata"]["total_files"] = len(
+        [k for k in codebase_map.keys() if k != "_metadata"]
+    )
+
+    # Write back
+    with open(map_file, "w") as f:
+        json.dump(codebase_map, f, indent=2, sort_keys=True)
+
+
+_write_queue: MemoryWriteQueue | None = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> MemoryWriteQueue:
+    """Get the process-wide memory write queue."""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            _write_queue = MemoryWriteQueue()
+            atexit.register(_write_queue.flush_at_exit)
+        return _write_queue
+
+
+def flush_memory_writes(timeout: float | None = None) -> bool:
+    """Write out all queued memory writes (call at session end)."""
+    return get_write_queue().flush(timeout)
+
+
+async def flush_memory_writes_async(timeout: float | None = None) -> bool:
+    """flush_memory_writes() for async callers."""
+    return await get_write_queue().flush_async(timeout)
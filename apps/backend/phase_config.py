@@ -62,6 +62,15 @@ DEFAULT_PHASE_THINKING: dict[str, str] = {
     "qa": "high",
 }
 
+# Token budget for packed file/pattern context injected into each phase's prompts
+# (estimated tokens, see context.packer.estimate_tokens)
+DEFAULT_CONTEXT_TOKEN_BUDGETS: dict[str, int] = {
+    "spec": 16000,
+    "planning": 24000,
+    "coding": 20000,
+    "qa": 16000,
+}
+
 
 class PhaseModelConfig(TypedDict, total=False):
     spec: str
@@ -85,6 +94,7 @@ class TaskMetadataConfig(TypedDict, total=False):
     phaseThinking: PhaseThinkingConfig
     model: str
     thinkingLevel: str
+    contextTokenBudget: int | dict[str, int]
 
 
 Phase = Literal["spec", "planning", "coding", "qa"]
@@ -317,3 +327,33 @@ def get_spec_phase_thinking_budget(phase_name: str) -> int | None:
     """
     thinking_level = SPEC_PHASE_THINKING_LEVELS.get(phase_name, "medium")
     return get_thinking_budget(thinking_level)
+
+
+def get_context_token_budget(spec_dir: Path, phase: Phase) -> int:
+    """
+    Get the context token budget for a specific execution phase.
+
+    task_metadata.json may set ``contextTokenBudget`` either to a single
+    integer (applies to every phase) or to a per-phase mapping.
+
+    Args:
+        spec_dir: Path to the spec directory
+        phase: Execution phase (spec, planning, coding, qa)
+
+    Returns:
+        Token budget for packed prompt context
+    """
+    default = DEFAULT_CONTEXT_TOKEN_BUDGETS[phase]
+    metadata = load_task_metadata(spec_dir)
+    if not metadata:
+        return default
+
+    configured = metadata.get("contextTokenBudget")
+    if isinstance(configured, dict):
+        configured = configured.get(phase)
+
+    if isinstance(configured, int) and not isinstance(configured, bool):
+        if configured > 0:
+            return configured
+
+    return default
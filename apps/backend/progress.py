@@ -6,6 +6,7 @@ Re-exports from core.progress for clean imports.
 """
 
 from core.progress import (
+    PlanSnapshot,
     count_subtasks,
     count_subtasks_detailed,
     format_duration,
@@ -14,6 +15,7 @@ from core.progress import (
     get_plan_summary,
     get_progress_percentage,
     is_build_complete,
+    load_plan_snapshot,
     print_build_complete_banner,
     print_paused_banner,
     print_progress_summary,
@@ -21,6 +23,7 @@ from core.progress import (
 )
 
 __all__ = [
+    "PlanSnapshot",
     "count_subtasks",
     "count_subtasks_detailed",
     "format_duration",
@@ -29,6 +32,7 @@ __all__ = [
     "get_plan_summary",
     "get_progress_percentage",
     "is_build_complete",
+    "load_plan_snapshot",
     "print_build_complete_banner",
     "print_paused_banner",
     "print_progress_summary",
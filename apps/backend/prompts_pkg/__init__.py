@@ -13,6 +13,13 @@ from .project_context import (
     load_project_index,
     should_refresh_project_index,
 )
+from .prompt_cache import (
+    PromptBuildStats,
+    PromptBuildTimer,
+    PromptFragmentCache,
+    get_prompt_cache,
+    reset_prompt_cache,
+)
 from .prompt_generator import (
     format_context_for_prompt,
     generate_environment_context,
@@ -20,6 +27,7 @@ from .prompt_generator import (
     generate_subtask_prompt,
     get_relative_spec_path,
     load_subtask_context,
+    pack_subtask_context,
 )
 
 # Import all functions from prompts
@@ -40,6 +48,7 @@ __all__ = [
     "generate_planner_prompt",
     "load_subtask_context",
     "format_context_for_prompt",
+    "pack_subtask_context",
     # prompts functions
     "get_planner_prompt",
     "get_coding_prompt",
@@ -47,6 +56,12 @@ __all__ = [
     "get_qa_reviewer_prompt",
     "get_qa_fixer_prompt",
     "is_first_run",
+    # prompt_cache
+    "PromptFragmentCache",
+    "PromptBuildStats",
+    "PromptBuildTimer",
+    "get_prompt_cache",
+    "reset_prompt_cache",
     # project_context functions
     "load_project_index",
     "detect_project_capabilities",
@@ -0,0 +1,260 @@
+"""
+Prompt Fragment Cache
+=====================
+
+Memoizes the file-backed fragments that go into agent prompts (prompt
+templates, recovery history, human input, pattern files, files to modify).
+
+The coder loop rebuilds its prompt on every iteration, but most of the source
+files it reads change rarely. Each fragment is cached by the file's
+(path, mtime, size) signature together with the function that rendered it, so
+a fragment is only re-read and re-rendered when its source file changes.
+
+The cache also tracks prompt build instrumentation (build time, prompt bytes,
+bytes read from disk, cache hits/misses) so long builds can report how much
+work prompt assembly is doing per session.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Upper bound on cached fragments; least recently used entries are evicted first
+_MAX_FRAGMENTS = 512
+
+
+@dataclass
+class PromptBuildStats:
+    """Aggregated prompt build instrumentation for one process."""
+
+    builds: int = 0
+    total_build_ms: float = 0.0
+    total_prompt_bytes: int = 0
+    last_build_ms: float = 0.0
+    last_prompt_bytes: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    bytes_read: int = 0
+    builds_by_kind: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of fragment lookups served from the cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "builds": self.builds,
+            "total_build_ms": round(self.total_build_ms, 2),
+            "avg_build_ms": round(self.total_build_ms / self.builds, 2)
+            if self.builds
+            else 0.0,
+            "total_prompt_bytes": self.total_prompt_bytes,
+            "last_build_ms": round(self.last_build_ms, 2),
+            "last_prompt_bytes": self.last_prompt_bytes,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "bytes_read": self.bytes_read,
+            "builds_by_kind": dict(self.builds_by_kind),
+        }
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it is not a readable file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PromptFragmentCache:
+    """
+    Thread-safe LRU cache of rendered prompt fragments keyed by source file.
+
+    Usage:
+        cache = get_prompt_cache()
+        template = cache.read_text(PROMPTS_DIR / "coder.md")
+        recovery = cache.get_fragment(history_file, render_recovery, "recovery")
+    """
+
+    def __init__(self, max_entries: int = _MAX_FRAGMENTS):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.stats = PromptBuildStats()
+
+    def get_fragment(
+        self,
+        path: Path,
+        render: Callable[[str], Any],
+        namespace: str = "text",
+        default: Any = None,
+    ) -> Any:
+        """
+        Get the rendered fragment for a file, re-rendering only when it changed.
+
+        Args:
+            path: Source file for the fragment
+            render: Function turning the raw file text into the fragment
+            namespace: Distinguishes different renderings of the same file
+            default: Returned when the file does not exist or cannot be read
+
+        Returns:
+            The rendered fragment, or ``default`` if the file is unavailable
+        """
+        signature = _file_signature(path)
+        if signature is None:
+            return default
+
+        key = (namespace, str(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.stats.cache_hits += 1
+                return entry[1]
+
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return default
+
+        value = render(raw)
+
+        with self._lock:
+            self.stats.cache_misses += 1
+            self.stats.bytes_read += signature[1]
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def read_text(self, path: Path, default: str | None = None) -> str | None:
+        """
+        Read a file's text through the cache.
+
+        Returns ``default`` only when the file does not exist. A file that
+        can't be read or isn't UTF-8 raises, like Path.read_text().
+        """
+        text = self.get_fragment(path, _identity, "text", _UNREADABLE)
+        if text is not _UNREADABLE:
+            return text
+        if _file_signature(path) is None:
+            return default
+        return path.read_text(encoding="utf-8")
+
+    def record_build(self, kind: str, prompt: str, duration_ms: float) -> None:
+        """
+        Record one prompt build for instrumentation.
+
+        Args:
+            kind: Prompt type (e.g., "planner", "subtask")
+            prompt: The assembled prompt
+            duration_ms: Time spent assembling it
+        """
+        prompt_bytes = len(prompt.encode("utf-8"))
+        with self._lock:
+            self.stats.builds += 1
+            self.stats.total_build_ms += duration_ms
+            self.stats.total_prompt_bytes += prompt_bytes
+            self.stats.last_build_ms = duration_ms
+            self.stats.last_prompt_bytes = prompt_bytes
+            self.stats.builds_by_kind[kind] = self.stats.builds_by_kind.get(kind, 0) + 1
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """
+        Drop cached fragments.
+
+        Args:
+            path: Only drop fragments rendered from this file, or None to clear all
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = str(path)
+            for key in [k for k in self._entries if k[1] == target]:
+                del self._entries[key]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = PromptBuildStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+# get_fragment default telling a missing file from an unreadable one
+_UNREADABLE = object()
+
+
+class PromptBuildTimer:
+    """
+    Context manager measuring one prompt build.
+
+    Usage:
+        with PromptBuildTimer("subtask") as timer:
+            prompt = generate_subtask_prompt(...)
+            timer.prompt = prompt
+    """
+
+    def __init__(self, kind: str, cache: PromptFragmentCache | None = None):
+        self.kind = kind
+        self.cache = cache if cache is not None else get_prompt_cache()
+        self.prompt = ""
+        self.duration_ms = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> PromptBuildTimer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        if exc_type is None:
+            self.cache.record_build(self.kind, self.prompt, self.duration_ms)
+
+    @property
+    def prompt_bytes(self) -> int:
+        return len(self.prompt.encode("utf-8"))
+
+
+_PROMPT_CACHE: PromptFragmentCache | None = None
+_PROMPT_CACHE_LOCK = threading.Lock()
+
+
+def get_prompt_cache() -> PromptFragmentCache:
+    """Get the process-wide prompt fragment cache."""
+    global _PROMPT_CACHE
+    if _PROMPT_CACHE is None:
+        with _PROMPT_CACHE_LOCK:
+            if _PROMPT_CACHE is None:
+                _PROMPT_CACHE = PromptFragmentCache()
+    return _PROMPT_CACHE
+
+
+def reset_prompt_cache() -> None:
+    """Discard the process-wide prompt cache (mainly for tests)."""
+    global _PROMPT_CACHE
+    with _PROMPT_CACHE_LOCK:
+        _PROMPT_CACHE = None
@@ -15,6 +15,10 @@ This approach:
 import json
 from pathlib import Path
 
+from context.packer import ContextFragment, ContextPacker, PackingReport
+
+from .prompt_cache import get_prompt_cache
+
 
 def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
     """
@@ -267,9 +271,8 @@ def generate_planner_prompt(spec_dir: Path, project_dir: Path | None = None) ->
         None,
     )
 
-    if planner_file:
-        prompt = planner_file.read_text(encoding="utf-8")
-    else:
+    prompt = get_prompt_cache().read_text(planner_file) if planner_file else None
+    if prompt is None:
         prompt = (
             "Read spec.md and create implementation_plan.json with phases and subtasks."
         )
@@ -331,43 +334,90 @@ def load_subtask_context(
         "spec_excerpt": None,
     }
 
+    # File contents are served from the prompt fragment cache, so unchanged
+    # files are not re-read and re-truncated on every coder iteration.
+    cache = get_prompt_cache()
+    render = _truncating_renderer(max_file_lines)
+    namespace = f"truncated:{max_file_lines}"
+
     # Load pattern files (truncated)
     for pattern_path in subtask.get("patterns_from", []):
         full_path = project_dir / pattern_path
         if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["patterns"][pattern_path] = content
-            except Exception:
-                context["patterns"][pattern_path] = "(Could not read file)"
+            context["patterns"][pattern_path] = cache.get_fragment(
+                full_path, render, namespace, default="(Could not read file)"
+            )
 
     # Load files to modify (truncated)
     for file_path in subtask.get("files_to_modify", []):
         full_path = project_dir / file_path
         if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["files_to_modify"][file_path] = content
-            except Exception:
-                context["files_to_modify"][file_path] = "(Could not read file)"
+            context["files_to_modify"][file_path] = cache.get_fragment(
+                full_path, render, namespace, default="(Could not read file)"
+            )
 
     return context
 
 
+def _truncating_renderer(max_file_lines: int):
+    """Build a fragment renderer that truncates file text to max_file_lines."""
+
+    def render(text: str) -> str:
+        lines = text.split("\n")
+        if len(lines) > max_file_lines:
+            content = "\n".join(lines[:max_file_lines])
+            content += f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
+            return content
+        return text
+
+    return render
+
+
+def pack_subtask_context(
+    context: dict, token_budget: int
+) -> tuple[dict, PackingReport]:
+    """
+    Fit loaded subtask file context into a token budget.
+
+    Files to modify rank above pattern files, and earlier entries in the
+    subtask's lists rank above later ones. Files that don't fit are dropped;
+    the last file that partially fits is truncated.
+
+    Args:
+        context: Dict from load_subtask_context
+        token_budget: Estimated token budget for file contents
+
+    Returns:
+        Tuple of (packed context dict, packing report)
+    """
+    # Each kind scores within its own band, (2, 3] and (1, 2], so every file
+    # to modify outranks every pattern file however many there are
+    fragments = []
+    for kind, section, weight in (
+        ("file_to_modify", "files_to_modify", 3.0),
+        ("pattern", "patterns", 2.0),
+    ):
+        entries = context.get(section) or {}
+        for rank, (path, content) in enumerate(entries.items()):
+            fragments.append(
+                ContextFragment(
+                    kind=kind,
+                    key=path,
+                    content=content,
+                    relevance=weight - rank / len(entries),
+                    truncatable=True,
+                    payload=section,
+                )
+            )
+
+    kept, report = ContextPacker(token_budget).pack(fragments)
+
+    packed = {**context, "patterns": {}, "files_to_modify": {}}
+    for fragment in kept:
+        packed[fragment.payload][fragment.key] = fragment.content
+    return packed, report
+
+
 def format_context_for_prompt(context: dict) -> str:
     """
     Format loaded context into a prompt section.
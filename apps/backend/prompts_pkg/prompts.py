@@ -17,6 +17,7 @@ from .project_context import (
     get_mcp_tools_for_project,
     load_project_index,
 )
+from .prompt_cache import get_prompt_cache
 
 
 def _validate_branch_name(branch: str | None) -> str | None:
@@ -173,7 +174,7 @@ def get_planner_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/planner.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = get_prompt_cache().read_text(prompt_file)
 
     # Inject spec directory information at the beginning
     spec_context = f"""## SPEC LOCATION
@@ -216,7 +217,7 @@ def get_coding_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/coder.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = get_prompt_cache().read_text(prompt_file)
 
     spec_context = f"""## SPEC LOCATION
 
@@ -238,11 +239,19 @@ The project root is the parent of auto-claude/. All code goes in the project roo
         spec_context += recovery_context
 
     # Check for human input file
-    human_input_file = spec_dir / "HUMAN_INPUT.md"
-    if human_input_file.exists():
-        human_input = human_input_file.read_text().strip()
-        if human_input:
-            spec_context += f"""## HUMAN INPUT (READ THIS FIRST!)
+    spec_context += get_prompt_cache().get_fragment(
+        spec_dir / "HUMAN_INPUT.md", _render_human_input, "human_input", default=""
+    )
+
+    return spec_context + prompt
+
+
+def _render_human_input(text: str) -> str:
+    """Render HUMAN_INPUT.md contents as a prompt section (empty if blank)."""
+    human_input = text.strip()
+    if not human_input:
+        return ""
+    return f"""## HUMAN INPUT (READ THIS FIRST!)
 
 The human has left you instructions. READ AND FOLLOW THESE CAREFULLY:
 
@@ -254,34 +263,46 @@ After addressing this input, you may delete or clear the HUMAN_INPUT.md file.
 
 """
 
-    return spec_context + prompt
-
 
 def _get_recovery_context(spec_dir: Path) -> str:
     """
     Get recovery context if there are failed attempts or stuck subtasks.
 
+    The rendered section is cached against attempt_history.json, so it is only
+    rebuilt when the recovery manager records a new attempt.
+
     Args:
         spec_dir: Spec directory containing memory/
 
     Returns:
         Recovery context string or empty string
     """
-    import json
-
     attempt_history_file = spec_dir / "memory" / "attempt_history.json"
 
-    if not attempt_history_file.exists():
-        return ""
+    return get_prompt_cache().get_fragment(
+        attempt_history_file, _render_recovery_context, "recovery", default=""
+    )
+
 
+def _render_recovery_context(raw_history: str) -> str:
+    """
+    Render attempt_history.json contents as a recovery prompt section.
+
+    Args:
+        raw_history: Raw JSON text of attempt_history.json
+
+    Returns:
+        Recovery context string or empty string
+    """
     try:
-        with open(attempt_history_file) as f:
-            history = json.load(f)
+        history = json.loads(raw_history)
+    except json.JSONDecodeError:
+        return ""
 
-        # Check for stuck subtasks
-        stuck_subtasks = history.get("stuck_subtasks", [])
-        if stuck_subtasks:
-            context = """## ⚠️ RECOVERY ALERT - STUCK SUBTASKS DETECTED
+    # Check for stuck subtasks
+    stuck_subtasks = history.get("stuck_subtasks", [])
+    if stuck_subtasks:
+        context = """## ⚠️ RECOVERY ALERT - STUCK SUBTASKS DETECTED
 
 Some subtasks have been attempted multiple times without success. These subtasks need:
 - A COMPLETELY DIFFERENT approach
@@ -290,21 +311,21 @@ Some subtasks have been attempted multiple times without success. These subtasks
 
 Stuck subtasks:
 """
-            for stuck in stuck_subtasks:
-                context += f"- {stuck['subtask_id']}: {stuck['reason']} ({stuck['attempt_count']} attempts)\n"
+        for stuck in stuck_subtasks:
+            context += f"- {stuck['subtask_id']}: {stuck['reason']} ({stuck['attempt_count']} attempts)\n"
 
-            context += "\nBefore working on any subtask, check memory/attempt_history.json for previous attempts!\n\n---\n\n"
-            return context
+        context += "\nBefore working on any subtask, check memory/attempt_history.json for previous attempts!\n\n---\n\n"
+        return context
 
-        # Check for subtasks with multiple attempts
-        subtasks_with_retries = []
-        for subtask_id, subtask_data in history.get("subtasks", {}).items():
-            attempts = subtask_data.get("attempts", [])
-            if len(attempts) > 1 and subtask_data.get("status") != "completed":
-                subtasks_with_retries.append((subtask_id, len(attempts)))
+    # Check for subtasks with multiple attempts
+    subtasks_with_retries = []
+    for subtask_id, subtask_data in history.get("subtasks", {}).items():
+        attempts = subtask_data.get("attempts", [])
+        if len(attempts) > 1 and subtask_data.get("status") != "completed":
+            subtasks_with_retries.append((subtask_id, len(attempts)))
 
-        if subtasks_with_retries:
-            context = """## ⚠️ RECOVERY CONTEXT - RETRY AWARENESS
+    if subtasks_with_retries:
+        context = """## ⚠️ RECOVERY CONTEXT - RETRY AWARENESS
 
 Some subtasks have been attempted before. When working on these:
 1. READ memory/attempt_history.json for the specific subtask
@@ -313,16 +334,13 @@ Some subtasks have been attempted before. When working on these:
 
 Subtasks with previous attempts:
 """
-            for subtask_id, attempt_count in subtasks_with_retries:
-                context += f"- {subtask_id}: {attempt_count} attempts\n"
-
-            context += "\n---\n\n"
-            return context
+        for subtask_id, attempt_count in subtasks_with_retries:
+            context += f"- {subtask_id}: {attempt_count} attempts\n"
 
-        return ""
+        context += "\n---\n\n"
+        return context
 
-    except (OSError, json.JSONDecodeError):
-        return ""
+    return ""
 
 
 def get_followup_planner_prompt(spec_dir: Path) -> str:
@@ -344,7 +362,7 @@ def get_followup_planner_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/followup_planner.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = get_prompt_cache().read_text(prompt_file)
 
     # Inject spec directory information at the beginning
     spec_context = f"""## SPEC LOCATION (FOLLOW-UP MODE)
@@ -424,9 +442,10 @@ def _load_prompt_file(filename: str) -> str:
         FileNotFoundError: If prompt file doesn't exist
     """
     prompt_file = PROMPTS_DIR / filename
-    if not prompt_file.exists():
+    content = get_prompt_cache().read_text(prompt_file)
+    if content is None:
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-    return prompt_file.read_text()
+    return content
 
 
 def get_qa_reviewer_prompt(spec_dir: Path, project_dir: Path) -> str:
@@ -7,21 +7,45 @@ Called from Node.js (Electron main process) via child_process.spawn().
 
 Usage:
     python query_memory.py get-status <db-path> <database>
-    python query_memory.py get-memories <db-path> <database> [--limit N]
-    python query_memory.py search <db-path> <database> <query> [--limit N]
+    python query_memory.py get-memories <db-path> <database> [--limit N] [--cursor C]
+    python query_memory.py search <db-path> <database> <query> [--limit N] [--cursor C]
     python query_memory.py semantic-search <db-path> <database> <query> [--limit N]
     python query_memory.py get-entities <db-path> <database> [--limit N]
+    python query_memory.py serve [--socket PATH] [--idle-timeout SECONDS]
 
 Output:
     JSON to stdout with structure: {"success": bool, "data": ..., "error": ...}
+
+    get-memories and search return "nextCursor" (null on the last page); pass
+    it back with --cursor to fetch the next page.
+
+Serve mode:
+    `serve` keeps the database connection and the Graphiti client warm and
+    answers newline-delimited JSON requests on stdin/stdout (or on a Unix
+    socket with --socket). Each request carries the arguments of one of the
+    commands above, and gets the same JSON a one-shot call prints, plus the
+    request's "id":
+
+        {"id": 1, "args": ["search", "<db-path>", "<database>", "auth", "--limit", "5"]}
+        {"success": true, "data": {...}, "id": 1}
+
+    The warm state is closed after --idle-timeout seconds without requests,
+    releasing the database lock for other processes.
 """
 
 import argparse
 import asyncio
+import base64
+import contextlib
+import functools
 import json
 import os
 import re
+import signal
+import socketserver
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -61,13 +85,121 @@ def serialize_value(val):
     return val
 
 
+# Seconds without requests before `serve` closes its warm connections
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+
+class _Response(BaseException):
+    """Carries a command's result out of the handler in serve mode.
+
+    A BaseException, like the SystemExit raised by sys.exit() in one-shot
+    mode, so the handlers' `except Exception` blocks let it through.
+    """
+
+    def __init__(self, result: dict):
+        super().__init__()
+        self.result = result
+
+
+class _ServeState:
+    """Database connections and Graphiti clients kept warm between requests."""
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        # Requests run one at a time (connections aren't shared across queries)
+        self.lock = threading.RLock()
+        self.loop = asyncio.new_event_loop()
+        self.databases: dict[str, object] = {}
+        self.connections: dict[str, object] = {}
+        self.semantic_clients: dict[str, object] = {}
+        self.last_request = time.monotonic()
+
+    def connection(self, full_path: Path):
+        """Get the warm connection for a database, opening it if needed."""
+        key = _db_key(full_path)
+        conn = self.connections.get(key)
+        if conn is None:
+            try:
+                import kuzu
+            except ImportError:
+                import real_ladybug as kuzu
+
+            db = self.databases.get(key)
+            if db is None:
+                db = kuzu.Database(str(full_path))
+                self.databases[key] = db
+            conn = kuzu.Connection(db)
+            self.connections[key] = conn
+        return conn
+
+    def close_database(self, key: str) -> None:
+        """Close the connection and database opened for a path by this process."""
+        conn = self.connections.pop(key, None)
+        db = self.databases.pop(key, None)
+        with contextlib.suppress(Exception):
+            if conn is not None:
+                conn.close()
+        # A database opened by a Graphiti driver is closed with its client
+        if db is not None and key not in self.semantic_clients:
+            with contextlib.suppress(Exception):
+                db.close()
+
+    def close_all(self) -> None:
+        """Close everything (idle timeout or shutdown); reopened on demand."""
+        for key in list(self.databases) + list(self.connections):
+            self.close_database(key)
+        clients = list(self.semantic_clients.values())
+        self.semantic_clients.clear()
+        for client in clients:
+            try:
+                self.loop.run_until_complete(client.close())
+            except Exception as e:
+                sys.stderr.write(f"Failed to close Graphiti client: {e}\n")
+
+    @property
+    def is_warm(self) -> bool:
+        return bool(self.databases or self.connections or self.semantic_clients)
+
+
+# Set while `serve` is running
+_serve_state: _ServeState | None = None
+
+
+def _db_key(full_path) -> str:
+    return str(Path(full_path).expanduser().resolve())
+
+
+def _run_async(coro):
+    """Run a coroutine, on the persistent event loop when serving."""
+    if _serve_state is not None:
+        return _serve_state.loop.run_until_complete(coro)
+    return asyncio.run(coro)
+
+
+def open_connection(full_path: Path):
+    """Open a connection to a database (the warm one when serving)."""
+    if _serve_state is not None:
+        return _serve_state.connection(full_path)
+
+    # Try to import kuzu (might be real_ladybug via monkeypatch or native)
+    try:
+        import kuzu
+    except ImportError:
+        import real_ladybug as kuzu
+
+    db = kuzu.Database(str(full_path))
+    return kuzu.Connection(db)
+
+
 def output_json(success: bool, data=None, error: str = None):
-    """Output JSON result to stdout and exit."""
+    """Output JSON result to stdout and exit (return it when serving)."""
     result = {"success": success}
     if data is not None:
         result["data"] = data
     if error:
         result["error"] = error
+    if _serve_state is not None:
+        raise _Response(result)
     print(
         json.dumps(result, default=str)
     )  # Use default=str for any non-serializable types
@@ -82,19 +214,11 @@ def output_error(message: str):
 def get_db_connection(db_path: str, database: str):
     """Get a database connection."""
     try:
-        # Try to import kuzu (might be real_ladybug via monkeypatch or native)
-        try:
-            import kuzu
-        except ImportError:
-            import real_ladybug as kuzu
-
         full_path = Path(db_path) / database
         if not full_path.exists():
             return None, f"Database not found at {full_path}"
 
-        db = kuzu.Database(str(full_path))
-        conn = kuzu.Connection(db)
-        return conn, None
+        return open_connection(full_path), None
     except Exception as e:
         return None, str(e)
 
@@ -160,6 +284,237 @@ def cmd_get_status(args):
     )
 
 
+# Graphiti's full-text index over episode content (see get_fulltext_indices())
+EPISODE_FTS_TABLE = "Episodic"
+EPISODE_FTS_INDEX = "episode_content"
+
+EPISODE_COLUMNS = """e.uuid as uuid, e.name as name, e.created_at as created_at,
+                   e.content as content, e.source_description as description,
+                   e.group_id as group_id"""
+
+
+class InvalidCursorError(ValueError):
+    """A --cursor value that wasn't produced by this command."""
+
+
+def encode_cursor(values: dict) -> str:
+    """Encode a pagination cursor (opaque to the caller)."""
+    data = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> dict | None:
+    """Decode a pagination cursor. Raises InvalidCursorError if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, dict):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def _cursor_created_at(values: dict):
+    """Restore the created_at of a cursor as the type stored in the database."""
+    created_at = values.get("created_at")
+    if values.get("timestamp") and created_at:
+        return datetime.fromisoformat(created_at)
+    return created_at
+
+
+def _created_at_cursor(row, **extra) -> str:
+    """Cursor positioned after a row ordered by (created_at, uuid) descending."""
+    created_at = row[2] if len(row) > 2 else None
+    return encode_cursor(
+        {
+            "created_at": serialize_value(created_at),
+            "timestamp": hasattr(created_at, "isoformat"),
+            "uuid": serialize_value(row[0]),
+            **extra,
+        }
+    )
+
+
+def episode_from_row(row) -> dict:
+    """Convert an Episodic result row (EPISODE_COLUMNS [, score]) to a memory."""
+    # Row order: uuid, name, created_at, content, description, group_id[, score]
+    uuid_val = serialize_value(row[0]) if len(row) > 0 else None
+    name_val = serialize_value(row[1]) if len(row) > 1 else ""
+    created_at_val = serialize_value(row[2]) if len(row) > 2 else None
+    content_val = serialize_value(row[3]) if len(row) > 3 else ""
+    description_val = serialize_value(row[4]) if len(row) > 4 else ""
+    group_id_val = serialize_value(row[5]) if len(row) > 5 else ""
+
+    memory = {
+        "id": uuid_val or name_val or "unknown",
+        "name": name_val or "",
+        "type": infer_episode_type(name_val or "", content_val or ""),
+        "timestamp": created_at_val or datetime.now().isoformat(),
+        "content": content_val or description_val or name_val or "",
+        "description": description_val or "",
+        "group_id": group_id_val or "",
+    }
+    if len(row) > 6:
+        memory["score"] = row[6]
+
+    # Extract session number if present
+    session_num = extract_session_number(name_val or "")
+    if session_num:
+        memory["session_number"] = session_num
+
+    return memory
+
+
+def _fetch_rows(conn, query: str, parameters: dict) -> list:
+    """Execute a query and collect its rows (without pandas)."""
+    result = conn.execute(query, parameters=parameters)
+    rows = []
+    while result.has_next():
+        rows.append(result.get_next())
+    return rows
+
+
+def list_episodes(conn, limit: int, cursor: str | None = None) -> tuple[list, str]:
+    """
+    List episodes, newest first.
+
+    Returns (memories, next_cursor). Pages continue after the cursor's
+    (created_at, uuid) instead of re-reading the earlier pages.
+    """
+    after = decode_cursor(cursor)
+    parameters = {"limit": limit + 1}
+    where = ""
+    if after:
+        where = """
+            WHERE e.created_at < $cursor_created_at
+               OR (e.created_at = $cursor_created_at AND e.uuid < $cursor_uuid)"""
+        parameters["cursor_created_at"] = _cursor_created_at(after)
+        parameters["cursor_uuid"] = after.get("uuid") or ""
+
+    query = f"""
+            MATCH (e:Episodic){where}
+            RETURN {EPISODE_COLUMNS}
+            ORDER BY e.created_at DESC, e.uuid DESC
+            LIMIT $limit
+        """
+    rows = _fetch_rows(conn, query, parameters)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _created_at_cursor(rows[-1])
+    return [episode_from_row(row) for row in rows], next_cursor
+
+
+def has_fts_index(conn, table: str, index: str) -> bool:
+    """Check whether a full-text index exists (loading the FTS extension)."""
+    try:
+        conn.execute("LOAD EXTENSION fts")
+    except Exception:
+        pass  # Already loaded, or unavailable (SHOW_INDEXES tells)
+
+    try:
+        rows = _fetch_rows(conn, "CALL SHOW_INDEXES() RETURN *", {})
+    except Exception:
+        return False
+    # Row order: table name, index name, index type, ...
+    return any(
+        len(row) > 2 and row[0] == table and row[1] == index and row[2] == "FTS"
+        for row in rows
+    )
+
+
+def search_episodes(
+    conn, search_query: str, limit: int, cursor: str | None = None
+) -> tuple[list, str, str]:
+    """
+    Search episodes by keyword.
+
+    Uses Graphiti's full-text index (BM25 ranking) when it exists and falls
+    back to a CONTAINS scan of every episode when it doesn't.
+
+    Returns (memories, next_cursor, search_type), where search_type is
+    "fulltext" or "keyword".
+    """
+    after = decode_cursor(cursor)
+    use_index = has_fts_index(conn, EPISODE_FTS_TABLE, EPISODE_FTS_INDEX)
+    search_type = "fulltext" if use_index else "keyword"
+    if after and after.get("type") != search_type:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+    if use_index:
+        # BM25 has to rank every match anyway; TOP only bounds the rows returned
+        seen = int(after.get("seen", 0)) if after else 0
+        parameters = {
+            "search_query": search_query,
+            "top": seen + limit + 1,
+            "limit": limit + 1,
+        }
+        where = ""
+        if after:
+            where = """
+            WHERE score < $cursor_score
+               OR (score = $cursor_score AND e.uuid > $cursor_uuid)"""
+            parameters["cursor_score"] = float(after.get("score", 0.0))
+            parameters["cursor_uuid"] = after.get("uuid") or ""
+
+        query = f"""
+            CALL QUERY_FTS_INDEX('{EPISODE_FTS_TABLE}', '{EPISODE_FTS_INDEX}',
+                                 cast($search_query AS STRING), TOP := $top)
+            WITH node AS e, score{where}
+            RETURN {EPISODE_COLUMNS}, score
+            ORDER BY score DESC, e.uuid
+            LIMIT $limit
+        """
+        rows = _fetch_rows(conn, query, parameters)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(
+                {
+                    "type": search_type,
+                    "score": rows[-1][6],
+                    "uuid": serialize_value(rows[-1][0]),
+                    "seen": seen + limit,
+                }
+            )
+        return [episode_from_row(row) for row in rows], next_cursor, search_type
+
+    # No index yet: scan episodes with CONTAINS, newest first
+    parameters = {"search_query": search_query.lower(), "limit": limit + 1}
+    cursor_filter = ""
+    if after:
+        cursor_filter = """
+              AND (e.created_at < $cursor_created_at
+                   OR (e.created_at = $cursor_created_at AND e.uuid < $cursor_uuid))"""
+        parameters["cursor_created_at"] = _cursor_created_at(after)
+        parameters["cursor_uuid"] = after.get("uuid") or ""
+
+    query = f"""
+            MATCH (e:Episodic)
+            WHERE (toLower(e.name) CONTAINS $search_query
+                   OR toLower(e.content) CONTAINS $search_query
+                   OR toLower(e.source_description) CONTAINS $search_query){cursor_filter}
+            RETURN {EPISODE_COLUMNS}
+            ORDER BY e.created_at DESC, e.uuid DESC
+            LIMIT $limit
+        """
+    rows = _fetch_rows(conn, query, parameters)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _created_at_cursor(rows[-1], type=search_type)
+    memories = [episode_from_row(row) for row in rows]
+    for memory in memories:
+        memory["score"] = 1.0  # Keyword match score
+    return memories, next_cursor, search_type
+
+
 def cmd_get_memories(args):
     """Get episodic memories from the database."""
     if not apply_monkeypatch():
@@ -173,56 +528,26 @@ def cmd_get_memories(args):
 
     try:
         limit = args.limit or 20
+        memories, next_cursor = list_episodes(
+            conn, limit, getattr(args, "cursor", None)
+        )
+        output_json(
+            True,
+            data={
+                "memories": memories,
+                "count": len(memories),
+                "nextCursor": next_cursor,
+            },
+        )
 
-        # Query episodic nodes with parameterized query
-        query = """
-            MATCH (e:Episodic)
-            RETURN e.uuid as uuid, e.name as name, e.created_at as created_at,
-                   e.content as content, e.source_description as description,
-                   e.group_id as group_id
-            ORDER BY e.created_at DESC
-            LIMIT $limit
-        """
-
-        result = conn.execute(query, parameters={"limit": limit})
-
-        # Process results without pandas (iterate through result set directly)
-        memories = []
-        while result.has_next():
-            row = result.get_next()
-            # Row order: uuid, name, created_at, content, description, group_id
-            uuid_val = serialize_value(row[0]) if len(row) > 0 else None
-            name_val = serialize_value(row[1]) if len(row) > 1 else ""
-            created_at_val = serialize_value(row[2]) if len(row) > 2 else None
-            content_val = serialize_value(row[3]) if len(row) > 3 else ""
-            description_val = serialize_value(row[4]) if len(row) > 4 else ""
-            group_id_val = serialize_value(row[5]) if len(row) > 5 else ""
-
-            memory = {
-                "id": uuid_val or name_val or "unknown",
-                "name": name_val or "",
-                "type": infer_episode_type(name_val or "", content_val or ""),
-                "timestamp": created_at_val or datetime.now().isoformat(),
-                "content": content_val or description_val or name_val or "",
-                "description": description_val or "",
-                "group_id": group_id_val or "",
-            }
-
-            # Extract session number if present
-            session_num = extract_session_number(name_val or "")
-            if session_num:
-                memory["session_number"] = session_num
-
-            memories.append(memory)
-
-        output_json(True, data={"memories": memories, "count": len(memories)})
-
+    except InvalidCursorError as e:
+        output_error(str(e))
     except Exception as e:
         # Table might not exist yet
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0})
+            output_json(True, data={"memories": [], "count": 0, "nextCursor": None})
         else:
             output_error(f"Query failed: {e}")
 
@@ -240,64 +565,35 @@ def cmd_search(args):
 
     try:
         limit = args.limit or 20
-        search_query = args.query.lower()
-
-        # Search in episodic nodes using CONTAINS with parameterized query
-        query = """
-            MATCH (e:Episodic)
-            WHERE toLower(e.name) CONTAINS $search_query
-               OR toLower(e.content) CONTAINS $search_query
-               OR toLower(e.source_description) CONTAINS $search_query
-            RETURN e.uuid as uuid, e.name as name, e.created_at as created_at,
-                   e.content as content, e.source_description as description,
-                   e.group_id as group_id
-            ORDER BY e.created_at DESC
-            LIMIT $limit
-        """
-
-        result = conn.execute(
-            query, parameters={"search_query": search_query, "limit": limit}
+        memories, next_cursor, search_type = search_episodes(
+            conn, args.query, limit, getattr(args, "cursor", None)
         )
-
-        # Process results without pandas
-        memories = []
-        while result.has_next():
-            row = result.get_next()
-            # Row order: uuid, name, created_at, content, description, group_id
-            uuid_val = serialize_value(row[0]) if len(row) > 0 else None
-            name_val = serialize_value(row[1]) if len(row) > 1 else ""
-            created_at_val = serialize_value(row[2]) if len(row) > 2 else None
-            content_val = serialize_value(row[3]) if len(row) > 3 else ""
-            description_val = serialize_value(row[4]) if len(row) > 4 else ""
-            group_id_val = serialize_value(row[5]) if len(row) > 5 else ""
-
-            memory = {
-                "id": uuid_val or name_val or "unknown",
-                "name": name_val or "",
-                "type": infer_episode_type(name_val or "", content_val or ""),
-                "timestamp": created_at_val or datetime.now().isoformat(),
-                "content": content_val or description_val or name_val or "",
-                "description": description_val or "",
-                "group_id": group_id_val or "",
-                "score": 1.0,  # Keyword match score
-            }
-
-            session_num = extract_session_number(name_val or "")
-            if session_num:
-                memory["session_number"] = session_num
-
-            memories.append(memory)
-
         output_json(
             True,
-            data={"memories": memories, "count": len(memories), "query": args.query},
+            data={
+                "memories": memories,
+                "count": len(memories),
+                "query": args.query,
+                "search_type": search_type,
+                "nextCursor": next_cursor,
+            },
         )
 
+    except InvalidCursorError as e:
+        output_error(str(e))
     except Exception as e:
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0, "query": args.query})
+            output_json(
+                True,
+                data={
+                    "memories": [],
+                    "count": 0,
+                    "query": args.query,
+                    "nextCursor": None,
+                },
+            )
         else:
             output_error(f"Search failed: {e}")
 
@@ -320,7 +616,7 @@ def cmd_semantic_search(args):
 
     # Try semantic search
     try:
-        result = asyncio.run(_async_semantic_search(args))
+        result = _run_async(_async_semantic_search(args))
         if result.get("success"):
             output_json(True, data=result.get("data"))
         else:
@@ -366,11 +662,10 @@ async def _async_semantic_search(args):
                 "error": f"Embedder provider not properly configured: {'; '.join(validation_errors)}",
             }
 
-        # Initialize client
-        client = GraphitiClient(config)
-        initialized = await client.initialize()
+        # Initialize client (or reuse the warm one when serving)
+        client = await _open_semantic_client(config, GraphitiClient)
 
-        if not initialized:
+        if client is None:
             return {"success": False, "error": "Failed to initialize Graphiti client"}
 
         try:
@@ -443,7 +738,8 @@ async def _async_semantic_search(args):
             }
 
         finally:
-            await client.close()
+            if _serve_state is None:
+                await client.close()
 
     except ImportError as e:
         return {"success": False, "error": f"Missing dependencies: {e}"}
@@ -451,6 +747,33 @@ async def _async_semantic_search(args):
         return {"success": False, "error": f"Semantic search failed: {e}"}
 
 
+async def _open_semantic_client(config, client_class):
+    """Initialize a GraphitiClient, reusing the warm one when serving."""
+    state = _serve_state
+    if state is None:
+        client = client_class(config)
+        return client if await client.initialize() else None
+
+    key = _db_key(config.get_db_path())
+    client = state.semantic_clients.get(key)
+    if client is not None and client.is_initialized:
+        return client
+
+    # The driver opens the database itself: release our handle on it first
+    state.semantic_clients.pop(key, None)
+    state.close_database(key)
+    client = client_class(config)
+    if not await client.initialize():
+        return None
+    state.semantic_clients[key] = client
+
+    # Share the driver's database with the keyword queries on the same path
+    driver_db = getattr(getattr(client, "_driver", None), "db", None)
+    if driver_db is not None:
+        state.databases[key] = driver_db
+    return client
+
+
 def cmd_get_entities(args):
     """Get entity memories (patterns, gotchas, etc.) from the database."""
     if not apply_monkeypatch():
@@ -531,11 +854,6 @@ def cmd_add_episode(args):
     try:
         import uuid as uuid_module
 
-        try:
-            import kuzu
-        except ImportError:
-            import real_ladybug as kuzu
-
         # Parse content from JSON if provided
         content = args.content
         if content:
@@ -559,8 +877,7 @@ def cmd_add_episode(args):
             Path(args.db_path).mkdir(parents=True, exist_ok=True)
 
         # Open database (creates it if it doesn't exist)
-        db = kuzu.Database(str(full_path))
-        conn = kuzu.Connection(db)
+        conn = open_connection(full_path)
 
         # Always try to create the Episodic table if it doesn't exist
         # This handles both new databases and existing databases without the table
@@ -665,7 +982,8 @@ def extract_session_number(name: str) -> int | None:
     return None
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (also used for serve requests)."""
     parser = argparse.ArgumentParser(
         description="Query LadybugDB memory database for auto-claude-ui"
     )
@@ -685,6 +1003,7 @@ def main():
     memories_parser.add_argument(
         "--limit", type=int, default=20, help="Maximum results"
     )
+    memories_parser.add_argument("--cursor", help="nextCursor from the previous page")
 
     # search command
     search_parser = subparsers.add_parser("search", help="Search memories")
@@ -692,6 +1011,7 @@ def main():
     search_parser.add_argument("database", help="Database name")
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--limit", type=int, default=20, help="Maximum results")
+    search_parser.add_argument("--cursor", help="nextCursor from the previous page")
 
     # semantic-search command
     semantic_parser = subparsers.add_parser(
@@ -734,6 +1054,159 @@ def main():
         "--group-id", dest="group_id", help="Optional group ID for namespacing"
     )
 
+    # serve command (long-lived process for the Electron app)
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Answer newline-delimited JSON requests with warm connections",
+    )
+    serve_parser.add_argument(
+        "--socket", help="Listen on this Unix socket instead of stdin/stdout"
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Close warm connections after this many idle seconds",
+    )
+
+    return parser
+
+
+def handle_request(line: str) -> dict:
+    """
+    Run one serve request and return its response.
+
+    The request is a JSON object with the command-line arguments in "args"
+    and an optional "id" that is copied to the response.
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"success": False, "error": f"Invalid request: {e}"}
+    if not isinstance(request, dict) or not isinstance(request.get("args"), list):
+        return {"success": False, "error": 'Invalid request: expected {"args": [...]}'}
+
+    response = _run_command([str(arg) for arg in request["args"]])
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+@functools.cache
+def _request_parser() -> argparse.ArgumentParser:
+    return build_parser()
+
+
+def _run_command(argv: list[str]) -> dict:
+    """Run a command in serve mode and capture its output_json() result."""
+    # Anything a command or argparse prints must not reach the response stream
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            args = _request_parser().parse_args(argv)
+        except SystemExit:
+            return {"success": False, "error": f"Invalid arguments: {argv}"}
+
+        handler = COMMANDS.get(args.command)
+        if handler is None:
+            return {"success": False, "error": f"Unknown command: {args.command}"}
+
+        try:
+            handler(args)
+        except _Response as response:
+            return response.result
+        except Exception as e:
+            return {"success": False, "error": f"{args.command} failed: {e}"}
+    return {"success": False, "error": f"{args.command} returned no result"}
+
+
+def _respond(line: str) -> str:
+    """Handle a request line and return the response line."""
+    state = _serve_state
+    with state.lock:
+        response = handle_request(line)
+        state.last_request = time.monotonic()
+    return json.dumps(response, default=str) + "\n"
+
+
+def _close_when_idle(state: _ServeState, stop: threading.Event) -> None:
+    """Close the warm state after idle_timeout seconds without requests."""
+    while not stop.wait(min(state.idle_timeout, 5.0)):
+        with state.lock:
+            idle = time.monotonic() - state.last_request
+            if state.is_warm and idle >= state.idle_timeout:
+                state.close_all()
+
+
+class _SocketRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if line:
+                self.wfile.write(_respond(line).encode("utf-8"))
+                self.wfile.flush()
+
+
+def cmd_serve(args):
+    """Serve requests until stdin closes (or the socket server is stopped)."""
+    global _serve_state
+
+    if args.socket and not hasattr(socketserver, "UnixStreamServer"):
+        output_error("Unix sockets are not supported on this platform")
+        return
+
+    state = _ServeState(idle_timeout=args.idle_timeout)
+    _serve_state = state
+    stop = threading.Event()
+    threading.Thread(
+        target=_close_when_idle, args=(state, stop), name="idle-close", daemon=True
+    ).start()
+
+    try:
+        if args.socket:
+            socket_path = Path(args.socket)
+            socket_path.unlink(missing_ok=True)
+            server = socketserver.ThreadingUnixStreamServer(
+                str(socket_path), _SocketRequestHandler
+            )
+            server.daemon_threads = True
+            # Stop cleanly (removing the socket) when the app terminates us
+            signal.signal(
+                signal.SIGTERM,
+                lambda *_: threading.Thread(target=server.shutdown).start(),
+            )
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+                socket_path.unlink(missing_ok=True)
+        else:
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    sys.stdout.write(_respond(line))
+                    sys.stdout.flush()
+    finally:
+        stop.set()
+        with state.lock:
+            state.close_all()
+        state.loop.close()
+        _serve_state = None
+
+
+COMMANDS = {
+    "get-status": cmd_get_status,
+    "get-memories": cmd_get_memories,
+    "search": cmd_search,
+    "semantic-search": cmd_semantic_search,
+    "get-entities": cmd_get_entities,
+    "add-episode": cmd_add_episode,
+}
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -741,17 +1214,12 @@ def main():
         output_error("No command specified")
         return
 
-    # Route to command handler
-    commands = {
-        "get-status": cmd_get_status,
-        "get-memories": cmd_get_memories,
-        "search": cmd_search,
-        "semantic-search": cmd_semantic_search,
-        "get-entities": cmd_get_entities,
-        "add-episode": cmd_add_episode,
-    }
+    if args.command == "serve":
+        cmd_serve(args)
+        return
 
-    handler = commands.get(args.command)
+    # Route to command handler
+    handler = COMMANDS.get(args.command)
     if handler:
         handler(args)
     else:
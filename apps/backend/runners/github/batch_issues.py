@@ -26,12 +26,14 @@ try:
     from ..phase_config import resolve_model_id
     from .batch_validator import BatchValidator
     from .duplicates import SIMILAR_THRESHOLD
-    from .file_lock import locked_json_write
+    from .file_lock import atomic_write
+    from .state_store import get_state_store
 except (ImportError, ValueError, SystemError):
     from batch_validator import BatchValidator
     from duplicates import SIMILAR_THRESHOLD
-    from file_lock import locked_json_write
+    from file_lock import atomic_write
     from phase_config import resolve_model_id
+    from state_store import get_state_store
 
 
 class ClaudeBatchAnalyzer:
@@ -351,26 +353,25 @@ class IssueBatch:
         )
 
     async def save(self, github_dir: Path) -> None:
-        """Save batch to disk atomically with file locking."""
+        """Save batch to the state store and export it for the UI."""
         batches_dir = github_dir / "batches"
         batches_dir.mkdir(parents=True, exist_ok=True)
 
         # Update timestamp BEFORE serializing to dict
         self.updated_at = datetime.now(timezone.utc).isoformat()
+        data = self.to_dict()
 
-        batch_file = batches_dir / f"batch_{self.batch_id}.json"
-        await locked_json_write(batch_file, self.to_dict(), timeout=5.0)
+        get_state_store(github_dir).save_batch(data)
+
+        # The desktop app lists batches from these files
+        with atomic_write(batches_dir / f"batch_{self.batch_id}.json") as f:
+            json.dump(data, f, indent=2)
 
     @classmethod
     def load(cls, github_dir: Path, batch_id: str) -> IssueBatch | None:
-        """Load batch from disk."""
-        batch_file = github_dir / "batches" / f"batch_{batch_id}.json"
-        if not batch_file.exists():
-            return None
-
-        with open(batch_file) as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        """Load batch from the state store."""
+        data = get_state_store(github_dir).get_batch(batch_id)
+        return cls.from_dict(data) if data else None
 
     def get_issue_numbers(self) -> list[int]:
         """Get all issue numbers in the batch."""
@@ -441,34 +442,17 @@ class IssueBatcher:
         )
 
         # Cache for batches
+        self.store = get_state_store(github_dir)
         self._batch_index: dict[int, str] = {}  # issue_number -> batch_id
         self._load_batch_index()
 
     def _load_batch_index(self) -> None:
-        """Load batch index from disk."""
-        index_file = self.github_dir / "batches" / "index.json"
-        if index_file.exists():
-            with open(index_file) as f:
-                data = json.load(f)
-            self._batch_index = {
-                int(k): v for k, v in data.get("issue_to_batch", {}).items()
-            }
+        """Load batch index from the state store."""
+        self._batch_index = self.store.load_batch_index()
 
     def _save_batch_index(self) -> None:
-        """Save batch index to disk."""
-        batches_dir = self.github_dir / "batches"
-        batches_dir.mkdir(parents=True, exist_ok=True)
-
-        index_file = batches_dir / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(
-                {
-                    "issue_to_batch": self._batch_index,
-                    "updated_at": datetime.now(timezone.utc).isoformat(),
-                },
-                f,
-                indent=2,
-            )
+        """Save batch index to the state store."""
+        self.store.save_batch_index(self._batch_index)
 
     def _generate_batch_id(self, primary_issue: int) -> str:
         """Generate unique batch ID."""
@@ -937,7 +921,7 @@ class IssueBatcher:
                 self._batch_index[item.issue_number] = batch.batch_id
 
             # Save batch
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
             final_batches.append(batch)
 
             logger.info(
@@ -1100,41 +1084,35 @@ class IssueBatcher:
 
     def get_all_batches(self) -> list[IssueBatch]:
         """Get all batches."""
-        batches_dir = self.github_dir / "batches"
-        if not batches_dir.exists():
-            return []
+        return self._list_batches()
 
+    def _list_batches(
+        self, statuses: tuple[BatchStatus, ...] | None = None
+    ) -> list[IssueBatch]:
+        """Batches from the state store, newest first."""
         batches = []
-        for batch_file in batches_dir.glob("batch_*.json"):
+        for data in self.store.list_batches(
+            [s.value for s in statuses] if statuses else None
+        ):
             try:
-                with open(batch_file) as f:
-                    data = json.load(f)
                 batches.append(IssueBatch.from_dict(data))
             except Exception as e:
-                logger.error(f"Error loading batch {batch_file}: {e}")
-
-        return sorted(batches, key=lambda b: b.created_at, reverse=True)
+                logger.error(f"Error loading batch {data.get('batch_id')}: {e}")
+        return batches
 
     def get_pending_batches(self) -> list[IssueBatch]:
         """Get batches that need processing."""
-        return [
-            b
-            for b in self.get_all_batches()
-            if b.status in (BatchStatus.PENDING, BatchStatus.ANALYZING)
-        ]
+        return self._list_batches((BatchStatus.PENDING, BatchStatus.ANALYZING))
 
     def get_active_batches(self) -> list[IssueBatch]:
         """Get batches currently being processed."""
-        return [
-            b
-            for b in self.get_all_batches()
-            if b.status
-            in (
+        return self._list_batches(
+            (
                 BatchStatus.CREATING_SPEC,
                 BatchStatus.BUILDING,
                 BatchStatus.QA_REVIEW,
             )
-        ]
+        )
 
     def is_issue_in_batch(self, issue_number: int) -> bool:
         """Check if an issue is already in a batch."""
@@ -1149,9 +1127,9 @@ class IssueBatcher:
         # Remove from index
         for issue_num in batch.get_issue_numbers():
             self._batch_index.pop(issue_num, None)
-        self._save_batch_index()
+        self.store.delete_batch(batch_id)
 
-        # Delete batch file
+        # Delete the UI's copy
         batch_file = self.github_dir / "batches" / f"batch_{batch_id}.json"
         if batch_file.exists():
             batch_file.unlink()
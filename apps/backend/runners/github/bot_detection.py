@@ -37,9 +37,9 @@ from pathlib import Path
 from core.gh_executable import get_gh_executable
 
 try:
-    from .file_lock import FileLock, atomic_write
+    from .state_store import get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import FileLock, atomic_write
+    from state_store import get_state_store
 
 
 @dataclass
@@ -68,25 +68,13 @@ class BotDetectionState:
         )
 
     def save(self, state_dir: Path) -> None:
-        """Save state to disk with file locking for concurrent safety."""
-        state_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_dir / "bot_detection_state.json"
-
-        # Use file locking to prevent concurrent write corruption
-        with FileLock(state_file, timeout=5.0, exclusive=True):
-            with atomic_write(state_file) as f:
-                json.dump(self.to_dict(), f, indent=2)
+        """Save state to the GitHub state store in one transaction."""
+        get_state_store(state_dir).save_bot_state(self.to_dict())
 
     @classmethod
     def load(cls, state_dir: Path) -> BotDetectionState:
-        """Load state from disk."""
-        state_file = state_dir / "bot_detection_state.json"
-
-        if not state_file.exists():
-            return cls()
-
-        with open(state_file) as f:
-            return cls.from_dict(json.load(f))
+        """Load state from the GitHub state store."""
+        return cls.from_dict(get_state_store(state_dir).load_bot_state())
 
 
 class BotDetector:
@@ -0,0 +1,199 @@
+"""
+Commit Fetcher
+==============
+
+Deduplicates ``git fetch origin <sha>`` across PR reviews in one process.
+
+Every review fetches its head and base commits, once while gathering context
+and again when creating the review worktree. When several PRs are reviewed
+together they usually share a base commit, so most of those fetches are
+redundant. The fetcher skips commits that already exist locally, remembers
+what it has fetched, and makes concurrent callers asking for the same commit
+wait for a single fetch instead of starting their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    from core.git_executable import get_isolated_git_env
+except ImportError:  # pragma: no cover - standalone usage
+    import os
+
+    def get_isolated_git_env(base_env: dict | None = None) -> dict:
+        return dict(base_env) if base_env is not None else os.environ.copy()
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchStats:
+    """Counters for fetch deduplication."""
+
+    requested: int = 0
+    already_local: int = 0
+    deduplicated: int = 0
+    fetched: int = 0
+    fetch_failures: int = 0
+    fetch_calls: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "requested": self.requested,
+            "already_local": self.already_local,
+            "deduplicated": self.deduplicated,
+            "fetched": self.fetched,
+            "fetch_failures": self.fetch_failures,
+            "fetch_calls": self.fetch_calls,
+        }
+
+
+class CommitFetcher:
+    """
+    Thread-safe, deduplicating fetcher for commits of one repository.
+
+    Usage:
+        fetcher = get_commit_fetcher(project_dir)
+        ok = fetcher.ensure_commits([head_sha, base_sha])
+        ok = await fetcher.ensure_commits_async([head_sha, base_sha])
+    """
+
+    def __init__(self, project_dir: Path, remote: str = "origin"):
+        self.project_dir = Path(project_dir)
+        self.remote = remote
+        self.stats = FetchStats()
+        self._available: set[str] = set()
+        self._lock = threading.Lock()
+        self._sha_locks: dict[str, threading.Lock] = {}
+
+    def _sha_lock(self, sha: str) -> threading.Lock:
+        with self._lock:
+            return self._sha_locks.setdefault(sha, threading.Lock())
+
+    def has_commit(self, sha: str) -> bool:
+        """Whether the commit object exists in the local repository."""
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "-e", f"{sha}^{{commit}}"],
+                cwd=self.project_dir,
+                capture_output=True,
+                timeout=10,
+                env=get_isolated_git_env(),
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+
+    def ensure_commits(self, shas: list[str], timeout: float = 60) -> bool:
+        """
+        Make sure the given commits are available locally.
+
+        Args:
+            shas: Commit SHAs to make available
+            timeout: Timeout for the fetch in seconds
+
+        Returns:
+            True if all commits are available afterwards
+        """
+        wanted = list(dict.fromkeys(s for s in shas if s))
+        with self._lock:
+            self.stats.requested += len(wanted)
+            missing = [s for s in wanted if s not in self._available]
+            self.stats.deduplicated += len(wanted) - len(missing)
+        if not missing:
+            return True
+
+        # Lock in a stable order so overlapping requests can't deadlock
+        locks = [self._sha_lock(sha) for sha in sorted(missing)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            to_fetch = []
+            for sha in missing:
+                with self._lock:
+                    if sha in self._available:
+                        # Another caller fetched it while we waited
+                        self.stats.deduplicated += 1
+                        continue
+                if self.has_commit(sha):
+                    with self._lock:
+                        self._available.add(sha)
+                        self.stats.already_local += 1
+                else:
+                    to_fetch.append(sha)
+
+            if not to_fetch:
+                return True
+            return self._fetch(to_fetch, timeout)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _fetch(self, shas: list[str], timeout: float) -> bool:
+        with self._lock:
+            self.stats.fetch_calls += 1
+        try:
+            result = subprocess.run(
+                ["git", "fetch", self.remote, *shas],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"[CommitFetcher] Timeout fetching {len(shas)} commit(s)")
+            with self._lock:
+                self.stats.fetch_failures += 1
+            return False
+        except OSError as e:
+            logger.warning(f"[CommitFetcher] Could not run git fetch: {e}")
+            with self._lock:
+                self.stats.fetch_failures += 1
+            return False
+
+        if result.returncode != 0:
+            logger.warning(
+                f"[CommitFetcher] Could not fetch {', '.join(s[:8] for s in shas)} "
+                f"from {self.remote}: {result.stderr.strip()}"
+            )
+            with self._lock:
+                self.stats.fetch_failures += 1
+            return False
+
+        with self._lock:
+            self._available.update(shas)
+            self.stats.fetched += len(shas)
+        return True
+
+    async def ensure_commits_async(self, shas: list[str], timeout: float = 60) -> bool:
+        """Async wrapper around ensure_commits (runs git in a worker thread)."""
+        return await asyncio.to_thread(self.ensure_commits, shas, timeout)
+
+
+_FETCHERS: dict[str, CommitFetcher] = {}
+_FETCHERS_LOCK = threading.Lock()
+
+
+def get_commit_fetcher(project_dir: Path) -> CommitFetcher:
+    """Get the process-wide fetcher for a repository."""
+    key = str(Path(project_dir).resolve())
+    with _FETCHERS_LOCK:
+        fetcher = _FETCHERS.get(key)
+        if fetcher is None:
+            fetcher = CommitFetcher(Path(project_dir))
+            _FETCHERS[key] = fetcher
+        return fetcher
+
+
+def reset_commit_fetchers() -> None:
+    """Forget all fetchers (mainly for tests)."""
+    with _FETCHERS_LOCK:
+        _FETCHERS.clear()
@@ -24,13 +24,17 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 try:
+    from .commit_fetcher import get_commit_fetcher
     from .gh_client import GHClient, PRTooLargeError
+    from .import_graph import ImportGraphCache, RepoImportGraph
     from .services.io_utils import safe_print
 except (ImportError, ValueError, SystemError):
     # Import from core.io_utils directly to avoid circular import with services package
     # (services/__init__.py imports pr_review_engine which imports context_gatherer)
+    from commit_fetcher import get_commit_fetcher
     from core.io_utils import safe_print
     from gh_client import GHClient, PRTooLargeError
+    from import_graph import ImportGraphCache, RepoImportGraph
 
 # Validation patterns for git refs and paths (defense-in-depth)
 # These patterns allow common valid characters while rejecting potentially dangerous ones
@@ -51,6 +55,9 @@ CONFIG_FILE_NAMES = [
     "vite.config.ts",
 ]
 
+# Cap on related files handed to the reviewer
+MAX_RELATED_FILES = 20
+
 
 def _validate_git_ref(ref: str) -> bool:
     """
@@ -242,6 +249,7 @@ class PRContextGatherer:
             max_retries=3,
             repo=repo,
         )
+        self._import_graph: RepoImportGraph | None = None
 
     async def gather(self) -> PRContext:
         """
@@ -385,20 +393,14 @@ class PRContextGatherer:
             return False
 
         try:
-            # Fetch the specific commits - this works even for fork PRs
-            proc = await asyncio.create_subprocess_exec(
-                "git",
-                "fetch",
-                "origin",
-                head_sha,
-                base_sha,
-                cwd=self.project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            # Fetch the specific commits - this works even for fork PRs.
+            # Shared with other reviews in this process, so commits that are
+            # already local or already fetched (e.g. a common base) are skipped.
+            fetched = await get_commit_fetcher(self.project_dir).ensure_commits_async(
+                [head_sha, base_sha], timeout=30.0
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30.0)
 
-            if proc.returncode == 0:
+            if fetched:
                 safe_print(
                     f"[Context] Fetched PR refs: base={base_sha[:8]} → head={head_sha[:8]}",
                     flush=True,
@@ -416,7 +418,7 @@ class PRContextGatherer:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
-                await asyncio.wait_for(proc2.communicate(), timeout=30.0)
+                _, stderr = await asyncio.wait_for(proc2.communicate(), timeout=30.0)
                 if proc2.returncode == 0:
                     safe_print(
                         f"[Context] Fetched PR ref: refs/pr/{self.pr_number}",
@@ -819,6 +821,13 @@ class PRContextGatherer:
 
         return "\n".join(structure_info)
 
+    def _get_import_graph(self) -> RepoImportGraph:
+        """Import graph of the local checkout, cached per commit in the state dir."""
+        if self._import_graph is None:
+            cache = ImportGraphCache(self.project_dir / ".auto-claude" / "github")
+            self._import_graph = cache.get(self.project_dir)
+        return self._import_graph
+
     def _find_related_files(self, changed_files: list[ChangedFile]) -> list[str]:
         """
         Find files related to the changes.
@@ -828,81 +837,23 @@ class PRContextGatherer:
         - Imported modules and dependencies
         - Configuration files in the same directory
         - Related type definition files
+        - Files that import the changed files (reverse dependents)
         """
-        related = set()
-
-        for changed_file in changed_files:
-            path = Path(changed_file.path)
-
-            # Find test files
-            related.update(self._find_test_files(path))
-
-            # Find imported files (for supported languages)
-            if path.suffix in [".ts", ".tsx", ".js", ".jsx", ".py"]:
-                related.update(self._find_imports(changed_file.content, path))
-
-            # Find config files in same directory
-            related.update(self._find_config_files(path.parent))
-
-            # Find type definition files
-            if path.suffix in [".ts", ".tsx"]:
-                related.update(self._find_type_definitions(path))
-
-        # Remove files that are already in changed_files
-        changed_paths = {cf.path for cf in changed_files}
-        related = {r for r in related if r not in changed_paths}
-
-        # Limit to 20 most relevant files
-        return sorted(related)[:20]
+        return _collect_related_files(changed_files, self._get_import_graph())
 
     def _find_test_files(self, source_path: Path) -> set[str]:
         """Find test files related to a source file."""
-        test_patterns = [
-            # Jest/Vitest patterns
-            source_path.parent / f"{source_path.stem}.test{source_path.suffix}",
-            source_path.parent / f"{source_path.stem}.spec{source_path.suffix}",
-            source_path.parent / "__tests__" / f"{source_path.name}",
-            # Python patterns
-            source_path.parent / f"test_{source_path.stem}.py",
-            source_path.parent / f"{source_path.stem}_test.py",
-            # Go patterns
-            source_path.parent / f"{source_path.stem}_test.go",
-        ]
-
-        found = set()
-        for test_path in test_patterns:
-            full_path = self.project_dir / test_path
-            if full_path.exists() and full_path.is_file():
-                found.add(str(test_path))
-
-        return found
+        return _find_test_files(source_path, self._get_import_graph())
 
     def _find_imports(self, content: str, source_path: Path) -> set[str]:
         """
         Find imported files from source code.
 
         Supports:
-        - JavaScript/TypeScript: import statements
-        - Python: import statements
+        - JavaScript/TypeScript: relative imports and tsconfig path aliases
+        - Python: absolute and relative package imports
         """
-        imports = set()
-
-        if source_path.suffix in [".ts", ".tsx", ".js", ".jsx"]:
-            # Match: import ... from './file' or from '../file'
-            # Only relative imports (starting with . or ..)
-            pattern = r"from\s+['\"](\.[^'\"]+)['\"]"
-            for match in re.finditer(pattern, content):
-                import_path = match.group(1)
-                resolved = self._resolve_import_path(import_path, source_path)
-                if resolved:
-                    imports.add(resolved)
-
-        elif source_path.suffix == ".py":
-            # Python relative imports are complex, skip for now
-            # Could add support for "from . import" later
-            pass
-
-        return imports
+        return self._get_import_graph().resolve_imports(source_path.as_posix(), content)
 
     def _resolve_import_path(self, import_path: str, source_path: Path) -> str | None:
         """
@@ -915,71 +866,22 @@ class PRContextGatherer:
         Returns:
             Absolute path relative to project root, or None if not found
         """
-        # Start from the directory containing the source file
-        base_dir = source_path.parent
-
-        # Resolve relative path - MUST prepend project_dir to resolve correctly
-        # when CWD is different from project root (e.g., running from apps/backend/)
-        resolved = (self.project_dir / base_dir / import_path).resolve()
-
-        # Try common extensions if no extension provided
-        if not resolved.suffix:
-            for ext in [".ts", ".tsx", ".js", ".jsx"]:
-                candidate = resolved.with_suffix(ext)
-                if candidate.exists() and candidate.is_file():
-                    try:
-                        rel_path = candidate.relative_to(self.project_dir)
-                        return str(rel_path)
-                    except ValueError:
-                        # File is outside project directory
-                        return None
-
-            # Also check for index files
-            for ext in [".ts", ".tsx", ".js", ".jsx"]:
-                index_file = resolved / f"index{ext}"
-                if index_file.exists() and index_file.is_file():
-                    try:
-                        rel_path = index_file.relative_to(self.project_dir)
-                        return str(rel_path)
-                    except ValueError:
-                        return None
-
-        # File with extension
-        if resolved.exists() and resolved.is_file():
-            try:
-                rel_path = resolved.relative_to(self.project_dir)
-                return str(rel_path)
-            except ValueError:
-                return None
-
-        return None
+        return self._get_import_graph().resolve_js(import_path, source_path.as_posix())
 
     def _find_config_files(self, directory: Path) -> set[str]:
         """Find configuration files in a directory."""
-        found = set()
-        for name in CONFIG_FILE_NAMES:
-            config_path = directory / name
-            full_path = self.project_dir / config_path
-            if full_path.exists() and full_path.is_file():
-                found.add(str(config_path))
-
-        return found
+        return _find_config_files(directory, self._get_import_graph())
 
     def _find_type_definitions(self, source_path: Path) -> set[str]:
         """Find TypeScript type definition files."""
-        # Look for .d.ts files with same name
-        type_def = source_path.parent / f"{source_path.stem}.d.ts"
-        full_path = self.project_dir / type_def
-
-        if full_path.exists() and full_path.is_file():
-            return {str(type_def)}
-
-        return set()
+        return _find_type_definitions(source_path, self._get_import_graph())
 
     @staticmethod
     def find_related_files_for_root(
         changed_files: list[ChangedFile],
         project_root: Path,
+        state_dir: Path | None = None,
+        head_sha: str | None = None,
     ) -> list[str]:
         """
         Find files related to the changes using a specific project root.
@@ -990,53 +892,106 @@ class PRContextGatherer:
         Args:
             changed_files: List of changed files from the PR
             project_root: Path to search for related files (e.g., worktree path)
+            state_dir: GitHub state directory for the per-commit import graph
+                cache (e.g., .auto-claude/github). Not cached when None.
+            head_sha: Commit checked out at project_root, used as cache key
 
         Returns:
             List of related file paths (relative to project root)
         """
-        related: set[str] = set()
-
-        for changed_file in changed_files:
-            path = Path(changed_file.path)
-
-            # Find test files
-            test_patterns = [
-                # Jest/Vitest patterns
-                path.parent / f"{path.stem}.test{path.suffix}",
-                path.parent / f"{path.stem}.spec{path.suffix}",
-                path.parent / "__tests__" / f"{path.name}",
-                # Python patterns
-                path.parent / f"test_{path.stem}.py",
-                path.parent / f"{path.stem}_test.py",
-                # Go patterns
-                path.parent / f"{path.stem}_test.go",
-            ]
+        if state_dir is not None:
+            graph = ImportGraphCache(state_dir).get(project_root, head_sha)
+        else:
+            graph = RepoImportGraph.build(project_root)
+        return _collect_related_files(changed_files, graph)
+
+    @staticmethod
+    def find_related_files_at_commit(
+        changed_files: list[ChangedFile],
+        repo_dir: Path,
+        head_sha: str,
+        state_dir: Path,
+    ) -> list[str]:
+        """
+        Find files related to the changes as of a commit, without checking it out.
+
+        Used to decide what a sparse PR worktree should contain before it
+        is created.
+
+        Args:
+            changed_files: List of changed files from the PR
+            repo_dir: Repository containing the commit
+            head_sha: Commit to read the import graph from
+            state_dir: GitHub state directory for the import graph cache
+
+        Returns:
+            List of related file paths (relative to the repository root)
+        """
+        graph = ImportGraphCache(state_dir).get_for_commit(repo_dir, head_sha)
+        return _collect_related_files(changed_files, graph)
+
+
+def _find_test_files(source_path: Path, graph: RepoImportGraph) -> set[str]:
+    """Find test files for a source file among the graph's files."""
+    test_patterns = [
+        # Jest/Vitest patterns
+        source_path.parent / f"{source_path.stem}.test{source_path.suffix}",
+        source_path.parent / f"{source_path.stem}.spec{source_path.suffix}",
+        source_path.parent / "__tests__" / f"{source_path.name}",
+        # Python patterns
+        source_path.parent / f"test_{source_path.stem}.py",
+        source_path.parent / f"{source_path.stem}_test.py",
+        # Go patterns
+        source_path.parent / f"{source_path.stem}_test.go",
+    ]
+    return {str(p) for p in test_patterns if p.as_posix() in graph.files}
+
+
+def _find_config_files(directory: Path, graph: RepoImportGraph) -> set[str]:
+    """Find configuration files in a directory among the graph's files."""
+    return {
+        str(directory / name)
+        for name in CONFIG_FILE_NAMES
+        if (directory / name).as_posix() in graph.files
+    }
+
+
+def _find_type_definitions(source_path: Path, graph: RepoImportGraph) -> set[str]:
+    """Find a .d.ts file with the same name as a TypeScript source file."""
+    type_def = source_path.parent / f"{source_path.stem}.d.ts"
+    return {str(type_def)} if type_def.as_posix() in graph.files else set()
+
+
+def _collect_related_files(
+    changed_files: list[ChangedFile], graph: RepoImportGraph
+) -> list[str]:
+    """
+    Related files for a PR from import graph queries.
+
+    Tests, imports, configs and type definitions of the changed files come
+    first; reverse dependents fill the remaining slots.
+    """
+    related: set[str] = set()
+    for changed_file in changed_files:
+        path = Path(changed_file.path)
+        related.update(_find_test_files(path, graph))
+        related.update(_find_config_files(path.parent, graph))
+        if path.suffix in [".ts", ".tsx"]:
+            related.update(_find_type_definitions(path, graph))
+
+    graph_related = graph.related_files(
+        [cf.path for cf in changed_files],
+        contents={cf.path: cf.content for cf in changed_files if cf.content},
+    )
+    related.update(graph_related["imports"])
+
+    # Remove files that are already in changed_files
+    changed_paths = {cf.path for cf in changed_files}
+    direct = sorted(r for r in related if r not in changed_paths)
+    dependents = sorted(graph_related["dependents"] - related - changed_paths)
 
-            for test_path in test_patterns:
-                full_path = project_root / test_path
-                if full_path.exists() and full_path.is_file():
-                    related.add(str(test_path))
-
-            # Find config files in same directory
-            for name in CONFIG_FILE_NAMES:
-                config_path = path.parent / name
-                full_path = project_root / config_path
-                if full_path.exists() and full_path.is_file():
-                    related.add(str(config_path))
-
-            # Find type definition files
-            if path.suffix in [".ts", ".tsx"]:
-                type_def = path.parent / f"{path.stem}.d.ts"
-                full_path = project_root / type_def
-                if full_path.exists() and full_path.is_file():
-                    related.add(str(type_def))
-
-        # Remove files that are already in changed_files
-        changed_paths = {cf.path for cf in changed_files}
-        related = {r for r in related if r not in changed_paths}
-
-        # Limit to 20 most relevant files
-        return sorted(related)[:20]
+    # Limit to the most relevant files
+    return (direct + dependents)[:MAX_RELATED_FILES]
 
 
 class FollowupContextGatherer:
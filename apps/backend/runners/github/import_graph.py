@@ -0,0 +1,871 @@
+"""
+Repository Import Graph
+=======================
+
+File-level import graph used to find files related to a PR.
+
+Related-file discovery used to probe the filesystem (``exists()`` /
+``is_file()``) for every candidate extension and index file of every import
+in every changed file, on every review. The graph is built once per commit
+from a single file listing: imports are resolved against an in-memory set of
+paths, and a reverse index answers "who depends on this file" queries.
+
+Covers:
+- JavaScript/TypeScript relative imports (``import``/``export ... from``,
+  side-effect imports, ``require()`` and dynamic ``import()``)
+- tsconfig/jsconfig ``compilerOptions.baseUrl`` and ``paths`` aliases
+- Python absolute and relative package imports
+
+Graphs are cached as JSON per commit SHA under the GitHub state directory
+(``.auto-claude/github/import_graph/<sha>.json``), so reviews of the same
+commit (or the follow-up rescan in the PR worktree) reuse the graph.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import posixpath
+import re
+import subprocess
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    from core.git_executable import get_isolated_git_env
+except ImportError:  # pragma: no cover - standalone usage
+
+    def get_isolated_git_env(base_env: dict | None = None) -> dict:
+        return dict(base_env) if base_env is not None else os.environ.copy()
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk format or resolution rules change
+GRAPH_VERSION = 1
+
+# Number of per-commit graphs kept in the cache directory
+MAX_CACHED_GRAPHS = 20
+
+JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+PY_EXTENSIONS = (".py",)
+
+# Directories never worth indexing (used when git ls-files is unavailable)
+SKIP_DIRS = {
+    ".git",
+    ".auto-claude",
+    ".worktrees",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "dist",
+    "build",
+    ".next",
+    "coverage",
+}
+
+# Source files larger than this are not parsed for imports
+MAX_PARSE_BYTES = 1_000_000
+
+# One alternation so each file is scanned once:
+# - import x from './a'; export { x } from './a'; import type { X } from './a'
+# - import './side-effect'
+# - require('./a'), import('./a')
+_JS_IMPORT_PATTERN = re.compile(
+    r"""\b(?:import|export)\b[^'";]*?\bfrom\s*['"](?P<from>[^'"]+)['"]"""
+    r"""|\bimport\s*['"](?P<bare>[^'"]+)['"]"""
+    r"""|\b(?:require|import)\s*\(\s*['"](?P<call>[^'"]+)['"]\s*\)"""
+)
+
+# from .pkg import (a, b) / from pkg import a, b / import a.b, c as d
+_PY_IMPORT_PATTERN = re.compile(
+    r"^[ \t]*(?:from[ \t]+(?P<dots>\.*)(?P<module>[\w.]*)[ \t]+import[ \t]+"
+    r"(?:\((?P<names>[^)]*)\)|(?P<plain>[^\n#;]+))"
+    r"|import[ \t]+(?P<modules>[\w. \t,]+))",
+    re.MULTILINE,
+)
+
+_TSCONFIG_NAMES = ("tsconfig.json", "jsconfig.json")
+
+_FULL_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+def _strip_jsonc(text: str) -> str:
+    """Remove comments and trailing commas so tsconfig files parse as JSON."""
+    text = re.sub(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', r"\1", text, flags=re.S)
+    return re.sub(r",\s*([}\]])", r"\1", text)
+
+
+def extract_js_imports(content: str) -> list[str]:
+    """
+    Extract module specifiers from JavaScript/TypeScript source.
+
+    Args:
+        content: Source text
+
+    Returns:
+        Specifiers in order of first appearance (e.g., ['react', './utils'])
+    """
+    seen: set[str] = set()
+    specifiers = []
+    for match in _JS_IMPORT_PATTERN.finditer(content):
+        spec = match.group("from") or match.group("bare") or match.group("call")
+        if spec not in seen:
+            seen.add(spec)
+            specifiers.append(spec)
+    return specifiers
+
+
+def extract_python_imports(content: str) -> list[tuple[int, str, list[str]]]:
+    """
+    Extract imports from Python source.
+
+    A line-based scan rather than a full ``ast`` parse: parsing every module
+    in a large repository dominates graph build time, and unresolvable
+    matches (e.g. inside docstrings) are dropped during resolution anyway.
+
+    Args:
+        content: Source text
+
+    Returns:
+        List of (level, module, names) tuples. ``import a.b`` gives
+        ``(0, "a.b", [])``; ``from ..pkg import x`` gives ``(2, "pkg", ["x"])``.
+    """
+    imports = []
+    for match in _PY_IMPORT_PATTERN.finditer(content):
+        if match.group("dots") is not None:
+            names_text = match.group("names") or match.group("plain") or ""
+            names_text = re.sub(r"#[^\n]*", "", names_text)
+            names = []
+            for part in names_text.split(","):
+                name = part.strip().split(" as ", 1)[0].strip()
+                if name.isidentifier():
+                    names.append(name)
+            imports.append((len(match.group("dots")), match.group("module"), names))
+        else:
+            for part in match.group("modules").split(","):
+                module = part.strip().split(" as ", 1)[0].strip()
+                if module and all(p.isidentifier() for p in module.split(".")):
+                    imports.append((0, module, []))
+    return imports
+
+
+@dataclass
+class PathAliases:
+    """tsconfig ``baseUrl``/``paths`` settings for one config directory."""
+
+    config_dir: str
+    base_url: str | None = None
+    paths: dict[str, list[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "config_dir": self.config_dir,
+            "base_url": self.base_url,
+            "paths": self.paths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PathAliases:
+        return cls(
+            config_dir=data.get("config_dir", ""),
+            base_url=data.get("base_url"),
+            paths=data.get("paths", {}),
+        )
+
+
+def _load_path_aliases(root: Path, config_path: str) -> PathAliases | None:
+    """Read baseUrl/paths from a tsconfig or jsconfig file."""
+    try:
+        raw = (root / config_path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return _parse_path_aliases(config_path, raw)
+
+
+def _parse_path_aliases(config_path: str, raw: str) -> PathAliases | None:
+    """Parse baseUrl/paths from tsconfig or jsconfig content."""
+    try:
+        data = json.loads(_strip_jsonc(raw))
+    except json.JSONDecodeError:
+        return None
+    options = data.get("compilerOptions") if isinstance(data, dict) else None
+    if not isinstance(options, dict):
+        return None
+
+    config_dir = posixpath.dirname(config_path)
+    base_url = options.get("baseUrl")
+    paths = options.get("paths")
+    if not isinstance(base_url, str) and not isinstance(paths, dict):
+        return None
+
+    base_dir = None
+    if isinstance(base_url, str):
+        base_dir = posixpath.normpath(posixpath.join(config_dir, base_url))
+    aliases = {}
+    if isinstance(paths, dict):
+        for pattern, targets in paths.items():
+            if isinstance(targets, list):
+                aliases[pattern] = [t for t in targets if isinstance(t, str)]
+    return PathAliases(config_dir=config_dir, base_url=base_dir, paths=aliases)
+
+
+def _normalize(path: str) -> str | None:
+    """Normalize a repo-relative posix path, rejecting paths outside the repo."""
+    normalized = posixpath.normpath(path)
+    if normalized.startswith("../") or normalized == ".." or normalized.startswith("/"):
+        return None
+    return "" if normalized == "." else normalized
+
+
+class RepoImportGraph:
+    """
+    File-level import graph of a repository snapshot.
+
+    Usage:
+        graph = RepoImportGraph.build(project_dir)
+        graph.imports_of("src/app.ts")      # files app.ts imports
+        graph.dependents_of("src/utils.ts") # files importing utils.ts
+        graph.related_files(["src/utils.ts"])
+    """
+
+    def __init__(
+        self,
+        files: set[str],
+        imports: dict[str, list[str]] | None = None,
+        aliases: list[PathAliases] | None = None,
+        sha: str | None = None,
+    ):
+        self.files = files
+        self.imports: dict[str, list[str]] = imports or {}
+        self.aliases = aliases or []
+        self.sha = sha
+        self.build_ms = 0.0
+        self._dirs = {posixpath.dirname(f) for f in files}
+        self._python_roots = self._find_python_roots()
+        self._dependents: dict[str, set[str]] | None = None
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, root: Path, sha: str | None = None) -> RepoImportGraph:
+        """
+        Build the graph from the files currently on disk under ``root``.
+
+        Args:
+            root: Repository (or worktree) root
+            sha: Commit the working tree corresponds to, recorded for caching
+
+        Returns:
+            The populated graph
+        """
+        start = time.perf_counter()
+        root = Path(root)
+        files = list_repo_files(root)
+
+        aliases = []
+        for path in sorted(files):
+            if posixpath.basename(path) in _TSCONFIG_NAMES:
+                loaded = _load_path_aliases(root, path)
+                if loaded:
+                    aliases.append(loaded)
+
+        graph = cls(set(files), aliases=aliases, sha=sha)
+        for path in files:
+            if not path.endswith(JS_EXTENSIONS + PY_EXTENSIONS):
+                continue
+            full_path = root / path
+            try:
+                if full_path.stat().st_size > MAX_PARSE_BYTES:
+                    continue
+                content = full_path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            graph._add_source(path, content)
+
+        graph.build_ms = (time.perf_counter() - start) * 1000
+        return graph
+
+    @classmethod
+    def build_from_commit(cls, root: Path, sha: str) -> RepoImportGraph:
+        """
+        Build the graph from a commit's tree instead of the working tree.
+
+        Used for sparse checkouts, where most files are not on disk, and to
+        find related files before a PR worktree is materialized.
+
+        Args:
+            root: Any checkout of the repository
+            sha: Commit to read
+
+        Returns:
+            The populated graph
+        """
+        start = time.perf_counter()
+        root = Path(root)
+        sizes = list_commit_files(root, sha)
+
+        configs = sorted(p for p in sizes if posixpath.basename(p) in _TSCONFIG_NAMES)
+        sources = [
+            p
+            for p, size in sizes.items()
+            if p.endswith(JS_EXTENSIONS + PY_EXTENSIONS) and size <= MAX_PARSE_BYTES
+        ]
+        blobs = read_commit_blobs(root, sha, configs + sources)
+
+        aliases = []
+        for path in configs:
+            loaded = _parse_path_aliases(path, blobs.get(path, ""))
+            if loaded:
+                aliases.append(loaded)
+
+        graph = cls(set(sizes), aliases=aliases, sha=sha)
+        for path in sources:
+            if path in blobs:
+                graph._add_source(path, blobs[path])
+
+        graph.build_ms = (time.perf_counter() - start) * 1000
+        return graph
+
+    def _add_source(self, path: str, content: str) -> None:
+        resolved = self.resolve_imports(path, content)
+        if resolved:
+            self.imports[path] = sorted(resolved)
+
+    def resolve_imports(self, source: str, content: str) -> set[str]:
+        """
+        Resolve the in-repo files imported by a source file.
+
+        Uses the given content rather than the indexed version, so callers can
+        resolve imports of a changed file against the graph's file set.
+
+        Args:
+            source: Repo-relative path of the importing file
+            content: Source text of the importing file
+
+        Returns:
+            Repo-relative paths of imported files that exist in the graph
+        """
+        resolved: set[str] = set()
+        if source.endswith(JS_EXTENSIONS):
+            for spec in extract_js_imports(content):
+                target = self.resolve_js(spec, source)
+                if target and target != source:
+                    resolved.add(target)
+        elif source.endswith(PY_EXTENSIONS):
+            for level, module, names in extract_python_imports(content):
+                resolved.update(self.resolve_python(level, module, names, source))
+            resolved.discard(source)
+        return resolved
+
+    # ------------------------------------------------------------------
+    # JavaScript / TypeScript resolution
+    # ------------------------------------------------------------------
+
+    def _resolve_js_candidate(self, base: str) -> str | None:
+        """Resolve a path without extension the way bundlers do."""
+        if base in self.files:
+            return base
+        for ext in JS_EXTENSIONS:
+            if base + ext in self.files:
+                return base + ext
+        # ESM-style TypeScript imports reference the emitted .js file
+        stem, ext = posixpath.splitext(base)
+        if ext in (".js", ".jsx", ".mjs", ".cjs"):
+            for ts_ext in (".ts", ".tsx", ".mts", ".cts"):
+                if stem + ts_ext in self.files:
+                    return stem + ts_ext
+        if base in self._dirs or not base:
+            for ext in JS_EXTENSIONS:
+                index = posixpath.join(base, f"index{ext}")
+                if index in self.files:
+                    return index
+        return None
+
+    def _aliases_for(self, source: str) -> list[PathAliases]:
+        """Configs applying to a file, nearest directory first."""
+        applicable = [
+            alias
+            for alias in self.aliases
+            if not alias.config_dir or source.startswith(alias.config_dir + "/")
+        ]
+        return sorted(applicable, key=lambda a: len(a.config_dir), reverse=True)
+
+    def resolve_js(self, spec: str, source: str) -> str | None:
+        """
+        Resolve a JS/TS module specifier to a repo file.
+
+        Args:
+            spec: Specifier, e.g. './utils', '@/lib/api' or 'src/config'
+            source: Repo-relative path of the importing file
+
+        Returns:
+            Repo-relative path, or None for packages and unresolved imports
+        """
+        if spec.startswith("."):
+            base = _normalize(posixpath.join(posixpath.dirname(source), spec))
+            return None if base is None else self._resolve_js_candidate(base)
+
+        for alias in self._aliases_for(source):
+            alias_base = (
+                alias.base_url if alias.base_url is not None else alias.config_dir
+            )
+            for pattern, targets in alias.paths.items():
+                if "*" in pattern:
+                    prefix, _, suffix = pattern.partition("*")
+                    if not (spec.startswith(prefix) and spec.endswith(suffix)):
+                        continue
+                    if len(spec) < len(prefix) + len(suffix):
+                        continue
+                    wildcard = spec[len(prefix) : len(spec) - len(suffix)]
+                elif spec == pattern:
+                    wildcard = ""
+                else:
+                    continue
+                for target in targets:
+                    base = _normalize(
+                        posixpath.join(alias_base, target.replace("*", wildcard))
+                    )
+                    if base is not None:
+                        found = self._resolve_js_candidate(base)
+                        if found:
+                            return found
+            if alias.base_url is not None:
+                base = _normalize(posixpath.join(alias.base_url, spec))
+                if base is not None:
+                    found = self._resolve_js_candidate(base)
+                    if found:
+                        return found
+        return None
+
+    # ------------------------------------------------------------------
+    # Python resolution
+    # ------------------------------------------------------------------
+
+    def _find_python_roots(self) -> list[str]:
+        """
+        Directories Python absolute imports are resolved from.
+
+        The repo root, ``src`` layouts, directories holding packaging or
+        requirements files, and the parent of every top-level package.
+        """
+        roots = {""}
+        markers = {"pyproject.toml", "setup.py", "setup.cfg", "requirements.txt"}
+        for path in self.files:
+            name = posixpath.basename(path)
+            directory = posixpath.dirname(path)
+            if name in markers:
+                roots.add(directory)
+                src = posixpath.join(directory, "src") if directory else "src"
+                if src in self._dirs:
+                    roots.add(src)
+            elif name == "__init__.py":
+                # Parent of a top-level package (one without a parent package)
+                package_parent = posixpath.dirname(directory)
+                if posixpath.join(package_parent, "__init__.py") not in self.files:
+                    roots.add(package_parent)
+        # Deepest roots first so monorepo packages win over the repo root
+        return sorted(roots, key=lambda r: (not r, -r.count("/"), r))
+
+    def _module_file(self, base: str) -> str | None:
+        """Map a module path (without extension) to its file."""
+        if base + ".py" in self.files:
+            return base + ".py"
+        init = posixpath.join(base, "__init__.py") if base else "__init__.py"
+        if init in self.files:
+            return init
+        return None
+
+    def _resolve_module(
+        self, base_dirs: list[str], module: str, names: list[str]
+    ) -> set[str]:
+        parts = module.split(".") if module else []
+        for base_dir in base_dirs:
+            module_base = posixpath.join(base_dir, *parts) if parts else base_dir
+            module_file = self._module_file(module_base) if module_base else None
+            submodules = set()
+            for name in names:
+                found = self._module_file(posixpath.join(module_base, name))
+                if found:
+                    submodules.add(found)
+            if module_file or submodules:
+                return submodules | ({module_file} if module_file else set())
+        return set()
+
+    def resolve_python(
+        self, level: int, module: str, names: list[str], source: str
+    ) -> set[str]:
+        """
+        Resolve a Python import to repo files.
+
+        Args:
+            level: Number of leading dots (0 for absolute imports)
+            module: Dotted module name after the dots (may be empty)
+            names: Imported names (``from x import a, b``), which may be submodules
+            source: Repo-relative path of the importing file
+
+        Returns:
+            Repo-relative paths of the imported module and any imported submodules
+        """
+        if level:
+            package = posixpath.dirname(source)
+            for _ in range(level - 1):
+                if not package:
+                    return set()
+                package = posixpath.dirname(package)
+            return self._resolve_module([package], module, names)
+
+        if not module:
+            return set()
+        # Prefer the root the importing file lives under
+        roots = [r for r in self._python_roots if not r or source.startswith(r + "/")]
+        roots += [r for r in self._python_roots if r not in roots]
+        return self._resolve_module(roots, module, names)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def dependents(self) -> dict[str, set[str]]:
+        """Reverse index: file -> files importing it."""
+        if self._dependents is None:
+            reverse: dict[str, set[str]] = {}
+            for source, targets in self.imports.items():
+                for target in targets:
+                    reverse.setdefault(target, set()).add(source)
+            self._dependents = reverse
+        return self._dependents
+
+    def imports_of(self, path: str) -> list[str]:
+        """Files imported by ``path``."""
+        return list(self.imports.get(path, []))
+
+    def dependents_of(self, path: str) -> list[str]:
+        """Files that import ``path``."""
+        return sorted(self.dependents.get(path, set()))
+
+    def related_files(
+        self,
+        paths: list[str],
+        contents: dict[str, str] | None = None,
+        include_dependents: bool = True,
+    ) -> dict[str, set[str]]:
+        """
+        Collect imports and reverse dependents of a set of files.
+
+        Args:
+            paths: Repo-relative paths (e.g., a PR's changed files)
+            contents: Optional current content per path; imports are then
+                resolved from this content instead of the indexed version
+            include_dependents: Whether to include files importing ``paths``
+
+        Returns:
+            Dict with "imports" and "dependents" sets (changed files excluded)
+        """
+        contents = contents or {}
+        changed = set(paths)
+        imports: set[str] = set()
+        dependents: set[str] = set()
+        for path in paths:
+            content = contents.get(path)
+            if content:
+                imports.update(self.resolve_imports(path, content))
+            else:
+                imports.update(self.imports.get(path, []))
+            if include_dependents:
+                dependents.update(self.dependents.get(path, set()))
+        return {"imports": imports - changed, "dependents": dependents - changed}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "version": GRAPH_VERSION,
+            "sha": self.sha,
+            "files": sorted(self.files),
+            "imports": self.imports,
+            "aliases": [alias.to_dict() for alias in self.aliases],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RepoImportGraph:
+        return cls(
+            set(data.get("files", [])),
+            imports=data.get("imports", {}),
+            aliases=[PathAliases.from_dict(a) for a in data.get("aliases", [])],
+            sha=data.get("sha"),
+        )
+
+
+def _run_git(root: Path, args: list[str], timeout: float = 30) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=get_isolated_git_env(),
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def list_repo_files(root: Path) -> list[str]:
+    """
+    List repo-relative file paths with one git call (os.walk as fallback).
+
+    Uses ``git ls-files`` for tracked and untracked-but-not-ignored files so
+    build output and vendored dependencies are skipped.
+    """
+    root = Path(root)
+    output = _run_git(
+        root, ["ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+    )
+    if output is not None:
+        files = {path for path in output.split("\0") if path}
+        # ls-files lists deleted-but-tracked files too
+        return sorted(f for f in files if (root / f).is_file())
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for name in filenames:
+            files.append(name if rel_dir == "." else f"{rel_dir}/{name}")
+    return sorted(files)
+
+
+def list_commit_files(root: Path, sha: str) -> dict[str, int]:
+    """Map each file in a commit's tree to its size, with one git call."""
+    output = _run_git(Path(root), ["ls-tree", "-r", "-z", "-l", sha], timeout=60)
+    files: dict[str, int] = {}
+    for entry in (output or "").split("\0"):
+        # "<mode> blob <oid> <size>\t<path>" (submodules are "commit" entries)
+        meta, _, path = entry.partition("\t")
+        parts = meta.split()
+        if len(parts) == 4 and parts[1] == "blob" and path:
+            files[path] = int(parts[3]) if parts[3].isdigit() else 0
+    return files
+
+
+def read_commit_blobs(
+    root: Path, sha: str, paths: list[str], chunk_size: int = 2000
+) -> dict[str, str]:
+    """Read file contents at a commit through ``git cat-file --batch``."""
+    contents: dict[str, str] = {}
+    paths = [p for p in paths if "\n" not in p]
+    for offset in range(0, len(paths), chunk_size):
+        chunk = paths[offset : offset + chunk_size]
+        request = "".join(f"{sha}:{path}\n" for path in chunk).encode("utf-8")
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "--batch"],
+                cwd=root,
+                input=request,
+                capture_output=True,
+                timeout=120,
+                env=get_isolated_git_env(),
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return contents
+        if result.returncode != 0:
+            return contents
+
+        data = result.stdout
+        pos = 0
+        for path in chunk:
+            header_end = data.find(b"\n", pos)
+            if header_end < 0:
+                break
+            header = data[pos:header_end].split()
+            pos = header_end + 1
+            if len(header) != 3 or header[1] != b"blob":
+                # "<object> missing" (or not a blob): no content follows
+                continue
+            size = int(header[2])
+            contents[path] = data[pos : pos + size].decode("utf-8", errors="replace")
+            pos += size + 1
+    return contents
+
+
+def get_head_sha(root: Path) -> str | None:
+    """Commit SHA checked out at ``root``, or None if it isn't a git checkout."""
+    output = _run_git(Path(root), ["rev-parse", "HEAD"], timeout=10)
+    return output.strip() if output else None
+
+
+def _affects_graph(path: str) -> bool:
+    """Whether a file changes the graph: a parsed source or a tsconfig/jsconfig."""
+    return (
+        path.endswith(JS_EXTENSIONS + PY_EXTENSIONS)
+        or posixpath.basename(path) in _TSCONFIG_NAMES
+    )
+
+
+def _is_clean(root: Path) -> bool:
+    """
+    True when the working tree has no uncommitted changes to the graph.
+
+    Untracked (non-ignored) sources and tsconfig/jsconfig files count as
+    changes: list_repo_files includes them, so a graph built with them
+    doesn't describe the commit. Other untracked files, such as the
+    .auto-claude/ state in the main checkout, don't change any import.
+    """
+    root = Path(root)
+    output = _run_git(root, ["status", "--porcelain", "--untracked-files=no"])
+    if output is None or output.strip():
+        return False
+    untracked = _run_git(root, ["ls-files", "-z", "--others", "--exclude-standard"])
+    if untracked is None:
+        return False
+    return not any(_affects_graph(path) for path in untracked.split("\0") if path)
+
+
+def is_sparse_checkout(root: Path) -> bool:
+    """True when only part of the tree is checked out at ``root``."""
+    output = _run_git(Path(root), ["config", "--get", "core.sparseCheckout"], 10)
+    return (output or "").strip().lower() == "true"
+
+
+class ImportGraphCache:
+    """
+    Per-commit cache of import graphs in the GitHub state directory.
+
+    Usage:
+        cache = ImportGraphCache(project_dir / ".auto-claude" / "github")
+        graph = cache.get(worktree_path, head_sha)
+    """
+
+    def __init__(self, state_dir: Path, max_graphs: int = MAX_CACHED_GRAPHS):
+        self.cache_dir = Path(state_dir) / "import_graph"
+        self.max_graphs = max_graphs
+        self._memory: dict[str, RepoImportGraph] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _path_for(self, sha: str) -> Path:
+        return self.cache_dir / f"{sha}.json"
+
+    def load(self, sha: str) -> RepoImportGraph | None:
+        """Load the cached graph for a commit, if present and current."""
+        if sha in self._memory:
+            return self._memory[sha]
+        try:
+            data = json.loads(self._path_for(sha).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != GRAPH_VERSION:
+            return None
+        graph = RepoImportGraph.from_dict(data)
+        self._memory[sha] = graph
+        return graph
+
+    def save(self, graph: RepoImportGraph) -> None:
+        """Persist a graph under its commit SHA and prune old entries."""
+        if not graph.sha:
+            return
+        self._memory[graph.sha] = graph
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path_for(graph.sha)
+            # Unique per writer: reviews running in parallel save concurrently
+            tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                tmp_path.write_text(json.dumps(graph.to_dict()), encoding="utf-8")
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"[ImportGraph] Could not save graph cache: {e}")
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue  # Removed by a concurrent prune
+        entries.sort(reverse=True)
+        for _, stale in entries[self.max_graphs :]:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"[ImportGraph] Could not prune {stale.name}: {e}")
+
+    def get(self, root: Path, sha: str | None = None) -> RepoImportGraph:
+        """
+        Get the import graph for the checkout at ``root``.
+
+        The graph is cached when ``root`` is a clean checkout of ``sha``
+        (defaulting to its HEAD); otherwise it is built fresh so local
+        modifications are reflected.
+
+        Args:
+            root: Repository or worktree root
+            sha: Commit the checkout is expected to be at
+
+        Returns:
+            The import graph
+        """
+        root = Path(root)
+        head = get_head_sha(root)
+        cacheable = bool(head) and (sha is None or sha == head) and _is_clean(root)
+
+        if cacheable:
+            if is_sparse_checkout(root):
+                # Most files aren't on disk; read the commit instead
+                return self.get_for_commit(root, head)
+            graph = self.load(head)
+            if graph is not None:
+                self.hits += 1
+                return graph
+
+        self.misses += 1
+        graph = RepoImportGraph.build(root, sha=head if cacheable else None)
+        logger.debug(
+            f"[ImportGraph] Built graph for {root}: {len(graph.files)} files, "
+            f"{len(graph.imports)} importers in {graph.build_ms:.0f}ms"
+        )
+        if cacheable:
+            self.save(graph)
+        return graph
+
+    def get_for_commit(self, root: Path, sha: str) -> RepoImportGraph:
+        """
+        Get the import graph of a commit, whatever is checked out at ``root``.
+
+        Args:
+            root: Any checkout of the repository containing ``sha``
+            sha: Full commit SHA
+
+        Returns:
+            The import graph (cached under ``sha``)
+        """
+        cacheable = bool(_FULL_SHA_PATTERN.match(sha))
+        graph = self.load(sha) if cacheable else None
+        if graph is not None:
+            self.hits += 1
+            return graph
+
+        self.misses += 1
+        graph = RepoImportGraph.build_from_commit(Path(root), sha)
+        logger.debug(
+            f"[ImportGraph] Built graph for commit {sha[:8]}: {len(graph.files)} "
+            f"files, {len(graph.imports)} importers in {graph.build_ms:.0f}ms"
+        )
+        if cacheable and graph.files:
+            self.save(graph)
+        return graph
@@ -25,13 +25,17 @@ Usage:
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import get_state_store
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -285,45 +289,23 @@ class LearningTracker:
 
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
-        self.learning_dir = state_dir / "learning"
-        self.learning_dir.mkdir(parents=True, exist_ok=True)
+        self.store = get_state_store(state_dir)
 
         self._outcomes: dict[str, ReviewOutcome] = {}
         self._load_outcomes()
 
-    def _get_outcomes_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.learning_dir / f"{safe_name}_outcomes.json"
-
     def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
+        """Load all outcomes from the state store."""
+        for item in self.store.list_outcomes():
             try:
-                with open(file) as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
+                outcome = ReviewOutcome.from_dict(item)
+            except (KeyError, ValueError):
                 continue
+            self._outcomes[outcome.review_id] = outcome
 
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
-
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
-
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
-
-        # Use file locking and atomic write for safe concurrent access
-        with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+    def _save_outcome(self, outcome: ReviewOutcome) -> None:
+        """Save a single outcome (other outcomes are not rewritten)."""
+        self.store.save_outcome(outcome.to_dict())
 
     def record_prediction(
         self,
@@ -367,7 +349,7 @@ class LearningTracker:
         )
 
         self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._save_outcome(outcome)
 
         return outcome
 
@@ -401,7 +383,7 @@ class LearningTracker:
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
 
-        self._save_outcomes(repo)
+        self._save_outcome(review_outcome)
 
         return review_outcome
 
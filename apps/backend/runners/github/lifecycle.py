@@ -13,13 +13,18 @@ Prevents conflicting operations:
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import get_state_store
+
 
 class IssueLifecycleState(str, Enum):
     """Unified issue lifecycle states."""
@@ -396,22 +401,12 @@ class LifecycleManager:
 
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
-        self.lifecycle_dir = state_dir / "lifecycle"
-        self.lifecycle_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_file(self, repo: str, issue_number: int) -> Path:
-        safe_repo = repo.replace("/", "_")
-        return self.lifecycle_dir / f"{safe_repo}_{issue_number}.json"
+        self.store = get_state_store(state_dir)
 
     def get(self, repo: str, issue_number: int) -> IssueLifecycle | None:
         """Get lifecycle for an issue."""
-        file = self._get_file(repo, issue_number)
-        if not file.exists():
-            return None
-
-        with open(file) as f:
-            data = json.load(f)
-        return IssueLifecycle.from_dict(data)
+        data = self.store.get_lifecycle(repo, issue_number)
+        return IssueLifecycle.from_dict(data) if data else None
 
     def get_or_create(self, repo: str, issue_number: int) -> IssueLifecycle:
         """Get or create lifecycle for an issue."""
@@ -425,9 +420,37 @@ class LifecycleManager:
 
     def save(self, lifecycle: IssueLifecycle) -> None:
         """Save lifecycle state."""
-        file = self._get_file(lifecycle.repo, lifecycle.issue_number)
-        with open(file, "w") as f:
-            json.dump(lifecycle.to_dict(), f, indent=2)
+        self.store.save_lifecycle(lifecycle.to_dict())
+
+    def _update(
+        self,
+        repo: str,
+        issue_number: int,
+        change: Callable[[IssueLifecycle], bool],
+        create: bool = True,
+    ) -> bool:
+        """
+        Apply a change to the stored lifecycle atomically across runners.
+
+        ``change`` returns whether the lifecycle should be saved; its result
+        is returned (False if the issue has no lifecycle and create is False).
+        """
+        changed = False
+
+        def update(data: dict[str, Any] | None) -> dict[str, Any] | None:
+            nonlocal changed
+            if data is None and not create:
+                return None
+            lifecycle = (
+                IssueLifecycle.from_dict(data)
+                if data
+                else IssueLifecycle(issue_number=issue_number, repo=repo)
+            )
+            changed = change(lifecycle)
+            return lifecycle.to_dict() if changed or data is None else None
+
+        self.store.update_lifecycle(repo, issue_number, update)
+        return changed
 
     def transition(
         self,
@@ -439,12 +462,14 @@ class LifecycleManager:
         metadata: dict[str, Any] | None = None,
     ) -> ConflictResult:
         """Transition issue to new state."""
-        lifecycle = self.get_or_create(repo, issue_number)
-        result = lifecycle.transition(new_state, actor, reason, metadata)
+        result = ConflictResult(has_conflict=False)
 
-        if not result.has_conflict:
-            self.save(lifecycle)
+        def change(lifecycle: IssueLifecycle) -> bool:
+            nonlocal result
+            result = lifecycle.transition(new_state, actor, reason, metadata)
+            return not result.has_conflict
 
+        self._update(repo, issue_number, change)
         return result
 
     def check_conflict(
@@ -480,11 +505,9 @@ class LifecycleManager:
         component: str,
     ) -> bool:
         """Acquire lock for an issue."""
-        lifecycle = self.get_or_create(repo, issue_number)
-        if lifecycle.acquire_lock(component):
-            self.save(lifecycle)
-            return True
-        return False
+        return self._update(
+            repo, issue_number, lambda lifecycle: lifecycle.acquire_lock(component)
+        )
 
     def release_lock(
         self,
@@ -493,11 +516,12 @@ class LifecycleManager:
         component: str,
     ) -> bool:
         """Release lock for an issue."""
-        lifecycle = self.get(repo, issue_number)
-        if lifecycle and lifecycle.release_lock(component):
-            self.save(lifecycle)
-            return True
-        return False
+        return self._update(
+            repo,
+            issue_number,
+            lambda lifecycle: lifecycle.release_lock(component),
+            create=False,
+        )
 
     def get_all_in_state(
         self,
@@ -505,27 +529,11 @@ class LifecycleManager:
         state: IssueLifecycleState,
     ) -> list[IssueLifecycle]:
         """Get all issues in a specific state."""
-        results = []
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file) as f:
-                data = json.load(f)
-                lifecycle = IssueLifecycle.from_dict(data)
-                if lifecycle.current_state == state:
-                    results.append(lifecycle)
-
-        return results
+        return [
+            IssueLifecycle.from_dict(data)
+            for data in self.store.list_lifecycles(repo, state=state.value)
+        ]
 
     def get_summary(self, repo: str) -> dict[str, int]:
         """Get count of issues by state."""
-        counts: dict[str, int] = {}
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file) as f:
-                data = json.load(f)
-                state = data.get("current_state", "new")
-                counts[state] = counts.get(state, 0) + 1
-
-        return counts
+        return self.store.count_lifecycle_states(repo)
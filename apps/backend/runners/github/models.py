@@ -839,6 +839,9 @@ class GitHubRunnerConfig:
     use_parallel_orchestrator: bool = (
         True  # Use SDK subagent parallel orchestrator (default)
     )
+    sparse_review_worktrees: bool = (
+        False  # Check out only changed/related files, expand on demand
+    )
 
     # Model settings
     # Note: Default uses shorthand "sonnet" which gets resolved via resolve_model_id()
@@ -865,6 +868,7 @@ class GitHubRunnerConfig:
             "review_own_prs": self.review_own_prs,
             "auto_post_reviews": self.auto_post_reviews,
             "allow_fix_commits": self.allow_fix_commits,
+            "sparse_review_worktrees": self.sparse_review_worktrees,
             "model": self.model,
             "thinking_level": self.thinking_level,
         }
@@ -917,6 +921,7 @@ class GitHubRunnerConfig:
             review_own_prs=settings.get("review_own_prs", False),
             auto_post_reviews=settings.get("auto_post_reviews", False),
             allow_fix_commits=settings.get("allow_fix_commits", True),
+            sparse_review_worktrees=settings.get("sparse_review_worktrees", False),
             # Note: model is stored as shorthand and resolved via resolve_model_id()
             model=settings.get("model", "sonnet"),
             thinking_level=settings.get("thinking_level", "medium"),
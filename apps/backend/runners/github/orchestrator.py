@@ -47,6 +47,16 @@ try:
         TriageEngine,
     )
     from .services.io_utils import safe_print
+    from .services.pr_worktree_manager import (
+        PR_WORKTREE_DIR,
+        PRWorktreeManager,
+        PRWorktreePool,
+    )
+    from .services.review_queue import (
+        DEFAULT_REVIEW_CONCURRENCY,
+        PRReviewQueue,
+        ReviewQueueReport,
+    )
 except (ImportError, ValueError, SystemError):
     # When imported directly (runner.py adds github dir to path)
     from bot_detection import BotDetector
@@ -76,6 +86,16 @@ except (ImportError, ValueError, SystemError):
         TriageEngine,
     )
     from services.io_utils import safe_print
+    from services.pr_worktree_manager import (
+        PR_WORKTREE_DIR,
+        PRWorktreeManager,
+        PRWorktreePool,
+    )
+    from services.review_queue import (
+        DEFAULT_REVIEW_CONCURRENCY,
+        PRReviewQueue,
+        ReviewQueueReport,
+    )
 
 
 @dataclass
@@ -108,6 +128,9 @@ class GitHubOrchestrator:
         # Review a PR
         result = await orchestrator.review_pr(pr_number=123)
 
+        # Review several PRs concurrently
+        report = await orchestrator.review_prs([101, 102, 103], concurrency=3)
+
         # Triage issues
         results = await orchestrator.triage_issues(issue_numbers=[1, 2, 3])
 
@@ -590,6 +613,57 @@ class GitHubOrchestrator:
             await result.save(self.github_dir)
             return result
 
+    async def review_prs(
+        self,
+        pr_numbers: list[int],
+        concurrency: int = DEFAULT_REVIEW_CONCURRENCY,
+        force_review: bool = False,
+    ) -> ReviewQueueReport:
+        """
+        Review several PRs concurrently.
+
+        Reviews run through a PRReviewQueue gated on the shared RateLimiter.
+        With the parallel orchestrator, reviews share a pool of ``concurrency``
+        detached worktrees that are reset to each PR's head SHA instead of
+        being created and removed per review.
+
+        Args:
+            pr_numbers: PRs to review
+            concurrency: Maximum number of reviews running at once
+            force_review: Passed through to review_pr for every PR
+
+        Returns:
+            ReviewQueueReport with per-PR results, queue latency and throughput
+        """
+        pool = None
+        if self.config.use_parallel_orchestrator:
+            manager = PRWorktreeManager(self.project_dir, PR_WORKTREE_DIR)
+            pool = PRWorktreePool(manager, size=concurrency)
+            self.pr_review_engine.worktree_pool = pool
+
+        async def review(pr_number: int) -> PRReviewResult:
+            return await self.review_pr(pr_number, force_review=force_review)
+
+        queue = PRReviewQueue(
+            review,
+            concurrency=concurrency,
+            rate_limiter=self.rate_limiter,
+        )
+        try:
+            report = await queue.run(pr_numbers)
+        finally:
+            if pool is not None:
+                self.pr_review_engine.worktree_pool = None
+                pool.close()
+                safe_print(
+                    f"[ReviewQueue] Worktree pool: created {pool.stats['created']}, "
+                    f"reused {pool.stats['reused']}",
+                    flush=True,
+                )
+
+        safe_print(report.summary(), flush=True)
+        return report
+
     async def followup_review_pr(self, pr_number: int) -> PRReviewResult:
         """
         Perform a focused follow-up review of a PR.
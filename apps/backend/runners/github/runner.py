@@ -13,6 +13,12 @@ Usage:
     # Review a specific PR
     python runner.py review-pr 123
 
+    # Review a PR from a sparse checkout of the files it touches
+    python runner.py review-pr 123 --sparse-checkout
+
+    # Review several PRs, 4 at a time
+    python runner.py review-prs 101 102 103 104 105 --concurrency 4
+
     # Triage all open issues
     python runner.py triage --apply-labels
 
@@ -176,6 +182,7 @@ def get_config(args) -> GitHubRunnerConfig:
         auto_fix_enabled=getattr(args, "auto_fix_enabled", False),
         auto_fix_labels=getattr(args, "auto_fix_labels", ["auto-fix"]),
         auto_post_reviews=getattr(args, "auto_post", False),
+        sparse_review_worktrees=getattr(args, "sparse_checkout", False),
     )
 
 
@@ -245,6 +252,40 @@ async def cmd_review_pr(args) -> int:
         return 1
 
 
+async def cmd_review_prs(args) -> int:
+    """Review several pull requests concurrently."""
+    config = get_config(args)
+    orchestrator = GitHubOrchestrator(
+        project_dir=args.project,
+        config=config,
+        progress_callback=print_progress,
+    )
+
+    report = await orchestrator.review_prs(
+        args.pr_numbers,
+        concurrency=args.concurrency,
+        force_review=getattr(args, "force", False),
+    )
+
+    if getattr(args, "json", False):
+        safe_print(json.dumps(report.to_dict(), indent=2))
+    else:
+        safe_print(f"\n{'=' * 60}")
+        safe_print("PR Review Queue Complete")
+        safe_print(f"{'=' * 60}")
+        for review in report.reviews:
+            status = "SKIP" if review.skipped else ("OK" if review.success else "ERR")
+            line = (
+                f"  [{status}] PR #{review.pr_number}: "
+                f"waited {review.queue_wait:.1f}s, reviewed in {review.duration:.1f}s"
+            )
+            if review.error:
+                line += f" - {review.error.splitlines()[0][:80]}"
+            safe_print(line)
+
+    return 0 if not report.failed else 1
+
+
 async def cmd_followup_review_pr(args) -> int:
     """Perform a follow-up review of a pull request."""
     import sys
@@ -698,6 +739,40 @@ def main():
         action="store_true",
         help="Force a new review even if commit was already reviewed",
     )
+    review_parser.add_argument(
+        "--sparse-checkout",
+        action="store_true",
+        help="Check out only changed and related files, expanding on demand",
+    )
+
+    # review-prs command
+    review_many_parser = subparsers.add_parser(
+        "review-prs", help="Review several pull requests concurrently"
+    )
+    review_many_parser.add_argument(
+        "pr_numbers", type=int, nargs="+", help="PR numbers to review"
+    )
+    review_many_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Number of reviews to run at once (default: 3)",
+    )
+    review_many_parser.add_argument(
+        "--auto-post",
+        action="store_true",
+        help="Automatically post reviews to GitHub",
+    )
+    review_many_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Force new reviews even if commits were already reviewed",
+    )
+    review_many_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the queue report as JSON",
+    )
 
     # followup-review-pr command
     followup_parser = subparsers.add_parser(
@@ -794,6 +869,7 @@ def main():
     # Route to command handler
     commands = {
         "review-pr": cmd_review_pr,
+        "review-prs": cmd_review_prs,
         "followup-review-pr": cmd_followup_review_pr,
         "triage": cmd_triage,
         "auto-fix": cmd_auto_fix,
@@ -16,6 +16,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "AutoFixProcessor": (".autofix_processor", "AutoFixProcessor"),
     "BatchProcessor": (".batch_processor", "BatchProcessor"),
     "PRReviewEngine": (".pr_review_engine", "PRReviewEngine"),
+    "PRReviewQueue": (".review_queue", "PRReviewQueue"),
     "PromptManager": (".prompt_manager", "PromptManager"),
     "ResponseParser": (".response_parsers", "ResponseParser"),
     "TriageEngine": (".triage_engine", "TriageEngine"),
@@ -25,6 +26,7 @@ __all__ = [
     "PromptManager",
     "ResponseParser",
     "PRReviewEngine",
+    "PRReviewQueue",
     "TriageEngine",
     "AutoFixProcessor",
     "BatchProcessor",
@@ -468,7 +468,7 @@ class BatchProcessor:
                 batcher._batch_index[item.issue_number] = batch.batch_id
 
             # Save batch
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
             created_batches.append(batch)
 
             # Create AutoFixState for primary issue
@@ -542,6 +542,6 @@ class BatchProcessor:
 
         for batch in pending:
             batch.update_status(BatchStatus.ANALYZING)
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
 
         return len(pending)
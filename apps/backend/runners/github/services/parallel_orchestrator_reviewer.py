@@ -17,9 +17,11 @@ Key Design:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import os
+import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -39,9 +41,14 @@ try:
         PRReviewResult,
         ReviewSeverity,
     )
+    from ..sparse_worktree import LazySparseCheckout
     from .category_utils import map_category
     from .io_utils import safe_print
-    from .pr_worktree_manager import PRWorktreeManager
+    from .pr_worktree_manager import (
+        PR_WORKTREE_DIR,
+        PRWorktreeManager,
+        PRWorktreePool,
+    )
     from .pydantic_models import ParallelOrchestratorResponse
     from .sdk_utils import process_sdk_stream
 except (ImportError, ValueError, SystemError):
@@ -60,9 +67,14 @@ except (ImportError, ValueError, SystemError):
     from phase_config import get_thinking_budget, resolve_model_id
     from services.category_utils import map_category
     from services.io_utils import safe_print
-    from services.pr_worktree_manager import PRWorktreeManager
+    from services.pr_worktree_manager import (
+        PR_WORKTREE_DIR,
+        PRWorktreeManager,
+        PRWorktreePool,
+    )
     from services.pydantic_models import ParallelOrchestratorResponse
     from services.sdk_utils import process_sdk_stream
+    from sparse_worktree import LazySparseCheckout
 
 
 logger = logging.getLogger(__name__)
@@ -70,9 +82,6 @@ logger = logging.getLogger(__name__)
 # Check if debug mode is enabled
 DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 
-# Directory for PR review worktrees (inside github/pr for consistency)
-PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
-
 
 class ParallelOrchestratorReviewer:
     """
@@ -94,12 +103,15 @@ class ParallelOrchestratorReviewer:
         github_dir: Path,
         config: GitHubRunnerConfig,
         progress_callback=None,
+        worktree_pool: PRWorktreePool | None = None,
     ):
         self.project_dir = Path(project_dir)
         self.github_dir = Path(github_dir)
         self.config = config
         self.progress_callback = progress_callback
         self.worktree_manager = PRWorktreeManager(project_dir, PR_WORKTREE_DIR)
+        # Shared by concurrent reviews in a review queue (None: one worktree per review)
+        self.worktree_pool = worktree_pool
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -130,12 +142,15 @@ class ParallelOrchestratorReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
+    def _create_pr_worktree(
+        self, head_sha: str, pr_number: int, sparse_paths: list[str] | None = None
+    ) -> Path:
         """Create a temporary worktree at the PR head commit.
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            sparse_paths: Files for a sparse checkout (None: full checkout)
 
         Returns:
             Path to the created worktree
@@ -151,14 +166,23 @@ class ParallelOrchestratorReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        if self.worktree_pool is not None:
+            return self.worktree_pool.acquire(head_sha)
+        return self.worktree_manager.create_worktree(
+            head_sha, pr_number, sparse_paths=sparse_paths
+        )
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
         """Remove a temporary PR review worktree with fallback chain.
 
+        Pooled worktrees are returned to the pool instead of being removed.
+
         Args:
             worktree_path: Path to the worktree to remove
         """
+        if self.worktree_pool is not None and self.worktree_pool.owns(worktree_path):
+            self.worktree_pool.release(worktree_path)
+            return
         self.worktree_manager.remove_worktree(worktree_path)
 
     def _cleanup_stale_pr_worktrees(self) -> None:
@@ -339,7 +363,11 @@ The SDK will run invoked agents in parallel automatically.
         return base_prompt + pr_context
 
     def _create_sdk_client(
-        self, project_root: Path, model: str, thinking_budget: int | None
+        self,
+        project_root: Path,
+        model: str,
+        thinking_budget: int | None,
+        sparse_checkout: LazySparseCheckout | None = None,
     ):
         """Create SDK client with subagents and configuration.
 
@@ -347,6 +375,7 @@ The SDK will run invoked agents in parallel automatically.
             project_root: Root directory of the project
             model: Model to use for orchestrator
             thinking_budget: Max thinking tokens budget
+            sparse_checkout: Sparse worktree to expand before file reads
 
         Returns:
             Configured SDK client instance
@@ -362,8 +391,28 @@ The SDK will run invoked agents in parallel automatically.
                 "type": "json_schema",
                 "schema": ParallelOrchestratorResponse.model_json_schema(),
             },
+            tool_hooks=(
+                {"Read|Grep|Glob": [sparse_checkout.pre_tool_use_hook]}
+                if sparse_checkout is not None
+                else None
+            ),
         )
 
+    def _sparse_review_paths(self, context: PRContext, head_sha: str) -> list[str]:
+        """Files a sparse review worktree starts with: changed plus related files."""
+        changed = [f.path for f in context.changed_files if f.status != "deleted"]
+        try:
+            related = PRContextGatherer.find_related_files_at_commit(
+                context.changed_files,
+                self.worktree_manager.project_dir,
+                head_sha,
+                state_dir=self.github_dir,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"[ParallelOrchestrator] Related file lookup failed: {e}")
+            related = []
+        return sorted(set(changed) | set(related))
+
     def _extract_structured_output(
         self, structured_output: dict[str, Any] | None, result_text: str
     ) -> tuple[list[PRReviewFinding], list[str]]:
@@ -475,6 +524,7 @@ The SDK will run invoked agents in parallel automatically.
 
         # Track worktree for cleanup
         worktree_path: Path | None = None
+        sparse_checkout: LazySparseCheckout | None = None
 
         try:
             self._report_progress(
@@ -527,11 +577,27 @@ The SDK will run invoked agents in parallel automatically.
                         f"[PRReview] DEBUG: Creating worktree for head_sha={head_sha}",
                         flush=True,
                     )
+                sparse_paths = None
+                if (
+                    getattr(self.config, "sparse_review_worktrees", False) is True
+                    and self.worktree_pool is None
+                ):
+                    sparse_paths = await asyncio.to_thread(
+                        self._sparse_review_paths, context, head_sha
+                    )
                 try:
-                    worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                    # Off the event loop so concurrent reviews keep running
+                    worktree_path = await asyncio.to_thread(
+                        self._create_pr_worktree,
+                        head_sha,
+                        context.pr_number,
+                        sparse_paths,
                     )
                     project_root = worktree_path
+                    if sparse_paths is not None:
+                        sparse_checkout = LazySparseCheckout(
+                            worktree_path, sparse_paths
+                        )
                     # Count files in worktree to give user visibility (with limit to avoid slowdown)
                     MAX_FILE_COUNT = 10000
                     try:
@@ -557,6 +623,12 @@ The SDK will run invoked agents in parallel automatically.
                         f"[PRReview] Worktree contains PR branch HEAD: {head_sha[:8]}",
                         flush=True,
                     )
+                    if sparse_checkout is not None:
+                        safe_print(
+                            f"[PRReview] Sparse checkout: {len(sparse_paths)} changed/related "
+                            "files plus top-level files, more on demand",
+                            flush=True,
+                        )
                 except (RuntimeError, ValueError) as e:
                     if DEBUG_MODE:
                         safe_print(
@@ -581,10 +653,16 @@ The SDK will run invoked agents in parallel automatically.
                 new_related_files = PRContextGatherer.find_related_files_for_root(
                     context.changed_files,
                     project_root,
+                    state_dir=self.github_dir,
+                    head_sha=context.head_sha or None,
                 )
                 # Always log rescan result (not gated by DEBUG_MODE)
                 if new_related_files:
                     context.related_files = new_related_files
+                    if sparse_checkout is not None:
+                        await asyncio.to_thread(
+                            sparse_checkout.ensure_paths, new_related_files
+                        )
                     safe_print(
                         f"[PRReview] Rescanned in worktree: found {len(new_related_files)} related files"
                     )
@@ -611,7 +689,9 @@ The SDK will run invoked agents in parallel automatically.
 
             # Create client with subagents defined
             # SDK handles parallel execution when Claude invokes multiple Task tools
-            client = self._create_sdk_client(project_root, model, thinking_budget)
+            client = self._create_sdk_client(
+                project_root, model, thinking_budget, sparse_checkout=sparse_checkout
+            )
 
             self._report_progress(
                 "orchestrating",
@@ -61,11 +61,14 @@ class PRReviewEngine:
         github_dir: Path,
         config: GitHubRunnerConfig,
         progress_callback=None,
+        worktree_pool=None,
     ):
         self.project_dir = Path(project_dir)
         self.github_dir = Path(github_dir)
         self.config = config
         self.progress_callback = progress_callback
+        # Optional PRWorktreePool shared across queued reviews
+        self.worktree_pool = worktree_pool
         self.prompt_manager = PromptManager()
         self.parser = ResponseParser()
 
@@ -305,6 +308,7 @@ class PRReviewEngine:
                 github_dir=self.github_dir,
                 config=self.config,
                 progress_callback=self.progress_callback,
+                worktree_pool=self.worktree_pool,
             )
 
             result = await orchestrator.review(context)
@@ -9,6 +9,8 @@ Features:
 - Count-based cleanup (keep only N most recent worktrees)
 - Orphaned worktree cleanup (worktrees not registered with git)
 - Automatic cleanup on review completion
+- Pooled worktrees reset to each head SHA for multi-PR review queues
+- Optional sparse checkout limited to the files a review needs
 """
 
 from __future__ import annotations
@@ -17,14 +19,28 @@ import logging
 import os
 import shutil
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import NamedTuple
 
 from core.git_executable import get_isolated_git_env
 
+try:
+    from ..file_lock import FileLock, FileLockError
+    from ..sparse_worktree import apply_sparse_checkout
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, FileLockError
+    from sparse_worktree import apply_sparse_checkout
+
 logger = logging.getLogger(__name__)
 
+# Directory for PR review worktrees (inside github/pr for consistency)
+PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
+
+# Directory for pooled worktrees shared by queued reviews
+PR_WORKTREE_POOL_DIR = ".auto-claude/github/pr/worktree-pool"
+
 # Default cleanup policies (can be overridden via environment variables)
 DEFAULT_MAX_PR_WORKTREES = 10  # Max worktrees to keep
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = 7  # Max age in days
@@ -89,7 +105,11 @@ class PRWorktreeManager:
         self.worktree_base_dir = self.project_dir / worktree_dir
 
     def create_worktree(
-        self, head_sha: str, pr_number: int, auto_cleanup: bool = True
+        self,
+        head_sha: str,
+        pr_number: int,
+        auto_cleanup: bool = True,
+        sparse_paths: list[str] | None = None,
     ) -> Path:
         """
         Create a PR worktree with automatic cleanup of old worktrees.
@@ -98,6 +118,9 @@ class PRWorktreeManager:
             head_sha: Git commit SHA to checkout
             pr_number: PR number for naming
             auto_cleanup: If True (default), run cleanup before creating
+            sparse_paths: If given, only these files plus the top-level files
+                are checked out (see sparse_worktree.LazySparseCheckout for
+                expanding it later)
 
         Returns:
             Path to the created worktree
@@ -132,28 +155,15 @@ class PRWorktreeManager:
         logger.debug(f"Creating worktree: {worktree_path}")
 
         env = get_isolated_git_env()
-        try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin", head_sha],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env,
-            )
+        self.ensure_commit(head_sha)
 
-            if fetch_result.returncode != 0:
-                logger.warning(
-                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
-                )
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                f"Timeout fetching {head_sha} from origin, continuing anyway"
-            )
+        add_args = ["git", "worktree", "add", "--detach"]
+        if sparse_paths is not None:
+            add_args.append("--no-checkout")
 
         try:
             result = subprocess.run(
-                ["git", "worktree", "add", "--detach", str(worktree_path), head_sha],
+                [*add_args, str(worktree_path), head_sha],
                 cwd=self.project_dir,
                 capture_output=True,
                 text=True,
@@ -175,6 +185,13 @@ class PRWorktreeManager:
                     f"Worktree creation reported success but path does not exist: {worktree_path}"
                 )
 
+            if sparse_paths is not None:
+                try:
+                    apply_sparse_checkout(worktree_path, sparse_paths)
+                except RuntimeError:
+                    self.remove_worktree(worktree_path)
+                    raise
+
         except subprocess.TimeoutExpired:
             # Clean up partial worktree on timeout
             if worktree_path.exists():
@@ -184,6 +201,55 @@ class PRWorktreeManager:
         logger.info(f"[WorktreeManager] Created worktree at {worktree_path}")
         return worktree_path
 
+    def ensure_commit(self, head_sha: str) -> bool:
+        """
+        Make sure a commit is available locally, fetching it only if missing.
+
+        Context gathering has usually fetched the PR commits already, so
+        checking for the object first avoids a redundant network round-trip.
+
+        Args:
+            head_sha: Git commit SHA (validated by the caller)
+
+        Returns:
+            True if the commit is available locally
+        """
+        env = get_isolated_git_env()
+        try:
+            check = subprocess.run(
+                ["git", "cat-file", "-e", f"{head_sha}^{{commit}}"],
+                cwd=self.project_dir,
+                capture_output=True,
+                timeout=10,
+                env=env,
+            )
+            if check.returncode == 0:
+                return True
+        except subprocess.TimeoutExpired:
+            pass
+
+        try:
+            fetch_result = subprocess.run(
+                ["git", "fetch", "origin", head_sha],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=env,
+            )
+
+            if fetch_result.returncode != 0:
+                logger.warning(
+                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
+                )
+                return False
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f"Timeout fetching {head_sha} from origin, continuing anyway"
+            )
+            return False
+        return True
+
     def remove_worktree(self, worktree_path: Path) -> None:
         """
         Remove a PR worktree with fallback chain.
@@ -441,3 +507,238 @@ class PRWorktreeManager:
             logger.info(f"[WorktreeManager] Removed all {count} PR worktrees")
 
         return count
+
+
+class PRWorktreePool:
+    """
+    Fixed-size pool of detached worktrees reused across PR reviews.
+
+    Creating a worktree checks out the whole tree; when many PRs are reviewed
+    back to back, most of that work is repeated for nearly identical commits.
+    Pooled worktrees are instead reset to each review's head SHA
+    (``git checkout --detach --force`` + ``git clean``), which only touches
+    files that differ between commits.
+
+    Pool slots live outside the per-review worktree directory so the cleanup
+    policies of PRWorktreeManager never remove a slot that is in use.
+
+    Each slot is guarded by an exclusive file lock (slot-N.lock) held for as
+    long as the pool owns it, so several processes can share the pool
+    directory: a slot whose lock is held elsewhere is never adopted, reset
+    or deleted.
+
+    Usage:
+        pool = PRWorktreePool(manager, size=3)
+        path = pool.acquire(head_sha)
+        try:
+            ...review in path...
+        finally:
+            pool.release(path)
+    """
+
+    def __init__(
+        self,
+        manager: PRWorktreeManager,
+        size: int,
+        pool_dir: str | Path = PR_WORKTREE_POOL_DIR,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            manager: Worktree manager for the project (used for fetching)
+            size: Maximum number of pooled worktrees
+            pool_dir: Directory for pool slots (relative to the project dir)
+        """
+        if size <= 0:
+            raise ValueError(f"Invalid pool size: must be positive, got {size}")
+        self.manager = manager
+        self.size = size
+        self.pool_dir = manager.project_dir / pool_dir
+        self._condition = threading.Condition()
+        self._idle: list[Path] = []
+        self._busy: set[Path] = set()
+        self._locks: dict[Path, FileLock] = {}
+        self._slot_count = 0
+        self.stats = {"created": 0, "reused": 0, "reset_failures": 0, "waits": 0}
+        self._adopt_existing_slots()
+
+    def _lock_slot(self, path: Path) -> bool:
+        """Lock a slot without waiting; False if another process holds it."""
+        lock = FileLock(path, timeout=0)
+        try:
+            lock.__enter__()
+        except FileLockError:
+            return False
+        self._locks[path] = lock
+        return True
+
+    def _unlock_slot(self, path: Path) -> None:
+        lock = self._locks.pop(path, None)
+        if lock is not None:
+            lock.__exit__(None, None, None)
+
+    def _adopt_existing_slots(self) -> None:
+        """Reuse slots left registered by a previous run."""
+        if not self.pool_dir.exists():
+            return
+        registered = {p.resolve() for p in self.manager.get_registered_worktrees()}
+        for item in sorted(self.pool_dir.iterdir()):
+            if not item.is_dir() or not item.name.startswith("slot-"):
+                continue
+            if not self._lock_slot(item):
+                continue  # In use by another process
+            if item.resolve() in registered and self._slot_count < self.size:
+                self._idle.append(item)
+                self._slot_count += 1
+            else:
+                shutil.rmtree(item, ignore_errors=True)
+                self._unlock_slot(item)
+
+    def _next_slot_path(self) -> Path:
+        """Lock and return the first slot not owned by this or another pool."""
+        existing = {p.name for p in self._idle} | {p.name for p in self._busy}
+        index = 0
+        while True:
+            path = self.pool_dir / f"slot-{index}"
+            if path.name not in existing and self._lock_slot(path):
+                return path
+            index += 1
+
+    def acquire(self, head_sha: str, timeout: float | None = None) -> Path:
+        """
+        Get a worktree checked out at head_sha, waiting for a free slot if needed.
+
+        Args:
+            head_sha: Git commit SHA to check out
+            timeout: Max seconds to wait for a free slot (None waits forever)
+
+        Returns:
+            Path to the pooled worktree
+
+        Raises:
+            ValueError: If head_sha is invalid
+            RuntimeError: If no slot became free in time or checkout failed
+        """
+        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
+            raise ValueError(
+                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+
+        with self._condition:
+            if not self._idle and self._slot_count >= self.size:
+                self.stats["waits"] += 1
+            while not self._idle and self._slot_count >= self.size:
+                if not self._condition.wait(timeout):
+                    raise RuntimeError(
+                        f"Timeout waiting for a free worktree slot ({self.size} busy)"
+                    )
+            if self._idle:
+                path = self._idle.pop()
+                create = False
+            else:
+                path = self._next_slot_path()
+                self._slot_count += 1
+                create = True
+            self._busy.add(path)
+
+        try:
+            self.manager.ensure_commit(head_sha)
+            if create or not self._reset(path, head_sha):
+                self._create(path, head_sha)
+                with self._condition:
+                    self.stats["created"] += 1
+            else:
+                with self._condition:
+                    self.stats["reused"] += 1
+        except Exception:
+            with self._condition:
+                self._busy.discard(path)
+                self._slot_count -= 1
+                self._condition.notify()
+            shutil.rmtree(path, ignore_errors=True)
+            self._unlock_slot(path)
+            raise
+
+        logger.debug(f"[WorktreePool] Acquired {path.name} at {head_sha[:8]}")
+        return path
+
+    def release(self, path: Path) -> None:
+        """Return a worktree to the pool."""
+        with self._condition:
+            if path not in self._busy:
+                return
+            self._busy.discard(path)
+            self._idle.append(path)
+            self._condition.notify()
+
+    def owns(self, path: Path) -> bool:
+        """Whether a path is a slot of this pool."""
+        return Path(path).parent == self.pool_dir
+
+    def _reset(self, path: Path, head_sha: str) -> bool:
+        """Reset an existing slot to head_sha, discarding any local changes."""
+        env = get_isolated_git_env()
+        for command in (
+            ["git", "checkout", "--detach", "--force", head_sha],
+            ["git", "clean", "-ffdx", "--quiet"],
+        ):
+            try:
+                result = subprocess.run(
+                    command,
+                    cwd=path,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                    env=env,
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                result = None
+                logger.warning(f"[WorktreePool] Reset of {path.name} failed: {e}")
+            if result is None or result.returncode != 0:
+                if result is not None:
+                    logger.warning(
+                        f"[WorktreePool] Reset of {path.name} failed: {result.stderr.strip()}"
+                    )
+                with self._condition:
+                    self.stats["reset_failures"] += 1
+                self.manager.remove_worktree(path)
+                return False
+        return True
+
+    def _create(self, path: Path, head_sha: str) -> None:
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            # Left over by an exited process (this pool holds the slot lock)
+            shutil.rmtree(path, ignore_errors=True)
+            subprocess.run(
+                ["git", "worktree", "prune"],
+                cwd=self.manager.project_dir,
+                capture_output=True,
+                timeout=30,
+                env=get_isolated_git_env(),
+            )
+        try:
+            result = subprocess.run(
+                ["git", "worktree", "add", "--detach", str(path), head_sha],
+                cwd=self.manager.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Timeout creating pooled worktree for {head_sha}")
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to create pooled worktree: {result.stderr.strip()}"
+            )
+
+    def close(self) -> None:
+        """Remove all idle pooled worktrees."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._slot_count -= len(idle)
+        for path in idle:
+            self.manager.remove_worktree(path)
+            self._unlock_slot(path)
@@ -0,0 +1,261 @@
+"""
+PR Review Queue
+===============
+
+Runs reviews for a list of PRs concurrently.
+
+A single review is dominated by waiting on the AI and the GitHub API, so a
+release train of many PRs reviewed one after another leaves the machine idle
+most of the time. The queue runs up to N reviews at once with a fixed pool
+of workers. Every review start is gated on the shared RateLimiter (a GitHub
+token, and the AI cost budget), so concurrency never bypasses the limits
+that apply to single reviews.
+
+Per-PR queue latency (time waiting for a worker), review duration and
+overall throughput are reported when the queue drains.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+try:
+    from .io_utils import safe_print
+except (ImportError, ValueError, SystemError):
+    from core.io_utils import safe_print
+
+if TYPE_CHECKING:
+    from ..rate_limiter import RateLimiter
+
+# Default number of reviews run at once
+DEFAULT_REVIEW_CONCURRENCY = 3
+
+# Max seconds a review waits for a GitHub rate-limit token before it is skipped
+GITHUB_TOKEN_TIMEOUT = 300.0
+
+
+@dataclass
+class QueuedReview:
+    """Timing and outcome of one PR in the queue."""
+
+    pr_number: int
+    enqueued_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    success: bool = False
+    skipped: bool = False
+    error: str | None = None
+
+    @property
+    def queue_wait(self) -> float:
+        """Seconds between enqueueing and a worker picking the PR up."""
+        if self.started_at is None:
+            return 0.0
+        return self.started_at - self.enqueued_at
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent reviewing."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pr_number": self.pr_number,
+            "success": self.success,
+            "skipped": self.skipped,
+            "error": self.error,
+            "queue_wait_seconds": round(self.queue_wait, 3),
+            "duration_seconds": round(self.duration, 3),
+        }
+
+
+@dataclass
+class ReviewQueueReport:
+    """Aggregate outcome of a queue run."""
+
+    concurrency: int
+    reviews: list[QueuedReview] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def completed(self) -> list[QueuedReview]:
+        return [r for r in self.reviews if r.success]
+
+    @property
+    def failed(self) -> list[QueuedReview]:
+        return [r for r in self.reviews if not r.success and not r.skipped]
+
+    @property
+    def skipped(self) -> list[QueuedReview]:
+        return [r for r in self.reviews if r.skipped]
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """Finished (successful or failed) reviews per minute of wall time."""
+        finished = len(self.reviews) - len(self.skipped)
+        return finished / self.wall_time * 60 if self.wall_time > 0 else 0.0
+
+    @property
+    def avg_queue_wait(self) -> float:
+        started = [r for r in self.reviews if r.started_at is not None]
+        return sum(r.queue_wait for r in started) / len(started) if started else 0.0
+
+    @property
+    def max_queue_wait(self) -> float:
+        return max((r.queue_wait for r in self.reviews), default=0.0)
+
+    @property
+    def avg_duration(self) -> float:
+        ran = [r for r in self.reviews if r.finished_at is not None and not r.skipped]
+        return sum(r.duration for r in ran) / len(ran) if ran else 0.0
+
+    def summary(self) -> str:
+        """Multi-line summary for the CLI."""
+        return "\n".join(
+            [
+                f"Reviewed {len(self.reviews)} PR(s) with concurrency {self.concurrency} "
+                f"in {self.wall_time:.1f}s",
+                f"  Succeeded: {len(self.completed)}, failed: {len(self.failed)}, "
+                f"skipped: {len(self.skipped)}",
+                f"  Throughput: {self.throughput_per_minute:.2f} reviews/min",
+                f"  Queue wait: avg {self.avg_queue_wait:.1f}s, "
+                f"max {self.max_queue_wait:.1f}s",
+                f"  Review duration: avg {self.avg_duration:.1f}s",
+            ]
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "wall_time_seconds": round(self.wall_time, 3),
+            "succeeded": len(self.completed),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+            "throughput_per_minute": round(self.throughput_per_minute, 3),
+            "avg_queue_wait_seconds": round(self.avg_queue_wait, 3),
+            "max_queue_wait_seconds": round(self.max_queue_wait, 3),
+            "avg_duration_seconds": round(self.avg_duration, 3),
+            "reviews": [r.to_dict() for r in self.reviews],
+        }
+
+
+class PRReviewQueue:
+    """
+    Bounded-concurrency queue of PR reviews.
+
+    Usage:
+        queue = PRReviewQueue(orchestrator.review_pr, concurrency=4,
+                              rate_limiter=RateLimiter.get_instance())
+        report = await queue.run([101, 102, 103])
+        print(report.summary())
+    """
+
+    def __init__(
+        self,
+        review_fn: Callable[[int], Awaitable[Any]],
+        concurrency: int = DEFAULT_REVIEW_CONCURRENCY,
+        rate_limiter: RateLimiter | None = None,
+        github_token_timeout: float | None = GITHUB_TOKEN_TIMEOUT,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            review_fn: Coroutine function reviewing one PR; its result is
+                treated as successful unless it has ``success = False``
+            concurrency: Maximum number of reviews running at once
+            rate_limiter: Shared limiter gating each review start
+            github_token_timeout: Max wait for a GitHub token per review
+        """
+        if concurrency <= 0:
+            raise ValueError(
+                f"Invalid concurrency: must be positive, got {concurrency}"
+            )
+        self.review_fn = review_fn
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.github_token_timeout = github_token_timeout
+
+    async def _admit(self, item: QueuedReview) -> bool:
+        """Check the shared limits before starting a review."""
+        if self.rate_limiter is None:
+            return True
+        available, message = self.rate_limiter.check_cost_available()
+        if not available:
+            item.skipped = True
+            item.error = message
+            return False
+        if not await self.rate_limiter.acquire_github(
+            timeout=self.github_token_timeout
+        ):
+            item.skipped = True
+            item.error = "Timed out waiting for GitHub rate limit"
+            return False
+        return True
+
+    async def _worker(self, queue: asyncio.Queue[QueuedReview]) -> None:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                if not await self._admit(item):
+                    safe_print(
+                        f"[ReviewQueue] Skipping PR #{item.pr_number}: {item.error}",
+                        flush=True,
+                    )
+                    continue
+
+                item.started_at = time.monotonic()
+                safe_print(
+                    f"[ReviewQueue] Starting PR #{item.pr_number} "
+                    f"(waited {item.queue_wait:.1f}s)",
+                    flush=True,
+                )
+                try:
+                    result = await self.review_fn(item.pr_number)
+                    item.success = bool(getattr(result, "success", True))
+                    if not item.success:
+                        item.error = getattr(result, "error", None)
+                except Exception as e:
+                    item.success = False
+                    item.error = f"{type(e).__name__}: {e}"
+                item.finished_at = time.monotonic()
+                safe_print(
+                    f"[ReviewQueue] Finished PR #{item.pr_number} in "
+                    f"{item.duration:.1f}s ({'ok' if item.success else 'failed'})",
+                    flush=True,
+                )
+            finally:
+                queue.task_done()
+
+    async def run(self, pr_numbers: list[int]) -> ReviewQueueReport:
+        """
+        Review all PRs and wait for the queue to drain.
+
+        Args:
+            pr_numbers: PRs to review (duplicates are reviewed once)
+
+        Returns:
+            Report with per-PR timings, latency and throughput
+        """
+        start = time.monotonic()
+        report = ReviewQueueReport(concurrency=self.concurrency)
+        queue: asyncio.Queue[QueuedReview] = asyncio.Queue()
+        for pr_number in dict.fromkeys(pr_numbers):
+            item = QueuedReview(pr_number=pr_number, enqueued_at=start)
+            report.reviews.append(item)
+            queue.put_nowait(item)
+
+        workers = min(self.concurrency, len(report.reviews))
+        await asyncio.gather(*(self._worker(queue) for _ in range(workers)))
+
+        report.wall_time = time.monotonic() - start
+        return report
@@ -0,0 +1,450 @@
+"""
+Sparse PR Review Worktrees
+==========================
+
+Partial checkouts for PR review worktrees.
+
+Reviewers mostly read the changed files, the files related to them and the
+repository's top-level configuration, yet a full ``git worktree add`` writes
+the entire tree for every review. In sparse mode the worktree is created
+with ``--no-checkout`` and a non-cone sparse-checkout containing only:
+
+- the PR's changed files
+- related files (imports, dependents, tests, configs) from the import graph
+  of the PR head commit
+- every file at the repository root (package.json, tsconfig.json, ...)
+
+Anything else is materialized lazily: ``LazySparseCheckout.pre_tool_use_hook``
+runs before the agents' Read/Grep/Glob tool calls and adds the paths they
+are about to touch to the sparse-checkout. A Grep over the whole repository
+without a file filter turns the sparse-checkout off, since it needs every
+file anyway. Shell commands (Bash) are not intercepted.
+
+Benchmark against a full checkout:
+    python sparse_worktree.py --project /path/to/repo --sha <commit> \\
+        --paths src/a.ts src/b.ts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import posixpath
+import re
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from core.git_executable import get_isolated_git_env
+
+logger = logging.getLogger(__name__)
+
+# Non-cone patterns selecting all files (but no directories) at the root
+TOP_LEVEL_FILE_PATTERNS = ("/*", "!/*/")
+
+# Characters with a meaning in gitignore-style patterns
+_PATTERN_SPECIAL = re.compile(r"([\\*?\[\]!#])")
+
+# Grep "type" filters mapped to file extensions
+GREP_TYPE_EXTENSIONS = {
+    "py": (".py", ".pyi"),
+    "js": (".js", ".jsx", ".mjs", ".cjs"),
+    "ts": (".ts", ".tsx", ".mts", ".cts"),
+    "go": (".go",),
+    "rust": (".rs",),
+    "java": (".java",),
+    "kotlin": (".kt", ".kts"),
+    "ruby": (".rb",),
+    "php": (".php",),
+    "css": (".css", ".scss"),
+    "html": (".html",),
+    "json": (".json",),
+    "md": (".md",),
+    "yaml": (".yml", ".yaml"),
+}
+
+
+def _git(
+    cwd: Path, args: list[str], input_text: str | None = None, timeout: float = 120
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        input=input_text,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=get_isolated_git_env(),
+    )
+
+
+def file_pattern(path: str) -> str:
+    """Sparse-checkout pattern matching exactly one repo-relative file."""
+    escaped = _PATTERN_SPECIAL.sub(r"\\\1", path.strip("/"))
+    if escaped.endswith(" "):
+        escaped = escaped[:-1] + "\\ "
+    return f"/{escaped}"
+
+
+def directory_pattern(path: str) -> str:
+    """Sparse-checkout pattern matching a directory recursively."""
+    return file_pattern(path) + "/"
+
+
+def sparse_patterns(files: Iterable[str], directories: Iterable[str] = ()) -> list[str]:
+    """Patterns for the top-level files plus the given files and directories."""
+    patterns = list(TOP_LEVEL_FILE_PATTERNS)
+    patterns.extend(file_pattern(f) for f in sorted(set(files)) if f.strip("/"))
+    patterns.extend(
+        directory_pattern(d) for d in sorted(set(directories)) if d.strip("/")
+    )
+    return patterns
+
+
+def apply_sparse_checkout(worktree_path: Path, files: Iterable[str]) -> None:
+    """
+    Restrict a ``--no-checkout`` worktree to the given files and check it out.
+
+    Args:
+        worktree_path: Worktree created with ``git worktree add --no-checkout``
+        files: Repo-relative files to materialize (top-level files always are)
+
+    Raises:
+        RuntimeError: If git fails
+    """
+    patterns = "\n".join(sparse_patterns(files)) + "\n"
+    result = _git(
+        worktree_path, ["sparse-checkout", "set", "--no-cone", "--stdin"], patterns
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to set sparse-checkout: {result.stderr.strip()}")
+    # Populate the index and write only the files inside the sparse-checkout
+    result = _git(worktree_path, ["read-tree", "-mu", "HEAD"])
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to check out sparse worktree: {result.stderr}")
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a Glob/Grep tool glob (``**``, ``*``, ``?``, ``{a,b}``)."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "{":
+            end = pattern.find("}", i)
+            if end > i:
+                options = pattern[i + 1 : end].split(",")
+                out.append("(?:" + "|".join(re.escape(o) for o in options) + ")")
+                i = end + 1
+                continue
+            out.append(re.escape(char))
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+class LazySparseCheckout:
+    """
+    Expands a sparse PR worktree on demand.
+
+    Usage:
+        sparse = LazySparseCheckout(worktree_path, initial_files)
+        sparse.ensure_paths(["src/other.ts"])
+        hooks = {"Read|Grep|Glob": [sparse.pre_tool_use_hook]}
+    """
+
+    def __init__(self, worktree_path: Path, files: Iterable[str] = ()):
+        self.worktree_path = Path(worktree_path).resolve()
+        self.files: set[str] = set(files)
+        self.directories: set[str] = set()
+        self.full = False
+        self.stats = {
+            "expansions": 0,
+            "files_added": 0,
+            "directories_added": 0,
+            "full_expansions": 0,
+        }
+        self._tracked: set[str] | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    @property
+    def tracked_files(self) -> set[str]:
+        """All files in the worktree's commit (checked out or not)."""
+        if self._tracked is None:
+            result = _git(self.worktree_path, ["ls-files", "-z"], timeout=60)
+            self._tracked = (
+                {p for p in result.stdout.split("\0") if p}
+                if result.returncode == 0
+                else set()
+            )
+        return self._tracked
+
+    def is_materialized(self, path: str) -> bool:
+        """Whether a repo-relative path is inside the sparse-checkout."""
+        if self.full or path in self.files or "/" not in path:
+            return True
+        parent = posixpath.dirname(path)
+        while parent:
+            if parent in self.directories:
+                return True
+            parent = posixpath.dirname(parent)
+        return False
+
+    def _relative(self, path: str | None) -> str | None:
+        """Repo-relative path for a tool path argument ("" for the root)."""
+        if not path:
+            return ""
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            candidate = self.worktree_path / candidate
+        try:
+            rel = Path(os.path.normpath(candidate)).relative_to(self.worktree_path)
+        except ValueError:
+            return None  # Outside the worktree
+        rel_posix = rel.as_posix()
+        return "" if rel_posix == "." else rel_posix
+
+    # ------------------------------------------------------------------
+    # Expansion
+    # ------------------------------------------------------------------
+
+    def _add(self, patterns: list[str]) -> bool:
+        result = _git(
+            self.worktree_path,
+            ["sparse-checkout", "add", "--stdin"],
+            "\n".join(patterns) + "\n",
+        )
+        if result.returncode != 0:
+            logger.warning(
+                f"[SparseWorktree] Could not expand sparse-checkout: {result.stderr}"
+            )
+            return False
+        self.stats["expansions"] += 1
+        return True
+
+    def ensure_paths(self, paths: Iterable[str]) -> list[str]:
+        """
+        Materialize tracked files that are not checked out yet.
+
+        Args:
+            paths: Repo-relative file paths
+
+        Returns:
+            The files that were added
+        """
+        with self._lock:
+            missing = sorted(
+                {
+                    p
+                    for p in paths
+                    if p in self.tracked_files and not self.is_materialized(p)
+                }
+            )
+            if not missing or not self._add([file_pattern(p) for p in missing]):
+                return []
+            self.files.update(missing)
+            self.stats["files_added"] += len(missing)
+            return missing
+
+    def ensure_directory(self, directory: str) -> bool:
+        """Materialize a directory recursively ("" means the whole tree)."""
+        with self._lock:
+            if self.full:
+                return False
+            if not directory:
+                result = _git(self.worktree_path, ["sparse-checkout", "disable"])
+                if result.returncode != 0:
+                    logger.warning(
+                        f"[SparseWorktree] Could not disable sparse-checkout: "
+                        f"{result.stderr}"
+                    )
+                    return False
+                self.full = True
+                self.stats["full_expansions"] += 1
+                return True
+            if self.is_materialized(f"{directory}/.") or not any(
+                f.startswith(f"{directory}/") for f in self.tracked_files
+            ):
+                return False
+            if not self._add([directory_pattern(directory)]):
+                return False
+            self.directories.add(directory)
+            self.stats["directories_added"] += 1
+            return True
+
+    def _matching(self, base: str, pattern: str, basename_only: bool) -> list[str]:
+        regex = _glob_to_regex(pattern)
+        prefix = f"{base}/" if base else ""
+        matches = []
+        for path in self.tracked_files:
+            if not path.startswith(prefix):
+                continue
+            rel = path[len(prefix) :]
+            target = posixpath.basename(rel) if basename_only else rel
+            if regex.match(target):
+                matches.append(path)
+        return matches
+
+    def ensure_for_tool(self, tool_name: str, tool_input: dict[str, Any]) -> None:
+        """Materialize whatever a Read/Grep/Glob call is about to look at."""
+        if self.full:
+            return
+        if tool_name == "Read":
+            rel = self._relative(tool_input.get("file_path"))
+            if rel:
+                self.ensure_paths([rel])
+            return
+
+        base = self._relative(tool_input.get("path"))
+        if base is None:
+            return
+        if base in self.tracked_files:
+            self.ensure_paths([base])
+            return
+
+        if tool_name == "Glob":
+            pattern = tool_input.get("pattern") or "**/*"
+            self.ensure_paths(self._matching(base, pattern, basename_only=False))
+        elif tool_name == "Grep":
+            file_glob = tool_input.get("glob")
+            extensions = GREP_TYPE_EXTENSIONS.get(tool_input.get("type") or "")
+            if file_glob:
+                self.ensure_paths(
+                    self._matching(base, file_glob, basename_only="/" not in file_glob)
+                )
+            elif extensions:
+                prefix = f"{base}/" if base else ""
+                self.ensure_paths(
+                    p
+                    for p in self.tracked_files
+                    if p.startswith(prefix) and p.endswith(extensions)
+                )
+            else:
+                self.ensure_directory(base)
+
+    async def pre_tool_use_hook(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        PreToolUse hook expanding the sparse-checkout before file reads.
+
+        Never blocks the tool call; if expansion fails the tool simply sees
+        the file as missing.
+        """
+        tool_input = input_data.get("tool_input")
+        if isinstance(tool_input, dict):
+            try:
+                await asyncio.to_thread(
+                    self.ensure_for_tool, input_data.get("tool_name", ""), tool_input
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"[SparseWorktree] Expansion failed: {e}")
+        return {}
+
+
+def _materialized_size(path: Path) -> tuple[int, int]:
+    files = 0
+    size = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for name in filenames:
+            if name == ".git":  # Worktree gitdir pointer
+                continue
+            try:
+                size += os.lstat(os.path.join(dirpath, name)).st_size
+                files += 1
+            except OSError:
+                continue
+    return files, size
+
+
+def benchmark(project_dir: Path, sha: str, paths: list[str]) -> dict:
+    """
+    Time a full worktree checkout against a sparse one for the same commit.
+
+    Args:
+        project_dir: Repository to create the worktrees from
+        sha: Commit to check out
+        paths: Files the sparse worktree should contain
+
+    Returns:
+        Seconds, materialized file count and bytes for both modes
+    """
+    base = project_dir / ".auto-claude" / "github" / "pr" / "sparse-benchmark"
+    base.mkdir(parents=True, exist_ok=True)
+    results = {}
+    for mode in ("full", "sparse"):
+        path = base / mode
+        start = time.perf_counter()
+        args = ["worktree", "add", "--detach"]
+        if mode == "sparse":
+            args.append("--no-checkout")
+        result = _git(project_dir, [*args, str(path), sha], timeout=600)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to create worktree: {result.stderr}")
+        try:
+            if mode == "sparse":
+                apply_sparse_checkout(path, paths)
+            seconds = time.perf_counter() - start
+            files, size = _materialized_size(path)
+            results[mode] = {
+                "seconds": round(seconds, 3),
+                "files": files,
+                "bytes": size,
+            }
+        finally:
+            _git(project_dir, ["worktree", "remove", "--force", str(path)])
+            shutil.rmtree(path, ignore_errors=True)
+    shutil.rmtree(base, ignore_errors=True)
+
+    full, sparse = results["full"], results["sparse"]
+    results["speedup"] = (
+        round(full["seconds"] / sparse["seconds"], 2) if sparse["seconds"] else None
+    )
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark sparse vs full PR worktree checkout"
+    )
+    parser.add_argument("--project", type=Path, default=Path.cwd())
+    parser.add_argument("--sha", default="HEAD", help="Commit to check out")
+    parser.add_argument(
+        "--paths", nargs="*", default=[], help="Files for the sparse worktree"
+    )
+    cli_args = parser.parse_args()
+    print(
+        json.dumps(
+            benchmark(cli_args.project.resolve(), cli_args.sha, cli_args.paths),
+            indent=2,
+        )
+    )
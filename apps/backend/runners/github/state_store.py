@@ -0,0 +1,507 @@
+"""
+GitHub Automation State Store
+=============================
+
+Single SQLite database (``state.db`` in the GitHub state directory) for the
+runner's record-style state:
+
+- Issue lifecycles (lifecycle.py)
+- Trust levels (trust.py)
+- Review outcomes (learning.py)
+- Reviewed PR commits (bot_detection.py)
+- Issue batches and the issue -> batch index (batch_issues.py)
+
+The database runs in WAL mode so readers never block the single writer and
+several runners can share it without file locks. Each record is stored as
+its ``to_dict()`` JSON next to the columns it is queried by, so lookups such
+as "all issues in state X" are index scans instead of parsing every file.
+
+The per-record JSON files used before are imported once, the first time the
+store is opened for a state directory. They are left in place.
+
+Usage:
+    store = get_state_store(Path(".auto-claude/github"))
+    store.save_lifecycle(lifecycle.to_dict())
+    building = store.list_lifecycles("owner/repo", state="building")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_DB_FILE = "state.db"
+
+# Seconds a writer waits for another process holding the write lock
+BUSY_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_lifecycles (
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    current_state TEXT NOT NULL,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (repo, issue_number)
+);
+CREATE INDEX IF NOT EXISTS idx_lifecycles_state
+    ON issue_lifecycles (repo, current_state);
+CREATE TABLE IF NOT EXISTS trust_states (
+    repo TEXT PRIMARY KEY,
+    current_level INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS review_outcomes (
+    review_id TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    prediction TEXT NOT NULL,
+    actual_outcome TEXT,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outcomes_repo
+    ON review_outcomes (repo, created_at);
+CREATE TABLE IF NOT EXISTS bot_reviews (
+    pr_key TEXT PRIMARY KEY,
+    reviewed_commits TEXT,
+    last_review_at TEXT
+);
+CREATE TABLE IF NOT EXISTS issue_batches (
+    batch_id TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    primary_issue INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_status ON issue_batches (status);
+CREATE TABLE IF NOT EXISTS batch_index (
+    issue_number INTEGER PRIMARY KEY,
+    batch_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batch_index_batch ON batch_index (batch_id);
+"""
+
+
+def _read_json(path: Path) -> Any:
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning(f"[StateStore] Skipping unreadable state file {path}: {e}")
+        return None
+
+
+class StateStore:
+    """
+    WAL-mode SQLite store for GitHub runner state.
+
+    Use get_state_store() to share one instance (and its per-thread
+    connections) per state directory within a process.
+    """
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.state_dir / STATE_DB_FILE
+        self._local = threading.local()
+        self._initialize()
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            is_new = not self.db_path.exists()
+            # Autocommit mode: transactions are opened explicitly below
+            conn = sqlite3.connect(
+                self.db_path, timeout=BUSY_TIMEOUT, isolation_level=None
+            )
+            if is_new:
+                try:
+                    # Trust and review history are not for other users
+                    os.chmod(self.db_path, 0o600)
+                except OSError:
+                    pass
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Write transaction holding the database write lock until it ends.
+
+        Use for read-modify-write sequences that must not interleave with
+        other runners.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        return self._connection().execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Schema and migration
+    # ------------------------------------------------------------------
+
+    def _initialize(self) -> None:
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+        migrations: dict[str, Callable[[sqlite3.Connection], int]] = {
+            "lifecycle": self._migrate_lifecycles,
+            "trust": self._migrate_trust,
+            "learning": self._migrate_outcomes,
+            "bot_detection": self._migrate_bot_state,
+            "batches": self._migrate_batches,
+        }
+        for name, migrate in migrations.items():
+            key = f"json_migrated:{name}"
+            if self._query("SELECT 1 FROM meta WHERE key = ?", (key,)):
+                continue
+            with self.transaction() as tx:
+                # Another runner may have migrated while we waited for the lock
+                if tx.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                    continue
+                count = migrate(tx)
+                tx.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, "1"))
+            if count:
+                logger.info(f"[StateStore] Imported {count} {name} records from JSON")
+
+    def _migrate_lifecycles(self, conn: sqlite3.Connection) -> int:
+        count = 0
+        for path in sorted((self.state_dir / "lifecycle").glob("*.json")):
+            data = _read_json(path)
+            if isinstance(data, dict) and "repo" in data and "issue_number" in data:
+                self._put_lifecycle(conn, data)
+                count += 1
+        return count
+
+    def _migrate_trust(self, conn: sqlite3.Connection) -> int:
+        count = 0
+        for path in sorted((self.state_dir / "trust").glob("*.json")):
+            data = _read_json(path)
+            if isinstance(data, dict) and "repo" in data:
+                self._put_trust(conn, data)
+                count += 1
+        return count
+
+    def _migrate_outcomes(self, conn: sqlite3.Connection) -> int:
+        count = 0
+        for path in sorted((self.state_dir / "learning").glob("*_outcomes.json")):
+            data = _read_json(path)
+            if not isinstance(data, dict):
+                continue
+            for item in data.get("outcomes", []):
+                if isinstance(item, dict) and "review_id" in item:
+                    self._put_outcome(conn, item)
+                    count += 1
+        return count
+
+    def _migrate_bot_state(self, conn: sqlite3.Connection) -> int:
+        data = _read_json(self.state_dir / "bot_detection_state.json")
+        if not isinstance(data, dict):
+            return 0
+        self._put_bot_state(conn, data)
+        return len(data.get("reviewed_commits", {}))
+
+    def _migrate_batches(self, conn: sqlite3.Connection) -> int:
+        batches_dir = self.state_dir / "batches"
+        count = 0
+        for path in sorted(batches_dir.glob("batch_*.json")):
+            data = _read_json(path)
+            if isinstance(data, dict) and "batch_id" in data:
+                self._put_batch(conn, data)
+                count += 1
+        index = _read_json(batches_dir / "index.json") if count else None
+        if isinstance(index, dict):
+            conn.executemany(
+                "INSERT OR REPLACE INTO batch_index (issue_number, batch_id) "
+                "VALUES (?, ?)",
+                [(int(k), v) for k, v in index.get("issue_to_batch", {}).items()],
+            )
+        return count
+
+    # ------------------------------------------------------------------
+    # Issue lifecycles
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _put_lifecycle(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO issue_lifecycles "
+            "(repo, issue_number, current_state, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                data["repo"],
+                data["issue_number"],
+                data.get("current_state", "new"),
+                data.get("updated_at"),
+                json.dumps(data),
+            ),
+        )
+
+    def get_lifecycle(self, repo: str, issue_number: int) -> dict[str, Any] | None:
+        rows = self._query(
+            "SELECT data FROM issue_lifecycles WHERE repo = ? AND issue_number = ?",
+            (repo, issue_number),
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def save_lifecycle(self, data: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._put_lifecycle(conn, data)
+
+    def update_lifecycle(
+        self,
+        repo: str,
+        issue_number: int,
+        update: Callable[[dict[str, Any] | None], dict[str, Any] | None],
+    ) -> None:
+        """
+        Atomically read, modify and write one lifecycle record.
+
+        Args:
+            repo: Repository
+            issue_number: Issue number
+            update: Receives the current record (None if missing) and returns
+                the record to store, or None to leave it unchanged
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM issue_lifecycles WHERE repo = ? AND issue_number = ?",
+                (repo, issue_number),
+            ).fetchone()
+            updated = update(json.loads(row[0]) if row else None)
+            if updated is not None:
+                self._put_lifecycle(conn, updated)
+
+    def list_lifecycles(
+        self, repo: str, state: str | None = None
+    ) -> list[dict[str, Any]]:
+        if state is None:
+            rows = self._query(
+                "SELECT data FROM issue_lifecycles WHERE repo = ? "
+                "ORDER BY issue_number",
+                (repo,),
+            )
+        else:
+            rows = self._query(
+                "SELECT data FROM issue_lifecycles "
+                "WHERE repo = ? AND current_state = ? ORDER BY issue_number",
+                (repo, state),
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def count_lifecycle_states(self, repo: str) -> dict[str, int]:
+        rows = self._query(
+            "SELECT current_state, COUNT(*) FROM issue_lifecycles "
+            "WHERE repo = ? GROUP BY current_state",
+            (repo,),
+        )
+        return dict(rows)
+
+    # ------------------------------------------------------------------
+    # Trust
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _put_trust(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO trust_states (repo, current_level, data) "
+            "VALUES (?, ?, ?)",
+            (data["repo"], data.get("current_level", 0), json.dumps(data)),
+        )
+
+    def get_trust(self, repo: str) -> dict[str, Any] | None:
+        rows = self._query("SELECT data FROM trust_states WHERE repo = ?", (repo,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def save_trust(self, data: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._put_trust(conn, data)
+
+    def list_trust(self) -> list[dict[str, Any]]:
+        rows = self._query("SELECT data FROM trust_states ORDER BY repo")
+        return [json.loads(row[0]) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Review outcomes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _put_outcome(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO review_outcomes "
+            "(review_id, repo, prediction, actual_outcome, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                data["review_id"],
+                data["repo"],
+                data["prediction"],
+                data.get("actual_outcome"),
+                data["created_at"],
+                json.dumps(data),
+            ),
+        )
+
+    def save_outcome(self, data: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._put_outcome(conn, data)
+
+    def list_outcomes(self, repo: str | None = None) -> list[dict[str, Any]]:
+        if repo is None:
+            rows = self._query("SELECT data FROM review_outcomes ORDER BY created_at")
+        else:
+            rows = self._query(
+                "SELECT data FROM review_outcomes WHERE repo = ? ORDER BY created_at",
+                (repo,),
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Bot detection
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _put_bot_state(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+        commits = data.get("reviewed_commits", {})
+        times = data.get("last_review_times", {})
+        conn.execute("DELETE FROM bot_reviews")
+        conn.executemany(
+            "INSERT INTO bot_reviews (pr_key, reviewed_commits, last_review_at) "
+            "VALUES (?, ?, ?)",
+            [
+                (
+                    str(key),
+                    json.dumps(commits[key]) if key in commits else None,
+                    times.get(key),
+                )
+                for key in {*commits, *times}
+            ],
+        )
+
+    def load_bot_state(self) -> dict[str, Any]:
+        """Reviewed commits and last review times keyed by PR number string."""
+        commits: dict[str, list[str]] = {}
+        times: dict[str, str] = {}
+        for key, reviewed, last_review in self._query(
+            "SELECT pr_key, reviewed_commits, last_review_at FROM bot_reviews"
+        ):
+            if reviewed is not None:
+                commits[key] = json.loads(reviewed)
+            if last_review is not None:
+                times[key] = last_review
+        return {"reviewed_commits": commits, "last_review_times": times}
+
+    def save_bot_state(self, data: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._put_bot_state(conn, data)
+
+    # ------------------------------------------------------------------
+    # Issue batches
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _put_batch(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO issue_batches "
+            "(batch_id, repo, primary_issue, status, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                data["batch_id"],
+                data["repo"],
+                data["primary_issue"],
+                data.get("status", "pending"),
+                data.get("created_at", ""),
+                json.dumps(data),
+            ),
+        )
+
+    def get_batch(self, batch_id: str) -> dict[str, Any] | None:
+        rows = self._query(
+            "SELECT data FROM issue_batches WHERE batch_id = ?", (batch_id,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def save_batch(self, data: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._put_batch(conn, data)
+
+    def list_batches(self, statuses: list[str] | None = None) -> list[dict[str, Any]]:
+        """Batches, newest first, optionally only those in the given statuses."""
+        if statuses:
+            placeholders = ", ".join("?" for _ in statuses)
+            rows = self._query(
+                f"SELECT data FROM issue_batches WHERE status IN ({placeholders}) "
+                "ORDER BY created_at DESC",
+                tuple(statuses),
+            )
+        else:
+            rows = self._query(
+                "SELECT data FROM issue_batches ORDER BY created_at DESC"
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def delete_batch(self, batch_id: str) -> None:
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM issue_batches WHERE batch_id = ?", (batch_id,))
+            conn.execute("DELETE FROM batch_index WHERE batch_id = ?", (batch_id,))
+
+    def load_batch_index(self) -> dict[int, str]:
+        return dict(self._query("SELECT issue_number, batch_id FROM batch_index"))
+
+    def save_batch_index(self, index: dict[int, str]) -> None:
+        """Add or move index entries (entries are removed by delete_batch)."""
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO batch_index (issue_number, batch_id) "
+                "VALUES (?, ?)",
+                [(int(k), v) for k, v in index.items()],
+            )
+
+
+_stores: dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(state_dir: Path) -> StateStore:
+    """Shared StateStore for a GitHub state directory (created on first use)."""
+    key = Path(state_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None or not store.db_path.exists():
+            store = StateStore(key)
+            _stores[key] = store
+        return store
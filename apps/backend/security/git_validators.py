@@ -235,7 +235,7 @@ def validate_git_commit_secrets(command_string: str) -> ValidationResult:
 
     # Import the secret scanner
     try:
-        from scan_secrets import get_staged_files, mask_secret, scan_files
+        from scan_secrets import get_staged_files, mask_secret, scan_diff, scan_files
     except ImportError:
         # Scanner not available, allow commit (don't break the build)
         return True, ""
@@ -245,7 +245,11 @@ def validate_git_commit_secrets(command_string: str) -> ValidationResult:
     if not staged_files:
         return True, ""  # No staged files, allow commit
 
-    matches = scan_files(staged_files, Path.cwd())
+    # Only scan the lines this commit adds; fall back to whole files if the
+    # staged diff can't be computed
+    matches = scan_diff(Path.cwd())
+    if matches is None:
+        matches = scan_files(staged_files, Path.cwd())
 
     if not matches:
         return True, ""  # No secrets found, allow commit
@@ -6,8 +6,13 @@ Secret Scanning Script for Auto-Build Framework
 Scans staged git files for potential secrets before commit.
 Designed to prevent accidental exposure of API keys, tokens, and credentials.
 
+With --diff, only the lines added by the staged changes (or, with --base,
+the lines added in the working tree since a base ref) are scanned, together
+with a few lines of context, so large files with small edits scan quickly.
+
 Usage:
     python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
+    python scan_secrets.py --diff [--base REF]
 
 Exit codes:
     0 - No secrets detected
@@ -16,6 +21,7 @@ Exit codes:
 """
 
 import argparse
+import ast
 import re
 import subprocess
 import sys
@@ -332,10 +338,23 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
 
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
     """Scan file content for potential secrets."""
+    return scan_lines(content.splitlines(), file_path)
+
+
+def scan_lines(
+    lines: list[str],
+    file_path: str,
+    line_numbers: set[int] | None = None,
+) -> list[SecretMatch]:
+    """Scan lines of a file (all of them, or only the given 1-based numbers)."""
     matches = []
-    lines = content.splitlines()
+    if line_numbers is None:
+        numbers = range(1, len(lines) + 1)
+    else:
+        numbers = sorted(n for n in line_numbers if 1 <= n <= len(lines))
 
-    for line_num, line in enumerate(lines, 1):
+    for line_num in numbers:
+        line = lines[line_num - 1]
         for pattern, pattern_name in ALL_PATTERNS:
             try:
                 for match in re.finditer(pattern, line, re.IGNORECASE):
@@ -424,6 +443,252 @@ def scan_files(
     return all_matches
 
 
+# =============================================================================
+# DIFF SCANNING
+# =============================================================================
+
+# Unchanged lines scanned on each side of added lines
+DIFF_CONTEXT_LINES = 2
+
+# How far to look for the start and end of a private key block
+MULTILINE_BLOCK_MAX_LINES = 200
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_BLOCK_START_RE = re.compile(r"-----BEGIN [A-Z0-9 ]+-----")
+_BLOCK_END_RE = re.compile(r"-----END [A-Z0-9 ]+-----")
+_BLOCK_BODY_RE = re.compile(r"^[A-Za-z0-9+/=]{16,}$")
+
+
+def _unquote_diff_path(path: str) -> str:
+    """Decode a path git quoted in diff headers (non-ASCII, quotes, tabs)."""
+    if len(path) >= 2 and path[0] == path[-1] == '"':
+        try:
+            return ast.literal_eval("b" + path).decode("utf-8", errors="replace")
+        except (ValueError, SyntaxError):
+            return path[1:-1]
+    return path
+
+
+def parse_added_lines(diff: str) -> dict[str, list[tuple[int, int]]]:
+    """
+    Parse a unified diff (as produced by git diff -U0) into added line ranges.
+
+    Returns:
+        Inclusive (first, last) line ranges in the new version, by file path
+    """
+    added: dict[str, list[tuple[int, int]]] = {}
+    current: str | None = None
+    old_remaining = new_remaining = 0
+
+    for line in diff.splitlines():
+        # Skip hunk content (added lines may themselves start with "+++")
+        if old_remaining or new_remaining:
+            if line.startswith("-"):
+                old_remaining -= 1
+            elif line.startswith("+"):
+                new_remaining -= 1
+            elif line.startswith(" "):
+                old_remaining -= 1
+                new_remaining -= 1
+            continue
+
+        if line.startswith("+++ "):
+            path = _unquote_diff_path(line[4:].rstrip("\t"))
+            current = path[2:] if path.startswith("b/") else None
+        elif line.startswith("@@") and current is not None:
+            match = _HUNK_HEADER_RE.match(line)
+            if not match:
+                continue
+            old_count, start, new_count = match.groups()
+            old_remaining = int(old_count) if old_count is not None else 1
+            new_remaining = int(new_count) if new_count is not None else 1
+            if new_remaining:
+                added.setdefault(current, []).append(
+                    (int(start), int(start) + new_remaining - 1)
+                )
+
+    return added
+
+
+def _run_git(args: list[str], project_dir: Path) -> str | None:
+    """Run a git command in project_dir; None if it fails."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def get_added_lines(
+    project_dir: Path | None = None,
+    base_ref: str | None = None,
+) -> dict[str, list[tuple[int, int]] | None] | None:
+    """
+    Get the lines added by the staged changes, or in the working tree since
+    base_ref.
+
+    Returns:
+        Added line ranges by file path; None for files that are entirely new
+        and untracked (base_ref only). None if git diff failed.
+    """
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    diff_args = [
+        "diff",
+        "-U0",
+        "--no-color",
+        "--no-ext-diff",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        "--diff-filter=ACMR",
+    ]
+    diff_args.append("--cached" if base_ref is None else base_ref)
+    diff = _run_git(diff_args, project_dir)
+    if diff is None:
+        return None
+
+    added: dict[str, list[tuple[int, int]] | None] = dict(parse_added_lines(diff))
+    if base_ref is not None:
+        untracked = _run_git(
+            ["ls-files", "--others", "--exclude-standard"], project_dir
+        )
+        for file_path in (untracked or "").splitlines():
+            if file_path.strip():
+                added[file_path.strip()] = None
+    return added
+
+
+def _find_block(lines: list[str], line_num: int) -> tuple[int, int] | None:
+    """The private key block (first, last line) that contains line_num, if any."""
+    line = lines[line_num - 1].strip()
+    start = None
+    if _BLOCK_START_RE.search(line):
+        start = line_num
+    elif _BLOCK_END_RE.search(line) or _BLOCK_BODY_RE.match(line):
+        # Look back for the start marker of the block
+        for n in range(line_num - 1, max(0, line_num - MULTILINE_BLOCK_MAX_LINES), -1):
+            previous = lines[n - 1]
+            if _BLOCK_START_RE.search(previous):
+                start = n
+                break
+            if _BLOCK_END_RE.search(previous):
+                break
+    if start is None:
+        return None
+
+    end = min(len(lines), start + MULTILINE_BLOCK_MAX_LINES)
+    for n in range(start + 1, end + 1):
+        if _BLOCK_END_RE.search(lines[n - 1]):
+            end = n
+            break
+    return start, end
+
+
+def diff_scan_window(
+    lines: list[str],
+    ranges: list[tuple[int, int]],
+    context_lines: int = DIFF_CONTEXT_LINES,
+) -> set[int]:
+    """
+    Line numbers to scan for the added line ranges of a file.
+
+    Each range is widened by context_lines. Added lines that start or sit
+    inside a private key block widen the window to the whole block, so the
+    BEGIN marker is scanned even when only the key body changed.
+    """
+    window: set[int] = set()
+    block: tuple[int, int] | None = None
+    for first, last in ranges:
+        last = min(last, len(lines))
+        window.update(
+            range(
+                max(1, first - context_lines), min(len(lines), last + context_lines) + 1
+            )
+        )
+        for line_num in range(first, last + 1):
+            if block and block[0] <= line_num <= block[1]:
+                continue
+            block = _find_block(lines, line_num)
+            if block:
+                window.update(range(block[0], block[1] + 1))
+    return window
+
+
+def _read_staged_file(project_dir: Path, file_path: str) -> str | None:
+    """Content of a file as staged in the index."""
+    return _run_git(["show", f":{file_path}"], project_dir)
+
+
+def scan_diff(
+    project_dir: Path | None = None,
+    base_ref: str | None = None,
+    files: list[str] | None = None,
+    context_lines: int = DIFF_CONTEXT_LINES,
+) -> list[SecretMatch] | None:
+    """
+    Scan only the lines added by the staged changes (or, with base_ref, in
+    the working tree since base_ref), plus context_lines around them.
+
+    Staged changes are scanned as they are in the index. Line numbers refer
+    to the scanned version of each file.
+
+    Args:
+        project_dir: Repository directory (defaults to the current directory)
+        base_ref: Compare the working tree with this ref instead of the index
+        files: Optional list of files to limit the scan to
+        context_lines: Unchanged lines to scan around added lines
+
+    Returns:
+        Matches found, or None if the diff could not be computed
+    """
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    added = get_added_lines(project_dir, base_ref)
+    if added is None:
+        return None
+
+    custom_ignores = load_secretsignore(project_dir)
+    only = set(files) if files is not None else None
+    all_matches = []
+
+    for file_path, ranges in added.items():
+        if only is not None and file_path not in only:
+            continue
+        if should_skip_file(file_path, custom_ignores):
+            continue
+
+        if base_ref is None:
+            content = _read_staged_file(project_dir, file_path)
+        else:
+            full_path = project_dir / file_path
+            if not full_path.is_file():
+                continue
+            try:
+                content = full_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+        if content is None:
+            continue
+
+        lines = content.splitlines()
+        window = (
+            None if ranges is None else diff_scan_window(lines, ranges, context_lines)
+        )
+        all_matches.extend(scan_lines(lines, file_path, window))
+
+    return all_matches
+
+
 # =============================================================================
 # OUTPUT FORMATTING
 # =============================================================================
@@ -510,6 +775,18 @@ def main() -> int:
     parser.add_argument(
         "--path", "-p", type=str, help="Scan a specific file or directory"
     )
+    parser.add_argument(
+        "--diff",
+        "-d",
+        action="store_true",
+        help="Only scan lines added by the staged changes (plus context)",
+    )
+    parser.add_argument(
+        "--base",
+        type=str,
+        metavar="REF",
+        help="With --diff, scan lines added in the working tree since REF",
+    )
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
@@ -519,6 +796,19 @@ def main() -> int:
 
     project_dir = Path.cwd()
 
+    if (args.diff or args.base) and not (args.path or args.all_files):
+        if not args.quiet and not args.json:
+            print("Scanning added lines for secrets...")
+        matches = scan_diff(project_dir, base_ref=args.base)
+        if matches is None:
+            print(f"{RED}Error: Could not compute git diff{NC}", file=sys.stderr)
+            return 2
+        if args.json:
+            print_json_results(matches)
+        elif matches or not args.quiet:
+            print_results(matches)
+        return 1 if matches else 0
+
     # Determine which files to scan
     if args.path:
         path = Path(args.path)
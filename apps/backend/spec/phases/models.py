@@ -19,5 +19,99 @@ class PhaseResult:
     retries: int
 
 
+@dataclass(frozen=True)
+class PhaseArtifacts:
+    """Spec directory files a phase reads (inputs) and writes (outputs)."""
+
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
+
+    def conflicts_with(self, earlier: "PhaseArtifacts") -> bool:
+        """True if this phase must wait for an earlier phase to finish.
+
+        That is the case when it reads what the earlier phase writes, writes
+        the same files, or writes what the earlier phase still reads.
+        """
+        return bool(
+            earlier.outputs & (self.inputs | self.outputs)
+            or self.outputs & earlier.inputs
+        )
+
+
+def _artifacts(inputs: tuple[str, ...], outputs: tuple[str, ...]) -> PhaseArtifacts:
+    return PhaseArtifacts(frozenset(inputs), frozenset(outputs))
+
+
+# Files each phase reads and writes. Agent phases also get the compaction
+# summaries of the phases that produced their inputs.
+PHASE_ARTIFACTS: dict[str, PhaseArtifacts] = {
+    "discovery": _artifacts((), ("project_index.json",)),
+    "requirements": _artifacts((), ("requirements.json",)),
+    "complexity_assessment": _artifacts(
+        ("requirements.json",), ("complexity_assessment.json",)
+    ),
+    "historical_context": _artifacts(("requirements.json",), ("graph_hints.json",)),
+    "research": _artifacts(("requirements.json",), ("research.json",)),
+    "context": _artifacts(("requirements.json",), ("context.json",)),
+    "spec_writing": _artifacts(
+        (
+            "project_index.json",
+            "requirements.json",
+            "graph_hints.json",
+            "research.json",
+            "context.json",
+        ),
+        ("spec.md",),
+    ),
+    "self_critique": _artifacts(
+        ("spec.md", "research.json"), ("spec.md", "critique_report.json")
+    ),
+    "planning": _artifacts(
+        ("project_index.json", "requirements.json", "context.json", "spec.md"),
+        ("implementation_plan.json",),
+    ),
+    # The validation fixer agent may edit any of the validated files
+    "validation": _artifacts(
+        (
+            "project_index.json",
+            "requirements.json",
+            "context.json",
+            "spec.md",
+            "implementation_plan.json",
+        ),
+        ("requirements.json", "context.json", "spec.md", "implementation_plan.json"),
+    ),
+    "quick_spec": _artifacts(
+        ("project_index.json", "requirements.json", "graph_hints.json"),
+        ("spec.md", "implementation_plan.json"),
+    ),
+}
+
+
+def get_phase_dependencies(phase_names: list[str]) -> dict[str, set[str]]:
+    """
+    Map each phase to the earlier phases in the list it has to wait for.
+
+    Phases keep the order of the list wherever their artifacts conflict, so
+    running them as soon as their dependencies are done gives the same files
+    as running the list in order. A phase without declared artifacts waits
+    for every earlier phase, and every later phase waits for it.
+    """
+    dependencies: dict[str, set[str]] = {}
+    names = list(dict.fromkeys(phase_names))
+    for i, name in enumerate(names):
+        artifacts = PHASE_ARTIFACTS.get(name)
+        dependencies[name] = set()
+        for earlier in names[:i]:
+            earlier_artifacts = PHASE_ARTIFACTS.get(earlier)
+            if (
+                artifacts is None
+                or earlier_artifacts is None
+                or artifacts.conflicts_with(earlier_artifacts)
+            ):
+                dependencies[name].add(earlier)
+    return dependencies
+
+
 # Maximum retry attempts for phase execution
 MAX_RETRIES = 3
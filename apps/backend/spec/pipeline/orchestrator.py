@@ -5,8 +5,9 @@ Spec Orchestrator
 Main orchestration logic for spec creation with dynamic complexity adaptation.
 """
 
+import asyncio
 import json
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 from analysis.analyzers import analyze_project
@@ -363,42 +364,43 @@ class SpecOrchestrator:
         print()
 
         phases_executed = ["discovery", "requirements", "complexity_assessment"]
+        known_phases = []
         for phase_name in phases_to_run:
             if phase_name not in all_phases:
                 print_status(f"Unknown phase: {phase_name}, skipping", "warning")
                 continue
+            known_phases.append(phase_name)
 
-            result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
-
-            # Store summary for subsequent phases (compaction)
-            if result.success:
-                await self._store_phase_summary(phase_name)
+        phase_results = await self._run_phase_graph(
+            known_phases,
+            lambda phase_name: run_phase(phase_name, all_phases[phase_name]),
+        )
+        results.extend(phase_results)
+        phases_executed.extend(r.phase for r in phase_results)
 
-            if not result.success:
+        failed = [r for r in phase_results if not r.success]
+        if failed:
+            for result in failed:
                 print()
                 print_status(
-                    f"Phase '{phase_name}' failed after {result.retries} retries",
+                    f"Phase '{result.phase}' failed after {result.retries} retries",
                     "error",
                 )
                 print(f"  {muted('Errors:')}")
                 for err in result.errors:
                     print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
-                print()
-                print_status(
-                    "Spec creation incomplete. Fix errors and retry.", "warning"
-                )
                 task_logger.log(
-                    f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
+                    f"Phase '{result.phase}' failed: {'; '.join(result.errors)}",
                     LogEntryType.ERROR,
                 )
-                task_logger.end_phase(
-                    LogPhase.PLANNING,
-                    success=False,
-                    message=f"Phase {phase_name} failed",
-                )
-                return False
+            print()
+            print_status("Spec creation incomplete. Fix errors and retry.", "warning")
+            task_logger.end_phase(
+                LogPhase.PLANNING,
+                success=False,
+                message=f"Phase {failed[0].phase} failed",
+            )
+            return False
 
         # Summary
         self._print_completion_summary(results, phases_executed)
@@ -411,6 +413,59 @@ class SpecOrchestrator:
         # === HUMAN REVIEW CHECKPOINT ===
         return self._run_review_checkpoint(auto_approve)
 
+    async def _run_phase_graph(
+        self,
+        phase_names: list[str],
+        run_phase: Callable[[str], Awaitable[phases.PhaseResult]],
+    ) -> list[phases.PhaseResult]:
+        """Run phases concurrently wherever their artifacts allow it.
+
+        Each phase starts once the phases it depends on (see
+        phases.get_phase_dependencies) have finished and their compaction
+        summaries are stored, so independent phases such as historical_context,
+        research and context overlap. After a failure no new phase is started;
+        phases already running are allowed to finish.
+
+        Args:
+            phase_names: Phases in the order they would run sequentially
+            run_phase: Async function running a phase by name
+
+        Returns:
+            Results of the phases that ran, in phase_names order
+        """
+        dependencies = phases.get_phase_dependencies(phase_names)
+        finished = {name: asyncio.Event() for name in dependencies}
+        phase_results: dict[str, phases.PhaseResult] = {}
+        failed = False
+
+        async def run_when_ready(phase_name: str) -> None:
+            nonlocal failed
+            try:
+                for dependency in dependencies[phase_name]:
+                    await finished[dependency].wait()
+                if failed:
+                    return
+                result = await run_phase(phase_name)
+                phase_results[phase_name] = result
+                if result.success:
+                    # Store summary for subsequent phases (compaction)
+                    await self._store_phase_summary(phase_name)
+            finally:
+                result = phase_results.get(phase_name)
+                if result is None or not result.success:
+                    failed = True
+                finished[phase_name].set()
+
+        outcomes = await asyncio.gather(
+            *(run_when_ready(name) for name in dependencies),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        return [phase_results[name] for name in dependencies if name in phase_results]
+
     async def _create_linear_task_if_enabled(self) -> None:
         """Create a Linear task if Linear integration is enabled."""
         from linear_updater import create_linear_task, is_linear_enabled
@@ -211,10 +211,76 @@ function getDefaultBranch(projectPath: string): string {
   }
 }
 
+// Where monorepo workspace members usually live (WORKSPACE_PARENTS in
+// apps/backend/core/workspace/dependency_sharing.py)
+const WORKSPACE_PARENTS = ['apps', 'packages', 'services'];
+
+const NODE_LOCKFILES = ['package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'bun.lockb', 'bun.lock'];
+
+/**
+ * Find the node_modules directories to share: the project root and every
+ * workspace member under apps/, packages/ and services/ with a package.json.
+ */
+function discoverNodeModulesLocations(projectPath: string): string[] {
+  const locations = ['node_modules'];
+  for (const parent of WORKSPACE_PARENTS) {
+    const parentPath = path.join(projectPath, parent);
+    let entries: string[];
+    try {
+      entries = readdirSync(parentPath).sort();
+    } catch {
+      continue;
+    }
+    for (const entry of entries) {
+      if (existsSync(path.join(parentPath, entry, 'package.json'))) {
+        locations.push(`${parent}/${entry}/node_modules`);
+      }
+    }
+  }
+  return locations;
+}
+
+/**
+ * Nearest lockfile for a node_modules location, walking up to the project
+ * root (workspace lockfiles are hoisted).
+ */
+function findNodeLockfile(projectPath: string, nodeModulesRel: string): string | null {
+  let current = path.posix.dirname(nodeModulesRel);
+  while (true) {
+    for (const name of NODE_LOCKFILES) {
+      const rel = current === '.' ? name : `${current}/${name}`;
+      if (existsSync(path.join(projectPath, rel))) {
+        return rel;
+      }
+    }
+    if (current === '.') {
+      return null;
+    }
+    current = path.posix.dirname(current);
+  }
+}
+
+function readFileOrNull(filePath: string): Buffer | null {
+  try {
+    return readFileSync(filePath);
+  } catch {
+    return null;
+  }
+}
+
 /**
- * Symlink node_modules from project root to worktree for TypeScript and tooling support.
+ * Symlink node_modules from the project to the worktree for TypeScript and tooling support.
  * This allows pre-commit hooks and IDE features to work without npm install in the worktree.
  *
+ * Mirrors the node_modules handling of apps/backend/core/workspace/dependency_sharing.py:
+ * - Locations are discovered (root + workspace members), not hardcoded
+ * - A location is only linked while the worktree's lockfile matches the main
+ *   project's, so an install in the worktree can't modify the main project's
+ *   dependencies
+ * - Existing directories and links in the worktree are never overwritten
+ *
+ * Keep the pre-commit hook check in .husky/pre-commit in sync.
+ *
  * @param projectPath - The main project directory
  * @param worktreePath - Path to the worktree
  * @returns Array of symlinked paths (relative to worktree)
@@ -222,45 +288,37 @@ function getDefaultBranch(projectPath: string): string {
 function symlinkNodeModulesToWorktree(projectPath: string, worktreePath: string): string[] {
   const symlinked: string[] = [];
 
-  // Node modules locations to symlink for TypeScript and tooling support.
-  // These are the standard locations for this monorepo structure.
-  //
-  // Design rationale:
-  // - Hardcoded paths are intentional for simplicity and reliability
-  // - Dynamic discovery (reading workspaces from package.json) would add complexity
-  //   and potential failure points without significant benefit
-  // - This monorepo uses npm workspaces with hoisting, so dependencies are primarily
-  //   in root node_modules with workspace-specific deps in apps/frontend/node_modules
-  //
-  // To add new workspace locations:
-  // 1. Add [sourceRelPath, targetRelPath] tuple below
-  // 2. Update the parallel Python implementation in apps/backend/core/workspace/setup.py
-  // 3. Update the pre-commit hook check in .husky/pre-commit if needed
-  const nodeModulesLocations = [
-    ['node_modules', 'node_modules'],
-    ['apps/frontend/node_modules', 'apps/frontend/node_modules'],
-  ];
-
-  for (const [sourceRel, targetRel] of nodeModulesLocations) {
-    const sourcePath = path.join(projectPath, sourceRel);
-    const targetPath = path.join(worktreePath, targetRel);
+  for (const rel of discoverNodeModulesLocations(projectPath)) {
+    const sourcePath = path.join(projectPath, rel);
+    const targetPath = path.join(worktreePath, rel);
 
     // Skip if source doesn't exist
     if (!existsSync(sourcePath)) {
-      debugLog('[TerminalWorktree] Skipping symlink - source does not exist:', sourceRel);
+      debugLog('[TerminalWorktree] Skipping symlink - source does not exist:', rel);
       continue;
     }
 
+    // Installed dependencies must match the worktree's lockfile
+    const lockfile = findNodeLockfile(projectPath, rel);
+    if (lockfile) {
+      const worktreeLockfile = readFileOrNull(path.join(worktreePath, lockfile));
+      const projectLockfile = readFileOrNull(path.join(projectPath, lockfile));
+      if (worktreeLockfile && projectLockfile && !worktreeLockfile.equals(projectLockfile)) {
+        debugLog('[TerminalWorktree] Skipping symlink -', lockfile, 'differs from project:', rel);
+        continue;
+      }
+    }
+
     // Skip if target already exists (don't overwrite existing node_modules)
     if (existsSync(targetPath)) {
-      debugLog('[TerminalWorktree] Skipping symlink - target already exists:', targetRel);
+      debugLog('[TerminalWorktree] Skipping symlink - target already exists:', rel);
       continue;
     }
 
     // Also skip if target is a symlink (even if broken)
     try {
       lstatSync(targetPath);
-      debugLog('[TerminalWorktree] Skipping symlink - target exists (possibly broken symlink):', targetRel);
+      debugLog('[TerminalWorktree] Skipping symlink - target exists (possibly broken symlink):', rel);
       continue;
     } catch {
       // Target doesn't exist at all - good, we can create symlink
@@ -278,20 +336,20 @@ function symlinkNodeModulesToWorktree(projectPath: string, worktreePath: string)
       // - Unix (macOS/Linux): Use relative paths for portability (worktree can be moved)
       if (process.platform === 'win32') {
         symlinkSync(sourcePath, targetPath, 'junction');
-        debugLog('[TerminalWorktree] Created junction (Windows):', targetRel, '->', sourcePath);
+        debugLog('[TerminalWorktree] Created junction (Windows):', rel, '->', sourcePath);
       } else {
         // On Unix, use relative symlinks for portability (matches Python implementation)
         const relativePath = path.relative(path.dirname(targetPath), sourcePath);
         symlinkSync(relativePath, targetPath);
-        debugLog('[TerminalWorktree] Created symlink (Unix):', targetRel, '->', relativePath);
+        debugLog('[TerminalWorktree] Created symlink (Unix):', rel, '->', relativePath);
       }
-      symlinked.push(targetRel);
+      symlinked.push(rel);
     } catch (error) {
       // Symlink creation can fail on some systems (e.g., FAT32 filesystem, or permission issues)
       // Log warning but don't fail - worktree is still usable, just without TypeScript checking
       // Note: This warning appears in dev console. Users may see TypeScript errors in pre-commit hooks.
-      debugError('[TerminalWorktree] Could not create symlink for', targetRel, ':', error);
-      console.warn(`[TerminalWorktree] Warning: Failed to link ${targetRel} - TypeScript checks may fail in this worktree`);
+      debugError('[TerminalWorktree] Could not create symlink for', rel, ':', error);
+      console.warn(`[TerminalWorktree] Warning: Failed to link ${rel} - TypeScript checks may fail in this worktree`);
     }
   }
 
@@ -670,3 +670,95 @@ class TestEdgeCases:
         result2 = discovery.discover(temp_dir)
 
         assert result1 is not result2
+
+
+# =============================================================================
+# PERSISTENT CACHE
+# =============================================================================
+
+
+def _age(root, seconds_ago):
+    """Set the mtime of everything under root (recently modified paths are never trusted)."""
+    import os
+    import time
+
+    mtime = time.time() - seconds_ago
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (mtime, mtime))
+
+
+class TestPersistentCache:
+    """Tests for CI configurations cached under .auto-claude/."""
+
+    WORKFLOW = "name: CI\non: push\njobs:\n  test:\n    runs-on: ubuntu-latest\n    steps:\n      - run: pytest --cov\n"
+
+    def _fail_parsing(self, monkeypatch):
+        def fail(self, path):
+            raise AssertionError(f"re-parsed {path}")
+
+        for name in ("_parse_github_actions", "_parse_gitlab_ci"):
+            monkeypatch.setattr(CIDiscovery, name, fail)
+
+    def test_new_instance_reuses_results(self, temp_dir, monkeypatch):
+        """Test that a new process reuses the parsed configuration."""
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(self.WORKFLOW)
+        _age(temp_dir, 100)
+
+        first = CIDiscovery().discover(temp_dir)
+        assert (temp_dir / ".auto-claude" / "ci_discovery_cache.json").exists()
+
+        self._fail_parsing(monkeypatch)
+        second = CIDiscovery().discover(temp_dir)
+
+        assert second is not first
+        assert CIDiscovery().to_dict(second) == CIDiscovery().to_dict(first)
+        assert second.coverage_command == "pytest --cov"
+
+    def test_new_workflow_file_invalidates(self, temp_dir):
+        """Test that adding a workflow file re-parses the workflows."""
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(self.WORKFLOW)
+        _age(temp_dir, 100)
+        CIDiscovery().discover(temp_dir)
+
+        (workflows / "e2e.yml").write_text("name: E2E\non: push\njobs:\n  e2e:\n    runs-on: ubuntu-latest\n    steps:\n      - run: npx playwright test\n")
+        _age(temp_dir, 50)
+        result = CIDiscovery().discover(temp_dir)
+
+        assert len(result.config_files) == 2
+        assert result.test_commands["e2e"] == "npx playwright test"
+
+    def test_edited_config_invalidates(self, temp_dir):
+        """Test that editing a CI file re-parses it."""
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - npm test\n")
+        _age(temp_dir, 100)
+        CIDiscovery().discover(temp_dir)
+
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - go test ./...\n")
+        _age(temp_dir, 50)
+        result = CIDiscovery().discover(temp_dir)
+
+        assert result.test_commands["unit"] == "go test ./..."
+
+    def test_higher_priority_ci_added(self, temp_dir):
+        """Test that a newly added higher-priority CI system is detected."""
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - npm test\n")
+        _age(temp_dir, 100)
+        assert CIDiscovery().discover(temp_dir).ci_system == "gitlab"
+
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(self.WORKFLOW)
+
+        assert CIDiscovery().discover(temp_dir).ci_system == "github_actions"
+
+    def test_use_cache_false(self, temp_dir):
+        """Test that the persistent cache can be disabled."""
+        (temp_dir / "Jenkinsfile").write_text("stage('Test') { sh 'pytest' }")
+
+        CIDiscovery(use_cache=False).discover(temp_dir)
+
+        assert not (temp_dir / ".auto-claude").exists()
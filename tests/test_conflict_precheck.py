@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched git conflict precheck.
+
+Tests cover:
+- Clean, conflicting and behind spec branches checked in one call
+- Reuse of cached (base SHA, spec SHA) results
+- Re-checking only branches that moved
+- Missing branches and unresolvable base branches
+- The merge flow's conflict check (core.workspace) using the cache
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.workspace import conflict_precheck
+from core.workspace.conflict_precheck import CACHE_FILE, check_git_conflicts_bulk
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> None:
+    for name, content in files.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(temp_git_repo: Path) -> Path:
+    _commit(
+        temp_git_repo,
+        {"shared.txt": "base\n", ".gitignore": f".auto-claude/{CACHE_FILE}\n"},
+        "Base",
+    )
+
+    _git(temp_git_repo, "checkout", "-q", "-b", "auto-claude/001-clean")
+    _commit(temp_git_repo, {"clean.txt": "clean\n"}, "Clean")
+
+    _git(temp_git_repo, "checkout", "-q", "main")
+    _git(temp_git_repo, "checkout", "-q", "-b", "auto-claude/002-conflict")
+    _commit(
+        temp_git_repo,
+        {"shared.txt": "spec\n", ".auto-claude/status.txt": "spec\n"},
+        "Conflict",
+    )
+
+    _git(temp_git_repo, "checkout", "-q", "main")
+    _commit(
+        temp_git_repo,
+        {"shared.txt": "main\n", ".auto-claude/status.txt": "main\n"},
+        "Main",
+    )
+    return temp_git_repo
+
+
+def _count_git_calls(project_dir: Path, **kwargs) -> tuple[dict, list[str]]:
+    calls = []
+    real_run_git = conflict_precheck.run_git
+
+    def counting_run_git(args, **kw):
+        calls.append(args[0])
+        return real_run_git(args, **kw)
+
+    with patch.object(conflict_precheck, "run_git", counting_run_git):
+        results = check_git_conflicts_bulk(project_dir, **kwargs)
+    return results, calls
+
+
+class TestConflictPrecheck:
+    """Tests for check_git_conflicts_bulk()."""
+
+    def test_checks_all_spec_branches(self, repo):
+        results = check_git_conflicts_bulk(repo)
+
+        assert sorted(results) == ["001-clean", "002-conflict"]
+        clean = results["001-clean"]
+        assert not clean["has_conflicts"]
+        assert clean["needs_rebase"] and clean["commits_behind"] == 1
+        assert clean["commits_ahead"] == 1
+        assert clean["base_branch"] == "main"
+        assert clean["spec_branch"] == "auto-claude/001-clean"
+
+        conflict = results["002-conflict"]
+        assert conflict["has_conflicts"]
+        # .auto-claude files never count as conflicts
+        assert conflict["conflicting_files"] == ["shared.txt"]
+        assert conflict["spec_commit"] == _git(
+            repo, "rev-parse", "auto-claude/002-conflict"
+        )
+
+    def test_cached_results_skip_git(self, repo):
+        first, _ = _count_git_calls(repo)
+
+        second, calls = _count_git_calls(repo)
+
+        assert calls == ["for-each-ref"]
+        assert second == first
+        assert (repo / ".auto-claude" / CACHE_FILE).exists()
+
+    def test_only_moved_branches_are_rechecked(self, repo):
+        check_git_conflicts_bulk(repo)
+        _git(repo, "checkout", "-q", "auto-claude/002-conflict")
+        _commit(repo, {"shared.txt": "main\n"}, "Resolve")
+        _git(repo, "checkout", "-q", "main")
+
+        results, calls = _count_git_calls(repo)
+
+        assert calls == ["for-each-ref", "merge-tree", "rev-list"]
+        assert not results["002-conflict"]["has_conflicts"]
+        assert results["001-clean"]["commits_behind"] == 1
+
+    def test_missing_branch_and_base(self, repo):
+        results = check_git_conflicts_bulk(repo, spec_names=["001-clean", "404"])
+
+        assert "error" not in results["001-clean"]
+        assert "not found" in results["404"]["error"]
+
+        results = check_git_conflicts_bulk(repo, base_branch="no-such-branch")
+
+        assert all("error" in r for r in results.values())
+
+    def test_explicit_base_branch(self, repo):
+        results = check_git_conflicts_bulk(
+            repo, spec_names=["002-conflict"], base_branch="auto-claude/001-clean"
+        )
+
+        result = results["002-conflict"]
+        assert not result["has_conflicts"]
+        assert result["base_branch"] == "auto-claude/001-clean"
+        assert result["commits_behind"] == 1
+
+    def test_auto_claude_only_conflicts(self, repo):
+        _git(repo, "checkout", "-q", "-b", "auto-claude/003-status", "main~1")
+        _commit(repo, {".auto-claude/status.txt": "spec\n"}, "Status")
+        _git(repo, "checkout", "-q", "main")
+
+        results = check_git_conflicts_bulk(repo)
+
+        assert not results["003-status"]["has_conflicts"]
+        assert results["003-status"]["auto_claude_conflicts_only"]
+        assert not results["002-conflict"]["auto_claude_conflicts_only"]
+        assert not results["001-clean"]["auto_claude_conflicts_only"]
+
+
+class TestMergeConflictCheck:
+    """Tests for core.workspace._check_git_conflicts() on top of the precheck."""
+
+    def test_uses_cached_precheck(self, repo):
+        from core.workspace import _check_git_conflicts
+
+        first = _check_git_conflicts(repo, "002-conflict")
+        with patch.object(
+            conflict_precheck, "run_git", wraps=conflict_precheck.run_git
+        ) as run_git:
+            second = _check_git_conflicts(repo, "002-conflict")
+
+        assert first["has_conflicts"]
+        assert first["conflicting_files"] == ["shared.txt"]
+        assert first["needs_rebase"] and first["commits_behind"] == 1
+        assert not first.get("diverged_but_no_conflicts")
+        assert [c.args[0][0] for c in run_git.call_args_list] == ["for-each-ref"]
+        assert second == first
+
+    def test_auto_claude_only_conflicts_are_copied(self, repo):
+        from core.workspace import _check_git_conflicts
+
+        _git(repo, "checkout", "-q", "-b", "auto-claude/003-status", "main~1")
+        _commit(repo, {".auto-claude/status.txt": "spec\n"}, "Status")
+        _git(repo, "checkout", "-q", "main")
+
+        result = _check_git_conflicts(repo, "003-status")
+
+        assert not result["has_conflicts"]
+        assert result["diverged_but_no_conflicts"]
+
+    def test_missing_branch_returns_defaults(self, repo):
+        from core.workspace import _check_git_conflicts
+
+        result = _check_git_conflicts(repo, "404")
+
+        assert not result["has_conflicts"]
+        assert not result["needs_rebase"]
+        assert result["commits_behind"] == 0
+        assert "error" not in result
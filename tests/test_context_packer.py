@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for token-budgeted context packing.
+
+Tests cover:
+- Token estimation
+- Greedy relevance-ordered packing with truncation
+- Packing a TaskContext from ContextBuilder
+- Packing subtask file context for the coder prompt
+- Per-phase context budgets from phase_config
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from context.models import TaskContext
+from context.packer import (
+    ContextFragment,
+    ContextPacker,
+    estimate_tokens,
+    pack_task_context,
+)
+from context.serialization import serialize_context
+from phase_config import DEFAULT_CONTEXT_TOKEN_BUDGETS, get_context_token_budget
+from prompts_pkg.prompt_generator import pack_subtask_context
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens."""
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_rounds_up(self):
+        assert estimate_tokens("abcde") == 2
+        assert estimate_tokens("a" * 400) == 100
+
+
+class TestContextPacker:
+    """Tests for ContextPacker."""
+
+    def test_keeps_most_relevant_within_budget(self):
+        fragments = [
+            ContextFragment("file_to_reference", "low.py", "x" * 400, relevance=1),
+            ContextFragment("file_to_modify", "high.py", "y" * 400, relevance=9),
+            ContextFragment("pattern", "mid", "z" * 400, relevance=5),
+        ]
+
+        kept, report = ContextPacker(220).pack(fragments)
+
+        assert [f.key for f in kept] == ["high.py", "mid"]
+        assert report.used_tokens == 200
+        assert [d["key"] for d in report.dropped] == ["low.py"]
+        assert report.dropped_tokens == 100
+
+    def test_smaller_fragment_fills_remaining_budget(self):
+        fragments = [
+            ContextFragment("a", "big", "x" * 800, relevance=5),
+            ContextFragment("a", "small", "x" * 40, relevance=1),
+        ]
+
+        kept, report = ContextPacker(50).pack(fragments)
+
+        assert [f.key for f in kept] == ["small"]
+        assert len(report.dropped) == 1
+
+    def test_truncates_truncatable_fragment(self):
+        content = "\n".join(f"line {i:04d}" for i in range(200))
+        fragments = [ContextFragment("pattern", "p", content, truncatable=True)]
+
+        kept, report = ContextPacker(100).pack(fragments)
+
+        assert len(kept) == 1
+        assert kept[0].tokens <= 100
+        assert kept[0].content.endswith("(truncated to fit context budget)")
+        assert report.truncated[0]["original_tokens"] == fragments[0].tokens
+
+    def test_preserves_original_order(self):
+        fragments = [
+            ContextFragment("a", "first", "x", relevance=1),
+            ContextFragment("a", "second", "x", relevance=3),
+            ContextFragment("a", "third", "x", relevance=2),
+        ]
+
+        kept, _ = ContextPacker(100).pack(fragments)
+
+        assert [f.key for f in kept] == ["first", "second", "third"]
+
+    def test_report_formatting(self):
+        fragments = [
+            ContextFragment("file_to_modify", "keep.py", "x" * 40, relevance=2),
+            ContextFragment("file_to_modify", "drop.py", "x" * 400, relevance=1),
+        ]
+
+        _, report = ContextPacker(20).pack(fragments)
+
+        assert "kept 1 fragment(s)" in report.summary()
+        assert "dropped 1" in report.summary()
+        detail = report.format_detail()
+        assert "+ [file_to_modify] keep.py" in detail
+        assert "- [file_to_modify] drop.py" in detail
+
+
+class TestPackTaskContext:
+    """Tests for pack_task_context."""
+
+    def _context(self):
+        return TaskContext(
+            task_description="Add retry",
+            scoped_services=["api"],
+            files_to_modify=[
+                {
+                    "path": "api/retry.py",
+                    "service": "api",
+                    "reason": "Likely to modify",
+                    "relevance_score": 10,
+                    "matching_lines": [(1, "def retry():")],
+                }
+            ],
+            files_to_reference=[
+                {
+                    "path": f"api/ref_{i}.py",
+                    "service": "api",
+                    "reason": "Related",
+                    "relevance_score": i,
+                    "matching_lines": [],
+                }
+                for i in range(1, 6)
+            ],
+            patterns_discovered={
+                "retry_pattern": "From api/ref_5.py:\n" + "x = 1\n" * 50,
+            },
+            service_contexts={},
+            graph_hints=[{"content": "use backoff", "score": 0.1, "type": "gotcha"}],
+        )
+
+    def test_unbounded_budget_keeps_everything(self):
+        packed, report = pack_task_context(self._context(), 100_000)
+
+        assert len(packed.files_to_reference) == 5
+        assert packed.patterns_discovered.keys() == {"retry_pattern"}
+        assert len(packed.graph_hints) == 1
+        assert report.dropped == []
+
+    def test_tight_budget_drops_least_relevant(self):
+        packed, report = pack_task_context(self._context(), 30)
+
+        assert [f["path"] for f in packed.files_to_modify] == ["api/retry.py"]
+        assert packed.graph_hints == []
+        assert report.used_tokens <= 30
+        assert packed.packing_report["budget_tokens"] == 30
+
+    def test_serialized_context_includes_report(self):
+        packed, _ = pack_task_context(self._context(), 50)
+
+        result = serialize_context(packed)
+
+        assert result["packing"]["budget_tokens"] == 50
+        json.dumps(result)
+
+    def test_unpacked_context_has_no_report(self):
+        assert "packing" not in serialize_context(self._context())
+
+
+class TestPackSubtaskContext:
+    """Tests for pack_subtask_context."""
+
+    def test_files_to_modify_rank_above_patterns(self):
+        context = {
+            "patterns": {"pattern.py": "p" * 400},
+            "files_to_modify": {"target.py": "t" * 400},
+            "spec_excerpt": None,
+        }
+
+        packed, report = pack_subtask_context(context, 110)
+
+        assert packed["files_to_modify"] == {"target.py": "t" * 400}
+        assert packed["patterns"] == {}
+        assert packed["spec_excerpt"] is None
+        assert report.dropped[0]["key"] == "pattern.py"
+
+    def test_more_patterns_than_files_to_modify(self):
+        context = {
+            "patterns": {f"p{i}.py": "p" * 1700 for i in range(5)},
+            "files_to_modify": {"a.py": "a" * 1700},
+            "spec_excerpt": None,
+        }
+
+        packed, _report = pack_subtask_context(context, 1100)
+
+        assert packed["files_to_modify"] == {"a.py": "a" * 1700}
+        assert list(packed["patterns"]) == ["p0.py", "p1.py"]
+
+
+class TestContextTokenBudget:
+    """Tests for get_context_token_budget."""
+
+    def test_default(self, tmp_path):
+        assert get_context_token_budget(tmp_path, "coding") == (
+            DEFAULT_CONTEXT_TOKEN_BUDGETS["coding"]
+        )
+
+    @pytest.mark.parametrize(
+        ("configured", "expected"),
+        [
+            (5000, 5000),
+            ({"coding": 7000}, 7000),
+            ({"qa": 7000}, DEFAULT_CONTEXT_TOKEN_BUDGETS["coding"]),
+            (-1, DEFAULT_CONTEXT_TOKEN_BUDGETS["coding"]),
+            ("big", DEFAULT_CONTEXT_TOKEN_BUDGETS["coding"]),
+        ],
+    )
+    def test_metadata_override(self, tmp_path, configured, expected):
+        (tmp_path / "task_metadata.json").write_text(
+            json.dumps({"contextTokenBudget": configured})
+        )
+
+        assert get_context_token_budget(tmp_path, "coding") == expected
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tests for sharing dependency directories into worktrees.
+
+Tests cover:
+- Workspace root discovery (project index, monorepo members)
+- Symlinking installed dependencies, including hoisted lockfiles
+- Hardlink farm strategy (never for virtualenvs)
+- Lockfile conflict detection and unsharing of links created here only
+- Reflink timeout
+- Skipping existing directories and editable virtualenvs
+- Disk usage reporting
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core.workspace import dependency_sharing
+from core.workspace.dependency_sharing import (
+    SHARED_RECORD_FILE,
+    STRATEGY_ENV_VAR,
+    ShareStrategy,
+    discover_workspace_roots,
+    share_dependencies_to_worktree,
+)
+
+
+def _write(root: Path, rel_path: str, content: str = "") -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path, monkeypatch) -> tuple[Path, Path]:
+    """An npm workspace monorepo with a Python service, and its worktree."""
+    monkeypatch.delenv(STRATEGY_ENV_VAR, raising=False)
+    project = tmp_path / "project"
+    worktree = tmp_path / "worktree"
+    for root in (project, worktree):
+        _write(root, "package.json", '{"workspaces": ["apps/*"]}')
+        _write(root, "package-lock.json", '{"lockfileVersion": 3}')
+        _write(root, "apps/web/package.json", '{"name": "web"}')
+        _write(root, "services/api/requirements.txt", "flask==3.0\n")
+    _write(project, "node_modules/react/index.js", "module.exports = {};\n")
+    _write(project, "apps/web/node_modules/vite/index.js", "x" * 100)
+    _write(project, "services/api/.venv/pyvenv.cfg", "home = /usr/bin\n")
+    return project, worktree
+
+
+class TestDiscovery:
+    """Tests for workspace root discovery."""
+
+    def test_roots_from_index_and_workspace_parents(self, monorepo):
+        project, _ = monorepo
+        _write(
+            project,
+            ".auto-claude/project_index.json",
+            json.dumps(
+                {
+                    "services": {
+                        "api": {"path": str(project / "services" / "api")},
+                        "elsewhere": {"path": "/some/other/checkout"},
+                    }
+                }
+            ),
+        )
+
+        roots = discover_workspace_roots(project)
+
+        assert roots == [Path("."), Path("services/api"), Path("apps/web")]
+
+
+class TestShareDependencies:
+    """Tests for share_dependencies_to_worktree."""
+
+    def test_symlinks_dependencies(self, monorepo):
+        project, worktree = monorepo
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert sorted(dep.path for dep in report.shared) == [
+            "apps/web/node_modules",
+            "node_modules",
+            "services/api/.venv",
+        ]
+        for dep in report.shared:
+            target = worktree / dep.path
+            assert target.is_symlink()
+            assert target.resolve() == (project / dep.path).resolve()
+            assert dep.strategy == "symlink"
+        # Hoisted lockfile is used for the workspace member
+        web = next(d for d in report.shared if d.path == "apps/web/node_modules")
+        assert web.lockfile == "package-lock.json"
+        assert web.bytes_saved == 100
+        assert web.files == 1
+        assert report.bytes_saved > 100
+        assert "not duplicated" in report.summary()
+        assert (worktree / SHARED_RECORD_FILE).exists()
+
+    def test_venv_without_index_is_found_via_services_dir(self, monorepo):
+        project, worktree = monorepo
+
+        share_dependencies_to_worktree(project, worktree)
+
+        assert (worktree / "services/api/.venv").is_symlink()
+
+    def test_hardlink_farm(self, monorepo):
+        project, worktree = monorepo
+
+        report = share_dependencies_to_worktree(
+            project, worktree, strategy=ShareStrategy.HARDLINK
+        )
+
+        target = worktree / "node_modules" / "react" / "index.js"
+        assert not (worktree / "node_modules").is_symlink()
+        assert os.path.samefile(target, project / "node_modules/react/index.js")
+        assert {dep.strategy for dep in report.shared} == {"hardlink"}
+        # Virtualenv files are rewritten in place, a hardlink would reach main
+        assert "services/api/.venv" in report.skipped
+        assert not (worktree / "services/api/.venv").exists()
+
+    def test_hardlink_farm_is_unshared(self, monorepo):
+        project, worktree = monorepo
+        share_dependencies_to_worktree(
+            project, worktree, strategy=ShareStrategy.HARDLINK
+        )
+        _write(worktree, "package-lock.json", '{"lockfileVersion": 3, "y": 2}')
+
+        report = share_dependencies_to_worktree(
+            project, worktree, strategy=ShareStrategy.HARDLINK
+        )
+
+        assert all(c.unshared for c in report.conflicts)
+        assert not (worktree / "node_modules").exists()
+        assert (project / "node_modules/react/index.js").exists()
+
+    def test_lockfile_conflict_is_not_shared(self, monorepo):
+        project, worktree = monorepo
+        _write(worktree, "package-lock.json", '{"lockfileVersion": 3, "x": 1}')
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert {c.path for c in report.conflicts} == {
+            "node_modules",
+            "apps/web/node_modules",
+        }
+        assert not (worktree / "node_modules").exists()
+
+    def test_lockfile_change_unshares(self, monorepo):
+        project, worktree = monorepo
+        share_dependencies_to_worktree(project, worktree)
+
+        # The agent adds a package in the worktree
+        _write(worktree, "package-lock.json", '{"lockfileVersion": 3, "y": 2}')
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert {c.path for c in report.conflicts} == {
+            "node_modules",
+            "apps/web/node_modules",
+        }
+        assert all(c.unshared for c in report.conflicts)
+        assert not (worktree / "node_modules").exists()
+        # The main project's dependencies are untouched
+        assert (project / "node_modules/react/index.js").exists()
+
+    def test_replaced_link_is_not_removed(self, monorepo):
+        project, worktree = monorepo
+        share_dependencies_to_worktree(project, worktree)
+        # The user installed into a real directory in place of the link
+        (worktree / "node_modules").unlink()
+        _write(worktree, "node_modules/own/index.js")
+        _write(worktree, "package-lock.json", '{"lockfileVersion": 3, "y": 2}')
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        conflict = next(c for c in report.conflicts if c.path == "node_modules")
+        assert not conflict.unshared
+        assert (worktree / "node_modules/own/index.js").exists()
+
+    def test_reflink_timeout(self, tmp_path, monkeypatch):
+        def hang(*args, **kwargs):
+            raise subprocess.TimeoutExpired(args[0], kwargs["timeout"])
+
+        monkeypatch.setattr(
+            dependency_sharing, "_reflink_command", lambda src, dst: ["cp"]
+        )
+        monkeypatch.setattr(dependency_sharing.subprocess, "run", hang)
+        source = tmp_path / "target"
+        source.mkdir()
+
+        with pytest.raises(OSError, match="timed out"):
+            dependency_sharing._reflink_tree(source, tmp_path / "clone")
+
+    def test_existing_directories_are_kept(self, monorepo):
+        project, worktree = monorepo
+        _write(worktree, "node_modules/own/index.js")
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert not (worktree / "node_modules").is_symlink()
+        assert report.skipped["node_modules"] == "already exists in worktree"
+
+    def test_rerun_keeps_record(self, monorepo):
+        project, worktree = monorepo
+        share_dependencies_to_worktree(project, worktree)
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert len(report.shared) == 3
+        assert report.skipped == {}
+
+    def test_editable_venv_is_skipped(self, monorepo):
+        project, worktree = monorepo
+        _write(
+            project,
+            "services/api/.venv/lib/python3.12/site-packages/__editable__.api.pth",
+            str(project / "services" / "api"),
+        )
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert "services/api/.venv" in report.skipped
+        assert not (worktree / "services/api/.venv").exists()
+
+    def test_disabled_by_env(self, monorepo, monkeypatch):
+        project, worktree = monorepo
+        monkeypatch.setenv(STRATEGY_ENV_VAR, "off")
+
+        report = share_dependencies_to_worktree(project, worktree)
+
+        assert report.shared == []
+        assert not (worktree / "node_modules").exists()
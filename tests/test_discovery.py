@@ -576,3 +576,133 @@ class TestEdgeCases:
         result2 = discovery.discover(temp_dir)
 
         assert result1 is not result2
+
+
+# =============================================================================
+# PERSISTENT CACHE
+# =============================================================================
+
+
+def _age(root, seconds_ago):
+    """Set the mtime of everything under root (recently modified paths are never trusted)."""
+    import os
+    import time
+
+    mtime = time.time() - seconds_ago
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (mtime, mtime))
+
+
+class TestPersistentCache:
+    """Tests for detector results cached under .auto-claude/."""
+
+    def _count_calls(self, monkeypatch, method_name):
+        calls = []
+        original = getattr(TestDiscovery, method_name)
+
+        def counting(self, *args, **kwargs):
+            calls.append(method_name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(TestDiscovery, method_name, counting)
+        return calls
+
+    def test_new_instance_reuses_results(self, temp_dir, monkeypatch):
+        """Test that a new process reuses the results without re-running detectors."""
+        pkg = {"devDependencies": {"jest": "^29.0.0"}}
+        (temp_dir / "package.json").write_text(json.dumps(pkg))
+        (temp_dir / "tests").mkdir()
+        (temp_dir / "tests" / "test_main.py").write_text("def test_x(): pass")
+        # Projects already have it; creating it changes the root directory
+        (temp_dir / ".auto-claude").mkdir()
+        _age(temp_dir, 100)
+
+        first = TestDiscovery().discover(temp_dir)
+        assert (temp_dir / ".auto-claude" / "test_discovery_cache.json").exists()
+
+        js_calls = self._count_calls(monkeypatch, "_discover_js_frameworks")
+        walks = self._count_calls(monkeypatch, "_walk_test_tree")
+        second = TestDiscovery().discover(temp_dir)
+
+        assert js_calls == []
+        assert walks == []
+        assert TestDiscovery().to_dict(second) == TestDiscovery().to_dict(first)
+
+    def test_only_invalidated_detectors_rerun(self, temp_dir, monkeypatch):
+        """Test that changing one manifest re-runs only its detector."""
+        pkg = {"devDependencies": {"jest": "^29.0.0"}}
+        (temp_dir / "package.json").write_text(json.dumps(pkg))
+        (temp_dir / "Gemfile").write_text("gem 'minitest'\n")
+        _age(temp_dir, 100)
+        TestDiscovery().discover(temp_dir)
+
+        (temp_dir / "Gemfile").write_text("gem 'rspec'\n")
+        _age(temp_dir, 50)
+        js_calls = self._count_calls(monkeypatch, "_discover_js_frameworks")
+        ruby_calls = self._count_calls(monkeypatch, "_discover_ruby_frameworks")
+        result = TestDiscovery().discover(temp_dir)
+
+        assert js_calls == []
+        assert len(ruby_calls) == 1
+        assert [f.name for f in result.frameworks] == ["jest", "rspec"]
+
+    def test_touched_file_with_same_content_is_reused(self, temp_dir, monkeypatch):
+        """Test that an mtime change without a content change keeps the result."""
+        (temp_dir / "requirements.txt").write_text("pytest\n")
+        _age(temp_dir, 100)
+        TestDiscovery().discover(temp_dir)
+
+        _age(temp_dir, 50)
+        calls = self._count_calls(monkeypatch, "_discover_python_frameworks")
+        result = TestDiscovery().discover(temp_dir)
+
+        assert calls == []
+        assert result.frameworks[0].name == "pytest"
+
+    def test_new_test_file_invalidates_tree(self, temp_dir):
+        """Test that adding a test file is seen after a cached 'no tests' result."""
+        (temp_dir / "src").mkdir()
+        _age(temp_dir, 100)
+        assert TestDiscovery().discover(temp_dir).has_tests is False
+
+        (temp_dir / "src" / "app.test.js").write_text("test('x', () => {})")
+        _age(temp_dir, 50)
+
+        assert TestDiscovery().discover(temp_dir).has_tests is True
+
+    def test_deleted_test_file_invalidates_tree(self, temp_dir):
+        """Test that removing the only test file is seen."""
+        (temp_dir / "test_app.py").write_text("def test_x(): pass")
+        _age(temp_dir, 100)
+        assert TestDiscovery().discover(temp_dir).has_tests is True
+
+        (temp_dir / "test_app.py").unlink()
+        _age(temp_dir, 50)
+
+        assert TestDiscovery().discover(temp_dir).has_tests is False
+
+    def test_skipped_directories_are_not_searched(self, discovery, temp_dir):
+        """Test that dependencies and metadata directories don't count as tests."""
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "node_modules" / "pkg" / "index.test.js").write_text("")
+
+        assert discovery.discover(temp_dir).has_tests is False
+
+    def test_rspec_files_only_in_spec_directory(self, discovery, temp_dir):
+        """Test that *_spec.rb files count only inside spec/."""
+        (temp_dir / "lib").mkdir()
+        (temp_dir / "lib" / "user_spec.rb").write_text("")
+        assert discovery.discover(temp_dir).has_tests is False
+
+        (temp_dir / "spec" / "models").mkdir(parents=True)
+        (temp_dir / "spec" / "models" / "user_spec.rb").write_text("")
+        discovery.clear_cache()
+        assert discovery.discover(temp_dir).has_tests is True
+
+    def test_use_cache_false(self, temp_dir):
+        """Test that the persistent cache can be disabled."""
+        (temp_dir / "requirements.txt").write_text("pytest\n")
+
+        TestDiscovery(use_cache=False).discover(temp_dir)
+
+        assert not (temp_dir / ".auto-claude").exists()
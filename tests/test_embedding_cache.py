@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the embedding cache and batcher.
+
+Tests cover:
+- Vectors reused across embedder instances through the SQLite store
+- Concurrent requests coalesced into provider-sized batches
+- In-flight deduplication of identical texts
+- Cache namespaces per provider, model and dimension
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from graphiti_config import GraphitiConfig
+from integrations.graphiti.providers_pkg import embedding_cache
+from integrations.graphiti.providers_pkg.embedding_cache import (
+    CachedEmbedder,
+    EmbeddingStore,
+)
+
+
+class FakeEmbedder:
+    """Deterministic embedder that counts provider calls."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[str]] = []
+        self.fail = fail
+        self.config = "fake-config"
+
+    @staticmethod
+    def vector(text: str) -> list[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 997) / 7]
+
+    async def create(self, input_data):
+        self.batches.append(["create", input_data])
+        return self.vector(" ".join(input_data))
+
+    async def create_batch(self, input_data_list):
+        await asyncio.sleep(0)
+        self.batches.append(list(input_data_list))
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [self.vector(text) for text in input_data_list]
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    store = EmbeddingStore(tmp_path / ".embedding_cache.sqlite")
+    yield store
+    store.close()
+
+
+def _cached(embedder, store, **kwargs) -> CachedEmbedder:
+    return CachedEmbedder(
+        embedder, "openai", "text-embedding-3-small", 2, store, **kwargs
+    )
+
+
+class TestCachedEmbedder:
+    """Tests for CachedEmbedder."""
+
+    async def test_concurrent_requests_share_batches(self, store):
+        embedder = FakeEmbedder()
+        cached = _cached(embedder, store, batch_size=4)
+        texts = [f"summary of file {i}" for i in range(10)]
+
+        # Graphiti embeds node names one create([text]) at a time
+        vectors = await asyncio.gather(*(cached.create([t]) for t in texts))
+
+        assert vectors == [FakeEmbedder.vector(t) for t in texts]
+        assert [len(batch) for batch in embedder.batches] == [4, 4, 2]
+        assert cached.stats["batches"] == 3
+
+    async def test_in_flight_duplicates_are_embedded_once(self, store):
+        embedder = FakeEmbedder()
+        cached = _cached(embedder, store)
+
+        results = await asyncio.gather(
+            cached.create(["same task"]),
+            cached.create_batch(["same task", "other", "same task"]),
+            cached.create("same task"),
+        )
+
+        assert results[0] == results[1][0] == results[1][2] == results[2]
+        assert embedder.batches == [["same task", "other"]]
+        assert cached.stats["deduplicated"] == 3
+
+    async def test_cache_hits_across_instances(self, store):
+        texts = ["task description", "issue body", "file summary"]
+        first = FakeEmbedder()
+        await _cached(first, store).create_batch(texts)
+
+        second = FakeEmbedder()
+        cached = _cached(second, store)
+        vectors = await cached.create_batch(texts + ["new text"])
+
+        assert vectors[:3] == [FakeEmbedder.vector(t) for t in texts]
+        assert second.batches == [["new text"]]
+        assert cached.hit_rate == 0.75
+
+    async def test_namespaces_are_separate(self, store):
+        await _cached(FakeEmbedder(), store).create(["text"])
+
+        embedder = FakeEmbedder()
+        other_model = CachedEmbedder(
+            embedder, "openai", "text-embedding-3-large", 2, store
+        )
+        await other_model.create(["text"])
+
+        assert embedder.batches == [["text"]]
+
+    async def test_provider_errors_reach_every_waiter(self, store):
+        cached = _cached(FakeEmbedder(fail=True), store)
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            await cached.create_batch(["a", "b"])
+        assert cached.stats["embedded"] == 0
+        assert cached._pending == {}
+
+    async def test_non_text_input_passes_through(self, store):
+        embedder = FakeEmbedder()
+        cached = _cached(embedder, store)
+
+        await cached.create(["several", "texts"])
+
+        assert embedder.batches == [["create", ["several", "texts"]]]
+        assert cached.config == "fake-config"
+
+    async def test_default_create_batch_falls_back_to_create(self, store):
+        class SingleEmbedder(FakeEmbedder):
+            async def create_batch(self, input_data_list):
+                raise NotImplementedError()  # EmbedderClient default
+
+        embedder = SingleEmbedder()
+        cached = _cached(embedder, store)
+
+        vectors = await cached.create_batch(["a", "b"])
+
+        assert vectors == [FakeEmbedder.vector("a"), FakeEmbedder.vector("b")]
+        assert embedder.batches == [["create", ["a"]], ["create", ["b"]]]
+
+    def test_accepted_as_graphiti_embedder(self, store):
+        client = pytest.importorskip("graphiti_core.embedder.client")
+        graphiti_types = pytest.importorskip("graphiti_core.graphiti_types")
+
+        cached = _cached(FakeEmbedder(), store)
+        assert isinstance(cached, client.EmbedderClient)
+
+        # GraphitiClients validates the embedder with isinstance
+        field = graphiti_types.GraphitiClients.model_fields["embedder"]
+        assert field.annotation is client.EmbedderClient
+        clients = graphiti_types.GraphitiClients.model_construct(embedder=cached)
+        graphiti_types.GraphitiClients.__pydantic_validator__.validate_assignment(
+            clients, "embedder", cached
+        )
+        assert clients.embedder is cached
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_round_trip_is_exact(self, store):
+        vector = [0.1 + 0.2, -1e-12, 3.141592653589793]
+        namespace = ("voyage", "voyage-3", 1024)
+
+        store.put_many(namespace, {"abc": vector})
+
+        assert store.get_many(namespace, ["abc", "missing"]) == {"abc": vector}
+
+    def test_unusable_path_disables_cache(self, tmp_path: Path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        store = EmbeddingStore(blocker / "cache.sqlite")
+
+        store.put_many(("openai", "m", 2), {"abc": [1.0]})
+
+        assert store.get_many(("openai", "m", 2), ["abc"]) == {}
+
+
+def test_factory_wraps_embedder(monkeypatch, tmp_path: Path):
+    from integrations.graphiti.providers_pkg import factory
+
+    monkeypatch.setattr(
+        factory, "create_voyage_embedder", lambda config: FakeEmbedder()
+    )
+    monkeypatch.setattr(embedding_cache, "_stores", {})
+    config = GraphitiConfig(embedder_provider="voyage", db_path=str(tmp_path))
+
+    embedder = factory.create_embedder(config)
+
+    assert isinstance(embedder, CachedEmbedder)
+    assert embedder.namespace == ("voyage", "voyage-3", 1024)
+    assert embedder.store.path == (tmp_path / ".embedding_cache.sqlite").resolve()
+
+    config.embedding_cache = False
+    assert isinstance(factory.create_embedder(config), FakeEmbedder)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub runner SQLite state store.
+
+Tests cover:
+- One-time import of the legacy JSON state files
+- Lifecycle queries and atomic lock acquisition
+- Trust, learning and batch managers backed by the store
+- WAL mode
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from bot_detection import BotDetectionState
+from learning import LearningTracker, OutcomeType, PredictionType
+from lifecycle import IssueLifecycle, IssueLifecycleState, LifecycleManager
+from state_store import STATE_DB_FILE, StateStore, get_state_store
+from trust import TrustManager
+
+
+def _batch(batch_id: str, issue: int, status: str = "pending") -> dict:
+    return {
+        "batch_id": batch_id,
+        "repo": "o/r",
+        "primary_issue": issue,
+        "issues": [{"issue_number": issue, "title": "t", "body": "b"}],
+        "status": status,
+        "created_at": f"2025-01-0{issue}T10:00:00",
+    }
+
+
+def _write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def state_dir(tmp_path: Path) -> Path:
+    return tmp_path / "github"
+
+
+class TestMigration:
+    """Tests for importing the JSON state files."""
+
+    def test_imports_legacy_files_once(self, state_dir):
+        lifecycle = IssueLifecycle(issue_number=7, repo="o/r")
+        _write_json(state_dir / "lifecycle" / "o_r_7.json", lifecycle.to_dict())
+        _write_json(
+            state_dir / "trust" / "o_r.json", {"repo": "o/r", "current_level": 2}
+        )
+        _write_json(
+            state_dir / "bot_detection_state.json",
+            {
+                "reviewed_commits": {"12": ["abc"]},
+                "last_review_times": {"12": "2025-01-01T10:00:00"},
+            },
+        )
+        _write_json(state_dir / "batches" / "batch_b1.json", _batch("b1", 7))
+        _write_json(
+            state_dir / "batches" / "index.json", {"issue_to_batch": {"7": "b1"}}
+        )
+        (state_dir / "lifecycle" / "broken.json").write_text("{not json")
+
+        store = StateStore(state_dir)
+
+        assert store.get_lifecycle("o/r", 7)["issue_number"] == 7
+        assert store.get_trust("o/r")["current_level"] == 2
+        assert BotDetectionState.load(state_dir).reviewed_commits == {"12": ["abc"]}
+        assert store.get_batch("b1")["primary_issue"] == 7
+        assert store.load_batch_index() == {7: "b1"}
+
+        # Files written after the migration are not imported again
+        _write_json(
+            state_dir / "lifecycle" / "o_r_8.json",
+            IssueLifecycle(issue_number=8, repo="o/r").to_dict(),
+        )
+        assert StateStore(state_dir).get_lifecycle("o/r", 8) is None
+
+    def test_wal_mode(self, state_dir):
+        store = StateStore(state_dir)
+
+        mode = store._query("PRAGMA journal_mode")[0][0]
+
+        assert mode == "wal"
+        assert (state_dir / STATE_DB_FILE).exists()
+
+
+class TestLifecycleManager:
+    """Tests for lifecycle persistence."""
+
+    def test_state_queries(self, state_dir):
+        manager = LifecycleManager(state_dir)
+        for number in (1, 2, 3):
+            manager.transition("o/r", number, IssueLifecycleState.TRIAGING, "bot")
+        manager.transition("o/r", 2, IssueLifecycleState.SPAM, "bot")
+        manager.get_or_create("other/repo", 1)
+
+        triaging = manager.get_all_in_state("o/r", IssueLifecycleState.TRIAGING)
+
+        assert [lc.issue_number for lc in triaging] == [1, 3]
+        assert manager.get_summary("o/r") == {"triaging": 2, "spam": 1}
+        assert manager.get("o/r", 2).transitions[-1].to_state == (
+            IssueLifecycleState.SPAM
+        )
+
+    def test_invalid_transition_is_not_saved(self, state_dir):
+        manager = LifecycleManager(state_dir)
+
+        result = manager.transition("o/r", 1, IssueLifecycleState.MERGED, "bot")
+
+        assert result.has_conflict
+        assert manager.get("o/r", 1).current_state == IssueLifecycleState.NEW
+
+    def test_lock_is_shared_between_managers(self, state_dir):
+        first = LifecycleManager(state_dir)
+        second = LifecycleManager(state_dir)
+
+        assert first.acquire_lock("o/r", 5, "autofix")
+        assert not second.acquire_lock("o/r", 5, "triage")
+        assert not second.release_lock("o/r", 5, "triage")
+        assert first.release_lock("o/r", 5, "autofix")
+        assert second.acquire_lock("o/r", 5, "triage")
+        assert not first.release_lock("o/r", 99, "autofix")
+        assert first.get("o/r", 99) is None
+
+
+class TestManagers:
+    """Tests for the other stores."""
+
+    def test_trust_round_trip(self, state_dir):
+        TrustManager(state_dir).record_action("o/r", "review", correct=True)
+
+        manager = TrustManager(state_dir)
+
+        assert manager.get_state("o/r").metrics.total_actions == 1
+        assert manager.get_summary()["total_repos"] == 1
+
+    def test_learning_outcomes(self, state_dir):
+        tracker = LearningTracker(state_dir)
+        tracker.record_prediction("o/r", "r1", PredictionType.REVIEW_APPROVE)
+        tracker.record_prediction("o/r", "r2", PredictionType.REVIEW_APPROVE)
+        tracker.record_outcome("o/r", "r1", OutcomeType.MERGED)
+
+        reloaded = LearningTracker(state_dir)
+
+        assert reloaded.get_accuracy("o/r").correct_predictions == 1
+        assert [o.review_id for o in reloaded.get_pending_outcomes()] == ["r2"]
+
+    def test_batches(self, state_dir):
+        store = get_state_store(state_dir)
+        store.save_batch(_batch("b1", 1))
+        store.save_batch(_batch("b2", 2, status="building"))
+
+        assert [b["batch_id"] for b in store.list_batches()] == ["b2", "b1"]
+        assert [b["batch_id"] for b in store.list_batches(["building"])] == ["b2"]
+        assert store.get_batch("b1")["primary_issue"] == 1
+
+        store.save_batch_index({1: "b1", 2: "b2"})
+        store.delete_batch("b1")
+
+        assert store.get_batch("b1") is None
+        assert store.load_batch_index() == {2: "b2"}
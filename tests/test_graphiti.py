@@ -93,6 +93,19 @@ class TestGraphitiConfig:
             assert config.database == "my_graph"
             assert config.db_path == "/custom/path"
 
+    def test_from_env_read_connections(self):
+        """Read connection pool size comes from GRAPHITI_READ_CONNECTIONS."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert GraphitiConfig.from_env().read_connections == 4
+
+        with patch.dict(os.environ, {"GRAPHITI_READ_CONNECTIONS": "8"}, clear=True):
+            assert GraphitiConfig.from_env().read_connections == 8
+
+        for value in ("0", "many"):
+            env = {"GRAPHITI_READ_CONNECTIONS": value}
+            with patch.dict(os.environ, env, clear=True):
+                assert GraphitiConfig.from_env().read_connections >= 1
+
     def test_is_valid_requires_only_enabled(self):
         """is_valid() requires only GRAPHITI_ENABLED.
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for Graphiti context retrieval before coder sessions.
+
+Tests cover:
+- The three retrievals run concurrently
+- Retried subtasks reuse cached results until an episode is added
+- One timeout for the whole retrieval, and partial failures
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from agents import memory_manager
+from agents.memory_manager import clear_graphiti_context_cache, get_graphiti_context
+from integrations.graphiti.queries_pkg import queries
+
+
+class FakeMemory:
+    """GraphitiMemory stand-in that records concurrent queries."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail = set()
+        # Failures the search layer logs and returns as empty results
+        self.swallow = set()
+        self.search_failures = 0
+        self.group_id = "project_test"
+        self.spec_context_id = "001-feature"
+        self.is_initialized = True
+
+    async def _query(self, name, result):
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if name in self.fail:
+            raise RuntimeError(f"{name} failed")
+        if name in self.swallow:
+            self.search_failures += 1
+            return ([], []) if isinstance(result, tuple) else []
+        return result
+
+    async def initialize(self):
+        return True
+
+    async def get_relevant_context(self, query, num_results=5):
+        return await self._query(
+            "context", [{"type": "pattern", "content": f"Context for {query}"}]
+        )
+
+    async def get_patterns_and_gotchas(self, query, num_results=3, min_score=0.5):
+        return await self._query(
+            "patterns", ([{"pattern": "Use the repository layer"}], [])
+        )
+
+    async def get_session_history(self, limit=3):
+        return await self._query(
+            "history",
+            [{"session_number": 1, "recommendations_for_next_session": ["Add tests"]}],
+        )
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def memory(monkeypatch) -> FakeMemory:
+    memory = FakeMemory()
+    clear_graphiti_context_cache()
+    monkeypatch.setattr(memory_manager, "is_graphiti_enabled", lambda: True)
+    monkeypatch.setattr(
+        memory_manager, "get_graphiti_memory", lambda spec_dir, project_dir: memory
+    )
+    yield memory
+    clear_graphiti_context_cache()
+
+
+SUBTASK = {"id": "subtask-1", "description": "Add login endpoint"}
+
+
+async def _context(tmp_path: Path, subtask: dict = SUBTASK) -> str | None:
+    return await get_graphiti_context(tmp_path, tmp_path, subtask)
+
+
+class TestGetGraphitiContext:
+    """Tests for get_graphiti_context()."""
+
+    async def test_queries_run_concurrently(self, memory, tmp_path):
+        context = await _context(tmp_path)
+
+        assert memory.max_in_flight == 3
+        assert "Context for Add login endpoint subtask-1" in context
+        assert "Use the repository layer" in context
+        assert "- Add tests" in context
+
+    async def test_retry_uses_cache_until_episode_added(self, memory, tmp_path):
+        first = await _context(tmp_path)
+        assert await _context(tmp_path) == first
+        assert len(memory.calls) == 3
+
+        # A different subtask is a different query
+        await _context(tmp_path, {"id": "subtask-2", "description": "Other"})
+        assert len(memory.calls) == 6
+
+        queries._bump_write_generation()
+        await _context(tmp_path)
+        assert len(memory.calls) == 9
+
+    async def test_timeout_returns_none(self, memory, tmp_path, monkeypatch):
+        monkeypatch.setattr(memory_manager, "CONTEXT_RETRIEVAL_TIMEOUT_SECONDS", 0.01)
+        memory.delay = 1
+
+        assert await _context(tmp_path) is None
+
+        memory.delay = 0
+        assert await _context(tmp_path) is not None
+
+    async def test_failed_query_keeps_other_sections(self, memory, tmp_path):
+        memory.fail.add("context")
+
+        context = await _context(tmp_path)
+
+        assert "Relevant Knowledge" not in context
+        assert "Use the repository layer" in context
+        # Partial results aren't cached
+        memory.fail.clear()
+        assert "Relevant Knowledge" in await _context(tmp_path)
+
+    async def test_swallowed_search_failure_is_not_cached(self, memory, tmp_path):
+        memory.swallow.add("context")
+
+        context = await _context(tmp_path)
+
+        assert "Relevant Knowledge" not in context
+        memory.swallow.clear()
+        assert "Relevant Knowledge" in await _context(tmp_path)
+        assert memory.calls.count("context") == 2
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled GraphitiMemory instances.
+
+Tests cover:
+- One initialization per (project, spec, group mode) within an event loop
+- Borrowed references: close() returns them to the pool
+- New event loops, failed initialization and pool shutdown
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from integrations.graphiti import memory as graphiti_memory_module
+from memory import graphiti_helpers, graphiti_pool
+from memory.graphiti_helpers import get_graphiti_memory
+from memory.graphiti_pool import GraphitiMemoryPool, close_graphiti_pool
+
+
+class FakeGraphitiMemory:
+    """Stands in for GraphitiMemory and counts initializations."""
+
+    instances: list["FakeGraphitiMemory"] = []
+    fail_init = False
+
+    def __init__(self, spec_dir, project_dir, group_id_mode="spec"):
+        self.spec_dir = spec_dir
+        self.group_id_mode = group_id_mode
+        self.initializations = 0
+        self.closed = False
+        self._initialized = False
+        self.saved = []
+        FakeGraphitiMemory.instances.append(self)
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._initialized
+
+    async def initialize(self) -> bool:
+        if self._initialized:
+            return True
+        await asyncio.sleep(0)
+        self.initializations += 1
+        self._initialized = not FakeGraphitiMemory.fail_init
+        return self._initialized
+
+    async def save_pattern(self, pattern: str) -> bool:
+        if not await self.initialize():
+            return False
+        self.saved.append(pattern)
+        return True
+
+    async def close(self) -> None:
+        self.closed = True
+        self._initialized = False
+
+
+@pytest.fixture
+def pool(monkeypatch) -> GraphitiMemoryPool:
+    FakeGraphitiMemory.instances = []
+    FakeGraphitiMemory.fail_init = False
+    pool = GraphitiMemoryPool()
+    monkeypatch.setattr(graphiti_pool, "_pool", pool)
+    monkeypatch.setattr(graphiti_memory_module, "GraphitiMemory", FakeGraphitiMemory)
+    monkeypatch.setattr(graphiti_helpers, "is_graphiti_memory_enabled", lambda: True)
+    return pool
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    spec_dir = tmp_path / ".auto-claude" / "specs" / "001-feature"
+    spec_dir.mkdir(parents=True)
+    return spec_dir
+
+
+async def _use(spec_dir: Path, pattern: str):
+    memory = get_graphiti_memory(spec_dir)
+    try:
+        await memory.save_pattern(pattern)
+    finally:
+        await memory.close()
+    return memory
+
+
+class TestGraphitiMemoryPool:
+    """Tests for GraphitiMemoryPool."""
+
+    async def test_one_initialization_per_loop(self, pool, spec_dir):
+        # Context retrieval, queued writes and the session-end save
+        for name in ("context", "write", "session"):
+            await _use(spec_dir, name)
+
+        assert len(FakeGraphitiMemory.instances) == 1
+        memory = FakeGraphitiMemory.instances[0]
+        assert memory.initializations == 1
+        assert memory.saved == ["context", "write", "session"]
+        assert not memory.closed
+        assert memory.group_id_mode == "project"
+        assert pool.stats == {"created": 1, "borrowed": 3, "discarded": 0}
+
+    async def test_concurrent_borrowers_initialize_once(self, pool, spec_dir):
+        memories = [get_graphiti_memory(spec_dir) for _ in range(3)]
+
+        assert await asyncio.gather(*(m.initialize() for m in memories)) == [
+            True,
+            True,
+            True,
+        ]
+
+        assert FakeGraphitiMemory.instances[0].initializations == 1
+
+    async def test_keys_are_separate(self, pool, spec_dir):
+        other_spec = spec_dir.parent / "002-other"
+        other_spec.mkdir()
+
+        await _use(spec_dir, "a")
+        await _use(other_spec, "b")
+
+        assert len(FakeGraphitiMemory.instances) == 2
+
+    async def test_failed_initialization_is_retried(self, pool, spec_dir):
+        FakeGraphitiMemory.fail_init = True
+        await _use(spec_dir, "a")
+        FakeGraphitiMemory.fail_init = False
+
+        await _use(spec_dir, "b")
+
+        assert len(FakeGraphitiMemory.instances) == 2
+        assert FakeGraphitiMemory.instances[1].saved == ["b"]
+
+    async def test_close_pool(self, pool, spec_dir):
+        await _use(spec_dir, "a")
+
+        await close_graphiti_pool()
+
+        assert FakeGraphitiMemory.instances[0].closed
+        await _use(spec_dir, "b")
+        assert len(FakeGraphitiMemory.instances) == 2
+
+
+class TestEventLoops:
+    """Tests for instances used from different event loops."""
+
+    def test_new_loop_gets_new_instance(self, pool, spec_dir):
+        asyncio.run(_use(spec_dir, "a"))
+        asyncio.run(_use(spec_dir, "b"))
+
+        _first, second = FakeGraphitiMemory.instances
+        assert second.saved == ["b"]
+        assert pool.stats["discarded"] == 1
+
+    def test_without_loop_returns_unpooled_instance(self, pool, spec_dir):
+        memory = get_graphiti_memory(spec_dir)
+
+        assert isinstance(memory, FakeGraphitiMemory)
+        assert pool.stats["borrowed"] == 0
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Tests for the repository import graph used in PR related-file discovery.
+
+Tests cover:
+- JS/TS relative imports, index files and tsconfig path aliases
+- Python absolute and relative package imports
+- Reverse dependents
+- Per-commit caching in the GitHub state directory
+- Building from a commit's tree (sparse checkouts)
+- Related-file collection for PR reviews
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from context_gatherer import ChangedFile, PRContextGatherer
+from import_graph import (
+    ImportGraphCache,
+    RepoImportGraph,
+    extract_js_imports,
+    extract_python_imports,
+)
+
+
+def _write(root: Path, rel_path: str, content: str = "") -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=root, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small TypeScript + Python repository."""
+    root = tmp_path / "project"
+    _write(
+        root,
+        "tsconfig.json",
+        '{\n  // aliases\n  "compilerOptions": {\n    "baseUrl": ".",\n'
+        '    "paths": {"@/*": ["src/*"]},\n  },\n}\n',
+    )
+    _write(root, "src/app.tsx", "import { helper } from './utils';\nimport '@/lib';\n")
+    _write(root, "src/utils.ts", "export const helper = () => 1;\n")
+    _write(root, "src/utils.test.ts", "import { helper } from './utils';\n")
+    _write(root, "src/lib/index.ts", "export * from '../utils';\n")
+    _write(root, "src/config/settings.ts", "import React from 'react';\n")
+    _write(root, "backend/requirements.txt", "")
+    _write(root, "backend/core/__init__.py", "")
+    _write(root, "backend/core/client.py", "from .auth import token\n")
+    _write(root, "backend/core/auth.py", "import os\ntoken = os.getenv('T')\n")
+    _write(root, "backend/agents/__init__.py", "")
+    _write(
+        root,
+        "backend/agents/coder.py",
+        "from core.client import create\nfrom core import auth\n",
+    )
+    _write(root, "node_modules/react/index.js", "")
+    return root
+
+
+@pytest.fixture
+def git_project(project):
+    _git(project, "init", "-q")
+    _git(project, "config", "user.email", "test@example.com")
+    _git(project, "config", "user.name", "Test")
+    (project / ".gitignore").write_text("node_modules/\n.auto-claude/\n")
+    _git(project, "add", "-A")
+    _git(project, "commit", "-q", "-m", "init")
+    return project
+
+
+class TestExtractImports:
+    """Tests for import extraction."""
+
+    def test_js_forms(self):
+        content = (
+            "import a from './a';\nimport type { B } from \"./b\";\n"
+            "export { c } from './c';\nimport './d.css';\n"
+            "const e = require('./e');\nconst f = await import('./f');\n"
+        )
+
+        assert extract_js_imports(content) == [
+            "./a",
+            "./b",
+            "./c",
+            "./d.css",
+            "./e",
+            "./f",
+        ]
+
+    def test_python_forms(self):
+        imports = extract_python_imports(
+            "import os.path\nfrom . import sibling\nfrom ..pkg.mod import x, y\n"
+        )
+
+        assert imports == [
+            (0, "os.path", []),
+            (1, "", ["sibling"]),
+            (2, "pkg.mod", ["x", "y"]),
+        ]
+
+    def test_python_parenthesized_names(self):
+        imports = extract_python_imports(
+            "from pkg import (\n    a,  # first\n    b as c,\n)\nimport x as y, z\n"
+        )
+
+        assert imports == [(0, "pkg", ["a", "b"]), (0, "x", []), (0, "z", [])]
+
+
+class TestRepoImportGraph:
+    """Tests for graph construction and queries."""
+
+    def test_js_relative_and_alias_imports(self, project):
+        graph = RepoImportGraph.build(project)
+
+        assert graph.imports_of("src/app.tsx") == ["src/lib/index.ts", "src/utils.ts"]
+        assert graph.imports_of("src/lib/index.ts") == ["src/utils.ts"]
+        # Packages and vendored dependencies are not part of the graph
+        assert graph.imports_of("src/config/settings.ts") == []
+        assert "node_modules/react/index.js" not in graph.files
+
+    def test_base_url_import(self, project):
+        graph = RepoImportGraph.build(project)
+
+        assert graph.resolve_js("src/config/settings", "src/app.tsx") == (
+            "src/config/settings.ts"
+        )
+        assert graph.resolve_js("../../outside", "src/app.tsx") is None
+
+    def test_python_imports(self, project):
+        graph = RepoImportGraph.build(project)
+
+        assert graph.imports_of("backend/core/client.py") == ["backend/core/auth.py"]
+        assert graph.imports_of("backend/agents/coder.py") == [
+            "backend/core/__init__.py",
+            "backend/core/auth.py",
+            "backend/core/client.py",
+        ]
+
+    def test_dependents(self, project):
+        graph = RepoImportGraph.build(project)
+
+        assert graph.dependents_of("src/utils.ts") == [
+            "src/app.tsx",
+            "src/lib/index.ts",
+            "src/utils.test.ts",
+        ]
+        assert graph.dependents_of("backend/core/auth.py") == [
+            "backend/agents/coder.py",
+            "backend/core/client.py",
+        ]
+
+    def test_related_files_uses_given_content(self, project):
+        graph = RepoImportGraph.build(project)
+
+        related = graph.related_files(
+            ["src/config/settings.ts"],
+            contents={"src/config/settings.ts": "import { helper } from '../utils';"},
+        )
+
+        assert related["imports"] == {"src/utils.ts"}
+        assert related["dependents"] == set()
+
+    def test_round_trip(self, project):
+        graph = RepoImportGraph.build(project, sha="abc")
+
+        restored = RepoImportGraph.from_dict(json.loads(json.dumps(graph.to_dict())))
+
+        assert restored.files == graph.files
+        assert restored.imports == graph.imports
+        assert restored.resolve_js("@/utils", "src/app.tsx") == "src/utils.ts"
+
+
+class TestImportGraphCache:
+    """Tests for per-commit caching."""
+
+    def test_cached_per_commit(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+        sha = _git(git_project, "rev-parse", "HEAD")
+
+        ImportGraphCache(state_dir).get(git_project)
+        assert (state_dir / "import_graph" / f"{sha}.json").exists()
+
+        cache = ImportGraphCache(state_dir)
+        graph = cache.get(git_project, sha)
+
+        assert cache.hits == 1
+        assert cache.misses == 0
+        assert graph.sha == sha
+        assert graph.dependents_of("src/utils.ts")
+
+    def test_dirty_checkout_is_not_cached(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+        (git_project / "src" / "utils.ts").write_text("export const x = 2;\n")
+
+        graph = ImportGraphCache(state_dir).get(git_project)
+
+        assert graph.sha is None
+        assert not (state_dir / "import_graph").exists()
+
+    def test_untracked_file_is_not_cached(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+        _write(git_project, "src/local.ts", "import { helper } from './utils';\n")
+
+        graph = ImportGraphCache(state_dir).get(git_project)
+
+        assert graph.sha is None
+        assert "src/local.ts" in graph.dependents_of("src/utils.ts")
+        assert not (state_dir / "import_graph").exists()
+
+    def test_untracked_non_source_files_are_cached(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+        # Notes, agent state and the like don't change any import
+        _write(git_project, "docs/notes.md", "# Notes\n")
+
+        graph = ImportGraphCache(state_dir).get(git_project)
+
+        sha = _git(git_project, "rev-parse", "HEAD")
+        assert graph.sha == sha
+        assert (state_dir / "import_graph" / f"{sha}.json").exists()
+
+    def test_other_sha_is_not_cached(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+
+        ImportGraphCache(state_dir).get(git_project, "0" * 40)
+
+        assert not (state_dir / "import_graph").exists()
+
+    def test_build_from_commit_matches_working_tree(self, git_project):
+        sha = _git(git_project, "rev-parse", "HEAD")
+
+        from_disk = RepoImportGraph.build(git_project, sha=sha)
+        from_commit = RepoImportGraph.build_from_commit(git_project, sha)
+
+        assert from_commit.files == from_disk.files
+        assert from_commit.imports == from_disk.imports
+        assert from_commit.resolve_js("@/utils", "src/app.tsx") == "src/utils.ts"
+
+    def test_sparse_checkout_uses_commit_tree(self, git_project, tmp_path):
+        state_dir = tmp_path / "state"
+        _git(git_project, "sparse-checkout", "set", "--no-cone", "/src/utils.ts")
+        assert not (git_project / "src" / "app.tsx").exists()
+
+        graph = ImportGraphCache(state_dir).get(git_project)
+
+        assert "src/app.tsx" in graph.dependents_of("src/utils.ts")
+        sha = _git(git_project, "rev-parse", "HEAD")
+        assert (state_dir / "import_graph" / f"{sha}.json").exists()
+
+    def test_prunes_old_graphs(self, tmp_path):
+        cache = ImportGraphCache(tmp_path / "state", max_graphs=1)
+        cache.save(RepoImportGraph(set(), sha="a" * 40))
+        os.utime(cache.cache_dir / f"{'a' * 40}.json", (0, 0))
+        cache.save(RepoImportGraph(set(), sha="b" * 40))
+
+        assert [p.stem for p in cache.cache_dir.glob("*.json")] == ["b" * 40]
+
+    def test_prune_tolerates_vanished_entries(self, tmp_path):
+        cache = ImportGraphCache(tmp_path / "state", max_graphs=1)
+        cache.cache_dir.mkdir(parents=True)
+        # Deleted by another process between listing and stat
+        (cache.cache_dir / f"{'c' * 40}.json").symlink_to(tmp_path / "gone")
+
+        cache.save(RepoImportGraph(set(), sha="b" * 40))
+
+        assert (cache.cache_dir / f"{'b' * 40}.json").exists()
+        assert not list(cache.cache_dir.glob("*.tmp"))
+
+
+class TestRelatedFilesForPR:
+    """Tests for PRContextGatherer related-file discovery."""
+
+    def test_find_related_files_for_root(self, git_project, tmp_path):
+        changed = [ChangedFile("src/utils.ts", "modified", 1, 0, "", "", "")]
+
+        related = PRContextGatherer.find_related_files_for_root(
+            changed, git_project, state_dir=tmp_path / "state"
+        )
+
+        # Tests first, then reverse dependents
+        assert related == [
+            "src/utils.test.ts",
+            "src/app.tsx",
+            "src/lib/index.ts",
+        ]
+
+    def test_find_related_files_at_commit(self, git_project, tmp_path):
+        sha = _git(git_project, "rev-parse", "HEAD")
+        changed = [ChangedFile("src/utils.ts", "modified", 1, 0, "", "", "")]
+
+        related = PRContextGatherer.find_related_files_at_commit(
+            changed, git_project, sha, state_dir=tmp_path / "state"
+        )
+
+        assert related == [
+            "src/utils.test.ts",
+            "src/app.tsx",
+            "src/lib/index.ts",
+        ]
+
+    def test_gatherer_resolves_python_imports(self, project):
+        gatherer = PRContextGatherer(project, 1)
+
+        imports = gatherer._find_imports(
+            "from .auth import token\n", Path("backend/core/client.py")
+        )
+
+        assert imports == {"backend/core/auth.py"}
+        assert gatherer._resolve_import_path("./utils", Path("src/app.tsx")) == (
+            "src/utils.ts"
+        )
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the session diff used by insight extraction.
+
+Tests cover:
+- Source patches come before docs and generated/lock files
+- Files over the diff budget are summarized instead of read
+- A single oversized file is truncated
+- The temporary order file is removed when git can't be started
+- Changed files and commit messages from the same helper
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import insight_extractor
+from insight_extractor import (
+    collect_session_changes,
+    get_changed_files,
+    get_session_diff,
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for name, content in files.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def session(temp_git_repo: Path) -> tuple[Path, str, str]:
+    before = _git(temp_git_repo, "rev-parse", "HEAD")
+    _commit(
+        temp_git_repo,
+        {
+            "package-lock.json": "".join(f'"dep-{i}": "1.0.0",\n' for i in range(2000)),
+            "docs/guide.md": "# Guide\n",
+        },
+        "Add dependencies",
+    )
+    after = _commit(
+        temp_git_repo, {"src/app.py": "def main():\n    return 1\n"}, "Add app"
+    )
+    return temp_git_repo, before, after
+
+
+class TestCollectSessionChanges:
+    """Tests for collect_session_changes()."""
+
+    def test_source_first_and_generated_summarized(self, session):
+        repo, before, after = session
+
+        changes = collect_session_changes(repo, before, after)
+
+        assert sorted(changes["changed_files"]) == [
+            "docs/guide.md",
+            "package-lock.json",
+            "src/app.py",
+        ]
+        assert changes["commit_messages"].splitlines()[0].endswith("Add app")
+        diff = changes["diff"]
+        assert diff.index("b/src/app.py") < diff.index("b/docs/guide.md")
+        assert "dep-0" not in diff
+        assert "package-lock.json | 2000 (+2000 -0)" in diff
+        assert len(diff) < insight_extractor._module.MAX_DIFF_CHARS
+
+    def test_everything_fits(self, session, monkeypatch):
+        repo, before, after = session
+        monkeypatch.setattr(insight_extractor._module, "MAX_DIFF_CHARS", 1_000_000)
+
+        diff = get_session_diff(repo, before, after)
+
+        assert "dep-1999" in diff
+        assert "not shown" not in diff
+
+    def test_oversized_single_file_is_truncated(self, temp_git_repo, monkeypatch):
+        monkeypatch.setattr(insight_extractor._module, "MAX_DIFF_CHARS", 500)
+        before = _git(temp_git_repo, "rev-parse", "HEAD")
+        after = _commit(temp_git_repo, {"big.py": "x = 1\n" * 10_000}, "Add big module")
+
+        diff = get_session_diff(temp_git_repo, before, after)
+
+        assert diff.startswith("diff --git a/big.py")
+        assert "... (truncated)" in diff
+        assert len(diff) < 600
+
+    def test_no_changes(self, session):
+        repo, _before, after = session
+
+        assert get_session_diff(repo, after, after) == "(No changes - same commit)"
+        assert get_session_diff(repo, None, after) == "(No commits to diff)"
+        assert get_changed_files(repo, after, after) == []
+        assert collect_session_changes(repo, None, None)["commit_messages"] == (
+            "(No commits)"
+        )
+
+    def test_order_file_removed_when_git_fails_to_start(
+        self, session, tmp_path, monkeypatch
+    ):
+        repo, before, after = session
+        order_dir = tmp_path / "order"
+        order_dir.mkdir()
+        monkeypatch.setattr(
+            insight_extractor._module.tempfile, "tempdir", str(order_dir)
+        )
+
+        def fail(*args, **kwargs):
+            raise OSError("git not found")
+
+        monkeypatch.setattr(insight_extractor._module.subprocess, "Popen", fail)
+
+        with pytest.raises(OSError, match="git not found"):
+            insight_extractor._module._stream_diff(
+                repo, before, after, ["src/app.py"], 1000
+            )
+        assert list(order_dir.iterdir()) == []
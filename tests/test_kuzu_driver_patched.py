@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the read/write query routing of the patched Kuzu driver.
+
+Tests cover:
+- Graphiti's search queries are classified as read-only
+- Writes, schema changes and index procedures go to the writer connection
+- Keywords inside string literals are ignored
+- One driver per database path, shared across event loops
+"""
+
+import asyncio
+
+import pytest
+
+from integrations.graphiti.queries_pkg import kuzu_driver_patched
+from integrations.graphiti.queries_pkg.kuzu_driver_patched import (
+    acquire_kuzu_driver,
+    is_read_only_query,
+    release_kuzu_driver,
+)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n:Entity) WHERE n.group_id IN $group_ids RETURN n.uuid AS uuid",
+        "CALL QUERY_FTS_INDEX('Entity', 'node_name_and_summary', $query, TOP := $limit)"
+        " WITH node AS n, score RETURN n.uuid AS uuid, score",
+        "MATCH (n:Entity) WITH n, array_cosine_similarity(n.name_embedding, $v) AS score"
+        " WHERE score > $min_score RETURN n ORDER BY score DESC LIMIT $limit",
+        "MATCH (e:Episodic) RETURN e.created_at AS created_at, e.valid_at SKIP 5",
+        "MATCH (n) WHERE n.name = 'CREATE TABLE' RETURN n",
+    ],
+)
+def test_read_queries(query):
+    assert is_read_only_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MERGE (n:Entity {uuid: $uuid}) SET n.name = $name RETURN n.uuid AS uuid",
+        "CREATE (e:Episodic {uuid: $uuid})",
+        "MATCH (n {uuid: $uuid}) DETACH DELETE n",
+        "MATCH (n) REMOVE n.summary",
+        "CALL CREATE_FTS_INDEX('Entity', 'node_name_and_summary', ['name', 'summary'])",
+        "CALL DROP_FTS_INDEX('Entity', 'node_name_and_summary')",
+        "CALL threads=4",
+        "INSTALL fts",
+        "LOAD EXTENSION fts",
+        "CHECKPOINT",
+    ],
+)
+def test_write_queries(query):
+    assert not is_read_only_query(query)
+
+
+class TestSharedDriver:
+    """Tests for acquire_kuzu_driver / release_kuzu_driver."""
+
+    @pytest.fixture(autouse=True)
+    def opened(self, monkeypatch):
+        # Stands in for opening the database, which locks its files
+        opened = []
+
+        def create(db=":memory:", max_concurrent_queries=1):
+            opened.append(db)
+            return object()
+
+        monkeypatch.setattr(kuzu_driver_patched, "_shared_drivers", {})
+        monkeypatch.setattr(kuzu_driver_patched, "create_patched_kuzu_driver", create)
+        return opened
+
+    def test_event_loops_share_the_database(self, opened, tmp_path):
+        db = str(tmp_path / "graphiti" / "memory")
+
+        async def open_driver():
+            return acquire_kuzu_driver(db)
+
+        # The write queue worker runs its own event loop
+        first = asyncio.run(open_driver())
+        second = asyncio.run(open_driver())
+
+        assert first is second
+        assert opened == [db]
+
+    def test_last_release_forgets_the_driver(self, opened, tmp_path):
+        db = str(tmp_path / "memory")
+        first = acquire_kuzu_driver(db)
+        acquire_kuzu_driver(db)
+
+        release_kuzu_driver(first)
+        assert acquire_kuzu_driver(db) is first
+        release_kuzu_driver(first)
+        release_kuzu_driver(first)
+
+        assert acquire_kuzu_driver(db) is not first
+        assert len(opened) == 2
+
+    def test_in_memory_databases_are_private(self, opened):
+        assert acquire_kuzu_driver(":memory:") is not acquire_kuzu_driver(":memory:")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory write queue.
+
+Tests cover:
+- Queued patterns, gotchas and codebase map updates are visible to readers
+- In-memory deduplication, reset when the files change on disk
+- Batched Graphiti ingestion over one connection per spec
+- Background flushing and latency counters
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from memory import (
+    append_gotcha,
+    append_pattern,
+    clear_memory,
+    flush_memory_writes,
+    get_write_queue,
+    load_codebase_map,
+    load_gotchas,
+    load_patterns,
+    update_codebase_map,
+    write_queue,
+)
+from memory.write_queue import MemoryWriteQueue
+
+
+class FakeGraphiti:
+    """Records the saves of a GraphitiMemory connection."""
+
+    def __init__(self):
+        self.saved = []
+        self.closed = False
+
+    async def save_codebase_discoveries(self, discoveries):
+        self.saved.append(("discoveries", discoveries))
+        return True
+
+    async def save_pattern(self, pattern):
+        self.saved.append(("pattern", pattern))
+        return True
+
+    async def save_gotcha(self, gotcha):
+        self.saved.append(("gotcha", gotcha))
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def queue(monkeypatch) -> MemoryWriteQueue:
+    # A long delay so only explicit flushes and reads write anything
+    queue = MemoryWriteQueue(flush_delay=60)
+    monkeypatch.setattr(write_queue, "_write_queue", queue)
+    return queue
+
+
+@pytest.fixture
+def graphiti(monkeypatch) -> list[FakeGraphiti]:
+    connections = []
+
+    def fake_get_graphiti_memory(spec_dir):
+        connections.append(FakeGraphiti())
+        return connections[-1]
+
+    monkeypatch.setattr(write_queue, "is_graphiti_memory_enabled", lambda: True)
+    monkeypatch.setattr(write_queue, "get_graphiti_memory", fake_get_graphiti_memory)
+    return connections
+
+
+class TestFileWrites:
+    """Tests for queued file-based memory writes."""
+
+    def test_reads_see_queued_writes(self, queue, tmp_path: Path):
+        append_pattern(tmp_path, "Use dependency injection")
+        append_gotcha(tmp_path, "  Close DB connections  ")
+        update_codebase_map(tmp_path, {"src/app.py": "Entry point"})
+        update_codebase_map(tmp_path, {"src/db.py": "Database"})
+
+        assert load_patterns(tmp_path) == ["Use dependency injection"]
+        assert load_gotchas(tmp_path) == ["Close DB connections"]
+        assert load_codebase_map(tmp_path) == {
+            "src/app.py": "Entry point",
+            "src/db.py": "Database",
+        }
+        codebase_map = json.loads(
+            (tmp_path / "memory" / "codebase_map.json").read_text()
+        )
+        assert codebase_map["_metadata"]["total_files"] == 2
+        content = (tmp_path / "memory" / "patterns.md").read_text()
+        assert content.startswith("# Code Patterns\n\n")
+
+    def test_deduplicates_in_memory(self, queue, tmp_path: Path):
+        memory_dir = tmp_path / "memory"
+        memory_dir.mkdir()
+        (memory_dir / "gotchas.md").write_text("# Gotchas\n\n- Existing\n")
+
+        append_gotcha(tmp_path, "Existing")
+        append_gotcha(tmp_path, "New")
+        append_gotcha(tmp_path, "New")
+        append_gotcha(tmp_path, "   ")
+
+        assert load_gotchas(tmp_path) == ["Existing", "New"]
+        assert queue.get_stats()["duplicates"] == 2
+
+    def test_changed_files_reset_dedupe(self, queue, tmp_path: Path):
+        append_pattern(tmp_path, "Pattern")
+        load_patterns(tmp_path)
+
+        clear_memory(tmp_path)
+        append_pattern(tmp_path, "Pattern")
+
+        assert load_patterns(tmp_path) == ["Pattern"]
+
+    def test_clear_drops_pending_writes(self, queue, tmp_path: Path):
+        append_pattern(tmp_path, "Pattern")
+
+        clear_memory(tmp_path)
+        flush_memory_writes(timeout=5)
+
+        assert load_patterns(tmp_path) == []
+        assert get_write_queue().get_stats()["pending"] == 0
+
+
+class TestFlushing:
+    """Tests for batched Graphiti ingestion and background flushing."""
+
+    def test_graphiti_batch_uses_one_connection(self, queue, graphiti, tmp_path):
+        for i in range(3):
+            append_pattern(tmp_path, f"Pattern {i}")
+        append_gotcha(tmp_path, "Gotcha")
+        update_codebase_map(tmp_path, {"a.py": "A"})
+        update_codebase_map(tmp_path, {"b.py": "B"})
+
+        assert graphiti == []
+        assert flush_memory_writes(timeout=5)
+
+        assert len(graphiti) == 1
+        assert graphiti[0].closed
+        assert graphiti[0].saved == [
+            ("discoveries", {"a.py": "A", "b.py": "B"}),
+            ("pattern", "Pattern 0"),
+            ("pattern", "Pattern 1"),
+            ("pattern", "Pattern 2"),
+            ("gotcha", "Gotcha"),
+        ]
+        stats = queue.get_stats()
+        assert stats["queued"] == 6
+        assert stats["graphiti_batches"] == 1
+        assert stats["graphiti_episodes"] == 5
+        assert stats["pending"] == 0
+
+    def test_flushes_in_background(self, monkeypatch, tmp_path: Path):
+        queue = MemoryWriteQueue(flush_delay=0.05)
+        monkeypatch.setattr(write_queue, "_write_queue", queue)
+
+        append_pattern(tmp_path, "Pattern")
+
+        deadline = time.monotonic() + 5
+        while queue.get_stats()["file_flushes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert queue.get_stats()["file_flushes"] == 1
+        patterns_file = tmp_path / "memory" / "patterns.md"
+        assert "- Pattern" in patterns_file.read_text()
+
+    def test_flush_without_writes(self, queue):
+        assert queue.flush(timeout=1)
+
+    def test_exit_flush_is_bounded(self, queue, monkeypatch, tmp_path, caplog):
+        started = threading.Event()
+
+        class HungGraphiti(FakeGraphiti):
+            async def save_pattern(self, pattern):
+                started.set()
+                await asyncio.sleep(0.5)
+                return True
+
+        monkeypatch.setattr(write_queue, "is_graphiti_memory_enabled", lambda: True)
+        monkeypatch.setattr(
+            write_queue, "get_graphiti_memory", lambda spec_dir: HungGraphiti()
+        )
+        append_pattern(tmp_path, "Pattern 1")
+        queue.flush(timeout=0)
+        assert started.wait(5)
+        append_pattern(tmp_path, "Pattern 2")
+
+        start = time.monotonic()
+        assert not queue.flush_at_exit(timeout=0.05)
+
+        assert time.monotonic() - start < 0.4
+        assert "1 queued Graphiti episodes" in caplog.text
+        assert queue.flush(timeout=5)
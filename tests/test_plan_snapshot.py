@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for PlanSnapshot and the cached progress helpers.
+
+Tests cover:
+- Counts, current phase and next subtask from one parse
+- Reuse of the cached snapshot until the plan file changes
+- Missing and corrupt plans
+- Helpers return copies that callers can modify
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.plan_normalization import normalize_subtask_aliases
+from progress import (
+    PlanSnapshot,
+    count_subtasks,
+    count_subtasks_detailed,
+    get_current_phase,
+    get_next_subtask,
+    get_plan_summary,
+    get_progress_percentage,
+    is_build_complete,
+    load_plan_snapshot,
+)
+
+PLAN = {
+    "workflow_type": "feature",
+    "phases": [
+        {
+            "id": "p1",
+            "phase": 1,
+            "name": "Backend",
+            "subtasks": [
+                {"id": "1.1", "description": "a", "status": "completed"},
+                {"id": "1.2", "description": "b", "status": "in_progress"},
+            ],
+        },
+        {
+            "id": "p2",
+            "phase": 2,
+            "name": "Frontend",
+            "depends_on": ["p1"],
+            "subtasks": [{"id": "2.1", "description": "c", "status": "pending"}],
+        },
+        {
+            "id": "p3",
+            "phase": 3,
+            "name": "Docs",
+            "subtasks": [
+                {"subtask_id": "3.1", "title": "d", "status": "not_started"},
+                {"id": "3.2", "description": "e", "status": "failed"},
+            ],
+        },
+    ],
+}
+
+
+def _write_plan(spec_dir: Path, plan) -> None:
+    # Atomic replace, as write_json_atomic does, so the inode changes
+    tmp = spec_dir / "plan.tmp"
+    tmp.write_text(json.dumps(plan))
+    tmp.replace(spec_dir / "implementation_plan.json")
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    _write_plan(tmp_path, PLAN)
+    return tmp_path
+
+
+class TestPlanSnapshot:
+    """Tests for values derived from the plan."""
+
+    def test_counts(self, spec_dir):
+        assert count_subtasks(spec_dir) == (1, 5)
+        assert count_subtasks_detailed(spec_dir) == {
+            "completed": 1,
+            "in_progress": 1,
+            "pending": 2,
+            "failed": 1,
+            "total": 5,
+        }
+        assert get_progress_percentage(spec_dir) == 20.0
+        assert not is_build_complete(spec_dir)
+
+    def test_current_phase_and_next_subtask(self, spec_dir):
+        assert get_current_phase(spec_dir) == {
+            "id": "p1",
+            "phase": 1,
+            "name": "Backend",
+            "completed": 1,
+            "total": 2,
+        }
+        # p2 waits for p1, so the next subtask comes from p3
+        next_subtask = get_next_subtask(spec_dir)
+        assert next_subtask["id"] == "3.1"
+        assert next_subtask["description"] == "d"
+        assert next_subtask["status"] == "pending"
+        assert next_subtask["phase_name"] == "Docs"
+
+    def test_summary(self, spec_dir):
+        summary = get_plan_summary(spec_dir)
+
+        assert summary["total_phases"] == 3
+        assert summary["pending_subtasks"] == 2
+        assert [p["completed"] for p in summary["phases"]] == [1, 0, 0]
+        assert summary["phases"][1]["depends_on"] == ["p1"]
+
+    def test_matches_normalization(self):
+        subtask = PLAN["phases"][2]["subtasks"][0]
+        expected, _changed = normalize_subtask_aliases(subtask)
+
+        next_subtask = PlanSnapshot(PLAN).next_subtask
+
+        assert next_subtask["id"] == expected["id"]
+
+
+class TestSnapshotCache:
+    """Tests for mtime-validated caching."""
+
+    def test_reused_until_plan_changes(self, spec_dir):
+        first = load_plan_snapshot(spec_dir)
+
+        assert load_plan_snapshot(spec_dir) is first
+
+        plan = json.loads(json.dumps(PLAN))
+        for phase in plan["phases"]:
+            for subtask in phase["subtasks"]:
+                subtask["status"] = "completed"
+        _write_plan(spec_dir, plan)
+
+        assert load_plan_snapshot(spec_dir) is not first
+        assert is_build_complete(spec_dir)
+        assert get_next_subtask(spec_dir) is None
+        assert get_current_phase(spec_dir) is None
+
+    def test_missing_and_corrupt_plans(self, tmp_path):
+        assert count_subtasks(tmp_path) == (0, 0)
+        assert get_plan_summary(tmp_path)["phases"] == []
+
+        (tmp_path / "implementation_plan.json").write_text("{not json")
+
+        assert count_subtasks_detailed(tmp_path)["total"] == 0
+        assert get_next_subtask(tmp_path) is None
+
+    def test_helpers_return_copies(self, spec_dir):
+        get_next_subtask(spec_dir)["id"] = "changed"
+        get_plan_summary(spec_dir)["phases"].clear()
+        count_subtasks_detailed(spec_dir)["total"] = 0
+
+        assert get_next_subtask(spec_dir)["id"] == "3.1"
+        assert len(get_plan_summary(spec_dir)["phases"]) == 3
+        assert count_subtasks_detailed(spec_dir)["total"] == 5
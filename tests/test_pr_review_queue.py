@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent multi-PR review.
+
+Tests cover:
+- PRReviewQueue concurrency, rate-limit gating and reporting
+- PRWorktreePool slot reuse and reset to each head SHA
+- Slot locks between pools sharing the pool directory
+- Fetch deduplication for commits shared between reviews
+"""
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from commit_fetcher import CommitFetcher
+
+
+def _load_service(name: str):
+    # Load directly: another top-level "services" package may already be imported
+    spec = importlib.util.spec_from_file_location(
+        f"github_{name}", _github_dir / "services" / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_worktree_module = _load_service("pr_worktree_manager")
+PRWorktreeManager = _worktree_module.PRWorktreeManager
+PRWorktreePool = _worktree_module.PRWorktreePool
+PRReviewQueue = _load_service("review_queue").PRReviewQueue
+
+
+class _Result:
+    def __init__(self, success: bool, error: str | None = None):
+        self.success = success
+        self.error = error
+
+
+class _FakeLimiter:
+    def __init__(self, cost_ok: bool = True, github_ok: bool = True):
+        self.cost_ok = cost_ok
+        self.github_ok = github_ok
+        self.acquired = 0
+
+    def check_cost_available(self):
+        return (True, "ok") if self.cost_ok else (False, "Cost budget exceeded")
+
+    async def acquire_github(self, timeout=None):
+        self.acquired += 1
+        return self.github_ok
+
+
+class TestPRReviewQueue:
+    """Tests for PRReviewQueue."""
+
+    async def test_runs_reviews_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def review(pr_number):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return _Result(success=pr_number != 3, error="boom")
+
+        limiter = _FakeLimiter()
+        queue = PRReviewQueue(review, concurrency=2, rate_limiter=limiter)
+
+        report = await queue.run([1, 2, 3, 4, 4])
+
+        assert peak == 2
+        assert [r.pr_number for r in report.reviews] == [1, 2, 3, 4]
+        assert limiter.acquired == 4
+        assert [r.pr_number for r in report.failed] == [3]
+        assert report.failed[0].error == "boom"
+        assert len(report.completed) == 3
+        assert report.throughput_per_minute > 0
+        # Later PRs wait for a free worker
+        assert report.reviews[3].queue_wait > report.reviews[0].queue_wait
+
+    async def test_exceptions_are_reported_as_failures(self):
+        async def review(pr_number):
+            raise RuntimeError("network down")
+
+        report = await PRReviewQueue(review, concurrency=3).run([7])
+
+        assert report.failed[0].error == "RuntimeError: network down"
+        assert "failed: 1" in report.summary()
+
+    async def test_cost_budget_skips_reviews(self):
+        reviewed = []
+
+        async def review(pr_number):
+            reviewed.append(pr_number)
+            return _Result(True)
+
+        queue = PRReviewQueue(
+            review, concurrency=2, rate_limiter=_FakeLimiter(cost_ok=False)
+        )
+
+        report = await queue.run([1, 2])
+
+        assert reviewed == []
+        assert len(report.skipped) == 2
+        assert report.to_dict()["skipped"] == 2
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            PRReviewQueue(lambda n: None, concurrency=0)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Repository with two commits and an origin remote."""
+    for key, value in {
+        "GIT_AUTHOR_NAME": "Test User",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test User",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+        "GIT_CEILING_DIRECTORIES": str(tmp_path),
+    }.items():
+        monkeypatch.setenv(key, value)
+    for key in ("GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE"):
+        monkeypatch.delenv(key, raising=False)
+
+    origin = tmp_path / "origin.git"
+    origin.mkdir()
+    _git(origin, "init", "--bare", "-q")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "--initial-branch=main")
+    _git(repo, "remote", "add", "origin", str(origin))
+    (repo / "a.txt").write_text("one\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "one")
+    first = _git(repo, "rev-parse", "HEAD")
+    (repo / "a.txt").write_text("two\n")
+    (repo / "b.txt").write_text("new\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "two")
+    second = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "push", "-q", "origin", "main")
+    return repo, first, second
+
+
+def _exit(pool) -> None:
+    """Release the slot locks, as the pool's process exiting would."""
+    for path in list(pool._locks):
+        pool._unlock_slot(path)
+
+
+class TestPRWorktreePool:
+    """Tests for PRWorktreePool."""
+
+    def test_slot_is_reset_to_new_sha(self, git_repo):
+        repo, first, second = git_repo
+        manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+        pool = PRWorktreePool(manager, size=1)
+
+        path = pool.acquire(second)
+        assert (path / "b.txt").exists()
+        (path / "scratch.txt").write_text("left over from review")
+        pool.release(path)
+
+        reused = pool.acquire(first)
+
+        assert reused == path
+        assert _git(reused, "rev-parse", "HEAD") == first
+        assert (reused / "a.txt").read_text() == "one\n"
+        assert not (reused / "b.txt").exists()
+        assert not (reused / "scratch.txt").exists()
+        assert pool.stats["created"] == 1
+        assert pool.stats["reused"] == 1
+
+        pool.release(reused)
+        pool.close()
+        assert not path.exists()
+
+    def test_pool_slots_survive_review_cleanup(self, git_repo):
+        repo, first, _ = git_repo
+        manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+        pool = PRWorktreePool(manager, size=2)
+
+        path = pool.acquire(first)
+        manager.cleanup_all_worktrees()
+
+        assert path.exists()
+        assert pool.owns(path)
+        pool.release(path)
+        pool.close()
+
+    def test_busy_pool_times_out(self, git_repo):
+        repo, first, _ = git_repo
+        pool = PRWorktreePool(
+            PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees"), size=1
+        )
+        path = pool.acquire(first)
+
+        with pytest.raises(RuntimeError, match="Timeout"):
+            pool.acquire(first, timeout=0.05)
+
+        pool.release(path)
+        pool.close()
+
+    def test_adopts_slots_from_previous_run(self, git_repo):
+        repo, first, second = git_repo
+        manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+        pool = PRWorktreePool(manager, size=1)
+        pool.release(pool.acquire(first))
+        _exit(pool)
+
+        restarted = PRWorktreePool(manager, size=1)
+        path = restarted.acquire(second)
+
+        assert restarted.stats["reused"] == 1
+        assert _git(path, "rev-parse", "HEAD") == second
+        restarted.release(path)
+        restarted.close()
+
+    def test_slots_of_a_live_pool_are_left_alone(self, git_repo):
+        repo, first, second = git_repo
+        manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+        running = PRWorktreePool(manager, size=1)
+        busy = running.acquire(first)
+        idle_pool = PRWorktreePool(manager, size=1)
+        idle_pool.release(idle_pool.acquire(first))
+
+        other = PRWorktreePool(manager, size=2)
+        path = other.acquire(second)
+
+        assert other.stats == {
+            "created": 1,
+            "reused": 0,
+            "reset_failures": 0,
+            "waits": 0,
+        }
+        assert path not in (busy, *idle_pool._idle)
+        assert _git(busy, "rev-parse", "HEAD") == first
+        assert all(p.exists() for p in idle_pool._idle)
+
+        other.release(path)
+        other.close()
+        running.release(busy)
+        running.close()
+        idle_pool.close()
+
+    def test_rejects_invalid_sha(self, git_repo):
+        repo, _, _ = git_repo
+        pool = PRWorktreePool(
+            PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees"), size=1
+        )
+
+        with pytest.raises(ValueError):
+            pool.acquire("abc; rm -rf /")
+
+
+class TestCommitFetcher:
+    """Tests for fetch deduplication."""
+
+    def test_local_and_repeated_commits_are_not_fetched(self, git_repo):
+        repo, first, second = git_repo
+        fetcher = CommitFetcher(repo)
+
+        assert fetcher.ensure_commits([first, second, first])
+        assert fetcher.ensure_commits([second])
+
+        assert fetcher.stats.fetch_calls == 0
+        assert fetcher.stats.already_local == 2
+        assert fetcher.stats.deduplicated == 1
+
+    def test_missing_commit_is_fetched_once(self, git_repo, tmp_path):
+        repo, _, second = git_repo
+        clone = tmp_path / "clone"
+        _git(
+            tmp_path,
+            "clone",
+            "-q",
+            "--depth=1",
+            str(repo.parent / "origin.git"),
+            str(clone),
+        )
+        _git(
+            repo.parent / "origin.git",
+            "config",
+            "uploadpack.allowAnySHA1InWant",
+            "true",
+        )
+        (repo / "c.txt").write_text("three\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "three")
+        third = _git(repo, "rev-parse", "HEAD")
+        _git(repo, "push", "-q", "origin", "main")
+
+        fetcher = CommitFetcher(clone)
+
+        async def fetch_concurrently():
+            return await asyncio.gather(
+                *(fetcher.ensure_commits_async([third, second]) for _ in range(3))
+            )
+
+        assert all(asyncio.run(fetch_concurrently()))
+        assert fetcher.stats.fetch_calls == 1
+        assert fetcher.has_commit(third)
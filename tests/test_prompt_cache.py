@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Tests for the prompt fragment cache.
+
+Tests cover:
+- Fragment memoization by (path, mtime, size)
+- Re-rendering when the source file changes
+- Cached recovery context and human input in get_coding_prompt
+- Cached, truncated file context in load_subtask_context
+- Prompt build instrumentation
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg.prompt_cache import (
+    PromptBuildTimer,
+    PromptFragmentCache,
+    get_prompt_cache,
+    reset_prompt_cache,
+)
+from prompts_pkg.prompt_generator import load_subtask_context
+from prompts_pkg.prompts import _get_recovery_context, get_coding_prompt
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Give every test its own process-wide prompt cache."""
+    reset_prompt_cache()
+    yield
+    reset_prompt_cache()
+
+
+def _touch_later(path: Path, content: str) -> None:
+    """Rewrite a file and force its mtime forward so the change is detected."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestPromptFragmentCache:
+    """Tests for PromptFragmentCache."""
+
+    def test_renders_once_while_unchanged(self, tmp_path):
+        source = tmp_path / "fragment.md"
+        source.write_text("hello")
+        calls = []
+
+        def render(text):
+            calls.append(text)
+            return text.upper()
+
+        cache = PromptFragmentCache()
+        assert cache.get_fragment(source, render) == "HELLO"
+        assert cache.get_fragment(source, render) == "HELLO"
+
+        assert calls == ["hello"]
+        assert cache.stats.cache_hits == 1
+        assert cache.stats.cache_misses == 1
+        assert cache.stats.bytes_read == len("hello")
+
+    def test_rerenders_after_change(self, tmp_path):
+        source = tmp_path / "fragment.md"
+        source.write_text("one")
+        cache = PromptFragmentCache()
+        assert cache.read_text(source) == "one"
+
+        _touch_later(source, "two")
+
+        assert cache.read_text(source) == "two"
+        assert cache.stats.cache_misses == 2
+
+    def test_namespaces_are_independent(self, tmp_path):
+        source = tmp_path / "fragment.md"
+        source.write_text("abc")
+        cache = PromptFragmentCache()
+
+        assert cache.get_fragment(source, str.upper, "upper") == "ABC"
+        assert cache.get_fragment(source, lambda t: t[::-1], "reverse") == "cba"
+
+    def test_missing_file_returns_default(self, tmp_path):
+        cache = PromptFragmentCache()
+        assert cache.read_text(tmp_path / "missing.md") is None
+        assert cache.get_fragment(tmp_path / "missing.md", str.upper, default="") == ""
+        assert cache.stats.cache_misses == 0
+
+    def test_undecodable_file_raises(self, tmp_path):
+        source = tmp_path / "planner.md"
+        source.write_bytes(b"\xff\xfe not utf-8")
+        cache = PromptFragmentCache()
+
+        # Like Path.read_text(): prompt builders must not get None back
+        with pytest.raises(UnicodeDecodeError):
+            cache.read_text(source)
+        assert cache.get_fragment(source, str.upper, default="") == ""
+
+    def test_lru_eviction(self, tmp_path):
+        cache = PromptFragmentCache(max_entries=2)
+        files = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.md"
+            path.write_text(str(i))
+            files.append(path)
+            cache.read_text(path)
+
+        assert len(cache) == 2
+        cache.read_text(files[0])
+        assert cache.stats.cache_misses == 4
+
+    def test_invalidate_path(self, tmp_path):
+        source = tmp_path / "fragment.md"
+        source.write_text("x")
+        cache = PromptFragmentCache()
+        cache.read_text(source)
+
+        cache.invalidate(source)
+
+        assert len(cache) == 0
+
+
+class TestPromptBuildTimer:
+    """Tests for prompt build instrumentation."""
+
+    def test_records_build(self):
+        cache = PromptFragmentCache()
+        with PromptBuildTimer("subtask", cache) as timer:
+            timer.prompt = "é" * 10
+
+        assert timer.prompt_bytes == 20
+        assert cache.stats.builds == 1
+        assert cache.stats.last_prompt_bytes == 20
+        assert cache.stats.builds_by_kind == {"subtask": 1}
+        assert cache.stats.to_dict()["total_prompt_bytes"] == 20
+
+    def test_failed_build_not_recorded(self):
+        cache = PromptFragmentCache()
+        with pytest.raises(RuntimeError):
+            with PromptBuildTimer("subtask", cache):
+                raise RuntimeError("boom")
+
+        assert cache.stats.builds == 0
+
+
+class TestCachedPromptSources:
+    """Tests for prompt builders reading through the cache."""
+
+    def test_recovery_context_tracks_history_changes(self, tmp_path):
+        memory_dir = tmp_path / "memory"
+        memory_dir.mkdir()
+        history_file = memory_dir / "attempt_history.json"
+        history_file.write_text(json.dumps({"subtasks": {}, "stuck_subtasks": []}))
+
+        assert _get_recovery_context(tmp_path) == ""
+
+        _touch_later(
+            history_file,
+            json.dumps(
+                {
+                    "subtasks": {},
+                    "stuck_subtasks": [
+                        {
+                            "subtask_id": "1.1",
+                            "reason": "keeps failing",
+                            "attempt_count": 3,
+                        }
+                    ],
+                }
+            ),
+        )
+
+        context = _get_recovery_context(tmp_path)
+        assert "STUCK SUBTASKS DETECTED" in context
+        assert "1.1: keeps failing (3 attempts)" in context
+
+    def test_recovery_context_invalid_json(self, tmp_path):
+        memory_dir = tmp_path / "memory"
+        memory_dir.mkdir()
+        (memory_dir / "attempt_history.json").write_text("{not json")
+
+        assert _get_recovery_context(tmp_path) == ""
+
+    def test_coding_prompt_reuses_template(self, tmp_path):
+        (tmp_path / "HUMAN_INPUT.md").write_text("Use the new API")
+
+        first = get_coding_prompt(tmp_path)
+        misses = get_prompt_cache().stats.cache_misses
+        second = get_coding_prompt(tmp_path)
+
+        assert first == second
+        assert "Use the new API" in first
+        assert get_prompt_cache().stats.cache_misses == misses
+
+    def test_blank_human_input_is_omitted(self, tmp_path):
+        (tmp_path / "HUMAN_INPUT.md").write_text("   \n")
+
+        assert "HUMAN INPUT" not in get_coding_prompt(tmp_path)
+
+    def test_subtask_context_truncates_and_caches(self, tmp_path):
+        (tmp_path / "big.py").write_text("\n".join(f"line {i}" for i in range(10)))
+        subtask = {"patterns_from": ["big.py"], "files_to_modify": ["big.py"]}
+
+        context = load_subtask_context(tmp_path, tmp_path, subtask, max_file_lines=3)
+
+        assert context["patterns"]["big.py"].startswith("line 0\nline 1\nline 2")
+        assert "(truncated, 7 more lines)" in context["patterns"]["big.py"]
+        assert context["files_to_modify"]["big.py"] == context["patterns"]["big.py"]
+        assert get_prompt_cache().stats.cache_misses == 1
+        assert get_prompt_cache().stats.cache_hits == 1
+
+    def test_subtask_context_unreadable_path(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        subtask = {"files_to_modify": ["pkg", "missing.py"]}
+
+        context = load_subtask_context(tmp_path, tmp_path, subtask)
+
+        assert context["files_to_modify"] == {"pkg": "(Could not read file)"}
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Tests for keyword search and pagination in the memory query CLI.
+
+Tests cover:
+- Full-text (BM25) search when Graphiti's FTS index exists
+- CONTAINS fallback when the index is missing
+- Pagination cursors for search and get-memories
+- serve: JSON-line requests answered with warm connections
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import query_memory
+from query_memory import (
+    InvalidCursorError,
+    _ServeState,
+    decode_cursor,
+    encode_cursor,
+    handle_request,
+    list_episodes,
+    search_episodes,
+)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def has_next(self):
+        return bool(self._rows)
+
+    def get_next(self):
+        return self._rows.pop(0)
+
+
+class FakeConnection:
+    """Returns scripted rows for queries and records what was executed."""
+
+    def __init__(self, rows=(), fts_index=True):
+        self.rows = list(rows)
+        self.fts_index = fts_index
+        self.queries = []
+
+    def execute(self, query, parameters=None):
+        self.queries.append((query, parameters or {}))
+        if "SHOW_INDEXES" in query:
+            if not self.fts_index:
+                return FakeResult([])
+            return FakeResult([["Episodic", "episode_content", "FTS", ["content"]]])
+        if "LOAD EXTENSION" in query:
+            return FakeResult([])
+        return FakeResult(self.rows[: parameters["limit"]])
+
+    @property
+    def last_query(self):
+        return self.queries[-1]
+
+
+def _episode(i, score=None):
+    row = [
+        f"uuid-{i}",
+        f"session_{i}",
+        datetime(2025, 1, 1, 12, i),
+        f"content {i}",
+        "",
+        "group",
+    ]
+    if score is not None:
+        row.append(score)
+    return row
+
+
+class TestCursors:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        values = {"type": "fulltext", "score": 1.5, "uuid": "abc", "seen": 20}
+
+        assert decode_cursor(encode_cursor(values)) == values
+        assert decode_cursor(None) is None
+
+    def test_invalid_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not a cursor!")
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor(["list"]))  # type: ignore[arg-type]
+
+
+class TestSearchEpisodes:
+    """Tests for search_episodes()."""
+
+    def test_fulltext_search_pages(self):
+        conn = FakeConnection([_episode(i, score=3.0 - i) for i in range(3)])
+
+        memories, cursor, search_type = search_episodes(conn, "auth", limit=2)
+
+        assert search_type == "fulltext"
+        assert [m["id"] for m in memories] == ["uuid-0", "uuid-1"]
+        assert memories[0]["score"] == 3.0
+        assert memories[1]["session_number"] == 1
+        query, params = conn.last_query
+        assert "QUERY_FTS_INDEX('Episodic', 'episode_content'" in query
+        assert "CONTAINS" not in query
+        assert params == {"search_query": "auth", "top": 3, "limit": 3}
+
+        conn.rows = [_episode(2, score=1.0)]
+        memories, next_cursor, _ = search_episodes(conn, "auth", limit=2, cursor=cursor)
+
+        assert [m["id"] for m in memories] == ["uuid-2"]
+        assert next_cursor is None
+        _query, params = conn.last_query
+        assert params["top"] == 5
+        assert params["cursor_score"] == 2.0
+        assert params["cursor_uuid"] == "uuid-1"
+
+    def test_falls_back_to_contains_without_index(self):
+        conn = FakeConnection([_episode(i) for i in range(3)], fts_index=False)
+
+        memories, cursor, search_type = search_episodes(conn, "Auth", limit=2)
+
+        assert search_type == "keyword"
+        assert [m["score"] for m in memories] == [1.0, 1.0]
+        assert cursor is not None
+        assert not any("QUERY_FTS_INDEX" in q for q, _ in conn.queries)
+        query, params = conn.last_query
+        assert "CONTAINS $search_query" in query
+        assert params["search_query"] == "auth"
+
+    def test_cursor_from_other_search_type_is_rejected(self):
+        conn = FakeConnection([_episode(i) for i in range(3)], fts_index=False)
+        _memories, cursor, _ = search_episodes(conn, "auth", limit=2)
+
+        conn.fts_index = True
+        with pytest.raises(InvalidCursorError):
+            search_episodes(conn, "auth", limit=2, cursor=cursor)
+
+
+class TestListEpisodes:
+    """Tests for list_episodes()."""
+
+    def test_keyset_pagination(self):
+        conn = FakeConnection([_episode(i) for i in range(3)])
+
+        memories, cursor = list_episodes(conn, limit=2)
+
+        assert len(memories) == 2
+        assert "WHERE" not in conn.last_query[0]
+
+        conn.rows = [_episode(2)]
+        memories, next_cursor = list_episodes(conn, limit=2, cursor=cursor)
+
+        assert [m["id"] for m in memories] == ["uuid-2"]
+        assert next_cursor is None
+        query, params = conn.last_query
+        assert "e.created_at < $cursor_created_at" in query
+        # Timestamps go back to the database as datetimes, not strings
+        assert params["cursor_created_at"] == datetime(2025, 1, 1, 12, 1)
+        assert params["cursor_uuid"] == "uuid-1"
+
+
+class TestServe:
+    """Tests for the serve command."""
+
+    @pytest.fixture
+    def serving(self, monkeypatch, tmp_path: Path):
+        (tmp_path / "memory_db").mkdir()
+        opened = []
+
+        def fake_connection(state, full_path):
+            if not opened:
+                opened.append(FakeConnection([_episode(i) for i in range(3)]))
+            return opened[0]
+
+        state = _ServeState()
+        monkeypatch.setattr(query_memory, "_serve_state", state)
+        monkeypatch.setattr(query_memory, "apply_monkeypatch", lambda: "kuzu")
+        monkeypatch.setattr(_ServeState, "connection", fake_connection)
+        yield tmp_path, opened
+        state.loop.close()
+
+    def test_requests_reuse_connection(self, serving):
+        db_path, opened = serving
+
+        responses = [
+            handle_request(
+                json.dumps(
+                    {
+                        "id": i,
+                        "args": ["search", str(db_path), "memory_db", "auth"],
+                    }
+                )
+            )
+            for i in range(3)
+        ]
+
+        assert [r["id"] for r in responses] == [0, 1, 2]
+        assert all(r["success"] for r in responses)
+        assert responses[0]["data"]["count"] == 3
+        assert len(opened) == 1
+
+    def test_errors_are_responses(self, serving):
+        db_path, _opened = serving
+
+        assert not handle_request("not json")["success"]
+        assert not handle_request(json.dumps({"args": "search"}))["success"]
+        response = handle_request(json.dumps({"id": "x", "args": ["--help"]}))
+        assert response == {
+            "success": False,
+            "error": "Invalid arguments: ['--help']",
+            "id": "x",
+        }
+        response = handle_request(
+            json.dumps({"args": ["get-memories", str(db_path), "missing_db"]})
+        )
+        assert not response["success"]
+        assert "Database not found" in response["error"]
+
+    def test_stdio_protocol(self, tmp_path: Path):
+        script = Path(query_memory.__file__)
+        requests = "\n".join(
+            json.dumps({"id": i, "args": ["get-status", str(tmp_path), "db"]})
+            for i in range(2)
+        )
+
+        result = subprocess.run(
+            [sys.executable, str(script), "serve"],
+            input=requests + "\n",
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        lines = result.stdout.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [0, 1]
+        assert all(json.loads(line)["success"] for line in lines)
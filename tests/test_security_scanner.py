@@ -8,10 +8,13 @@ Tests cover:
 - Dependency audit integration
 - Result aggregation
 - Blocking logic
+- Concurrent scans and the audit/Bandit result cache
 """
 
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -29,6 +32,7 @@ from security_scanner import (
     has_security_issues,
     scan_secrets_only,
     HAS_SECRETS_SCANNER,
+    SCAN_CACHE_FILE,
 )
 
 
@@ -355,6 +359,25 @@ class TestConvenienceFunctions:
 
         assert isinstance(result, SecurityScanResult)
 
+    def test_cli_base_branch(self, temp_dir, monkeypatch):
+        """Test that --base-branch is passed to the scan."""
+        from analysis import security_scanner as scanner_module
+
+        calls = []
+
+        def fake_scan(self, project_dir, **kwargs):
+            calls.append(kwargs)
+            return SecurityScanResult()
+
+        monkeypatch.setattr(scanner_module.SecurityScanner, "scan", fake_scan)
+        monkeypatch.setattr(
+            sys, "argv", ["security_scanner", str(temp_dir), "--base-branch", "main"]
+        )
+
+        scanner_module.main()
+
+        assert calls[0]["base_branch"] == "main"
+
     def test_has_security_issues_clean(self, temp_dir):
         """Test has_security_issues on clean project."""
         (temp_dir / "app.py").write_text("print('hello')")
@@ -492,3 +515,171 @@ class TestSASTIntegration:
         # Check parsing worked
         if result.vulnerabilities:
             assert any(v.source == "npm_audit" for v in result.vulnerabilities)
+
+
+# =============================================================================
+# CONCURRENCY AND CACHING TESTS
+# =============================================================================
+
+STUB_LATENCY = 0.3
+
+STUB_TOOLS = {
+    "bandit": """
+if "--version" in sys.argv:
+    print("bandit 1.7.9")
+    sys.exit(0)
+results = []
+for path in sys.argv[1:]:
+    if path.endswith(".py") and "eval(" in open(path).read():
+        results.append({
+            "filename": path,
+            "issue_severity": "MEDIUM",
+            "issue_text": "Use of possibly insecure function",
+            "line_number": 1,
+            "issue_cwe": {"id": 78},
+        })
+print(json.dumps({"results": results, "errors": []}))
+""",
+    "npm": """
+print(json.dumps({"vulnerabilities": {
+    "lodash": {"severity": "high", "via": [{"title": "Prototype Pollution"}]}
+}}))
+""",
+    "pip-audit": """
+print(json.dumps([
+    {"name": "flask", "fix_versions": ["2.2.5"], "description": "", "aliases": []}
+]))
+""",
+}
+
+
+@pytest.fixture
+def stub_tools(tmp_path, monkeypatch):
+    """Put slow bandit, npm and pip-audit stubs on PATH; returns their call log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log_file = tmp_path / "calls.log"
+    for name, body in STUB_TOOLS.items():
+        script = bin_dir / name
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys, time\n"
+            f"with open({str(log_file)!r}, 'a') as log:\n"
+            f"    log.write(json.dumps([{name!r}, sys.argv[1:]]) + '\\n')\n"
+            f"if '--version' not in sys.argv:\n"
+            f"    time.sleep({STUB_LATENCY})\n"
+            + body
+        )
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def calls(tool):
+        if not log_file.exists():
+            return []
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        return [args for name, args in entries if name == tool and "--version" not in args]
+
+    return calls
+
+
+@pytest.fixture
+def mixed_project(tmp_path):
+    """Python + Node project with one Bandit finding."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("flask==2.0.0\n")
+    (project / "package.json").write_text(json.dumps({"name": "test"}))
+    (project / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3}))
+    (project / "app.py").write_text("eval(input())\n")
+    (project / "util.py").write_text("VALUE = 1\n")
+    return project
+
+
+def _scan(project, use_cache=True):
+    return SecurityScanner(use_cache=use_cache).scan(project, run_secrets=False)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stub tools are POSIX scripts")
+class TestConcurrentCachedScans:
+    """Tests for concurrent scans and cached audit/Bandit results."""
+
+    def test_scans_run_concurrently(self, stub_tools, mixed_project):
+        """Bandit, npm audit and pip-audit overlap instead of adding up."""
+        start = time.perf_counter()
+        result = _scan(mixed_project)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < STUB_LATENCY * 2.5
+        # Findings are merged in scan order
+        assert [v.source for v in result.vulnerabilities] == [
+            "bandit",
+            "npm_audit",
+            "pip_audit",
+        ]
+        assert result.vulnerabilities[0].file == "app.py"
+
+    def test_audits_cached_until_lockfile_changes(self, stub_tools, mixed_project):
+        """Audits are skipped while their lockfiles are unchanged."""
+        first = _scan(mixed_project)
+        second = _scan(mixed_project)
+
+        assert len(stub_tools("npm")) == 1
+        assert len(stub_tools("pip-audit")) == 1
+        assert [v.title for v in second.vulnerabilities] == [
+            v.title for v in first.vulnerabilities
+        ]
+        assert (mixed_project / SCAN_CACHE_FILE).exists()
+
+        (mixed_project / "package-lock.json").write_text(json.dumps({"v": 4}))
+        _scan(mixed_project)
+
+        assert len(stub_tools("npm")) == 2
+        assert len(stub_tools("pip-audit")) == 1
+        # The requirements file is audited, not the scanner's environment
+        assert stub_tools("pip-audit")[0][-2:] == ["-r", "requirements.txt"]
+
+    def test_environment_audit_keyed_by_installed_packages(
+        self, stub_tools, tmp_path
+    ):
+        """Without requirements files, installs invalidate the pip-audit cache."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        # The stub's environment (its bin/ is tmp_path/bin)
+        site_packages = tmp_path / "lib" / "python3.11" / "site-packages"
+        site_packages.mkdir(parents=True)
+        os.utime(site_packages, ns=(0, 0))
+
+        _scan(project)
+        _scan(project)
+        assert len(stub_tools("pip-audit")) == 1
+        assert "-r" not in stub_tools("pip-audit")[0]
+
+        (site_packages / "flask-3.0.0.dist-info").mkdir()
+        _scan(project)
+
+        assert len(stub_tools("pip-audit")) == 2
+
+    def test_bandit_rescans_only_changed_files(self, stub_tools, mixed_project):
+        """Only Python files whose content changed go back to Bandit."""
+        _scan(mixed_project)
+        (mixed_project / "util.py").write_text("VALUE = 2\n")
+
+        result = _scan(mixed_project)
+
+        assert stub_tools("bandit")[0][-2:] == ["app.py", "util.py"]
+        assert stub_tools("bandit")[1][-1:] == ["util.py"]
+        assert "app.py" not in stub_tools("bandit")[1]
+        # Cached findings of unchanged files are still reported
+        assert [v.file for v in result.vulnerabilities if v.source == "bandit"] == [
+            "app.py"
+        ]
+
+    def test_cache_disabled(self, stub_tools, mixed_project):
+        """use_cache=False always runs the tools and writes no cache."""
+        _scan(mixed_project, use_cache=False)
+        _scan(mixed_project, use_cache=False)
+
+        assert len(stub_tools("npm")) == 2
+        assert len(stub_tools("bandit")) == 2
+        assert not (mixed_project / SCAN_CACHE_FILE).exists()
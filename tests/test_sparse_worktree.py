@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for sparse PR review worktrees.
+
+Tests cover:
+- Sparse-checkout patterns for files with special characters
+- Creating a sparse worktree with only the requested and top-level files
+- Lazy expansion before Read, Glob and Grep tool calls
+- Full expansion for repository-wide searches
+"""
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from sparse_worktree import LazySparseCheckout, benchmark, file_pattern
+
+
+def _load_service(name: str):
+    # Load directly: another top-level "services" package may already be imported
+    spec = importlib.util.spec_from_file_location(
+        f"github_{name}", _github_dir / "services" / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+PRWorktreeManager = _load_service("pr_worktree_manager").PRWorktreeManager
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _write(root: Path, rel_path: str, content: str = "") -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    _write(root, "package.json", "{}")
+    _write(root, "src/app.ts", "import './utils';\n")
+    _write(root, "src/utils.ts", "export const x = 1;\n")
+    _write(root, "src/deep/nested/a.py", "import os\n")
+    _write(root, "docs/guide.md", "# Guide\n")
+    _write(root, "lib/[id].ts", "export default 1;\n")
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "test@example.com")
+    _git(root, "config", "user.name", "Test")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+@pytest.fixture
+def sparse_worktree(repo: Path) -> Path:
+    manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+    sha = _git(repo, "rev-parse", "HEAD")
+    return manager.create_worktree(
+        sha, 1, auto_cleanup=False, sparse_paths=["src/app.ts", "lib/[id].ts"]
+    )
+
+
+def _files(root: Path) -> set[str]:
+    return {
+        p.relative_to(root).as_posix()
+        for p in root.rglob("*")
+        if p.is_file() and ".git" not in p.parts
+    }
+
+
+class TestSparseCheckout:
+    """Tests for creating sparse PR worktrees."""
+
+    def test_file_pattern_escapes_special_characters(self):
+        assert file_pattern("src/app.ts") == "/src/app.ts"
+        assert file_pattern("lib/[id].ts") == "/lib/\\[id\\].ts"
+        assert file_pattern("a/!b#*.md") == "/a/\\!b\\#\\*.md"
+
+    def test_only_requested_and_top_level_files(self, repo, sparse_worktree):
+        assert _files(sparse_worktree) == {"package.json", "src/app.ts", "lib/[id].ts"}
+        # The checkout is clean and the main repository stays complete
+        assert _git(sparse_worktree, "status", "--porcelain") == ""
+        assert (repo / "docs" / "guide.md").exists()
+
+    def test_full_checkout_by_default(self, repo):
+        manager = PRWorktreeManager(repo, ".auto-claude/github/pr/worktrees")
+        path = manager.create_worktree(
+            _git(repo, "rev-parse", "HEAD"), 2, auto_cleanup=False
+        )
+
+        assert "docs/guide.md" in _files(path)
+
+    def test_benchmark(self, repo):
+        results = benchmark(repo, "HEAD", ["src/app.ts"])
+
+        assert results["full"]["files"] == 6
+        assert results["sparse"]["files"] == 2
+        assert results["sparse"]["bytes"] < results["full"]["bytes"]
+
+
+class TestLazySparseCheckout:
+    """Tests for on-demand expansion."""
+
+    def test_read_materializes_file(self, sparse_worktree):
+        sparse = LazySparseCheckout(sparse_worktree, ["src/app.ts"])
+
+        result = asyncio.run(
+            sparse.pre_tool_use_hook(
+                {
+                    "tool_name": "Read",
+                    "tool_input": {"file_path": str(sparse_worktree / "src/utils.ts")},
+                }
+            )
+        )
+
+        assert result == {}
+        assert (sparse_worktree / "src" / "utils.ts").exists()
+        assert sparse.stats["files_added"] == 1
+        # Already checked out: no more git calls
+        assert sparse.ensure_paths(["src/utils.ts", "src/app.ts"]) == []
+        assert sparse.stats["expansions"] == 1
+
+    def test_read_outside_worktree_is_ignored(self, sparse_worktree, tmp_path):
+        sparse = LazySparseCheckout(sparse_worktree)
+
+        sparse.ensure_for_tool("Read", {"file_path": str(tmp_path / "other.txt")})
+
+        assert sparse.stats["expansions"] == 0
+
+    def test_glob_materializes_matches(self, sparse_worktree):
+        sparse = LazySparseCheckout(sparse_worktree, ["src/app.ts"])
+
+        sparse.ensure_for_tool("Glob", {"pattern": "**/*.py", "path": "src"})
+
+        assert (sparse_worktree / "src/deep/nested/a.py").exists()
+        assert not (sparse_worktree / "docs/guide.md").exists()
+
+    def test_grep_with_glob_or_type(self, sparse_worktree):
+        sparse = LazySparseCheckout(sparse_worktree, ["src/app.ts"])
+
+        sparse.ensure_for_tool("Grep", {"pattern": "x", "glob": "*.{md,txt}"})
+        sparse.ensure_for_tool("Grep", {"pattern": "x", "type": "ts", "path": "src"})
+
+        assert (sparse_worktree / "docs/guide.md").exists()
+        assert (sparse_worktree / "src/utils.ts").exists()
+        assert not (sparse_worktree / "src/deep/nested/a.py").exists()
+
+    def test_grep_directory_and_whole_repo(self, sparse_worktree):
+        sparse = LazySparseCheckout(sparse_worktree, ["src/app.ts"])
+
+        sparse.ensure_for_tool("Grep", {"pattern": "x", "path": "src/deep"})
+        assert (sparse_worktree / "src/deep/nested/a.py").exists()
+        assert sparse.is_materialized("src/deep/nested/other.py")
+        assert not (sparse_worktree / "docs/guide.md").exists()
+
+        sparse.ensure_for_tool("Grep", {"pattern": "x"})
+
+        assert sparse.full
+        assert sparse.stats["full_expansions"] == 1
+        assert (sparse_worktree / "docs/guide.md").exists()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the spec catalog.
+
+Tests cover:
+- Listing matches the per-spec status and build presence
+- Unchanged plans are served from the catalog
+- Plans changed outside record_plan() are re-parsed
+- Plan saves update the catalog entry
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from core.spec_catalog import CATALOG_FILE, SpecCatalog
+from implementation_plan import ImplementationPlan, Phase, Subtask, SubtaskStatus
+
+
+def _plan(*statuses: str) -> dict:
+    return {
+        "feature": "x",
+        "phases": [
+            {
+                "phase": 1,
+                "name": "p",
+                "subtasks": [
+                    {"id": f"s{i}", "description": "d", "status": status}
+                    for i, status in enumerate(statuses)
+                ],
+            }
+        ],
+    }
+
+
+def _add_spec(specs_dir: Path, folder: str, plan: dict | None = None) -> Path:
+    spec_dir = specs_dir / folder
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text("# Spec\n")
+    if plan is not None:
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+    return spec_dir
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    specs_dir = tmp_path / ".auto-claude" / "specs"
+    _add_spec(specs_dir, "001-done", _plan("completed", "completed"))
+    _add_spec(specs_dir, "002-working", _plan("completed", "pending"))
+    _add_spec(specs_dir, "003-empty", {"feature": "x", "phases": []})
+    _add_spec(specs_dir, "004-new")
+    (specs_dir / "005-no-spec-md").mkdir()
+    (specs_dir / "notes").mkdir()
+    (tmp_path / ".auto-claude" / "worktrees" / "tasks" / "002-working").mkdir(
+        parents=True
+    )
+    return tmp_path
+
+
+def _catalog(project: Path) -> SpecCatalog:
+    return SpecCatalog(project / ".auto-claude" / "specs")
+
+
+class TestSpecCatalog:
+    """Tests for SpecCatalog.list()."""
+
+    def test_lists_specs(self, project):
+        specs = _catalog(project).list(project)
+
+        assert [(s["folder"], s["status"], s["progress"]) for s in specs] == [
+            ("001-done", "complete", "2/2"),
+            ("002-working", "in_progress (has build)", "1/2"),
+            ("003-empty", "initialized", "0/0"),
+            ("004-new", "pending", "-"),
+        ]
+        assert specs[1]["has_build"] and specs[1]["number"] == "002"
+        assert specs[1]["name"] == "working"
+        assert specs[1]["path"] == project / ".auto-claude" / "specs" / "002-working"
+
+    def test_second_listing_uses_catalog(self, project):
+        _catalog(project).list(project)
+
+        catalog = _catalog(project)
+        catalog.list(project)
+
+        assert catalog.stats == {"parsed": 0, "cached": 4}
+
+    def test_changed_plan_is_reparsed(self, project):
+        _catalog(project).list(project)
+        plan_file = (
+            project
+            / ".auto-claude"
+            / "specs"
+            / "002-working"
+            / "implementation_plan.json"
+        )
+        plan_file.write_text(json.dumps(_plan("completed", "completed", "pending")))
+        os.utime(plan_file, ns=(1, 1))
+
+        catalog = _catalog(project)
+        specs = catalog.list(project)
+
+        assert specs[1]["progress"] == "2/3"
+        assert catalog.stats["parsed"] == 1
+
+    def test_corrupt_catalog_is_rebuilt(self, project):
+        catalog_file = project / ".auto-claude" / "specs" / CATALOG_FILE
+        catalog_file.write_text("{broken")
+
+        specs = _catalog(project).list(project)
+
+        assert len(specs) == 4
+        entries = json.loads(catalog_file.read_text())["specs"]
+        assert entries["001-done"]["progress"] == "2/2"
+
+    def test_plan_save_updates_catalog(self, project):
+        _catalog(project).list(project)
+        spec_dir = project / ".auto-claude" / "specs" / "004-new"
+        plan = ImplementationPlan(
+            feature="x",
+            phases=[
+                Phase(
+                    phase=1,
+                    name="p",
+                    subtasks=[
+                        Subtask(
+                            id="a", description="d", status=SubtaskStatus.COMPLETED
+                        ),
+                        Subtask(id="b", description="d"),
+                    ],
+                )
+            ],
+        )
+
+        plan.save(spec_dir / "implementation_plan.json")
+
+        catalog = _catalog(project)
+        specs = catalog.list(project)
+        assert specs[3]["progress"] == "1/2"
+        assert catalog.stats["parsed"] == 0
+
+    def test_record_plan_without_catalog_is_noop(self, tmp_path):
+        spec_dir = tmp_path / "specs" / "001-x"
+        spec_dir.mkdir(parents=True)
+
+        ImplementationPlan(feature="x").save(spec_dir / "implementation_plan.json")
+
+        assert not (tmp_path / "specs" / CATALOG_FILE).exists()
@@ -8,8 +8,10 @@ Tests the spec/pipeline.py module functionality including:
 - Spec directory creation and naming
 - Orphaned pending folder cleanup
 - Specs directory path resolution
+- Dependency-aware concurrent phase execution
 """
 
+import asyncio
 import json
 import pytest
 import sys
@@ -86,6 +88,7 @@ sys.modules['validate_spec'] = mock_validate_spec
 
 # Now import the module under test
 from spec.pipeline import SpecOrchestrator, get_specs_dir
+from spec.phases import PhaseResult, get_phase_dependencies
 
 
 # Cleanup fixture to restore original modules after all tests in this module
@@ -592,3 +595,141 @@ class TestSpecOrchestratorAssessment:
             orchestrator = SpecOrchestrator(project_dir=temp_dir)
 
             assert orchestrator.assessment is None
+
+
+COMPLEX_PHASES = [
+    "historical_context",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+]
+
+
+class FakePhases:
+    """Phases with a fixed latency that record when they ran."""
+
+    def __init__(self, latency: float = 0.02, failing=(), raising=()):
+        self.latency = latency
+        self.failing = set(failing)
+        self.raising = set(raising)
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def run(self, name: str) -> PhaseResult:
+        self.events.append(("start", name))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.latency)
+            if name in self.raising:
+                raise RuntimeError(f"{name} crashed")
+        finally:
+            self.running -= 1
+        self.events.append(("end", name))
+        if name in self.failing:
+            return PhaseResult(name, False, [], [f"{name} failed"], 3)
+        return PhaseResult(name, True, [f"{name}.json"], [], 0)
+
+    def index(self, event: str, name: str) -> int:
+        return self.events.index((event, name))
+
+
+@pytest.fixture
+def orchestrator(temp_dir: Path):
+    """SpecOrchestrator with phase summarization recorded instead of run."""
+    with patch('spec.pipeline.init_auto_claude_dir') as mock_init:
+        mock_init.return_value = (temp_dir / ".auto-claude", False)
+        (temp_dir / ".auto-claude" / "specs").mkdir(parents=True, exist_ok=True)
+        orchestrator = SpecOrchestrator(project_dir=temp_dir)
+    orchestrator.summarized = []
+
+    async def store_summary(phase_name):
+        orchestrator.summarized.append(phase_name)
+
+    orchestrator._store_phase_summary = store_summary
+    return orchestrator
+
+
+class TestPhaseDependencies:
+    """Tests for artifact-based phase dependencies."""
+
+    def test_complex_dependencies(self):
+        """Phases that only read requirements don't wait for each other."""
+        deps = get_phase_dependencies(COMPLEX_PHASES)
+
+        assert deps["historical_context"] == set()
+        assert deps["research"] == set()
+        assert deps["context"] == set()
+        assert deps["spec_writing"] == {"historical_context", "research", "context"}
+        assert "spec_writing" in deps["self_critique"]
+        assert "self_critique" in deps["planning"]
+        # The validation fixer may edit files earlier phases read
+        assert deps["validation"] == set(COMPLEX_PHASES[:-1])
+
+    def test_unknown_phase_is_a_barrier(self):
+        """Phases without declared artifacts keep the sequential order."""
+        deps = get_phase_dependencies(["research", "custom", "context"])
+
+        assert deps["custom"] == {"research"}
+        assert deps["context"] == {"custom"}
+
+
+class TestRunPhaseGraph:
+    """Tests for SpecOrchestrator._run_phase_graph."""
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_run_concurrently(self, orchestrator):
+        """historical_context, research and context overlap."""
+        fake = FakePhases()
+
+        results = await orchestrator._run_phase_graph(COMPLEX_PHASES, fake.run)
+
+        assert [r.phase for r in results] == COMPLEX_PHASES
+        assert fake.max_running == 3
+        # Dependents start after their inputs (and summaries) are done
+        for earlier in ("historical_context", "research", "context"):
+            assert fake.index("end", earlier) < fake.index("start", "spec_writing")
+        assert fake.index("end", "self_critique") < fake.index("start", "planning")
+        assert fake.index("end", "planning") < fake.index("start", "validation")
+        assert set(orchestrator.summarized) == set(COMPLEX_PHASES)
+
+    @pytest.mark.asyncio
+    async def test_complex_wall_clock_drops(self, orchestrator):
+        """Overlapping phases take less time than running them in order."""
+        latency = 0.05
+        fake = FakePhases(latency=latency)
+
+        start = time.perf_counter()
+        await orchestrator._run_phase_graph(COMPLEX_PHASES, fake.run)
+        elapsed = time.perf_counter() - start
+
+        # 5 sequential steps instead of 7
+        assert elapsed < latency * (len(COMPLEX_PHASES) - 1)
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_dependents(self, orchestrator):
+        """A failed phase lets running phases finish but starts no new ones."""
+        fake = FakePhases(failing={"research"})
+
+        results = await orchestrator._run_phase_graph(COMPLEX_PHASES, fake.run)
+
+        assert [r.phase for r in results] == ["historical_context", "research", "context"]
+        assert not results[1].success
+        assert ("start", "spec_writing") not in fake.events
+        assert "research" not in orchestrator.summarized
+        assert "context" in orchestrator.summarized
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self, orchestrator):
+        """An exception in a phase is raised after running phases finish."""
+        fake = FakePhases(raising={"context"})
+
+        with pytest.raises(RuntimeError, match="context crashed"):
+            await orchestrator._run_phase_graph(COMPLEX_PHASES, fake.run)
+
+        assert ("end", "research") in fake.events
+        assert ("start", "spec_writing") not in fake.events
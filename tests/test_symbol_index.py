@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent symbol index used by context discovery.
+
+Tests cover:
+- Symbol extraction for Python, TypeScript, Go and Rust
+- Incremental updates and persistence
+- Ranking by definitions and import-graph proximity
+- ContextBuilder integration
+- Benchmark on the backend source tree
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from context.builder import ContextBuilder
+from context.main import build_task_context
+from context.symbol_index import SymbolIndex, benchmark, extract_symbols
+
+
+def _write(root: Path, rel_path: str, content: str) -> Path:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small polyglot project."""
+    root = tmp_path / "project"
+    _write(
+        root,
+        "api/retry.py",
+        "import time\n\n\nclass RetryPolicy:\n    def backoff(self):\n        return time.sleep(1)\n",
+    )
+    _write(
+        root,
+        "api/client.py",
+        "from .retry import RetryPolicy\n\n\ndef fetch():\n    return RetryPolicy()\n",
+    )
+    _write(root, "api/unrelated.py", "# retry retry retry (comment only)\nVALUE = 1\n")
+    _write(
+        root,
+        "web/src/proxy.ts",
+        "import { sleep } from './util'\n\nexport class ProxyPool {}\nexport function rotateProxy() {}\n",
+    )
+    _write(root, "web/src/util.ts", "export const sleep = (ms: number) => ms\n")
+    _write(root, "node_modules/dep/index.js", "function retry() {}\n")
+    return root
+
+
+class TestExtractSymbols:
+    """Tests for extract_symbols."""
+
+    def test_python(self):
+        language, definitions, imports, references = extract_symbols(
+            "pkg/mod.py",
+            "import os\nfrom . import sibling\nfrom .base import Base\n\n"
+            "LIMIT = 3\n\n\nclass Thing(Base):\n    async def run(self):\n        os.getcwd()\n",
+        )
+
+        assert language == "python"
+        assert ("Thing", "class", 8) in definitions
+        assert ("run", "function", 9) in definitions
+        assert ("LIMIT", "variable", 5) in definitions
+        assert imports == ["os", ".", ".sibling", ".base"]
+        assert "getcwd" in references
+
+    def test_python_syntax_error_falls_back(self):
+        language, definitions, imports, references = extract_symbols(
+            "broken.py", "def oops(:\n    pass\n"
+        )
+
+        assert definitions == []
+        assert "oops" in references
+
+    def test_typescript(self):
+        _, definitions, imports, _ = extract_symbols(
+            "a.ts",
+            "import React from 'react'\nimport { x } from \"./x\"\n"
+            "export default class Widget {}\nexport interface Props {}\n"
+            "export type Id = string\nconst helper = () => 1\n"
+            "export async function load() {}\nconst y = require('./y')\n",
+        )
+
+        names = {name for name, _, _ in definitions}
+        assert {"Widget", "Props", "Id", "helper", "load", "y"} <= names
+        assert imports == ["react", "./x", "./y"]
+
+    def test_go(self):
+        _, definitions, imports, _ = extract_symbols(
+            "main.go",
+            'package main\n\nimport (\n\t"fmt"\n\tlog "github.com/x/log"\n)\n\n'
+            "type Server struct{}\n\nfunc (s *Server) Start() {}\nfunc main() {}\n",
+        )
+
+        assert {"Server", "Start", "main"} <= {name for name, _, _ in definitions}
+        assert imports == ["fmt", "github.com/x/log"]
+
+    def test_rust(self):
+        _, definitions, imports, _ = extract_symbols(
+            "lib.rs",
+            "use std::collections::HashMap;\npub struct Cache {}\n"
+            "pub(crate) async fn warm() {}\ntrait Store {}\n",
+        )
+
+        assert {"Cache", "warm", "Store"} <= {name for name, _, _ in definitions}
+        assert imports == ["std::collections::HashMap"]
+
+
+class TestSymbolIndex:
+    """Tests for SymbolIndex."""
+
+    def test_update_skips_vendored_dirs(self, project):
+        index = SymbolIndex(project)
+        stats = index.update()
+
+        assert stats.parsed == 5
+        assert "node_modules/dep/index.js" not in index.files
+        assert index.index_file.exists()
+
+    def test_incremental_update(self, project):
+        SymbolIndex(project).update()
+
+        index = SymbolIndex(project)
+        assert index.update().parsed == 0
+
+        changed = project / "api" / "unrelated.py"
+        changed.write_text("def retry_forever():\n    pass\n")
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (project / "web" / "src" / "util.ts").unlink()
+
+        stats = index.update()
+
+        assert stats.parsed == 1
+        assert stats.removed == 1
+        assert index.find_definitions("retry_forever") == [
+            ("api/unrelated.py", "function", 1)
+        ]
+
+    def test_definitions_outrank_mentions(self, project):
+        index = SymbolIndex(project)
+        index.update()
+
+        ranked = [path for path, _, _ in index.rank_files(["retry"])]
+
+        assert ranked[0] == "api/retry.py"
+        assert "api/client.py" in ranked
+        # Comment-only mentions are not symbols
+        assert "api/unrelated.py" not in ranked
+
+    def test_import_graph(self, project):
+        index = SymbolIndex(project)
+        index.update()
+
+        assert "api/retry.py" in index.import_graph["api/client.py"]
+        assert "web/src/util.ts" in index.import_graph["web/src/proxy.ts"]
+
+    def test_ambiguous_module_names_add_no_edge(self, project):
+        _write(project, "svc_a/src/helpers.py", "VALUE = 1\n")
+        _write(project, "svc_b/src/helpers.py", "VALUE = 2\n")
+        _write(
+            project, "helpers_user.py", "import helpers\nimport svc_b.src.helpers\n"
+        )
+        _write(project, "api/status.py", "import api.retry\n")
+        index = SymbolIndex(project)
+        index.update()
+
+        # "helpers" is a suffix of both files; the full path still resolves
+        assert index.import_graph["helpers_user.py"] == {"svc_b/src/helpers.py"}
+        assert "api/retry.py" in index.import_graph["api/status.py"]
+
+    def test_benchmark_leaves_project_index(self, project):
+        index = SymbolIndex(project)
+        index.update()
+        before = index.index_file.stat().st_mtime_ns
+
+        results = benchmark(project)
+
+        assert results["files"] == 5
+        assert index.index_file.stat().st_mtime_ns == before
+
+    def test_path_prefix(self, project):
+        index = SymbolIndex(project)
+        index.update()
+
+        ranked = index.rank_files(["proxy"], path_prefix="web")
+
+        assert ranked
+        assert all(path.startswith("web/") for path, _, _ in ranked)
+
+    def test_corrupt_index_is_rebuilt(self, project):
+        index = SymbolIndex(project)
+        index.index_file.parent.mkdir(parents=True)
+        index.index_file.write_text("{broken")
+
+        assert index.update().parsed == 5
+
+
+class TestContextBuilderIntegration:
+    """Tests for ranking through ContextBuilder.build_context."""
+
+    def test_symbol_ranking(self, project):
+        project_index = {"services": {"api": {"path": "api"}}}
+        builder = ContextBuilder(project, project_index)
+
+        context = builder.build_context(
+            "Add retry jitter",
+            services=["api"],
+            keywords=["retry"],
+            include_graph_hints=False,
+            use_symbol_index=True,
+        )
+
+        paths = [
+            f["path"] for f in context.files_to_modify + context.files_to_reference
+        ]
+        assert paths[0] == "api/retry.py"
+
+    def test_build_task_context_passes_flag(self, project):
+        index_dir = project / ".auto-claude"
+        index_dir.mkdir()
+        (index_dir / "project_index.json").write_text(
+            '{"services": {"api": {"path": "api"}}}'
+        )
+
+        build_task_context(project, "Add retry jitter", ["api"], ["retry"])
+        assert not (index_dir / "symbol_index.json").exists()
+
+        result = build_task_context(
+            project, "Add retry jitter", ["api"], ["retry"], use_symbol_index=True
+        )
+
+        assert (index_dir / "symbol_index.json").exists()
+        paths = [
+            f["path"] for f in result["files_to_modify"] + result["files_to_reference"]
+        ]
+        assert paths[0] == "api/retry.py"
+
+
+@pytest.mark.slow
+def test_benchmark_backend_tree(tmp_path):
+    """Warm updates of a real tree re-parse nothing and beat the cold build."""
+    backend = Path(__file__).parent.parent / "apps" / "backend"
+
+    results = benchmark(backend, tmp_path / "symbol_index.json")
+
+    assert results["files"] > 100
+    assert results["warm_reparsed"] == 0
+    assert results["warm_update_ms"] < results["cold_build_ms"]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-warmed worktree pool.
+
+Tests cover:
+- Replenishing slots (created, prepared, parked at origin/<base>)
+- Claiming a slot in WorktreeManager.create_worktree
+- Moving parked slots forward when the base branch advances
+- Skipping half-created and locked slots
+- Hit/miss and claim latency metrics
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core.worktree_pool import POOL_SIZE_ENV_VAR, WorktreePool, get_pool_size_from_env
+from worktree import WorktreeManager
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _prepare(path: Path) -> None:
+    (path / ".env").write_text("KEY=value\n")
+
+
+@pytest.fixture
+def repo_with_origin(temp_git_repo: Path, tmp_path: Path) -> Path:
+    """temp_git_repo with a bare origin remote that has main pushed."""
+    origin = tmp_path / "origin.git"
+    _git(tmp_path, "init", "--bare", "-q", str(origin))
+    _git(temp_git_repo, "remote", "add", "origin", str(origin))
+    _git(temp_git_repo, "push", "-q", "origin", "main")
+    (temp_git_repo / ".gitignore").write_text(".auto-claude/\n.env\n")
+    _git(temp_git_repo, "add", ".gitignore")
+    _git(temp_git_repo, "commit", "-q", "-m", "ignore")
+    _git(temp_git_repo, "push", "-q", "origin", "main")
+    return temp_git_repo
+
+
+def _advance_origin(repo: Path) -> str:
+    (repo / "new.txt").write_text("new\n")
+    _git(repo, "add", "new.txt")
+    _git(repo, "commit", "-q", "-m", "advance")
+    _git(repo, "push", "-q", "origin", "main")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+class TestWorktreePool:
+    """Tests for WorktreePool."""
+
+    def test_replenish_creates_prepared_slots(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=2, prepare=_prepare)
+
+        assert pool.replenish() == 2
+
+        slots = pool.ready_slots()
+        head = _git(repo_with_origin, "rev-parse", "origin/main")
+        assert [s.name for s in slots] == ["slot-0", "slot-1"]
+        for slot in slots:
+            assert _git(slot, "rev-parse", "HEAD") == head
+            assert (slot / ".env").read_text() == "KEY=value\n"
+        # Already parked at the latest commit: nothing to do
+        assert pool.replenish() == 0
+
+    def test_claim_creates_branch(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=1, prepare=_prepare)
+        pool.replenish()
+        target = repo_with_origin / ".auto-claude" / "worktrees" / "tasks" / "001-x"
+
+        assert pool.claim(target, "auto-claude/001-x")
+
+        assert _git(target, "rev-parse", "--abbrev-ref", "HEAD") == "auto-claude/001-x"
+        assert _git(target, "rev-parse", "HEAD") == _git(
+            repo_with_origin, "rev-parse", "origin/main"
+        )
+        assert (target / ".env").exists()
+        assert pool.ready_slots() == []
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+        assert stats["avg_claim_seconds"] > 0
+
+    def test_claim_moves_to_latest_base(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=1, max_base_age=0)
+        pool.replenish()
+        latest = _advance_origin(repo_with_origin)
+        target = repo_with_origin / ".auto-claude" / "worktrees" / "tasks" / "002-y"
+
+        assert pool.claim(target, "auto-claude/002-y")
+
+        assert _git(target, "rev-parse", "HEAD") == latest
+        assert (target / "new.txt").exists()
+
+    def test_replenish_moves_parked_slot_forward(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=1)
+        pool.replenish()
+        latest = _advance_origin(repo_with_origin)
+
+        assert pool.replenish() == 1
+
+        assert _git(pool.ready_slots()[0], "rev-parse", "HEAD") == latest
+        assert pool.get_stats()["slots_refreshed"] == 1
+
+    def test_half_created_slot_is_not_claimed(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=1)
+        pool.replenish()
+        slot = pool.ready_slots()[0]
+        slot.with_name("slot-0.json").unlink()
+        target = repo_with_origin / ".auto-claude" / "worktrees" / "tasks" / "003-z"
+
+        assert not pool.claim(target, "auto-claude/003-z")
+        assert pool.get_stats()["misses"] == 1
+
+        # Replenish replaces it with a complete slot
+        assert pool.replenish() == 1
+        assert pool.ready_slots() == [slot]
+
+    def test_locked_slot_is_skipped(self, repo_with_origin: Path):
+        pool = WorktreePool(repo_with_origin, "main", size=1)
+        pool.replenish()
+        slot = pool.ready_slots()[0]
+        slot.with_name("slot-0.lock").write_text("12345")
+        target = repo_with_origin / ".auto-claude" / "worktrees" / "tasks" / "004-w"
+
+        assert not pool.claim(target, "auto-claude/004-w")
+        assert slot.exists()
+
+    def test_pool_size_from_env(self, monkeypatch):
+        monkeypatch.setenv(POOL_SIZE_ENV_VAR, "3")
+        assert get_pool_size_from_env() == 3
+        monkeypatch.setenv(POOL_SIZE_ENV_VAR, "lots")
+        assert get_pool_size_from_env() == 0
+        monkeypatch.delenv(POOL_SIZE_ENV_VAR)
+        assert get_pool_size_from_env() == 0
+
+
+class TestWorktreeManagerWithPool:
+    """Tests for pool integration in WorktreeManager."""
+
+    def test_pool_disabled_by_default(self, repo_with_origin: Path, monkeypatch):
+        monkeypatch.delenv(POOL_SIZE_ENV_VAR, raising=False)
+
+        assert WorktreeManager(repo_with_origin).pool is None
+
+    def test_miss_then_hit(self, repo_with_origin: Path):
+        manager = WorktreeManager(
+            repo_with_origin, pool_size=1, prepare_worktree=_prepare
+        )
+        manager.setup()
+
+        first = manager.create_worktree("001-first")
+        manager.pool.wait()
+        second = manager.create_worktree("002-second")
+        manager.pool.wait()
+
+        stats = manager.pool.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["ready_slots"] == 1
+        assert second.branch == "auto-claude/002-second"
+        assert (second.path / ".env").exists()
+        assert not (first.path / ".env").exists()
+        info = manager.get_worktree_info("002-second")
+        assert info is not None
+        assert info.branch == "auto-claude/002-second"
+
+        manager.remove_worktree("002-second", delete_branch=True)
+        assert not second.path.exists()
+        manager.pool.clear()
+        assert manager.pool.ready_slots() == []
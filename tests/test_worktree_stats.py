@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the worktree statistics cache.
+
+Tests cover:
+- Reading worktree branches and HEADs from the git files
+- Statistics served from the (HEAD, base) cache without running git
+- Cache misses computed together
+- New commits and a moved base invalidate entries
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core import worktree_stats
+from core.worktree import WorktreeManager
+from core.worktree_stats import read_worktree_head, stats_cache_path
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, name: str, content: str) -> None:
+    (repo / name).write_text(content)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", f"Add {name}")
+
+
+@pytest.fixture
+def manager(temp_git_repo: Path) -> WorktreeManager:
+    manager = WorktreeManager(temp_git_repo, base_branch="main")
+    manager.setup()
+    for spec_name in ("001-a", "002-b"):
+        info = manager.create_worktree(spec_name)
+        _commit(info.path, f"{spec_name}.txt", "one\ntwo\n")
+    return manager
+
+
+def _list_counting_git(manager: WorktreeManager) -> tuple[list, list[str]]:
+    calls = []
+    real_run_git = worktree_stats.run_git
+
+    def counting_run_git(args, **kw):
+        calls.append(args[0])
+        return real_run_git(args, **kw)
+
+    with patch.object(worktree_stats, "run_git", counting_run_git):
+        infos = manager.list_all_worktrees()
+    return sorted(infos, key=lambda i: i.spec_name), calls
+
+
+class TestReadWorktreeHead:
+    """Tests for read_worktree_head()."""
+
+    def test_reads_branch_and_commit(self, manager):
+        path = manager.get_worktree_path("001-a")
+
+        branch, head = read_worktree_head(path)
+
+        assert branch == "auto-claude/001-a"
+        assert head == _git(path, "rev-parse", "HEAD")
+
+    def test_packed_and_detached_heads(self, manager):
+        path = manager.get_worktree_path("001-a")
+        head = _git(path, "rev-parse", "HEAD")
+        _git(manager.project_dir, "pack-refs", "--all")
+
+        assert read_worktree_head(path) == ("auto-claude/001-a", head)
+
+        _git(path, "checkout", "-q", "--detach")
+
+        assert read_worktree_head(path) == ("HEAD", head)
+
+    def test_not_a_worktree(self, tmp_path):
+        assert read_worktree_head(tmp_path) == (None, None)
+
+
+class TestWorktreeStatsCache:
+    """Tests for cached statistics in WorktreeManager."""
+
+    def test_stats_and_cache_hits(self, manager):
+        first, calls = _list_counting_git(manager)
+
+        assert [i.spec_name for i in first] == ["001-a", "002-b"]
+        assert first[0].branch == "auto-claude/001-a"
+        assert (first[0].commit_count, first[0].files_changed) == (1, 1)
+        assert (first[0].additions, first[0].deletions) == (2, 0)
+        assert first[0].days_since_last_commit == 0
+        # One `git show` for all dates, then counts and diff per worktree
+        assert calls.count("show") == 1
+        assert calls.count("rev-list") == calls.count("diff") == 2
+
+        second, calls = _list_counting_git(manager)
+
+        assert calls == []
+        assert second == first
+
+    def test_cache_stays_out_of_the_project(self, manager):
+        manager.list_all_worktrees()
+
+        assert stats_cache_path(manager.project_dir).exists()
+        status = _git(manager.project_dir, "status", "--porcelain", "-uall")
+        assert "stats" not in status
+
+    def test_new_commit_is_recomputed(self, manager):
+        manager.list_all_worktrees()
+        _commit(manager.get_worktree_path("002-b"), "more.txt", "x\n")
+
+        infos, calls = _list_counting_git(manager)
+
+        assert calls == ["show", "rev-list", "diff"]
+        assert infos[1].commit_count == 2
+        assert infos[0].commit_count == 1
+
+    def test_moved_base_is_recomputed(self, manager):
+        manager.list_all_worktrees()
+        _commit(manager.project_dir, "main.txt", "main\n")
+
+        infos, calls = _list_counting_git(manager)
+
+        assert calls.count("rev-list") == 2
+        assert [i.commit_count for i in infos] == [1, 1]